@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
-from .models import SystemSettings, Slider, PhoneVerification, MobileAppVersionPolicy
+from .models import SystemSettings, Slider, PhoneVerification, MobileAppVersionPolicy, OutboxEvent
 
 
 @admin.register(SystemSettings)
@@ -399,3 +399,36 @@ class MobileAppVersionPolicyAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
         return False
 
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'topic', 'key', 'status', 'attempts', 'created_at', 'processed_at']
+    list_filter = ['status', 'topic']
+    search_fields = ['key']
+    readonly_fields = [
+        'topic', 'key', 'payload', 'status', 'attempts', 'last_error',
+        'created_at', 'available_at', 'claimed_at', 'processed_at',
+    ]
+    actions = ['retry_events']
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description='Retry selected failed events')
+    def retry_events(self, request, queryset):
+        from apps.core.outbox import schedule_consumer
+
+        retried = 0
+        for event in queryset.filter(status=OutboxEvent.STATUS_FAILED):
+            # Skip keys that already have a newer pending event.
+            if OutboxEvent.objects.filter(
+                topic=event.topic, key=event.key, status=OutboxEvent.STATUS_PENDING
+            ).exists():
+                continue
+            event.status = OutboxEvent.STATUS_PENDING
+            event.available_at = timezone.now()
+            event.save(update_fields=['status', 'available_at'])
+            retried += 1
+        schedule_consumer()
+        self.message_user(request, f'{retried} events queued for retry')
@@ -0,0 +1,114 @@
+"""Process-local memoization of rarely-changing configuration.
+
+The active SystemSettings, the PDF measurement template and field map, and the
+default document layout are read on hot paths (pricing, every document render)
+but change only through the admin. Each process keeps them in a small LRU.
+A version token in the shared cache invalidates every process at once: writes
+call ``bump_config_version()`` from signals, and readers compare their token
+with the shared one at most once per request (outside a request, such as in
+Celery tasks, at most once every CONFIG_VERSION_CHECK_INTERVAL seconds).
+
+Cached values are shared by every caller in the process; treat them as
+read-only and copy before changing them.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.db import transaction
+
+from zthob.middleware import get_current_request
+
+CONFIG_VERSION_CACHE_KEY = 'core:config_version'
+CONFIG_CACHE_MAX_ENTRIES = 64
+CONFIG_VERSION_CHECK_INTERVAL = 5  # seconds, outside a request
+_REQUEST_ATTR = '_config_cache_version'
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+_local = {'version': None, 'checked_at': 0.0}
+
+
+def _shared_version():
+    version = cache.get(CONFIG_VERSION_CACHE_KEY)
+    if version is None:
+        # Evicted or never set: start a new version so no process keeps old values.
+        cache.add(CONFIG_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        version = cache.get(CONFIG_VERSION_CACHE_KEY)
+    return version
+
+
+def _current_version():
+    request = get_current_request()
+    if request is not None:
+        version = getattr(request, _REQUEST_ATTR, None)
+        if version is None:
+            version = _shared_version()
+            setattr(request, _REQUEST_ATTR, version)
+        return version
+    now = time.monotonic()
+    if _local['version'] is not None and now - _local['checked_at'] < CONFIG_VERSION_CHECK_INTERVAL:
+        return _local['version']
+    version = _shared_version()
+    _local['checked_at'] = now
+    return version
+
+
+def get_config(name, loader):
+    """Return the value memoized under ``name``, calling ``loader()`` on a miss."""
+    version = _current_version()
+    with _lock:
+        if version != _local['version']:
+            _entries.clear()
+            _local['version'] = version
+        if name in _entries:
+            _entries.move_to_end(name)
+            return _entries[name]
+    value = loader()
+    if _bump_pending():
+        # Loaded inside a transaction that changed configuration; it may still roll back.
+        return value
+    with _lock:
+        if _local['version'] == version:
+            _entries[name] = value
+            _entries.move_to_end(name)
+            while len(_entries) > CONFIG_CACHE_MAX_ENTRIES:
+                _entries.popitem(last=False)
+    return value
+
+
+def clear_config_cache():
+    """Drop this process's memoized values; other processes are unaffected."""
+    with _lock:
+        _entries.clear()
+        _local['version'] = None
+        _local['checked_at'] = 0.0
+
+
+def _bump():
+    version = uuid.uuid4().hex
+    cache.set(CONFIG_VERSION_CACHE_KEY, version, None)
+    with _lock:
+        _entries.clear()
+        _local['version'] = version
+        _local['checked_at'] = time.monotonic()
+    request = get_current_request()
+    if request is not None:
+        setattr(request, _REQUEST_ATTR, version)
+
+
+def _bump_pending():
+    connection = transaction.get_connection()
+    return connection.in_atomic_block and any(
+        func is _bump for _sids, func, _robust in connection.run_on_commit
+    )
+
+
+def bump_config_version():
+    """Invalidate memoized configuration in every process, now and after commit."""
+    pending = _bump_pending()
+    _bump()
+    if not pending:
+        transaction.on_commit(_bump)
@@ -0,0 +1,177 @@
+"""Size-bounded derivatives of uploaded images.
+
+Originals are stored untouched. Each named variant is a resized, recompressed
+copy under ``IMAGE_VARIANT_DIR/<variant>/`` that mirrors the original's path:
+
+    customer_fabrics/2026/05/a.jpg -> image_variants/pdf/customer_fabrics/2026/05/a.jpg
+    customer_fabrics/2026/05/a.webp -> image_variants/pdf/customer_fabrics/2026/05/a.webp.jpg
+
+Variants are generated after upload by a Celery task and lazily (then kept) by
+the PDF builders. API fields fall back to the original until a variant exists,
+so a request never waits on Pillow.
+"""
+import io
+import logging
+import os
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from apps.core.media_utils import build_public_media_url, media_path_from_url
+
+logger = logging.getLogger(__name__)
+
+IMAGE_VARIANT_DIR = 'image_variants'
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    name: str
+    max_size: int
+    quality: int
+
+
+IMAGE_VARIANTS = {
+    # ~50 mm thumbnails at print resolution.
+    'pdf': ImageVariant('pdf', 600, 80),
+    'list': ImageVariant('list', 320, 75),
+    'detail': ImageVariant('detail', 1280, 85),
+}
+
+# Models whose uploads get variants (app_label.Model, image field).
+IMAGE_VARIANT_SOURCES = (
+    ('orders.CustomerFabricImage', 'image'),
+    ('orders.StyleReferenceImage', 'image'),
+    ('tailors.FabricImage', 'image'),
+    ('customization.CustomStyle', 'image'),
+)
+
+_LOSSLESS_EXTENSIONS = ('.png', '.gif')
+
+
+def variant_name(name, variant):
+    """Storage name of ``variant`` for the original stored as ``name``."""
+    relative = media_path_from_url(name)
+    if not relative:
+        return None
+    ext = os.path.splitext(relative)[1]
+    target = '.png' if ext.lower() in _LOSSLESS_EXTENSIONS else '.jpg'
+    # Keep the original extension so a.jpeg and a.webp do not share a.jpg.
+    if ext != target:
+        relative += target
+    return f'{IMAGE_VARIANT_DIR}/{IMAGE_VARIANTS[variant].name}/{relative}'
+
+
+def _is_fresh(source_path, derived_path):
+    try:
+        return os.stat(derived_path).st_mtime_ns >= os.stat(source_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _encode(source_path, spec, lossless):
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((spec.max_size, spec.max_size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        if lossless:
+            if image.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+                image = image.convert('RGBA')
+            image.save(buffer, format='PNG', optimize=True)
+        else:
+            if image.mode in ('RGBA', 'LA', 'P'):
+                image = image.convert('RGBA')
+                background = Image.new('RGB', image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel('A'))
+                image = background
+            elif image.mode != 'RGB':
+                image = image.convert('RGB')
+            image.save(buffer, format='JPEG', quality=spec.quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def generate_image_variant(name, variant, *, force=False):
+    """Create (or refresh) one variant. Returns its storage name, or None on failure."""
+    derived = variant_name(name, variant)
+    if not derived:
+        return None
+    source = media_path_from_url(name)
+    try:
+        source_path = default_storage.path(source)
+        derived_path = default_storage.path(derived)
+        if not force and _is_fresh(source_path, derived_path):
+            return derived
+        content = _encode(source_path, IMAGE_VARIANTS[variant], derived.endswith('.png'))
+        if default_storage.exists(derived):
+            default_storage.delete(derived)
+        default_storage.save(derived, ContentFile(content))
+    except Exception:
+        logger.warning('Unable to build %s variant for %s', variant, name, exc_info=True)
+        return None
+    return derived
+
+
+def generate_image_variants(name, variants=None):
+    """Build every variant for an uploaded image."""
+    return {
+        variant: generate_image_variant(name, variant)
+        for variant in (variants or IMAGE_VARIANTS)
+    }
+
+
+def delete_image_variants(name):
+    for variant in IMAGE_VARIANTS:
+        derived = variant_name(name, variant)
+        try:
+            if derived and default_storage.exists(derived):
+                default_storage.delete(derived)
+        except Exception:
+            logger.warning('Unable to delete %s variant for %s', variant, name, exc_info=True)
+
+
+def image_variant_path(path, variant='pdf'):
+    """
+    Local path of ``variant`` for a file under MEDIA_ROOT, generating it on first use.
+
+    Paths outside MEDIA_ROOT and images Pillow cannot read are returned unchanged.
+    """
+    if not path:
+        return path
+    media_root = os.path.abspath(settings.MEDIA_ROOT)
+    absolute = os.path.abspath(path)
+    if os.path.commonpath([media_root, absolute]) != media_root:
+        return path
+    derived = generate_image_variant(os.path.relpath(absolute, media_root), variant)
+    return default_storage.path(derived) if derived else path
+
+
+def image_variant_url(request, image, variant):
+    """
+    Public URL of ``variant`` when it exists and is current, else of the original.
+
+    ``image`` is a FieldFile or a stored name.
+    """
+    name = getattr(image, 'name', image)
+    if not name:
+        return None
+    derived = variant_name(name, variant)
+    try:
+        source_path = default_storage.path(media_path_from_url(name))
+        if derived and _is_fresh(source_path, default_storage.path(derived)):
+            return build_public_media_url(request, derived)
+    except NotImplementedError:
+        pass
+    return build_public_media_url(request, getattr(image, 'url', name))
+
+
+def schedule_image_variants(name):
+    """Build variants in the background once the upload is committed."""
+    if not name:
+        return
+    from apps.core.tasks import generate_image_variants_task
+
+    transaction.on_commit(lambda: generate_image_variants_task.delay(name))
@@ -0,0 +1,46 @@
+"""
+Management command to build size variants for images uploaded before the
+variant pipeline existed. Safe to re-run; current variants are skipped.
+"""
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.core.image_variants import IMAGE_VARIANT_SOURCES, IMAGE_VARIANTS, generate_image_variant
+
+
+class Command(BaseCommand):
+    help = 'Generate pdf/list/detail variants for uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--variant',
+            action='append',
+            choices=sorted(IMAGE_VARIANTS),
+            help='Variant to build (repeatable). Defaults to all variants.',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild variants even when they are current',
+        )
+
+    def handle(self, *args, **options):
+        variants = options['variant'] or list(IMAGE_VARIANTS)
+        built = failed = 0
+        for model_label, field_name in IMAGE_VARIANT_SOURCES:
+            model = apps.get_model(model_label)
+            names = (
+                model.objects.exclude(**{field_name: ''})
+                .exclude(**{f'{field_name}__isnull': True})
+                .values_list(field_name, flat=True)
+                .iterator()
+            )
+            for name in names:
+                for variant in variants:
+                    if generate_image_variant(name, variant, force=options['force']):
+                        built += 1
+                    else:
+                        failed += 1
+            self.stdout.write(f'{model_label}: done')
+
+        self.stdout.write(self.style.SUCCESS(f'Variants ready: {built}, failed: {failed}'))
@@ -0,0 +1,49 @@
+"""
+Management command to process pending outbox events.
+
+Usage:
+    python manage.py process_outbox
+    python manage.py process_outbox --topic orders.order_saved --purge-days 7
+
+Events are normally consumed by Celery right after the publishing transaction
+commits. Run this every few minutes via cron job or task scheduler to pick up
+events whose task was lost (e.g. broker outage) and retries that are due.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.core.outbox import OUTBOX_BATCH_SIZE, drain, purge_processed
+
+
+class Command(BaseCommand):
+    help = 'Process pending outbox events and purge old processed ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--topic',
+            action='append',
+            help='Only process this topic (repeatable). Defaults to all topics.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=OUTBOX_BATCH_SIZE,
+            help=f'Events claimed per batch (default: {OUTBOX_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--purge-days',
+            type=int,
+            default=None,
+            help='Delete processed events older than this many days',
+        )
+
+    def handle(self, *args, **options):
+        processed, failed = drain(batch_size=options['batch_size'], topics=options['topic'])
+        style = self.style.WARNING if failed else self.style.SUCCESS
+        self.stdout.write(style(f'Processed {processed} outbox events, {failed} failed'))
+
+        if options['purge_days'] is not None:
+            deleted = purge_processed(timezone.now() - timedelta(days=options['purge_days']))
+            self.stdout.write(f'Purged {deleted} processed outbox events')
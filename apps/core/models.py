@@ -1,12 +1,14 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator
 from decimal import Decimal
-from django.core.cache import cache
 import uuid
 
+from apps.core.config_cache import get_config
+
 User = get_user_model()
 
 # Image validator for slider images
@@ -63,6 +65,20 @@ class PhoneVerification(models.Model):
 
 
 
+def refresh_maintained_fields(instance, fields):
+    """
+    Copy ``fields`` of an existing row onto ``instance`` before a full save.
+
+    For columns kept by queryset UPDATEs (counters, denormalized flags): the
+    full save then writes back the stored value, not a stale in-memory one.
+    """
+    if instance._state.adding or instance.pk is None:
+        return
+    current = type(instance)._base_manager.filter(pk=instance.pk).values(*fields).first()
+    for name, value in (current or {}).items():
+        setattr(instance, name, value)
+
+
 class BaseModel(models.Model):
     created_at=models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at=models.DateTimeField(auto_now=True)
@@ -177,27 +193,22 @@ class SystemSettings(models.Model):
     
     @classmethod
     def get_active_settings(cls):
-        """Get the active system settings (singleton pattern) with caching"""
-        cache_key = 'active_system_settings'
-        settings_obj = cache.get(cache_key)
-        
-        if settings_obj is None:
-            settings_obj = cls.objects.filter(is_active=True).first()
-            if not settings_obj:
-                # Create default settings if none exist
-                settings_obj = cls.objects.create()
-            # Cache for 24 hours
-            cache.set(cache_key, settings_obj, 60 * 60 * 24)
-            
+        """Get the active system settings (singleton pattern), memoized per process"""
+        return get_config('system_settings', cls._load_active_settings)
+
+    @classmethod
+    def _load_active_settings(cls):
+        settings_obj = cls.objects.filter(is_active=True).first()
+        if not settings_obj:
+            # Create default settings if none exist
+            settings_obj = cls.objects.create()
         return settings_obj
     
     def save(self, *args, **kwargs):
-        """Override save to ensure only one active setting exists and clear cache"""
+        """Override save to ensure only one active setting exists (signals bump the config version)"""
         if self.is_active:
             # Deactivate all other settings
             SystemSettings.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False)
-            # Clear cache when active settings change
-            cache.delete('active_system_settings')
         super().save(*args, **kwargs)
 
 
@@ -320,3 +331,57 @@ class MobileAppVersionPolicy(models.Model):
 
     def __str__(self):
         return f'{self.get_app_display()} ({self.get_platform_display()})'
+
+
+class OutboxEvent(models.Model):
+    """
+    Side effect recorded in the same transaction as the write that caused it.
+
+    Consumers (see apps.core.outbox) process pending events in batches after
+    commit. At most one pending event exists per (topic, key): publishing again
+    before it is picked up is a no-op, so bursts of saves collapse into one run.
+    """
+
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_PROCESSING, 'Processing'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    topic = models.CharField(max_length=100)
+    key = models.CharField(max_length=100, help_text='Deduplication key within the topic, e.g. the order id')
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'Outbox Event'
+        verbose_name_plural = 'Outbox Events'
+        ordering = ['id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['topic', 'key'],
+                condition=Q(status='pending'),
+                name='outbox_one_pending_per_key',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['available_at', 'id'],
+                condition=Q(status__in=['pending', 'processing']),
+                name='outbox_open_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.topic}:{self.key} ({self.status})'
@@ -0,0 +1,231 @@
+"""Transactional outbox for side effects of model writes.
+
+A write publishes an ``OutboxEvent`` inside its own transaction; consumers
+registered with ``@outbox_handler(topic)`` run later, in batches, from the
+``process_outbox_task`` Celery task (scheduled on commit) or the
+``process_outbox`` management command (cron fallback):
+
+    publish(ORDER_SAVED, key=order.pk, payload={'order_id': order.pk})
+
+Events are deduplicated per (topic, key) while pending, so handlers must read
+current state rather than trust the payload, and must be idempotent: a failed
+event is retried with every handler of its topic. Publishers that need the
+payload of every publish pass ``merge`` to fold it into the pending event.
+
+Handlers registered with ``batch=True`` receive the list of claimed events of
+their topic at once, e.g. to hand them to a single Celery task.
+"""
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+# Events left in processing longer than this (crashed worker) are reclaimed.
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+# Publishes within this window share one queued consumer run.
+OUTBOX_SCHEDULE_DELAY_SECONDS = 1
+OUTBOX_SCHEDULE_CACHE_KEY = 'outbox:consumer_scheduled'
+
+_handlers = {}
+_batch_handlers = {}
+
+
+def outbox_handler(topic, batch=False):
+    """Register ``func(event)`` (or ``func(events)`` with batch) as a consumer of ``topic``."""
+    registry = _batch_handlers if batch else _handlers
+
+    def decorator(func):
+        registry.setdefault(topic, []).append(func)
+        return func
+    return decorator
+
+
+def handlers_for(topic):
+    return list(_handlers.get(topic, ()))
+
+
+def batch_handlers_for(topic):
+    return list(_batch_handlers.get(topic, ()))
+
+
+def publish(topic, key, payload=None, merge=None):
+    """
+    Record an event in the current transaction and schedule a consumer run
+    once it commits. While an event for (topic, key) is still pending this is
+    a no-op, or, with ``merge(pending_payload, payload)``, rewrites its payload.
+    """
+    key = str(key)
+    payload = payload or {}
+    if merge is None:
+        OutboxEvent.objects.bulk_create(
+            [OutboxEvent(topic=topic, key=key, payload=payload)],
+            ignore_conflicts=True,
+        )
+    else:
+        _publish_merged(topic, key, payload, merge)
+    transaction.on_commit(schedule_consumer)
+
+
+def _publish_merged(topic, key, payload, merge):
+    for _ in range(2):
+        with transaction.atomic():
+            pending = OutboxEvent.objects.select_for_update().filter(
+                topic=topic, key=key, status=OutboxEvent.STATUS_PENDING,
+            ).first()
+            if pending is not None:
+                pending.payload = merge(pending.payload, payload)
+                pending.save(update_fields=['payload'])
+                return
+        try:
+            with transaction.atomic():
+                OutboxEvent.objects.create(topic=topic, key=key, payload=payload)
+            return
+        except IntegrityError:
+            # A concurrent publish inserted the pending event; merge into it.
+            continue
+
+
+def schedule_consumer():
+    """Queue one delayed consumer run for all events published meanwhile."""
+    from apps.core.tasks import process_outbox_task
+
+    try:
+        if not cache.add(OUTBOX_SCHEDULE_CACHE_KEY, 1, timeout=OUTBOX_SCHEDULE_DELAY_SECONDS):
+            return
+    except Exception:
+        # Without the cache every publish queues its own (cheap) run.
+        pass
+    try:
+        process_outbox_task.apply_async(countdown=OUTBOX_SCHEDULE_DELAY_SECONDS)
+    except Exception as e:
+        # Events stay pending and are picked up by the process_outbox command.
+        logger.error(f"Failed to queue outbox consumer: {str(e)}")
+
+
+def _claim(batch_size, topics=None):
+    now = timezone.now()
+    open_events = OutboxEvent.objects.filter(
+        Q(status=OutboxEvent.STATUS_PENDING, available_at__lte=now)
+        | Q(status=OutboxEvent.STATUS_PROCESSING, claimed_at__lt=now - OUTBOX_CLAIM_TIMEOUT)
+    )
+    if topics:
+        open_events = open_events.filter(topic__in=topics)
+
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            open_events = open_events.select_for_update(skip_locked=True)
+        ids = list(open_events.order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return []
+        OutboxEvent.objects.filter(id__in=ids).update(
+            status=OutboxEvent.STATUS_PROCESSING,
+            claimed_at=now,
+        )
+    return list(OutboxEvent.objects.filter(id__in=ids).order_by('id'))
+
+
+def _handle(event):
+    with transaction.atomic():
+        for handler in handlers_for(event.topic):
+            handler(event)
+
+
+def _handle_batch(topic, events):
+    with transaction.atomic():
+        for handler in batch_handlers_for(topic):
+            handler(events)
+
+
+def _mark_failed(event, error):
+    event.attempts += 1
+    event.last_error = error
+    if event.attempts >= OUTBOX_MAX_ATTEMPTS:
+        event.status = OutboxEvent.STATUS_FAILED
+        event.save(update_fields=['attempts', 'last_error', 'status'])
+        return
+    event.status = OutboxEvent.STATUS_PENDING
+    event.available_at = timezone.now() + timedelta(seconds=30 * 2 ** (event.attempts - 1))
+    try:
+        with transaction.atomic():
+            event.save(update_fields=['attempts', 'last_error', 'status', 'available_at'])
+    except IntegrityError:
+        # A newer pending event for the same key will re-run the handlers.
+        OutboxEvent.objects.filter(pk=event.pk).update(
+            status=OutboxEvent.STATUS_DONE,
+            attempts=event.attempts,
+            last_error=error,
+            processed_at=timezone.now(),
+        )
+
+
+def process_pending(batch_size=OUTBOX_BATCH_SIZE, topics=None):
+    """
+    Claim and process one batch of due events.
+    Returns (processed, failed) counts for the batch.
+    """
+    processed = failed = 0
+    done_ids = []
+    by_topic = {}
+    for event in _claim(batch_size, topics):
+        by_topic.setdefault(event.topic, []).append(event)
+
+    for topic, events in by_topic.items():
+        handled = []
+        for event in events:
+            try:
+                _handle(event)
+            except Exception as e:
+                failed += 1
+                logger.error(f"Outbox event {event.pk} ({event.topic}:{event.key}) failed: {str(e)}")
+                _mark_failed(event, str(e))
+                continue
+            handled.append(event)
+
+        if handled and batch_handlers_for(topic):
+            try:
+                _handle_batch(topic, handled)
+            except Exception as e:
+                failed += len(handled)
+                logger.error(f"Outbox batch of {len(handled)} {topic} events failed: {str(e)}")
+                for event in handled:
+                    _mark_failed(event, str(e))
+                continue
+
+        processed += len(handled)
+        done_ids.extend(event.pk for event in handled)
+
+    if done_ids:
+        OutboxEvent.objects.filter(id__in=done_ids).update(
+            status=OutboxEvent.STATUS_DONE,
+            processed_at=timezone.now(),
+        )
+    return processed, failed
+
+
+def drain(batch_size=OUTBOX_BATCH_SIZE, topics=None):
+    """Process batches until nothing is due. Returns (processed, failed)."""
+    processed = failed = 0
+    while True:
+        batch_processed, batch_failed = process_pending(batch_size, topics)
+        if not batch_processed and not batch_failed:
+            return processed, failed
+        processed += batch_processed
+        failed += batch_failed
+
+
+def purge_processed(older_than):
+    """Delete done events processed before ``older_than``."""
+    deleted, _ = OutboxEvent.objects.filter(
+        status=OutboxEvent.STATUS_DONE,
+        processed_at__lt=older_than,
+    ).delete()
+    return deleted
@@ -0,0 +1,124 @@
+"""Normalized search keys and ranked type-ahead matching.
+
+Stored keys and typed terms go through the same normalization, so a search
+for "احمد" finds "أحمد" and "٠٥٥" finds "055":
+
+    normalize_search_text('أحمد  Al-Harbi')  -> 'احمد al-harbi'
+    phone_search_digits('+966 55 123 4567')  -> '0551234567'
+
+``ranked_match`` turns a term into a filter plus a rank (exact, prefix, word
+prefix, substring). Substring matches are served by a pg_trgm GIN index on
+PostgreSQL (see ``trigram_index_operations``) and by a scan elsewhere.
+"""
+import re
+
+from django.db import migrations
+from django.db.models import Case, FloatField, Func, IntegerField, Q, Value, When
+
+# Harakat, Quranic marks, superscript alef and tatweel carry no meaning for search.
+_ARABIC_MARKS = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+_ARABIC_LETTERS = str.maketrans({
+    '\u0622': '\u0627',  # alef madda -> alef
+    '\u0623': '\u0627',  # alef hamza above -> alef
+    '\u0625': '\u0627',  # alef hamza below -> alef
+    '\u0671': '\u0627',  # alef wasla -> alef
+    '\u0649': '\u064a',  # alef maksura -> yeh
+    '\u0629': '\u0647',  # teh marbuta -> heh
+    '\u0624': '\u0648',  # waw hamza -> waw
+    '\u0626': '\u064a',  # yeh hamza -> yeh
+})
+# Arabic-Indic and Eastern Arabic-Indic digits.
+_DIGITS = str.maketrans(
+    '\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669'
+    '\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9',
+    '01234567890123456789',
+)
+_WHITESPACE = re.compile(r'\s+')
+_PHONE_TERM = re.compile(r'[\d\s+\-()]+')
+
+MIN_TYPEAHEAD_LENGTH = 2
+
+# Match quality, best first.
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_CONTAINS = 3
+
+
+def normalize_search_text(value):
+    """Lowercase, strip Arabic diacritics, unify letter variants and digits."""
+    if not value:
+        return ''
+    value = _ARABIC_MARKS.sub('', str(value)).translate(_ARABIC_LETTERS).translate(_DIGITS)
+    return _WHITESPACE.sub(' ', value).strip().lower()
+
+
+def phone_search_digits(value):
+    """Digits of a phone number in local Saudi form (05XXXXXXXX) where recognizable."""
+    digits = ''.join(filter(str.isdigit, str(value or '').translate(_DIGITS)))
+    if digits.startswith('00966'):
+        digits = digits[2:]
+    if digits.startswith('9665'):
+        # Also partial input such as "+966 55 12" while typing.
+        return '0' + digits[3:]
+    if digits.startswith('5') and len(digits) == 9:
+        return '0' + digits
+    return digits
+
+
+def is_phone_term(term):
+    """Whether a typed term looks like (part of) a phone or order number."""
+    return bool(term) and bool(_PHONE_TERM.fullmatch(term.translate(_DIGITS)))
+
+
+def ranked_match(field, term):
+    """
+    Return (filter Q, rank expression) matching ``term`` in the normalized
+    key column ``field``. ``term`` must already be normalized.
+    """
+    condition = Q(**{f'{field}__contains': term})
+    rank = Case(
+        When(**{field: term}, then=Value(RANK_EXACT)),
+        When(**{f'{field}__startswith': term}, then=Value(RANK_PREFIX)),
+        When(**{f'{field}__contains': f' {term}'}, then=Value(RANK_WORD_PREFIX)),
+        default=Value(RANK_CONTAINS),
+        output_field=IntegerField(),
+    )
+    return condition, rank
+
+
+class TrigramSimilarity(Func):
+    """pg_trgm similarity(); only valid on PostgreSQL."""
+    function = 'SIMILARITY'
+    output_field = FloatField()
+
+
+def similarity_rank(connection, field, term):
+    """Trigram similarity as a secondary rank on PostgreSQL, a constant elsewhere."""
+    if connection.vendor == 'postgresql':
+        return TrigramSimilarity(field, Value(term))
+    return Value(0.0, output_field=FloatField())
+
+
+def trigram_index_operations(table, columns):
+    """
+    Migration operations creating pg_trgm GIN indexes on PostgreSQL only.
+    Other databases keep using their B-tree indexes and substring scans.
+    """
+    def create(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in columns:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_{column}_trgm '
+                f'ON {table} USING gin ({column} gin_trgm_ops)'
+            )
+
+    def drop(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for column in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {table}_{column}_trgm')
+
+    return [migrations.RunPython(create, drop)]
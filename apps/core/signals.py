@@ -1,7 +1,10 @@
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.core.cache import cache
-from .models import Slider, MobileAppVersionPolicy
+from .config_cache import bump_config_version
+from .models import Slider, MobileAppVersionPolicy, SystemSettings
+from .image_variants import IMAGE_VARIANT_SOURCES, delete_image_variants, schedule_image_variants
 from .mobile_version import clear_mobile_version_cache
 
 # Cache keys
@@ -18,3 +21,62 @@ def clear_slider_cache(sender, instance, **kwargs):
 @receiver([post_save, post_delete], sender=MobileAppVersionPolicy)
 def clear_mobile_version_policy_cache(sender, instance, **kwargs):
     clear_mobile_version_cache(instance.app, instance.platform)
+
+
+@receiver([post_save, post_delete], sender=SystemSettings)
+def bump_config_for_system_settings(sender, instance, **kwargs):
+    bump_config_version()
+
+
+def _remember_stored_upload(field_name):
+    def handler(sender, instance, update_fields=None, **kwargs):
+        if instance._state.adding or instance.pk is None:
+            return
+        if update_fields is not None and field_name not in update_fields:
+            return
+        instance._stored_variant_source = (
+            sender._base_manager.filter(pk=instance.pk).values_list(field_name, flat=True).first()
+        )
+    return handler
+
+
+def _schedule_variants_on_upload(field_name):
+    def handler(sender, instance, created=False, update_fields=None, **kwargs):
+        stored = instance.__dict__.pop('_stored_variant_source', None)
+        if update_fields is not None and field_name not in update_fields:
+            return
+        image = getattr(instance, field_name, None)
+        # Only a new file needs variants; saves that keep the same file do not.
+        if image and image.name != stored:
+            schedule_image_variants(image.name)
+    return handler
+
+
+def _delete_variants_with_upload(field_name):
+    def handler(sender, instance, **kwargs):
+        image = getattr(instance, field_name, None)
+        if image:
+            name = image.name
+            transaction.on_commit(lambda: delete_image_variants(name))
+    return handler
+
+
+for _model, _field in IMAGE_VARIANT_SOURCES:
+    pre_save.connect(
+        _remember_stored_upload(_field),
+        sender=_model,
+        weak=False,
+        dispatch_uid=f'image_variants_remember_{_model}',
+    )
+    post_save.connect(
+        _schedule_variants_on_upload(_field),
+        sender=_model,
+        weak=False,
+        dispatch_uid=f'image_variants_build_{_model}',
+    )
+    post_delete.connect(
+        _delete_variants_with_upload(_field),
+        sender=_model,
+        weak=False,
+        dispatch_uid=f'image_variants_delete_{_model}',
+    )
@@ -0,0 +1,160 @@
+"""
+Pooled, rate-limited transport for Taqnyat SMS.
+
+Every Taqnyat call in a process shares one keep-alive ``requests.Session``.
+Plain SMS sends also pass through a token bucket sized to the provider quota
+(TAQNYAT_SMS_RATE_PER_SECOND, TAQNYAT_SMS_BURST). The bucket is per process,
+so split the account quota across the worker processes. ``iter_concurrently``
+fans a batch out over at most TAQNYAT_SMS_MAX_WORKERS threads.
+
+SMS and verify POSTs are not idempotent, so only failures where the provider
+cannot have acted are retried, with exponential backoff: connection attempts
+that failed or timed out before anything was sent, and 429/503 responses.
+Read timeouts, dropped connections and other 5xx are not retried, because the
+provider may already have accepted the message and a retry would send it twice.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = frozenset({429, 503})
+RETRY_BACKOFF_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket. ``acquire`` blocks until a token is free."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_lock = threading.Lock()
+_state = {'session': None, 'limiter': None}
+
+
+def get_session():
+    """The process-wide Taqnyat session, created on first use."""
+    with _lock:
+        if _state['session'] is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(settings.TAQNYAT_SMS_MAX_WORKERS, 1))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _state['session'] = session
+        return _state['session']
+
+
+def get_rate_limiter():
+    with _lock:
+        if _state['limiter'] is None:
+            _state['limiter'] = TokenBucket(settings.TAQNYAT_SMS_RATE_PER_SECOND, settings.TAQNYAT_SMS_BURST)
+        return _state['limiter']
+
+
+def reset_dispatcher():
+    """Close the pooled session and drop the limiter; both are rebuilt from settings on next use."""
+    with _lock:
+        session = _state['session']
+        _state['session'] = None
+        _state['limiter'] = None
+    if session is not None:
+        session.close()
+
+
+def _forget_after_fork():
+    # A forked worker must not share the parent's sockets; it opens its own.
+    _state['session'] = None
+    _state['limiter'] = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_after_fork)
+
+
+def _never_sent(exc):
+    """True when the request failed while connecting, before any bytes went out."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _retry_delay(attempt, response=None):
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), MAX_RETRY_DELAY_SECONDS)
+    return min(RETRY_BACKOFF_SECONDS * 2 ** attempt, MAX_RETRY_DELAY_SECONDS)
+
+
+def post_json(url, payload, rate_limited=False):
+    """
+    POST ``payload`` as JSON with the Taqnyat bearer token.
+
+    Returns the final response, whatever its status. Raises
+    ``requests.RequestException`` when no response arrived.
+    """
+    headers = {'Authorization': f'Bearer {settings.TAQNYAT_BEARER_TOKEN}'}
+    timeout = (settings.TAQNYAT_CONNECT_TIMEOUT_SECONDS, settings.TAQNYAT_READ_TIMEOUT_SECONDS)
+    retries = max(settings.TAQNYAT_SMS_MAX_RETRIES, 0)
+    for attempt in range(retries + 1):
+        if rate_limited:
+            get_rate_limiter().acquire()
+        try:
+            response = get_session().post(url, json=payload, headers=headers, timeout=timeout)
+        except requests.ConnectionError as exc:
+            if attempt == retries or not _never_sent(exc):
+                raise
+            logger.warning('Taqnyat connection error (attempt %s): %s', attempt + 1, exc)
+            time.sleep(_retry_delay(attempt))
+            continue
+        if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+            return response
+        logger.warning('Taqnyat HTTP %s (attempt %s), retrying', response.status_code, attempt + 1)
+        time.sleep(_retry_delay(attempt, response))
+    return response
+
+
+def iter_concurrently(func, items):
+    """
+    Yield ``func(item)`` for each item, in order, as results arrive. Up to
+    TAQNYAT_SMS_MAX_WORKERS calls run at once.
+    """
+    items = list(items)
+    workers = min(max(settings.TAQNYAT_SMS_MAX_WORKERS, 1), len(items))
+    if workers <= 1:
+        yield from map(func, items)
+        return
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sms-dispatch')
+    try:
+        yield from executor.map(func, items)
+    finally:
+        # Drop sends not yet started if the consumer stops early, e.g. on a crash.
+        executor.shutdown(cancel_futures=True)
@@ -1,12 +1,13 @@
 import json
 import logging
-import urllib.error
-import urllib.request
+from collections import namedtuple
 from typing import Any
 
+import requests
 from django.conf import settings
 
 from .phone_format import format_phone_for_taqnyat
+from .sms_dispatch import iter_concurrently, post_json
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,8 @@ VERIFY_ATTEMPTS_EXHAUSTED = 12
 VERIFY_ALREADY_ACTIVATED = 13
 VERIFY_NUMBER_ALREADY_VERIFIED = 19
 
+SMSMessage = namedtuple("SMSMessage", ("phone_number", "body"))
+
 
 class TaqnyatVerifyService:
     """Taqnyat Verify API for managed OTP send and check."""
@@ -41,28 +44,17 @@ class TaqnyatVerifyService:
         if not configured:
             return False, error, None
 
-        body = json.dumps([payload]).encode("utf-8")
-        request = urllib.request.Request(
-            VERIFY_URL,
-            data=body,
-            method="POST",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {settings.TAQNYAT_BEARER_TOKEN}",
-            },
-        )
-
         try:
-            with urllib.request.urlopen(request, timeout=15) as response:
-                raw = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            raw = exc.read().decode("utf-8") if exc.fp else str(exc)
-            logger.error("Taqnyat Verify HTTP error: %s - %s", exc.code, raw)
-            return False, f"Failed to contact Taqnyat Verify: HTTP {exc.code}", None
-        except urllib.error.URLError as exc:
+            response = post_json(VERIFY_URL, [payload])
+        except requests.RequestException as exc:
             logger.error("Taqnyat Verify connection error: %s", exc)
             return False, "Failed to contact Taqnyat Verify", None
 
+        raw = response.text
+        if response.status_code >= 400:
+            logger.error("Taqnyat Verify HTTP error: %s - %s", response.status_code, raw)
+            return False, f"Failed to contact Taqnyat Verify: HTTP {response.status_code}", None
+
         try:
             parsed = json.loads(raw)
         except json.JSONDecodeError:
@@ -231,33 +223,26 @@ class TaqnyatSMSService:
         if not body_text:
             return False, "SMS body is required", None
 
-        payload = json.dumps(
-            {
-                "recipients": [format_phone_for_taqnyat(phone_number)],
-                "body": body_text,
-                "sender": settings.TAQNYAT_SENDER_NAME,
-            }
-        ).encode("utf-8")
-
-        request = urllib.request.Request(
-            SMS_URL,
-            data=payload,
-            method="POST",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {settings.TAQNYAT_BEARER_TOKEN}",
-            },
-        )
+        payload = {
+            "recipients": [format_phone_for_taqnyat(phone_number)],
+            "body": body_text,
+            "sender": settings.TAQNYAT_SENDER_NAME,
+        }
+
+        try:
+            response = post_json(SMS_URL, payload, rate_limited=True)
+        except requests.RequestException as exc:
+            logger.error("Taqnyat SMS error: %s", exc)
+            return False, f"Failed to send SMS: {exc}", None
+
+        raw = response.text
+        if response.status_code >= 400:
+            logger.error("Taqnyat SMS HTTP error: %s - %s", response.status_code, raw)
+            return False, f"Failed to send SMS: HTTP {response.status_code}", None
 
         try:
-            with urllib.request.urlopen(request, timeout=15) as response:
-                raw = response.read().decode("utf-8")
-                parsed = json.loads(raw)
-        except urllib.error.HTTPError as exc:
-            raw = exc.read().decode("utf-8") if exc.fp else str(exc)
-            logger.error("Taqnyat SMS HTTP error: %s - %s", exc.code, raw)
-            return False, f"Failed to send SMS: HTTP {exc.code}", None
-        except (urllib.error.URLError, json.JSONDecodeError) as exc:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError as exc:
             logger.error("Taqnyat SMS error: %s", exc)
             return False, f"Failed to send SMS: {exc}", None
 
@@ -270,6 +255,29 @@ class TaqnyatSMSService:
         error_message = parsed.get("message", "Unknown error") if isinstance(parsed, dict) else raw
         return False, f"Failed to send SMS: {error_message}", None
 
+    @staticmethod
+    def send_many(messages) -> list[tuple[bool, str, str | None]]:
+        """
+        Send a batch of ``SMSMessage`` concurrently, within the rate limit.
+
+        Returns one ``send_sms`` result per message, in input order. A message
+        that raises is reported as failed; the rest of the batch still goes out.
+        """
+        return list(TaqnyatSMSService.iter_many(messages))
+
+    @staticmethod
+    def iter_many(messages):
+        """Like ``send_many``, but yields each result as soon as it and all earlier ones are in."""
+        return iter_concurrently(TaqnyatSMSService._send_batch_message, messages)
+
+    @staticmethod
+    def _send_batch_message(message: SMSMessage) -> tuple[bool, str, str | None]:
+        try:
+            return TaqnyatSMSService.send_sms(message.phone_number, message.body)
+        except Exception as exc:
+            logger.exception("Taqnyat SMS batch send failed for %s", message.phone_number)
+            return False, f"Failed to send SMS: {exc}", None
+
     @staticmethod
     def send_otp_sms(phone_number: str, otp_code: str) -> tuple[bool, str]:
         body_text = (
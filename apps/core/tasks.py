@@ -58,3 +58,31 @@ def send_verification_code_task(phone_number, locale='ar', verification_id=None)
     except Exception as e:
         logger.error(f"Error in send_verification_code_task: {str(e)}")
         return False
+
+
+@shared_task(name="apps.core.tasks.generate_image_variants_task")
+def generate_image_variants_task(name):
+    """Background task to build the named size variants of an uploaded image."""
+    from .image_variants import generate_image_variants
+
+    try:
+        results = generate_image_variants(name)
+        return all(results.values())
+    except Exception as e:
+        logger.error(f"Error in generate_image_variants_task for {name}: {str(e)}")
+        return False
+
+
+@shared_task(name="apps.core.tasks.process_outbox_task")
+def process_outbox_task(batch_size=None):
+    """Background task to run outbox consumers over every due event."""
+    from .outbox import OUTBOX_BATCH_SIZE, drain
+
+    try:
+        processed, failed = drain(batch_size=batch_size or OUTBOX_BATCH_SIZE)
+        if failed:
+            logger.warning(f"Outbox run processed {processed} events, {failed} failed")
+        return processed
+    except Exception as e:
+        logger.error(f"Error in process_outbox_task: {str(e)}")
+        return 0
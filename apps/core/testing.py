@@ -0,0 +1,93 @@
+"""Local HTTP stand-in for third-party APIs in tests."""
+import json
+import threading
+import time
+from collections import deque, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+StubRequest = namedtuple('StubRequest', ('method', 'path', 'headers', 'body', 'client_port'))
+
+
+class StubServer:
+    """
+    Serve scripted responses on 127.0.0.1 from a background thread.
+
+        with StubServer() as server:
+            server.respond(201, {'statusCode': 201})
+            requests.post(server.url('/v1/messages'), json={...})
+        server.requests  # [StubRequest, ...]
+
+    Queued responses are served in order, then ``default`` repeats. A response
+    may be a callable taking the StubRequest and returning ``(status, body)``.
+    ``delay`` holds a response back, to exercise timeouts. Connections are
+    kept alive, so ``connection_count`` shows whether a client reuses them.
+    """
+
+    def __init__(self, default=(200, {})):
+        self.default = default
+        self.requests = []
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    def respond(self, status, body=None, headers=None, delay=0):
+        self._queue.append((status, body, headers, delay))
+
+    def url(self, path=''):
+        host, port = self._httpd.server_address
+        return f'http://{host}:{port}{path}'
+
+    @property
+    def connection_count(self):
+        return len({request.client_port for request in self.requests})
+
+    def _next_response(self, request):
+        with self._lock:
+            self.requests.append(request)
+            spec = self._queue.popleft() if self._queue else self.default
+        if callable(spec):
+            spec = spec(request)
+        status, body, headers, delay = (tuple(spec) + (None, None, 0))[:4]
+        return status, body, headers or {}, delay or 0
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    body = raw.decode('utf-8', 'replace')
+                request = StubRequest(self.command, self.path, dict(self.headers), body, self.client_address[1])
+                status, payload, headers, delay = stub._next_response(request)
+                if delay:
+                    time.sleep(delay)
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        # Clients that time out close the socket before a delayed response is written.
+        self._httpd.handle_error = lambda request, client_address: None
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._httpd.shutdown()
+        self._httpd.server_close()
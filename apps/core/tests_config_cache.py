@@ -0,0 +1,88 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.core import config_cache
+from apps.core.models import SystemSettings
+from apps.documents.layout import resolve_layout
+from apps.documents.measurement_config import build_pdf_field_map
+from apps.documents.models import PdfDocumentTemplate
+from zthob import middleware
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ConfigCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        config_cache.clear_config_cache()
+
+    def tearDown(self):
+        config_cache.clear_config_cache()
+
+    def test_settings_are_memoized_until_a_save_bumps_the_version(self):
+        # An existing row; bulk_create skips the signals, as if saved by an earlier deploy.
+        SystemSettings.objects.bulk_create([SystemSettings()])
+        settings_obj = SystemSettings.get_active_settings()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIs(SystemSettings.get_active_settings(), settings_obj)
+        self.assertEqual(len(queries), 0)
+
+        settings_obj.tax_rate = Decimal('0.20')
+        settings_obj.save()
+        self.assertEqual(SystemSettings.get_active_settings().tax_rate, Decimal('0.20'))
+
+    def test_version_is_read_once_per_request(self):
+        loads = []
+        request = SimpleNamespace()
+        token = middleware._request_context.set(request)
+        try:
+            for _ in range(3):
+                config_cache.get_config('test:value', lambda: loads.append(1) or len(loads))
+            # Another process bumps the version mid-request; this request keeps its snapshot.
+            cache.set(config_cache.CONFIG_VERSION_CACHE_KEY, 'other-process')
+            self.assertEqual(config_cache.get_config('test:value', lambda: 99), 1)
+        finally:
+            middleware._request_context.reset(token)
+
+        middleware._request_context.set(SimpleNamespace())
+        try:
+            self.assertEqual(config_cache.get_config('test:value', lambda: 99), 99)
+        finally:
+            middleware._request_context.set(None)
+        self.assertEqual(len(loads), 1)
+
+    def test_field_map_copies_are_independent(self):
+        field_map = build_pdf_field_map()
+        if not field_map:
+            self.skipTest('No measurement template was seeded')
+        name = next(iter(field_map))
+        field_map[name]['pdf_grid_row'] = 99
+        self.assertNotEqual(build_pdf_field_map()[name]['pdf_grid_row'], 99)
+
+    def test_layout_follows_template_changes(self):
+        layout = resolve_layout()
+        self.assertIs(resolve_layout(), layout)
+        template = PdfDocumentTemplate.objects.filter(is_active=True).first()
+        if template is None:
+            self.skipTest('No document template was seeded')
+        template.name = 'Renamed receipt'
+        template.save()
+        self.assertIsNot(resolve_layout(), layout)
+
+    def test_values_loaded_before_commit_are_not_memoized(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            template = PdfDocumentTemplate.objects.filter(is_active=True).first()
+            if template is None:
+                self.skipTest('No document template was seeded')
+            template.save()
+            self.assertIsNot(resolve_layout(), resolve_layout())
+        self.assertEqual(len(callbacks), 1)
+
+    def test_lru_drops_oldest_entries(self):
+        for index in range(config_cache.CONFIG_CACHE_MAX_ENTRIES + 1):
+            config_cache.get_config(f'test:{index}', lambda index=index: index)
+        self.assertEqual(config_cache.get_config('test:0', lambda: 'reloaded'), 'reloaded')
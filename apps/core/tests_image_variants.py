@@ -0,0 +1,122 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from apps.core import image_variants
+from apps.core.image_variants import (
+    generate_image_variant,
+    image_variant_path,
+    image_variant_url,
+    variant_name,
+)
+from apps.orders.models import CustomerFabricImage
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix='zthob-image-variants-test-')
+
+
+def _image_bytes(size, mode='RGB', fmt='JPEG'):
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 30, 30, 128) if mode == 'RGBA' else (200, 30, 30)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+@override_settings(MEDIA_ROOT=_MEDIA_ROOT)
+class ImageVariantTests(TestCase):
+    def setUp(self):
+        os.makedirs(os.path.join(_MEDIA_ROOT, 'customer_fabrics'), exist_ok=True)
+        self.name = 'customer_fabrics/large.jpg'
+        with open(os.path.join(_MEDIA_ROOT, self.name), 'wb') as handle:
+            handle.write(_image_bytes((2400, 1600)))
+
+    def tearDown(self):
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def test_variant_is_bounded_and_mirrors_original_path(self):
+        derived = generate_image_variant(self.name, 'pdf')
+        self.assertEqual(derived, 'image_variants/pdf/customer_fabrics/large.jpg')
+        with Image.open(os.path.join(_MEDIA_ROOT, derived)) as image:
+            self.assertEqual(max(image.size), 600)
+            self.assertEqual(image.format, 'JPEG')
+
+    def test_png_with_alpha_stays_png(self):
+        name = 'customer_fabrics/style.png'
+        with open(os.path.join(_MEDIA_ROOT, name), 'wb') as handle:
+            handle.write(_image_bytes((900, 900), mode='RGBA', fmt='PNG'))
+        derived = generate_image_variant(name, 'list')
+        with Image.open(os.path.join(_MEDIA_ROOT, derived)) as image:
+            self.assertEqual(image.format, 'PNG')
+            self.assertEqual(image.mode, 'RGBA')
+            self.assertEqual(image.size, (320, 320))
+
+    def test_originals_differing_only_in_extension_get_their_own_variants(self):
+        names = [f'customer_fabrics/large{ext}' for ext in ('.jpg', '.jpeg', '.webp', '.JPG', '.gif')]
+        self.assertEqual(
+            [variant_name(name, 'pdf') for name in names],
+            [
+                'image_variants/pdf/customer_fabrics/large.jpg',
+                'image_variants/pdf/customer_fabrics/large.jpeg.jpg',
+                'image_variants/pdf/customer_fabrics/large.webp.jpg',
+                'image_variants/pdf/customer_fabrics/large.JPG.jpg',
+                'image_variants/pdf/customer_fabrics/large.gif.png',
+            ],
+        )
+
+    def test_pdf_path_is_generated_once_then_reused(self):
+        source = os.path.join(_MEDIA_ROOT, self.name)
+        with mock.patch('apps.core.image_variants._encode', wraps=image_variants._encode) as encode:
+            first = image_variant_path(source)
+            second = image_variant_path(source)
+        self.assertEqual(first, second)
+        self.assertEqual(encode.call_count, 1)
+        self.assertTrue(first.endswith(variant_name(self.name, 'pdf')))
+
+    def test_paths_outside_media_and_unreadable_files_are_returned_unchanged(self):
+        self.assertEqual(image_variant_path('/etc/hostname'), '/etc/hostname')
+        broken = os.path.join(_MEDIA_ROOT, 'customer_fabrics/broken.jpg')
+        with open(broken, 'wb') as handle:
+            handle.write(b'not an image')
+        self.assertEqual(image_variant_path(broken), broken)
+
+    def test_url_falls_back_to_original_until_variant_exists(self):
+        self.assertEqual(image_variant_url(None, self.name, 'list'), f'/api/media/{self.name}')
+        generate_image_variant(self.name, 'list')
+        self.assertEqual(
+            image_variant_url(None, self.name, 'list'),
+            '/api/media/image_variants/list/customer_fabrics/large.jpg',
+        )
+
+    @mock.patch('apps.core.tasks.generate_image_variants_task.delay')
+    def test_upload_schedules_variant_build_after_commit(self, delay):
+        user = User.objects.create_user(username='variant_uploader', password='testpass123')
+        with self.captureOnCommitCallbacks(execute=True):
+            image = CustomerFabricImage.objects.create(
+                uploaded_by=user,
+                image=SimpleUploadedFile('fabric.jpg', _image_bytes((800, 600)), content_type='image/jpeg'),
+            )
+        delay.assert_called_once_with(image.image.name)
+
+    @mock.patch('apps.core.tasks.generate_image_variants_task.delay')
+    def test_only_a_changed_file_schedules_another_build(self, delay):
+        user = User.objects.create_user(username='variant_editor', password='testpass123')
+        image = CustomerFabricImage.objects.create(
+            uploaded_by=user,
+            image=SimpleUploadedFile('fabric.jpg', _image_bytes((800, 600)), content_type='image/jpeg'),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CustomerFabricImage.objects.get(pk=image.pk).save()
+        delay.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.image = SimpleUploadedFile('other.jpg', _image_bytes((800, 600)), content_type='image/jpeg')
+            image.save()
+        delay.assert_called_once_with(image.image.name)
@@ -0,0 +1,118 @@
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.core import outbox
+from apps.core.models import OutboxEvent
+from apps.deliveries.models import DeliveryTracking
+from apps.finance.models import RiderWallet
+from apps.orders.models import ORDER_SAVED_TOPIC, Order
+
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class OrderSavedOutboxTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='outbox_customer', password='testpass123', role='USER',
+        )
+        self.tailor = User.objects.create_user(
+            username='outbox_tailor', password='testpass123', role='TAILOR',
+        )
+        self.rider = User.objects.create_user(
+            username='outbox_rider', password='testpass123', role='RIDER',
+        )
+
+    def _delivered_order(self):
+        return Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            rider=self.rider,
+            assigned_rider=self.rider,
+            delivery_rider=self.rider,
+            service_mode='home_delivery',
+            status='delivered',
+            payment_status='paid',
+            subtotal=Decimal('100.00'),
+            delivery_fee=Decimal('25.00'),
+            total_amount=Decimal('125.00'),
+        )
+
+    def _pending_events(self, order):
+        return OutboxEvent.objects.filter(
+            topic=ORDER_SAVED_TOPIC, key=str(order.pk), status=OutboxEvent.STATUS_PENDING,
+        )
+
+    def test_save_publishes_event_instead_of_crediting_inline(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            order = self._delivered_order()
+
+        self.assertEqual(self._pending_events(order).count(), 1)
+        self.assertFalse(RiderWallet.objects.filter(rider=self.rider).exists())
+        # Other receivers (e.g. the tailor dashboard cache) also run on commit.
+        self.assertEqual(callbacks.count(outbox.schedule_consumer), 1)
+
+    def test_repeated_saves_collapse_into_one_pending_event(self):
+        order = self._delivered_order()
+        for note in ('first', 'second', 'third'):
+            order.notes = note
+            order.save()
+
+        self.assertEqual(self._pending_events(order).count(), 1)
+
+    def test_drain_runs_finance_and_tracking_consumers_once(self):
+        order = self._delivered_order()
+
+        self.assertEqual(outbox.drain(), (1, 0))
+
+        wallet = RiderWallet.objects.get(rider=self.rider)
+        self.assertEqual(wallet.available_balance, Decimal('25.00'))
+        self.assertTrue(DeliveryTracking.objects.filter(order=order).exists())
+        self.assertFalse(self._pending_events(order).exists())
+        self.assertEqual(
+            OutboxEvent.objects.get(key=str(order.pk)).status,
+            OutboxEvent.STATUS_DONE,
+        )
+
+        order.save()
+        outbox.drain()
+        wallet.refresh_from_db()
+        self.assertEqual(wallet.available_balance, Decimal('25.00'))
+
+    def test_failed_event_is_retried_later(self):
+        order = self._delivered_order()
+
+        with mock.patch(
+            'apps.finance.signals.WalletService.process_order_earning',
+            side_effect=RuntimeError('wallet locked'),
+        ):
+            self.assertEqual(outbox.drain(), (0, 1))
+
+        event = OutboxEvent.objects.get(key=str(order.pk))
+        self.assertEqual(event.status, OutboxEvent.STATUS_PENDING)
+        self.assertEqual(event.attempts, 1)
+        self.assertIn('wallet locked', event.last_error)
+        # Backoff keeps it out of the next run; an order save in the meantime
+        # is absorbed by the already pending event.
+        self.assertEqual(outbox.drain(), (0, 0))
+        order.save()
+        self.assertEqual(self._pending_events(order).count(), 1)
+
+    def test_command_processes_pending_events(self):
+        self._delivered_order()
+        out = StringIO()
+
+        call_command('process_outbox', purge_days=0, stdout=out)
+
+        self.assertIn('Processed 1 outbox events, 0 failed', out.getvalue())
+        self.assertIn('Purged 1 processed outbox events', out.getvalue())
+        self.assertFalse(OutboxEvent.objects.exists())
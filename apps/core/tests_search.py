@@ -0,0 +1,26 @@
+from django.test import SimpleTestCase
+
+from apps.core.search import is_phone_term, normalize_search_text, phone_search_digits
+
+
+class SearchKeyNormalizationTest(SimpleTestCase):
+    def test_arabic_variants_and_diacritics_fold_together(self):
+        self.assertEqual(normalize_search_text('أَحْمَد'), normalize_search_text('احمد'))
+        self.assertEqual(normalize_search_text('إيمان'), 'ايمان')
+        self.assertEqual(normalize_search_text('فاطمة'), 'فاطمه')
+        self.assertEqual(normalize_search_text('مصطفى'), 'مصطفي')
+        self.assertEqual(normalize_search_text('محـــمد'), 'محمد')
+
+    def test_latin_case_whitespace_and_digits(self):
+        self.assertEqual(normalize_search_text('  Khalid   AL-Harbi '), 'khalid al-harbi')
+        self.assertEqual(normalize_search_text('طلب ٠٠١٢٣'), 'طلب 00123')
+        self.assertEqual(normalize_search_text(None), '')
+
+    def test_phone_digits_are_local(self):
+        self.assertEqual(phone_search_digits('+966 55 123 4567'), '0551234567')
+        self.assertEqual(phone_search_digits('00966551234567'), '0551234567')
+        self.assertEqual(phone_search_digits('551234567'), '0551234567')
+        self.assertEqual(phone_search_digits('+966 55 12'), '05512')
+        self.assertEqual(phone_search_digits('٠٥٥١'), '0551')
+        self.assertTrue(is_phone_term('+966 (55) 12-3'))
+        self.assertFalse(is_phone_term('khalid 55'))
@@ -0,0 +1,138 @@
+import time
+from unittest.mock import patch
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from apps.core import sms_dispatch
+from apps.core.taqnyat_service import SMSMessage, TaqnyatSMSService, TaqnyatVerifyService
+from apps.core.testing import StubServer
+
+
+@override_settings(
+    TAQNYAT_BEARER_TOKEN='test_token',
+    TAQNYAT_SENDER_NAME='TestSender',
+    TAQNYAT_SMS_RATE_PER_SECOND=0,
+    TAQNYAT_SMS_MAX_WORKERS=4,
+    TAQNYAT_SMS_MAX_RETRIES=2,
+    TAQNYAT_READ_TIMEOUT_SECONDS=1,
+)
+class SMSDispatchTest(SimpleTestCase):
+    def setUp(self):
+        sms_dispatch.reset_dispatcher()
+        self.server = StubServer(default=(201, {'statusCode': 201, 'messageId': 'msg-1'}))
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        self.addCleanup(sms_dispatch.reset_dispatcher)
+        for name, path in (('SMS_URL', '/v1/messages'), ('VERIFY_URL', '/verify.php')):
+            patcher = patch(f'apps.core.taqnyat_service.{name}', self.server.url(path))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(sms_dispatch, 'RETRY_BACKOFF_SECONDS', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sends_reuse_one_pooled_connection(self):
+        for _ in range(3):
+            success, _message, message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+            self.assertTrue(success)
+            self.assertEqual(message_id, 'msg-1')
+        TaqnyatVerifyService._post_verify({'requestId': 'r-1'})
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.server.connection_count, 1)
+        request = self.server.requests[0]
+        self.assertEqual(request.headers['Authorization'], 'Bearer test_token')
+        self.assertEqual(request.body['recipients'], ['966501234567'])
+        self.assertEqual(request.body['sender'], 'TestSender')
+
+    def test_throttled_and_unavailable_responses_are_retried(self):
+        self.server.respond(429, {}, headers={'Retry-After': '0'})
+        self.server.respond(503, {})
+
+        success, _message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+
+        self.assertTrue(success)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_retries_stop_at_the_configured_limit(self):
+        for _ in range(3):
+            self.server.respond(503, {})
+
+        success, message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+
+        self.assertFalse(success)
+        self.assertIn('HTTP 503', message)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_gateway_errors_the_provider_may_have_acted_on_are_not_retried(self):
+        for status_code in (502, 504, 500):
+            self.server.respond(status_code, {})
+            success, message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+            self.assertFalse(success)
+            self.assertIn(f'HTTP {status_code}', message)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_only_failures_before_sending_are_retried(self):
+        refused = requests.ConnectionError(
+            MaxRetryError(None, '/v1/messages', NewConnectionError(None, 'Connection refused')),
+        )
+        reset = requests.ConnectionError(ProtocolError('Connection aborted.', ConnectionResetError()))
+        session = sms_dispatch.get_session()
+
+        with patch.object(session, 'post', side_effect=[requests.ConnectTimeout(), refused, reset]) as post:
+            success, _message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+        self.assertFalse(success)
+        self.assertEqual(post.call_count, 3)
+
+        with patch.object(session, 'post', side_effect=[reset]) as post:
+            with self.settings(TAQNYAT_SMS_MAX_RETRIES=5):
+                success, _message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+        self.assertFalse(success)
+        self.assertEqual(post.call_count, 1)
+
+    def test_read_timeout_is_not_retried(self):
+        self.server.respond(201, {'statusCode': 201}, delay=1.5)
+
+        success, _message, _message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello')
+
+        self.assertFalse(success)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_send_many_runs_concurrently_and_keeps_order(self):
+        def echo(request):
+            return 201, {'statusCode': 201, 'messageId': request.body['body']}, None, 0.3
+
+        self.server.default = echo
+        messages = [SMSMessage('0501234567', f'message {index}') for index in range(4)]
+
+        started = time.monotonic()
+        results = TaqnyatSMSService.send_many(messages)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual([message_id for _ok, _msg, message_id in results], [m.body for m in messages])
+
+    @staticmethod
+    def _send_or_crash(phone_number, body):
+        if phone_number == 'crash':
+            raise ValueError('bad number')
+        return True, 'ok', 'msg-2'
+
+    def test_send_many_reports_a_crashing_message_and_sends_the_rest(self):
+        with patch.object(TaqnyatSMSService, 'send_sms', side_effect=self._send_or_crash):
+            results = TaqnyatSMSService.send_many([SMSMessage('crash', 'Hello'), SMSMessage('0501234567', 'Hello')])
+
+        self.assertFalse(results[0][0])
+        self.assertTrue(results[1][0])
+
+
+class TokenBucketTest(SimpleTestCase):
+    def test_acquire_waits_once_the_burst_is_spent(self):
+        bucket = sms_dispatch.TokenBucket(rate=20, capacity=2)
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        # Two tokens are free; the other four arrive at 20 per second.
+        self.assertGreaterEqual(time.monotonic() - started, 0.18)
@@ -12,6 +12,7 @@ from apps.tailors.serializers.catalog import (
 from apps.tailors.services.stitching_time import get_average_stitching_time_stats
 from apps.core.media_utils import build_public_media_url
 from apps.customers.models import Address, CustomerProfile, FamilyMember, FabricFavorite
+from apps.customers.services.favorites import get_favorite_fabric_ids
 
 # ============================================================================
 # LIGHTWEIGHT HOME SERIALIZERS (OPTIMIZED FOR PERFORMANCE)
@@ -162,7 +163,7 @@ class FabricCatalogSerializer(serializers.ModelSerializer):
     country = FabricCountryBasicSerializer(read_only=True)
     tags = FabricTagBasicSerializer(many=True, read_only=True)
     tailor = TailorHomeSerializer(read_only=True)
-    is_favorited = serializers.BooleanField(read_only=True, default=False)
+    is_favorited = serializers.SerializerMethodField()
     favorite_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
@@ -193,6 +194,16 @@ class FabricCatalogSerializer(serializers.ModelSerializer):
             "is_favorited",
             "favorite_count",
         ]
+
+    def get_is_favorited(self, obj) -> bool:
+        """Membership in the requesting user's cached favorite set (one lookup per response)."""
+        root = self.root
+        favorite_ids = getattr(root, '_favorite_fabric_ids', None)
+        if favorite_ids is None:
+            request = self.context.get('request')
+            favorite_ids = get_favorite_fabric_ids(getattr(request, 'user', None))
+            root._favorite_fabric_ids = favorite_ids
+        return obj.pk in favorite_ids
     
 
 class AddressSerializer(serializers.ModelSerializer):
@@ -0,0 +1,227 @@
+"""Catalog search over Fabric.search_document with facet counts.
+
+Every word of the query must appear in the fabric's normalized search
+document (name, category, type, country, tags, SKU, description; Arabic and
+English). Facets are counted over the search results with every other
+filter applied, so selecting a category still shows the other categories'
+counts. On PostgreSQL the document has a pg_trgm GIN index.
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.db import connection
+from django.db.models import Case, Count, Exists, FloatField, IntegerField, OuterRef, Prefetch, Q, Value, When
+
+from apps.core.search import (
+    RANK_CONTAINS,
+    RANK_EXACT,
+    RANK_PREFIX,
+    RANK_WORD_PREFIX,
+    normalize_search_text,
+    similarity_rank,
+)
+from apps.customers.models import Address
+from apps.tailors.models import Fabric, FabricCategory, FabricCountry, FabricType
+
+# (key, min price inclusive, max price exclusive), SAR.
+PRICE_BANDS = (
+    ('under_100', None, Decimal('100')),
+    ('100_200', Decimal('100'), Decimal('200')),
+    ('200_400', Decimal('200'), Decimal('400')),
+    ('400_plus', Decimal('400'), None),
+)
+PRICE_BAND_KEYS = tuple(key for key, _, _ in PRICE_BANDS)
+
+SORT_ORDERS = {
+    'relevance': ('search_rank', '-search_similarity', '-sales_count', '-created_at', '-id'),
+    'newest': ('-created_at', '-id'),
+    'price_asc': ('price', '-id'),
+    'price_desc': ('-price', '-id'),
+    'popular': ('-sales_count', '-created_at', '-id'),
+}
+
+# Tokens matched anywhere, but not as one phrase.
+RANK_TOKENS = RANK_CONTAINS + 1
+
+_ID_FILTERS = {
+    'category': 'category_id__in',
+    'fabric_type': 'fabric_type_id__in',
+    'country': 'country_id__in',
+}
+
+
+def visible_catalog_fabrics():
+    """Fabrics customers may browse: active, approved, from open approved shops."""
+    return Fabric.objects.filter(
+        is_active=True,
+        approval_status='approved',
+        tailor__review__review_status='approved',
+        tailor__shop_status=True,
+        tailor__user__is_active=True,
+    )
+
+
+def with_catalog_details(fabrics):
+    """
+    Joins and prefetches FabricCatalogSerializer reads. favorite_count is a
+    column and is_favorited comes from the user's cached favorite set.
+    """
+    return fabrics.select_related(
+        'category', 'fabric_type', 'country', 'tailor', 'tailor__user'
+    ).prefetch_related(
+        'tags', 'gallery',
+        Prefetch('tailor__user__addresses', queryset=Address.objects.filter(is_default=True)),
+        'tailor__review'
+    )
+
+
+def _ids(raw):
+    values = [part.strip() for part in raw.split(',') if part.strip()]
+    if not all(value.isdigit() for value in values):
+        raise ValueError
+    return [int(value) for value in values]
+
+
+def _price(raw):
+    try:
+        value = Decimal(raw)
+    except InvalidOperation:
+        raise ValueError
+    if not value.is_finite() or value < 0:
+        raise ValueError
+    return value
+
+
+def parse_fabric_search_params(params):
+    """
+    Read search filters from query params.
+    Returns (filters, errors); filters only holds parameters that were given.
+    """
+    filters, errors = {}, {}
+    for name in (*_ID_FILTERS, 'tag'):
+        raw = (params.get(name) or '').strip()
+        if not raw:
+            continue
+        if name == 'tag':
+            filters[name] = [part.strip() for part in raw.split(',') if part.strip()]
+            continue
+        try:
+            filters[name] = _ids(raw)
+        except ValueError:
+            errors[name] = 'Must be a comma-separated list of ids'
+    for name in ('min_price', 'max_price'):
+        raw = (params.get(name) or '').strip()
+        if not raw:
+            continue
+        try:
+            filters[name] = _price(raw)
+        except ValueError:
+            errors[name] = 'Must be a non-negative number'
+    band = (params.get('price_band') or '').strip()
+    if band:
+        if band in PRICE_BAND_KEYS:
+            filters['price_band'] = band
+        else:
+            errors['price_band'] = f"Must be one of: {', '.join(PRICE_BAND_KEYS)}"
+    return filters, errors
+
+
+def _band_q(key):
+    for band_key, low, high in PRICE_BANDS:
+        if band_key == key:
+            condition = Q()
+            if low is not None:
+                condition &= Q(price__gte=low)
+            if high is not None:
+                condition &= Q(price__lt=high)
+            return condition
+    raise KeyError(key)
+
+
+def apply_fabric_filters(fabrics, filters, skip=None):
+    """Apply parsed filters, leaving out the facet named ``skip``."""
+    for name, lookup in _ID_FILTERS.items():
+        if name in filters and name != skip:
+            fabrics = fabrics.filter(**{lookup: filters[name]})
+    if 'tag' in filters:
+        fabrics = fabrics.filter(Exists(
+            Fabric.tags.through.objects.filter(
+                fabric_id=OuterRef('pk'), fabrictag__slug__in=filters['tag'],
+            )
+        ))
+    if 'min_price' in filters:
+        fabrics = fabrics.filter(price__gte=filters['min_price'])
+    if 'max_price' in filters:
+        fabrics = fabrics.filter(price__lte=filters['max_price'])
+    if 'price_band' in filters and skip != 'price_band':
+        fabrics = fabrics.filter(_band_q(filters['price_band']))
+    return fabrics
+
+
+def match_fabric_terms(fabrics, term):
+    """Keep fabrics whose document contains every word of ``term``."""
+    for token in normalize_search_text(term).split():
+        fabrics = fabrics.filter(search_document__contains=token)
+    return fabrics
+
+
+def search_fabrics(fabrics, term):
+    """
+    ``match_fabric_terms`` plus ``search_rank`` (lower is better) and
+    ``search_similarity`` annotations for relevance ordering.
+    """
+    term = normalize_search_text(term)
+    if not term:
+        return fabrics.annotate(
+            search_rank=Value(RANK_EXACT, output_field=IntegerField()),
+            search_similarity=Value(0.0, output_field=FloatField()),
+        )
+    # The document starts with the fabric name, so a document prefix is a name prefix.
+    return match_fabric_terms(fabrics, term).annotate(
+        search_rank=Case(
+            When(search_document=term, then=Value(RANK_EXACT)),
+            When(search_document__startswith=term, then=Value(RANK_PREFIX)),
+            When(search_document__contains=f' {term}', then=Value(RANK_WORD_PREFIX)),
+            When(search_document__contains=term, then=Value(RANK_CONTAINS)),
+            default=Value(RANK_TOKENS),
+            output_field=IntegerField(),
+        ),
+        search_similarity=similarity_rank(connection, 'search_document', term),
+    )
+
+
+def _counts(fabrics, field):
+    rows = fabrics.order_by().values(field).annotate(count=Count('pk'))
+    return {row[field]: row['count'] for row in rows if row[field] is not None}
+
+
+def _lookup_facet(model, counts, *fields):
+    objects = model.objects.filter(pk__in=counts).values('id', *fields)
+    facet = [{**obj, 'count': counts[obj['id']]} for obj in objects]
+    facet.sort(key=lambda item: (-item['count'], item['name']))
+    return facet
+
+
+def fabric_facets(fabrics, filters):
+    """
+    Facet counts for ``fabrics`` (matched by ``match_fabric_terms``, not yet filtered):
+    category, fabric type, country and price band.
+    """
+    category = _counts(apply_fabric_filters(fabrics, filters, skip='category'), 'category_id')
+    fabric_type = _counts(apply_fabric_filters(fabrics, filters, skip='fabric_type'), 'fabric_type_id')
+    country = _counts(apply_fabric_filters(fabrics, filters, skip='country'), 'country_id')
+    bands = apply_fabric_filters(fabrics, filters, skip='price_band').aggregate(**{
+        key: Count('pk', filter=_band_q(key)) for key in PRICE_BAND_KEYS
+    })
+    return {
+        'category': _lookup_facet(FabricCategory, category, 'name', 'slug'),
+        'fabric_type': _lookup_facet(FabricType, fabric_type, 'name', 'slug'),
+        'country': _lookup_facet(FabricCountry, country, 'name', 'name_ar', 'code'),
+        'price_band': [
+            {'key': key, 'min': low, 'max': high, 'count': bands[key]}
+            for key, low, high in PRICE_BANDS
+        ],
+    }
+
+
+def sorted_fabrics(fabrics, sort):
+    return fabrics.order_by(*SORT_ORDERS[sort])
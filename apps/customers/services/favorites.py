@@ -0,0 +1,30 @@
+"""Cached per-user favorite fabric ids for catalog pages."""
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.customers.models import FabricFavorite
+
+FAVORITE_FABRIC_IDS_CACHE_TTL = 60 * 60 * 24
+
+
+def favorite_fabric_ids_cache_key(user_id):
+    return f'customers:favorite_fabric_ids:{user_id}'
+
+
+def get_favorite_fabric_ids(user):
+    """Ids of the fabrics ``user`` has favorited; empty for anonymous users."""
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    key = favorite_fabric_ids_cache_key(user.pk)
+    ids = cache.get(key)
+    if ids is None:
+        ids = frozenset(FabricFavorite.objects.filter(user=user).values_list('fabric_id', flat=True))
+        cache.set(key, ids, FAVORITE_FABRIC_IDS_CACHE_TTL)
+    return ids
+
+
+def invalidate_favorite_fabric_ids(user_id):
+    """Drop the cached set now and again after commit, so a concurrent read cannot re-cache stale ids."""
+    key = favorite_fabric_ids_cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,25 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.customers.models import FabricFavorite
+from apps.customers.services.favorites import invalidate_favorite_fabric_ids
+from apps.tailors.models import Fabric
+
+
+@receiver(post_save, sender=FabricFavorite)
+def count_fabric_favorite(sender, instance, created, raw=False, **kwargs):
+    """Keep Fabric.favorite_count and the user's cached favorite set in step."""
+    if not created or raw:
+        return
+    Fabric.objects.filter(pk=instance.fabric_id).update(favorite_count=F('favorite_count') + 1)
+    invalidate_favorite_fabric_ids(instance.user_id)
+
+
+@receiver(post_delete, sender=FabricFavorite)
+def uncount_fabric_favorite(sender, instance, **kwargs):
+    Fabric.objects.filter(pk=instance.fabric_id).update(
+        favorite_count=Greatest(F('favorite_count') - 1, 0),
+    )
+    invalidate_favorite_fabric_ids(instance.user_id)
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.customers.models import FabricFavorite
+from apps.tailors.models import Fabric, TailorProfile, TailorProfileReview
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class FabricFavoriteCountTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.customer = User.objects.create_user(username='favorite_count_customer', role='USER')
+        self.other_customer = User.objects.create_user(username='favorite_count_other', role='USER')
+        tailor = User.objects.create_user(username='favorite_count_tailor', role='TAILOR')
+        tailor_profile, _ = TailorProfile.objects.get_or_create(user=tailor)
+        tailor_profile.shop_status = True
+        tailor_profile.save(update_fields=['shop_status'])
+        TailorProfileReview.objects.update_or_create(
+            profile=tailor_profile, defaults={'review_status': 'approved'},
+        )
+        self.fabric = Fabric.objects.create(
+            tailor=tailor_profile, name='Favorite Fabric', price=Decimal('100.00'), approval_status='approved',
+        )
+        self.client.force_authenticate(user=self.customer)
+
+    def _catalog_entry(self):
+        response = self.client.get('/api/customers/allfabrics/')
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data['data']['results'][0]
+
+    def test_toggle_maintains_count_and_cached_favorite_set(self):
+        FabricFavorite.objects.create(user=self.other_customer, fabric=self.fabric)
+        entry = self._catalog_entry()
+        self.assertEqual((entry['favorite_count'], entry['is_favorited']), (1, False))
+
+        response = self.client.post(f'/api/customers/fabrics/{self.fabric.id}/favorite/')
+        self.assertEqual(response.data['data']['favorite_count'], 2)
+        entry = self._catalog_entry()
+        self.assertEqual((entry['favorite_count'], entry['is_favorited']), (2, True))
+
+        response = self.client.post(f'/api/customers/fabrics/{self.fabric.id}/favorite/')
+        self.assertEqual(response.data['data']['favorite_count'], 1)
+        entry = self._catalog_entry()
+        self.assertEqual((entry['favorite_count'], entry['is_favorited']), (1, False))
+
+    def test_unrelated_full_save_keeps_the_count(self):
+        stale = Fabric.objects.get(pk=self.fabric.pk)
+        FabricFavorite.objects.create(user=self.other_customer, fabric=self.fabric)
+
+        # e.g. the tailor edits the fabric from an instance loaded before the favorite.
+        stale.name = 'Renamed Fabric'
+        stale.save()
+
+        self.fabric.refresh_from_db()
+        self.assertEqual((self.fabric.name, self.fabric.favorite_count), ('Renamed Fabric', 1))
+
+    def test_deleting_a_user_uncounts_their_favorites(self):
+        FabricFavorite.objects.create(user=self.other_customer, fabric=self.fabric)
+        self.other_customer.delete()
+        self.fabric.refresh_from_db()
+        self.assertEqual(self.fabric.favorite_count, 0)
+
+    def test_catalog_page_reads_favorites_from_cache(self):
+        FabricFavorite.objects.create(user=self.customer, fabric=self.fabric)
+        self.assertTrue(self._catalog_entry()['is_favorited'])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(self._catalog_entry()['is_favorited'])
+        self.assertFalse([q['sql'] for q in queries if 'customers_fabricfavorite' in q['sql']])
@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.tailors.models import (
+    Fabric,
+    FabricCategory,
+    FabricCountry,
+    FabricTag,
+    FabricType,
+    TailorProfile,
+    TailorProfileReview,
+)
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class FabricSearchAPITest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        tailor = User.objects.create_user(username='fabric_search_tailor', role='TAILOR')
+        self.tailor_profile, _ = TailorProfile.objects.get_or_create(user=tailor)
+        self.tailor_profile.shop_status = True
+        self.tailor_profile.save(update_fields=['shop_status'])
+        TailorProfileReview.objects.update_or_create(
+            profile=self.tailor_profile, defaults={'review_status': 'approved'},
+        )
+        self.summer = FabricCategory.objects.create(name='Summer', slug='summer')
+        self.winter = FabricCategory.objects.create(name='Winter', slug='winter')
+        self.cotton = FabricType.objects.create(name='Cotton', slug='cotton')
+        self.japan, _ = FabricCountry.objects.update_or_create(
+            code='JP', defaults={'name': 'Japan', 'name_ar': 'اليابان'},
+        )
+        self.premium = FabricTag.objects.create(name='Premium', slug='premium')
+
+        self.white = self._fabric('Royal White', '150.00', self.summer, country=self.japan,
+                                  description='Soft breathable cotton')
+        self.white.tags.add(self.premium)
+        self.cream = self._fabric('Cream Linen', '90.00', self.summer)
+        self.wool = self._fabric('Grey Wool', '450.00', self.winter, fabric_type=None)
+        self._fabric('Royal Hidden', '150.00', self.summer, approval_status='pending')
+
+    def _fabric(self, name, price, category, fabric_type=0, country=None, **extra):
+        return Fabric.objects.create(
+            tailor=self.tailor_profile,
+            name=name,
+            price=Decimal(price),
+            category=category,
+            fabric_type=self.cotton if fabric_type == 0 else fabric_type,
+            country=country,
+            approval_status=extra.pop('approval_status', 'approved'),
+            **extra,
+        )
+
+    def _search(self, **params):
+        response = self.client.get('/api/customers/fabrics/search/', params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data['data']
+
+    def test_text_search_matches_all_words_across_fields(self):
+        self.assertEqual([f['id'] for f in self._search(q='royal')['results']], [self.white.id])
+        self.assertEqual([f['id'] for f in self._search(q='اليابان')['results']], [self.white.id])
+        self.assertEqual([f['id'] for f in self._search(q='premium breathable')['results']], [self.white.id])
+        self.assertEqual(self._search(q='premium wool')['count'], 0)
+
+    def test_search_document_follows_tag_and_lookup_renames(self):
+        self.premium.name = 'Luxury'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.premium.save()
+        self.assertEqual([f['id'] for f in self._search(q='luxury')['results']], [self.white.id])
+
+        self.white.tags.remove(self.premium)
+        self.assertEqual(self._search(q='luxury')['count'], 0)
+
+        self.winter.name = 'شتوي'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.winter.save()
+        self.assertEqual([f['id'] for f in self._search(q='شتوى')['results']], [self.wool.id])
+
+    def test_lookup_save_without_a_rename_rebuilds_nothing(self):
+        self.japan.description = 'Known for fine cotton'
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.japan.save()
+            self.summer.save(update_fields=['slug'])
+        self.assertEqual(callbacks, [])
+
+        self.japan.name_ar = 'يابان'
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.japan.save()
+        self.assertEqual(len(callbacks), 1)
+
+    def test_facets_count_other_filters_and_price_range(self):
+        data = self._search(category=self.summer.id)
+        self.assertEqual({f['id'] for f in data['results']}, {self.white.id, self.cream.id})
+        facets = data['facets']
+        self.assertEqual(
+            [(item['id'], item['count']) for item in facets['category']],
+            [(self.summer.id, 2), (self.winter.id, 1)],
+        )
+        self.assertEqual([(item['id'], item['count']) for item in facets['fabric_type']], [(self.cotton.id, 2)])
+        self.assertEqual([(item['code'], item['count']) for item in facets['country']], [('JP', 1)])
+        self.assertEqual(
+            {item['key']: item['count'] for item in facets['price_band']},
+            {'under_100': 1, '100_200': 1, '200_400': 0, '400_plus': 0},
+        )
+
+        data = self._search(min_price='100', sort='price_desc')
+        self.assertEqual([f['id'] for f in data['results']], [self.wool.id, self.white.id])
+        data = self._search(price_band='400_plus')
+        self.assertEqual([f['id'] for f in data['results']], [self.wool.id])
+        self.assertEqual(
+            {item['key']: item['count'] for item in data['facets']['price_band']},
+            {'under_100': 1, '100_200': 1, '200_400': 0, '400_plus': 1},
+        )
+
+    def test_invalid_parameters_are_rejected(self):
+        response = self.client.get('/api/customers/fabrics/search/', {'category': 'abc', 'price_band': 'cheap'})
+        self.assertEqual(response.status_code, 400)
@@ -1,7 +1,7 @@
 from django.urls import path
 
 from apps.core.views import SendOTPView, VerifyOTPView
-from apps.customers.views import AddressListView, AddressCreateView, AddressDetailView, CustomerProfileAPIView, FabricCatalogAPIView, FamilyMemberListView, FamilyMemberDetailView, TailorFabricsAPIView, TailorListAPIView, TailorDetailAPIView, FabricDetailAPIView, FabricFavoriteToggleView, FabricFavoriteListView, CustomerMeasurementsListView, FamilyMemberMeasurementsView, CustomerPreviousTailorsView
+from apps.customers.views import AddressListView, AddressCreateView, AddressDetailView, CustomerProfileAPIView, FabricCatalogAPIView, FabricSearchAPIView, FamilyMemberListView, FamilyMemberDetailView, TailorFabricsAPIView, TailorListAPIView, TailorDetailAPIView, FabricDetailAPIView, FabricFavoriteToggleView, FabricFavoriteListView, CustomerMeasurementsListView, FamilyMemberMeasurementsView, CustomerPreviousTailorsView
 from apps.customers.home_views import CustomerHomeAPIView
 from apps.tailors.views.rating import TailorRatingListView, SubmitTailorRatingView
 
@@ -10,6 +10,7 @@ urlpatterns = [
     path('home/', CustomerHomeAPIView.as_view(), name='customer-home'),
     path('customerprofile/',CustomerProfileAPIView.as_view(),name='customer_profile'),
     path('allfabrics/',FabricCatalogAPIView.as_view(),name='all-fabrics'),
+    path('fabrics/search/', FabricSearchAPIView.as_view(), name='fabric-search'),
     path("addresses/", AddressListView.as_view(), name="address-list"),
     path("addresses/create/", AddressCreateView.as_view(), name="address-create"),
     path("addresses/<int:pk>/", AddressDetailView.as_view(), name="address-detail"),
@@ -20,6 +20,17 @@ from apps.customers.services.home_tailor_sections import (
     is_valid_tailor_section,
     parse_section_geo_params,
 )
+from apps.customers.services.fabric_search import (
+    SORT_ORDERS,
+    apply_fabric_filters,
+    fabric_facets,
+    match_fabric_terms,
+    parse_fabric_search_params,
+    search_fabrics,
+    sorted_fabrics,
+    visible_catalog_fabrics,
+    with_catalog_details,
+)
 from apps.customers.measurement_queries import (
     apply_current_measurements_fallback,
     build_order_measurement_entry,
@@ -32,7 +43,7 @@ from apps.tailors.models import TailorProfile, ServiceArea
 from apps.tailors.serializers import TailorProfileSerializer
 from apps.core.models import Slider
 from apps.core.serializers import SliderSerializer
-from django.db.models import Count, Exists, OuterRef, Prefetch, Avg
+from django.db.models import Prefetch, Avg
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 from zthob.utils import api_response, StandardResultsSetPagination
@@ -61,26 +72,7 @@ class FabricCatalogAPIView(APIView):
     
     def get(self, request):
         """Get all active fabrics with optional geo-radius filtering."""
-        fabrics = Fabric.objects.filter(
-            is_active=True,
-            approval_status='approved',
-            tailor__review__review_status='approved',
-            tailor__shop_status=True,
-            tailor__user__is_active=True
-        ).select_related(
-            'category', 'fabric_type', 'country', 'tailor', 'tailor__user'
-        ).prefetch_related(
-            'tags', 'gallery', 
-            Prefetch('tailor__user__addresses', queryset=Address.objects.filter(is_default=True)),
-            'tailor__review'
-        ).annotate(
-            favorite_count=Count('favorites', distinct=True)
-        ).order_by('-created_at')
-        
-        if request.user.is_authenticated:
-            fabrics = fabrics.annotate(
-                is_favorited=Exists(FabricFavorite.objects.filter(user=request.user, fabric=OuterRef('pk')))
-            )
+        fabrics = with_catalog_details(visible_catalog_fabrics()).order_by('-created_at')
 
         # ── Geo filtering ────────────────────────────────────────────────────
         # Filter fabrics via tailor's existing Address (no new model fields).
@@ -105,8 +97,96 @@ class FabricCatalogAPIView(APIView):
             }
         )
         return paginator.get_paginated_response(serializer.data, message="Fabrics fetched successfully")
- 
- 
+
+
+@extend_schema(
+    tags=["Fabric Catalog"],
+    summary="Search fabric catalog",
+    description=(
+        "Arabic/English text search over fabric name, description, tags, category, type and country, "
+        "with filters and facet counts (category, fabric_type, country, price_band). "
+        "Each facet is counted with all other filters applied. Filters taking ids accept comma-separated lists."
+    ),
+    parameters=[
+        OpenApiParameter('q', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False,
+                         description='Search text; every word must match'),
+        OpenApiParameter('category', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('fabric_type', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('country', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('tag', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False,
+                         description='Tag slugs'),
+        OpenApiParameter('min_price', OpenApiTypes.NUMBER, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('max_price', OpenApiTypes.NUMBER, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('price_band', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False,
+                         description='under_100, 100_200, 200_400 or 400_plus'),
+        OpenApiParameter('tailor', OpenApiTypes.INT, OpenApiParameter.QUERY, required=False,
+                         description='Limit to one tailor (user id)'),
+        OpenApiParameter('sort', OpenApiTypes.STR, OpenApiParameter.QUERY, required=False,
+                         description='relevance (default with q), newest (default), price_asc, price_desc, popular'),
+        OpenApiParameter('lat', OpenApiTypes.FLOAT, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('lng', OpenApiTypes.FLOAT, OpenApiParameter.QUERY, required=False),
+        OpenApiParameter('radius', OpenApiTypes.FLOAT, OpenApiParameter.QUERY, required=False),
+    ],
+    responses={200: FabricCatalogSerializer(many=True)}
+)
+class FabricSearchAPIView(APIView):
+    serializer_class = FabricCatalogSerializer
+    permission_classes = [AllowAny]
+    pagination_class = StandardResultsSetPagination
+
+    def get(self, request):
+        term = (request.query_params.get('q') or '').strip()
+        filters, errors = parse_fabric_search_params(request.query_params)
+        sort = request.query_params.get('sort') or ('relevance' if term else 'newest')
+        if sort not in SORT_ORDERS:
+            errors['sort'] = f"Must be one of: {', '.join(SORT_ORDERS)}"
+        tailor_id = (request.query_params.get('tailor') or '').strip()
+        if tailor_id and not tailor_id.isdigit():
+            errors['tailor'] = 'Must be a tailor id'
+        if errors:
+            return api_response(
+                success=False,
+                message="Invalid search parameters",
+                errors=errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fabrics = visible_catalog_fabrics()
+        if tailor_id:
+            fabrics = fabrics.filter(tailor__user_id=int(tailor_id))
+        lat, lng, radius_km = parse_geo_params(request)
+        if lat is not None:
+            fabrics = fabrics.filter(tailor__user_id__in=get_nearby_user_ids(lat, lng, radius_km))
+        fabrics = match_fabric_terms(fabrics, term)
+
+        facets = fabric_facets(fabrics, filters)
+        results = sorted_fabrics(
+            with_catalog_details(search_fabrics(apply_fabric_filters(fabrics, filters), term)),
+            sort,
+        )
+
+        service_area_names = {sa.id: sa.name for sa in ServiceArea.objects.filter(is_active=True)}
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(results, request)
+        serializer = FabricCatalogSerializer(
+            page,
+            many=True,
+            context={"request": request, "service_area_names": service_area_names},
+        )
+        return api_response(
+            success=True,
+            message="Fabrics fetched successfully",
+            data={
+                'count': paginator.page.paginator.count,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'results': serializer.data,
+                'facets': facets,
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+
 
 
 class FamilyMemberListView(APIView):
@@ -494,14 +574,7 @@ class TailorFabricsAPIView(APIView):
                 'tags', 'gallery',
                 Prefetch('tailor__user__addresses', queryset=Address.objects.filter(is_default=True)),
                 'tailor__review'
-            ).annotate(
-                favorite_count=Count('favorites', distinct=True)
             ).order_by('-created_at')
-
-            if request.user.is_authenticated:
-                fabrics = fabrics.annotate(
-                    is_favorited=Exists(FabricFavorite.objects.filter(user=request.user, fabric=OuterRef('pk')))
-                )
             
             # Add service area names to context
             service_area_names = {sa.id: sa.name for sa in ServiceArea.objects.filter(is_active=True)}
@@ -636,8 +709,6 @@ class FabricDetailAPIView(APIView):
                 'tags', 'gallery',
                 Prefetch('tailor__user__addresses', queryset=Address.objects.filter(is_default=True)),
                 'tailor__review'
-            ).annotate(
-                favorite_count=Count('favorites', distinct=True)
             ).first()
             
             if not fabric:
@@ -648,10 +719,6 @@ class FabricDetailAPIView(APIView):
                     status_code=status.HTTP_404_NOT_FOUND
                 )
 
-            if request.user.is_authenticated:
-                # Add is_favorited manually for single object or re-fetch with annotation
-                fabric.is_favorited = FabricFavorite.objects.filter(user=request.user, fabric=fabric).exists()
-            
             # Add service area names to context
             service_area_names = {sa.id: sa.name for sa in ServiceArea.objects.filter(is_active=True)}
             
@@ -699,7 +766,8 @@ class FabricFavoriteToggleView(APIView):
                         "properties": {
                             "fabric_id": {"type": "integer"},
                             "is_favorited": {"type": "boolean"},
-                            "favorited_at": {"type": "string", "format": "date-time"}
+                            "favorited_at": {"type": "string", "format": "date-time"},
+                            "favorite_count": {"type": "integer"}
                         }
                     }
                 }
@@ -740,6 +808,8 @@ class FabricFavoriteToggleView(APIView):
             is_favorited = True
             message = "Fabric added to favorites"
             favorited_at = favorite.created_at
+        # Counted by the FabricFavorite signals (apps/customers/signals.py).
+        fabric.refresh_from_db(fields=['favorite_count'])
         
         return api_response(
             success=True,
@@ -747,7 +817,8 @@ class FabricFavoriteToggleView(APIView):
             data={
                 "fabric_id": fabric.id,
                 "is_favorited": is_favorited,
-                "favorited_at": favorited_at.isoformat() if favorited_at else None
+                "favorited_at": favorited_at.isoformat() if favorited_at else None,
+                "favorite_count": fabric.favorite_count,
             },
             status_code=status.HTTP_200_OK
         )
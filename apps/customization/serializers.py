@@ -4,6 +4,7 @@ from .models import (
     MeasurementTemplate, MeasurementField
 )
 from zthob.translations import translate_message, get_language_from_request
+from apps.core.image_variants import image_variant_url
 from apps.core.media_utils import build_public_media_url
 from apps.customization.preset_styles import (
     enrich_preset_style,
@@ -18,6 +19,7 @@ class CustomStyleSerializer(serializers.ModelSerializer):
     Translates name based on Accept-Language header.
     """
     image_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
     name = serializers.SerializerMethodField()
     
     class Meta:
@@ -27,6 +29,7 @@ class CustomStyleSerializer(serializers.ModelSerializer):
             'name',
             'code',
             'image_url',
+            'thumbnail_url',
             'description',
             'display_order',
             'extra_price',
@@ -51,6 +54,12 @@ class CustomStyleSerializer(serializers.ModelSerializer):
             return build_public_media_url(request, obj.image.url)
         return None
 
+    def get_thumbnail_url(self, obj):
+        """List-size variant of the style image (original until it is generated)."""
+        if obj.image:
+            return image_variant_url(self.context.get('request'), obj.image, 'list')
+        return None
+
 
 class CustomStyleCategorySerializer(serializers.ModelSerializer):
     """
@@ -95,6 +104,7 @@ class CustomStyleListSerializer(serializers.ModelSerializer):
     Translates name and category_display_name based on Accept-Language header.
     """
     image_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
     name = serializers.SerializerMethodField()
     category_name = serializers.CharField(source='category.name', read_only=True)
     category_display_name = serializers.SerializerMethodField()
@@ -108,6 +118,7 @@ class CustomStyleListSerializer(serializers.ModelSerializer):
             'name',
             'code',
             'image_url',
+            'thumbnail_url',
             'description',
             'display_order',
             'extra_price',
@@ -137,6 +148,12 @@ class CustomStyleListSerializer(serializers.ModelSerializer):
             request = self.context.get('request')
             return build_public_media_url(request, obj.image.url)
         return None
+
+    def get_thumbnail_url(self, obj):
+        """List-size variant of the style image (original until it is generated)."""
+        if obj.image:
+            return image_variant_url(self.context.get('request'), obj.image, 'list')
+        return None
 class UserStylePresetSerializer(serializers.ModelSerializer):
     """
     Serializer for user style presets with expanded style details
@@ -1,20 +1,21 @@
 """
-Signals for delivery tracking.
-Automatically creates tracking when rider is assigned to an order.
+Outbox consumers for delivery tracking.
+Automatically creates tracking when rider is assigned to an order. They run
+from the order_saved outbox event after commit, not inside Order.save().
 """
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from apps.orders.models import Order
+from apps.core.outbox import outbox_handler
+from apps.orders.models import ORDER_SAVED_TOPIC, order_for_event
 from apps.deliveries.models import DeliveryTracking
 from apps.deliveries.services import DeliveryTrackingService
 
 
-@receiver(post_save, sender=Order)
-def create_delivery_tracking_on_rider_assignment(sender, instance, created, **kwargs):
+@outbox_handler(ORDER_SAVED_TOPIC)
+def create_delivery_tracking_on_rider_assignment(event):
     """
     Automatically create or sync delivery tracking when a rider is assigned to an order.
     """
-    if instance.status == 'cancelled':
+    instance = order_for_event(event)
+    if instance is None or instance.status == 'cancelled':
         return
 
     active_rider = DeliveryTrackingService.resolve_active_tracking_rider(instance)
@@ -33,12 +34,13 @@ def create_delivery_tracking_on_rider_assignment(sender, instance, created, **kw
         )
 
 
-@receiver(post_save, sender=Order)
-def update_tracking_status_on_order_status_change(sender, instance, **kwargs):
+@outbox_handler(ORDER_SAVED_TOPIC)
+def update_tracking_status_on_order_status_change(event):
     """
     Update delivery tracking status when order status changes.
     """
-    if instance.rider:
+    instance = order_for_event(event)
+    if instance is not None and instance.rider:
         try:
             tracking = DeliveryTracking.objects.get(order=instance, is_active=True)
             
@@ -60,7 +62,7 @@ def update_tracking_status_on_order_status_change(sender, instance, **kwargs):
         except DeliveryTracking.DoesNotExist:
             pass
         except Exception as e:
-            # Log error but don't fail the order save
+            # Log error but don't fail the other order_saved consumers
             import logging
             logger = logging.getLogger(__name__)
             logger.error(f"Failed to update delivery tracking for order {instance.order_number}: {str(e)}")
@@ -2,7 +2,12 @@ from django.contrib import admin
 from django.urls import reverse
 from django.utils.html import format_html
 
-from apps.documents.models import PdfDocumentSection, PdfDocumentTemplate
+from apps.documents.models import (
+    OrderDocumentBatch,
+    OrderDocumentJob,
+    PdfDocumentSection,
+    PdfDocumentTemplate,
+)
 
 PDF_LAYOUT_STUDIO_URL_NAME = 'documents:pdf-layout-studio'
 
@@ -65,3 +70,27 @@ class PdfDocumentTemplateAdmin(admin.ModelAdmin):
         total = obj.sections.count()
         return f'{visible} visible / {total} total'
     section_count.short_description = 'Sections'
+
+
+@admin.register(OrderDocumentJob)
+class OrderDocumentJobAdmin(admin.ModelAdmin):
+    list_display = ['job_id', 'order', 'lang', 'status', 'requested_by', 'created_at', 'completed_at']
+    list_filter = ['status', 'lang']
+    search_fields = ['job_id', 'order__order_number']
+    raw_id_fields = ['order', 'requested_by']
+    readonly_fields = [
+        'job_id', 'order', 'requested_by', 'lang', 'status', 'file_path', 'etag',
+        'error_message', 'started_at', 'completed_at', 'created_at',
+    ]
+
+
+@admin.register(OrderDocumentBatch)
+class OrderDocumentBatchAdmin(admin.ModelAdmin):
+    list_display = ['job_id', 'tailor', 'output_format', 'order_count', 'lang', 'status', 'created_at', 'completed_at']
+    list_filter = ['status', 'output_format', 'lang']
+    search_fields = ['job_id', 'tailor__username']
+    raw_id_fields = ['tailor', 'requested_by']
+    readonly_fields = [
+        'job_id', 'tailor', 'requested_by', 'order_ids', 'lang', 'output_format', 'status',
+        'file_path', 'error_message', 'started_at', 'completed_at', 'created_at',
+    ]
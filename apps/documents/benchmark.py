@@ -0,0 +1,343 @@
+"""Render benchmarks for the order document engines.
+
+Synthetic orders (N persons, each with styles, artwork, reference and fabric
+photos) are created inside a transaction that is always rolled back, with
+images written to a throwaway MEDIA_ROOT. Each engine is timed per phase and
+its peak Python allocation is recorded with tracemalloc in a separate, untimed
+run (native WeasyPrint memory is not included).
+"""
+import io
+import platform
+import re
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.test.utils import override_settings
+from PIL import Image, ImageDraw
+
+from apps.documents.context import build_order_document_context
+from apps.documents.layout import resolve_layout
+from apps.documents.measurement_config import build_pdf_field_map
+from apps.documents.catalog import NOTES, PERSON_ITEMS, RIDERS, STATUS_HISTORY
+from apps.documents.renderers import (
+    DOCUMENT_TEMPLATE,
+    SECTION_PARTIALS,
+    html_engine_available,
+    render_html_pdf,
+    render_order_html,
+)
+
+BENCHMARK_SCHEMA_VERSION = 1
+DEFAULT_PERSON_COUNTS = (1, 5, 10, 20)
+ENGINES = ('reportlab', 'html')
+
+_STYLE_TYPES = ('collar', 'cuff', 'pocket', 'placket')
+_MEASUREMENTS = {
+    'hem': 142, 'teek': 48, 'chest_upper': 54, 'hips': 58, 'waist': 50,
+    'sleeve': 62, 'shoulder_front': 47, 'tall_front': 146, 'tall_back': 148,
+    'chest_girth': 112, 'cufflink': 24, 'armpit': 27,
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _write_image(media_root, name, size, color):
+    path = Path(media_root) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image = Image.new('RGB', size, color)
+    draw = ImageDraw.Draw(image)
+    for offset in range(0, size[0], 40):
+        draw.line([(offset, 0), (size[0] - offset, size[1])], fill=(255, 255, 255), width=3)
+    image.save(path, format='JPEG', quality=90)
+    return name
+
+
+def _synthetic_order(media_root, persons):
+    """Create one order with ``persons`` items. Must run inside a rolled-back transaction."""
+    from apps.customers.models import FamilyMember
+    from apps.orders.models import CustomerFabricImage, Order, OrderItem
+    from apps.tailors.models import TailorProfile
+
+    User = get_user_model()
+    stamp = time.monotonic_ns()
+    customer = User.objects.create_user(username=f'bench_customer_{stamp}', role='USER')
+    tailor = User.objects.create_user(username=f'bench_tailor_{stamp}', role='TAILOR')
+    TailorProfile.objects.get_or_create(user=tailor, defaults={'shop_name': 'Benchmark Tailors'})
+
+    artwork = {
+        style_type: _write_image(media_root, f'custom_styles/bench/{style_type}.jpg', (900, 900), (40, 90, 160))
+        for style_type in _STYLE_TYPES
+    }
+    reference = _write_image(media_root, 'style_references/bench/reference.jpg', (3000, 2000), (160, 90, 40))
+
+    order = Order.objects.create(
+        customer=customer,
+        tailor=tailor,
+        order_type='fabric_with_stitching',
+        payment_method='cod',
+        service_mode='walk_in',
+        subtotal=Decimal('100.00') * persons,
+        total_amount=Decimal('100.00') * persons,
+        special_instructions='Benchmark order — تعليمات خاصة للخياط',
+    )
+    for index in range(persons):
+        member = FamilyMember.objects.create(user=customer, name=f'فرد {index + 1}', relationship='son')
+        item = OrderItem.objects.create(
+            order=order,
+            family_member=member,
+            quantity=1,
+            unit_price=Decimal('100.00'),
+            total_price=Decimal('100.00'),
+            measurements={key: value + index for key, value in _MEASUREMENTS.items()},
+            custom_styles=[
+                {
+                    'style_type': style_type,
+                    'label': f'{style_type.title()} {index % 3 + 1}',
+                    'asset_path': artwork[style_type],
+                    'text': 'Keep it firm — اجعلها ثابتة',
+                    'reference_images': [reference] if style_type == 'collar' else [],
+                }
+                for style_type in _STYLE_TYPES
+            ],
+        )
+        photo = io.BytesIO()
+        Image.new('RGB', (2400, 1800), (90, 140, 60)).save(photo, format='JPEG', quality=90)
+        CustomerFabricImage.objects.create(
+            order_item=item,
+            uploaded_by=tailor,
+            image=ContentFile(photo.getvalue(), name=f'fabric_{index}.jpg'),
+        )
+
+    from apps.documents.jobs import order_document_queryset
+
+    return order_document_queryset().get(pk=order.pk)
+
+
+@contextmanager
+def synthetic_orders(person_counts):
+    """Yield ``{persons: order}``; all rows and files are discarded afterwards."""
+    media_root = tempfile.mkdtemp(prefix='order-document-benchmark-')
+    try:
+        with override_settings(MEDIA_ROOT=media_root):
+            try:
+                with transaction.atomic():
+                    yield {persons: _synthetic_order(media_root, persons) for persons in person_counts}
+                    raise _Rollback
+            except _Rollback:
+                pass
+    finally:
+        shutil.rmtree(media_root, ignore_errors=True)
+
+
+def _timed(phases, name, fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    phases[name] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def _run_reportlab(order, lang, layout, field_map):
+    from apps.tailors.services.order_pdf import (
+        _build_order_story,
+        _pdf_page_width,
+        _styles,
+        generate_orders_pdf_reportlab,
+    )
+
+    phases = {}
+    _timed(
+        phases, 'story', _build_order_story,
+        order, _pdf_page_width(), _styles(lang), lang, field_map,
+    )
+    pdf_bytes = _timed(
+        phases, 'total', generate_orders_pdf_reportlab,
+        [order], lang, measurement_fields=field_map,
+    )
+    phases['render'] = max(phases['total'] - phases['story'], 0.0)
+    return phases, pdf_bytes
+
+
+def _run_html(order, lang, layout, field_map):
+    phases = {}
+    context = _timed(
+        phases, 'context', build_order_document_context,
+        order, lang, layout, measurement_field_map=field_map,
+    )
+    html = _timed(phases, 'layout', render_order_html, context, layout)
+    pdf_bytes = _timed(phases, 'render', render_html_pdf, html)
+    phases['total'] = phases['context'] + phases['layout'] + phases['render']
+    return phases, pdf_bytes
+
+
+_RUNNERS = {'reportlab': _run_reportlab, 'html': _run_html}
+
+
+def _page_count(pdf_bytes):
+    return len(re.findall(rb'/Type\s*/Page[^s]', pdf_bytes))
+
+
+def benchmark_order(order, persons, engine, lang='en', *, iterations=3, warmup=1):
+    """Time one engine on one order. Returns a JSON-serializable result row."""
+    layout = resolve_layout()
+    field_map = build_pdf_field_map()
+    runner = _RUNNERS[engine]
+
+    for _ in range(warmup):
+        runner(order, lang, layout, field_map)
+
+    samples = []
+    pdf_bytes = b''
+    for _ in range(iterations):
+        phases, pdf_bytes = runner(order, lang, layout, field_map)
+        samples.append(phases)
+
+    # Separate traced run: tracemalloc slows allocation-heavy code several-fold.
+    tracemalloc.start()
+    try:
+        runner(order, lang, layout, field_map)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'engine': engine,
+        'persons': persons,
+        'lang': lang,
+        'iterations': iterations,
+        'phases': {
+            name: {
+                'median_ms': round(statistics.median(sample[name] for sample in samples), 3),
+                'min_ms': round(min(sample[name] for sample in samples), 3),
+            }
+            for name in samples[0]
+        },
+        'peak_python_kib': round(peak / 1024, 1),
+        'pdf_bytes': len(pdf_bytes),
+        'pages': _page_count(pdf_bytes),
+    }
+
+
+def available_engines(requested=ENGINES):
+    return [engine for engine in requested if engine != 'html' or html_engine_available()]
+
+
+def run_benchmark(person_counts=DEFAULT_PERSON_COUNTS, engines=ENGINES, lang='en', *, iterations=3, warmup=1):
+    engines = available_engines(engines)
+    results = []
+    with synthetic_orders(person_counts) as orders:
+        for persons, order in orders.items():
+            for engine in engines:
+                results.append(
+                    benchmark_order(order, persons, engine, lang, iterations=iterations, warmup=warmup)
+                )
+    return {
+        'schema': BENCHMARK_SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'engines': engines,
+        'results': results,
+    }
+
+
+def _result_key(row):
+    return (row['engine'], row['persons'], row['lang'])
+
+
+def compare_results(current, baseline, *, threshold=1.25, phase='total'):
+    """Rows whose ``phase`` median is more than ``threshold`` times the baseline."""
+    previous = {_result_key(row): row for row in baseline.get('results', [])}
+    regressions = []
+    for row in current.get('results', []):
+        before = previous.get(_result_key(row))
+        if not before or phase not in before['phases'] or phase not in row['phases']:
+            continue
+        old = before['phases'][phase]['median_ms']
+        new = row['phases'][phase]['median_ms']
+        if old and new / old > threshold:
+            regressions.append({
+                'engine': row['engine'],
+                'persons': row['persons'],
+                'lang': row['lang'],
+                'baseline_ms': old,
+                'current_ms': new,
+                'ratio': round(new / old, 2),
+            })
+    return regressions
+
+
+def _section_is_empty(key, context):
+    if key == RIDERS:
+        riders = context.get('riders') or {}
+        return not riders.get('measurement') and not riders.get('delivery')
+    if key == NOTES:
+        order = context.get('order') or {}
+        return not order.get('special_instructions') and not order.get('notes')
+    if key == STATUS_HISTORY:
+        return not context.get('status_history')
+    if key == PERSON_ITEMS:
+        return not context.get('items') and not context.get('rider_measurements')
+    return False
+
+
+def render_order_html_per_section(context, layout):
+    """
+    The renderer before layouts were compiled: one render_to_string, with its
+    own context copy, per section and one more for the shell. Kept as the
+    baseline for ``benchmark_layout_render``.
+    """
+    section_html = []
+    for section in layout.sections:
+        template_name = SECTION_PARTIALS.get(section.key)
+        if not template_name:
+            continue
+        if section.settings.get('hide_if_empty') and _section_is_empty(section.key, context):
+            continue
+        section_html.append(render_to_string(template_name, {**context, 'section': section}))
+    return render_to_string(DOCUMENT_TEMPLATE, {**context, 'section_html': section_html})
+
+
+def _median_ms(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def benchmark_layout_render(person_counts=DEFAULT_PERSON_COUNTS, lang='ar', *, iterations=20):
+    """
+    Time HTML layout rendering alone (no PDF) with the per-section baseline
+    and the compiled template. Contexts are built once per order.
+    """
+    layout = resolve_layout()
+    field_map = build_pdf_field_map()
+    rows = []
+    with synthetic_orders(person_counts) as orders:
+        for persons, order in orders.items():
+            context = build_order_document_context(order, lang, layout, measurement_field_map=field_map)
+            # Warm template loading and compilation for both paths.
+            render_order_html_per_section(context, layout)
+            render_order_html(context, layout)
+            per_section = _median_ms(lambda: render_order_html_per_section(context, layout), iterations)
+            compiled = _median_ms(lambda: render_order_html(context, layout), iterations)
+            rows.append({
+                'persons': persons,
+                'lang': lang,
+                'iterations': iterations,
+                'per_section_ms': per_section,
+                'compiled_ms': compiled,
+                'speedup': round(per_section / compiled, 2) if compiled else None,
+            })
+    return rows
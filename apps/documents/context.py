@@ -5,12 +5,17 @@ directly — they consume this dict so layout changes stay in HTML/admin.
 """
 import base64
 import mimetypes
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
 from django.utils import timezone
 from django.utils.html import escape
 
+from apps.core.image_variants import image_variant_path
 from apps.documents.catalog import PERSON_ITEMS
 from apps.documents.measurement_config import build_pdf_field_map
 from apps.documents.section_schemas import merge_section_settings, STATUS_HISTORY
@@ -42,9 +47,40 @@ def _label(text, lang):
     return _translate_label(text, lang)
 
 
+# path -> data URI, active only inside shared_image_cache() (batch exports).
+_image_cache: ContextVar = ContextVar('document_image_cache', default=None)
+
+
+@contextmanager
+def shared_image_cache():
+    """Reuse encoded images across every document built inside the block."""
+    if _image_cache.get() is not None:
+        yield
+        return
+    token = _image_cache.set({})
+    try:
+        yield
+    finally:
+        _image_cache.reset(token)
+
+
+# Style artwork repeats across orders; photos are per order and stay uncached.
+STYLE_IMAGE_CACHE_SIZE = 256
+
+
 def _file_to_data_uri(path):
     if not path:
         return None
+    cache = _image_cache.get()
+    if cache is not None:
+        key = str(path)
+        if key not in cache:
+            cache[key] = _read_data_uri(path)
+        return cache[key]
+    return _read_data_uri(path)
+
+
+def _read_data_uri(path):
     file_path = Path(path)
     if not file_path.is_file():
         return None
@@ -56,6 +92,23 @@ def _file_to_data_uri(path):
     return f'data:{mime};base64,{encoded}'
 
 
+def _style_image_data_uri(path):
+    """Data URI for catalog style artwork, memoized per file version."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _cached_style_image_data_uri(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=STYLE_IMAGE_CACHE_SIZE)
+def _cached_style_image_data_uri(path, _mtime_ns, _size):
+    return _read_data_uri(path)
+
+
+@lru_cache(maxsize=1)
 def _arabic_font_uris():
     fonts_dir = Path(settings.BASE_DIR) / 'fonts'
     regular = fonts_dir / 'IBMPlexSansArabic-Regular.ttf'
@@ -66,6 +119,16 @@ def _arabic_font_uris():
     }
 
 
+def warm_document_caches():
+    """Resolve font URIs before the first HTML render."""
+    _arabic_font_uris()
+
+
+def clear_document_caches():
+    _arabic_font_uris.cache_clear()
+    _cached_style_image_data_uri.cache_clear()
+
+
 def _section_settings(layout, key):
     for section in layout.sections:
         if section.key == key:
@@ -102,10 +165,10 @@ def _style_cards(styles, lang):
         if not isinstance(style, dict):
             continue
         comment = _truncate_style_comment((style.get('text') or '').strip())
-        image = _file_to_data_uri(_style_image_path(style))
+        image = _style_image_data_uri(image_variant_path(_style_image_path(style)))
         refs = [
             uri for uri in (
-                _file_to_data_uri(path) for path in _style_reference_image_paths(style)
+                _file_to_data_uri(image_variant_path(path)) for path in _style_reference_image_paths(style)
             ) if uri
         ]
         label = _custom_style_label_text(style)
@@ -162,7 +225,7 @@ def _build_items(order, lang, layout, field_map):
             'fabric_quantity': getattr(item, 'customer_fabric_quantity', None),
             'fabric_photos': [
                 uri for uri in (
-                    _file_to_data_uri(path) for path in _customer_fabric_image_paths(item)
+                    _file_to_data_uri(image_variant_path(path)) for path in _customer_fabric_image_paths(item)
                 ) if uri
             ],
             'measurement_title': measurements.get('title') or '',
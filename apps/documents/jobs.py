@@ -0,0 +1,281 @@
+"""Asynchronous order PDF rendering.
+
+The tailor app enqueues a job, polls it (or waits for the push), then downloads
+the file. Render tasks are routed to the ``documents`` Celery queue, which is
+served by its own worker pool with a fixed concurrency, so PDF spikes queue up
+there instead of holding gunicorn workers or delaying the default queue.
+"""
+import logging
+import tempfile
+import zipfile
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.documents.context import shared_image_cache
+from apps.documents.layout import resolve_layout
+from apps.documents.measurement_config import build_pdf_field_map
+from apps.documents.models import OrderDocumentBatch, OrderDocumentJob
+from apps.documents.pdf_cache import get_order_pdf, order_pdf_cache_enabled, order_pdf_cache_entry
+
+logger = logging.getLogger(__name__)
+
+ORDER_PDF_JOB_DIR = 'order_pdf_jobs'
+ORDER_PDF_BATCH_DIR = 'order_pdf_batches'
+MAX_BATCH_ORDERS = 50
+ORDER_DOCUMENT_QUEUE = 'documents'
+JOB_POLL_INTERVAL_SECONDS = 2
+
+# A render still 'processing' after this long is assumed to have died with its
+# worker; the redelivered task (acks_late) or a new request may take it over.
+STALE_PROCESSING_AFTER = timedelta(minutes=15)
+
+
+def _claimable():
+    """Rows a worker may claim: queued, or processing but abandoned."""
+    stale_before = timezone.now() - STALE_PROCESSING_AFTER
+    abandoned = Q(started_at__lt=stale_before) | Q(started_at__isnull=True)
+    return Q(status='queued') | (Q(status='processing') & abandoned)
+
+
+def _in_flight():
+    """Rows still worth waiting on: queued, or processing and recently started."""
+    return Q(status='queued') | Q(status='processing', started_at__gte=timezone.now() - STALE_PROCESSING_AFTER)
+
+
+def _claim(model, job_id):
+    return model.objects.filter(_claimable(), job_id=job_id).update(
+        status='processing',
+        started_at=timezone.now(),
+    )
+
+
+def order_document_queryset():
+    """Order queryset with everything the document context and renderers read."""
+    from apps.orders.models import Order
+
+    return Order.objects.select_related(
+        'customer',
+        'tailor',
+        'tailor__tailor_profile',
+        'measurement_rider__rider_profile',
+        'delivery_rider__rider_profile',
+        'delivery_address',
+    ).prefetch_related(
+        'order_items__fabric',
+        'order_items__family_member',
+        'order_items__customer_fabric_images',
+        'status_history__changed_by',
+    )
+
+
+def _complete_from_cache(job, entry):
+    job.status = 'completed'
+    job.file_path = entry.path
+    job.etag = entry.etag
+    job.started_at = job.completed_at = timezone.now()
+    job.save(update_fields=['status', 'file_path', 'etag', 'started_at', 'completed_at', 'updated_at'])
+
+
+def enqueue_order_document_job(order, lang='en', requested_by=None):
+    """
+    Return a job that will produce the order PDF.
+
+    An in-flight job for the same order and language is reused, unless it has
+    been processing for longer than STALE_PROCESSING_AFTER. When the PDF is
+    already in the render cache the job completes immediately without a task.
+    """
+    existing = (
+        OrderDocumentJob.objects.filter(_in_flight(), order=order, lang=lang)
+        .order_by('-created_at')
+        .first()
+    )
+    if existing is not None:
+        return existing
+
+    job = OrderDocumentJob.objects.create(
+        order=order,
+        lang=lang,
+        requested_by=requested_by,
+        created_by=requested_by,
+    )
+
+    if order_pdf_cache_enabled():
+        entry = order_pdf_cache_entry(order, lang)
+        if default_storage.exists(entry.path):
+            _complete_from_cache(job, entry)
+            return job
+
+    from apps.documents.tasks import render_order_document_job_task
+
+    job_id = str(job.job_id)
+    transaction.on_commit(lambda: render_order_document_job_task.delay(job_id))
+    return job
+
+
+def run_order_document_job(job_id):
+    """
+    Render the PDF for a queued job. Safe to call twice; only one run renders.
+    A job left processing by a crashed worker is reclaimed once it is stale.
+    """
+    claimed = _claim(OrderDocumentJob, job_id)
+    if not claimed:
+        return OrderDocumentJob.objects.filter(job_id=job_id).first()
+
+    job = OrderDocumentJob.objects.select_related('requested_by').get(job_id=job_id)
+    try:
+        order = order_document_queryset().get(pk=job.order_id)
+        pdf_bytes, entry = get_order_pdf(order, job.lang)
+        if entry is not None:
+            job.file_path = entry.path
+            job.etag = entry.etag
+        else:
+            job.file_path = default_storage.save(
+                f'{ORDER_PDF_JOB_DIR}/{job.job_id}.pdf',
+                ContentFile(pdf_bytes),
+            )
+        job.status = 'completed'
+    except Exception as exc:
+        logger.exception('Order document job %s failed', job_id)
+        job.status = 'failed'
+        job.error_message = str(exc)[:500]
+    job.completed_at = timezone.now()
+    job.save(update_fields=['status', 'file_path', 'etag', 'error_message', 'completed_at', 'updated_at'])
+
+    if job.status == 'completed':
+        _notify_job_ready(job, order)
+    return job
+
+
+def _notify_job_ready(job, order):
+    if not job.requested_by:
+        return
+    try:
+        from apps.notifications.services import NotificationService
+
+        NotificationService.send_notification(
+            user=job.requested_by,
+            title='Order document ready',
+            body='Order #{order_number} PDF is ready to download',
+            notification_type='SYSTEM',
+            category='order_document_ready',
+            data={
+                'job_id': str(job.job_id),
+                'order_id': order.id,
+                'order_number': order.order_number,
+            },
+            priority='normal',
+            app_role='TAILOR',
+        )
+    except Exception as exc:
+        logger.warning('Unable to notify document job %s completion: %s', job.job_id, exc)
+
+
+def enqueue_order_document_batch(tailor, order_ids, lang='en', output_format='pdf', requested_by=None):
+    """Create a batch export for orders that belong to ``tailor`` and queue its render."""
+    batch = OrderDocumentBatch.objects.create(
+        tailor=tailor,
+        requested_by=requested_by,
+        created_by=requested_by,
+        order_ids=list(order_ids),
+        lang=lang,
+        output_format=output_format,
+    )
+
+    from apps.documents.tasks import render_order_document_batch_task
+
+    job_id = str(batch.job_id)
+    transaction.on_commit(lambda: render_order_document_batch_task.delay(job_id))
+    return batch
+
+
+def _batch_orders(batch):
+    orders = order_document_queryset().filter(tailor_id=batch.tailor_id, pk__in=batch.order_ids).in_bulk()
+    return [orders[order_id] for order_id in batch.order_ids if order_id in orders]
+
+
+def _write_orders_zip(orders, lang, handle):
+    """Write one PDF per order into ``handle``, serving unchanged orders from the render cache."""
+    layout = resolve_layout()
+    field_map = build_pdf_field_map()
+    with zipfile.ZipFile(handle, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        with shared_image_cache():
+            for order in orders:
+                pdf_bytes, _entry = get_order_pdf(
+                    order, lang, layout=layout, measurement_field_map=field_map,
+                )
+                archive.writestr(f'order_{order.order_number}.pdf', pdf_bytes)
+
+
+def _render_batch_file(batch, orders):
+    from apps.documents.service import generate_orders_document
+
+    path = f'{ORDER_PDF_BATCH_DIR}/{batch.job_id}.{batch.output_format}'
+    if batch.output_format == 'zip':
+        # Spool to disk past a few MB so large exports are not held in memory.
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as handle:
+            _write_orders_zip(orders, batch.lang, handle)
+            handle.seek(0)
+            return default_storage.save(path, File(handle, name=path))
+    return default_storage.save(path, ContentFile(generate_orders_document(orders, batch.lang)))
+
+
+def run_order_document_batch(job_id):
+    """
+    Render a queued batch export. Safe to call twice; only one run renders.
+    A batch left processing by a crashed worker is reclaimed once it is stale.
+    """
+    claimed = _claim(OrderDocumentBatch, job_id)
+    if not claimed:
+        return OrderDocumentBatch.objects.filter(job_id=job_id).first()
+
+    batch = OrderDocumentBatch.objects.select_related('requested_by').get(job_id=job_id)
+    try:
+        orders = _batch_orders(batch)
+        if not orders:
+            raise ValueError('None of the requested orders are available.')
+        batch.file_path = _render_batch_file(batch, orders)
+        batch.status = 'completed'
+    except Exception as exc:
+        logger.exception('Order document batch %s failed', job_id)
+        batch.status = 'failed'
+        batch.error_message = str(exc)[:500]
+    batch.completed_at = timezone.now()
+    batch.save(update_fields=['status', 'file_path', 'error_message', 'completed_at', 'updated_at'])
+
+    if batch.status == 'completed':
+        _notify_batch_ready(batch)
+    return batch
+
+
+def _notify_batch_ready(batch):
+    if not batch.requested_by:
+        return
+    try:
+        from apps.notifications.services import NotificationService
+
+        NotificationService.send_notification(
+            user=batch.requested_by,
+            title='Order documents ready',
+            body='{order_count} order PDFs are ready to download',
+            notification_type='SYSTEM',
+            category='order_document_batch_ready',
+            data={
+                'job_id': str(batch.job_id),
+                'order_count': batch.order_count,
+                'format': batch.output_format,
+            },
+            priority='normal',
+            app_role='TAILOR',
+        )
+    except Exception as exc:
+        logger.warning('Unable to notify document batch %s completion: %s', batch.job_id, exc)
+
+
+def job_file_available(job):
+    return bool(job.status == 'completed' and job.file_path and default_storage.exists(job.file_path))
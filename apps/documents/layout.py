@@ -1,5 +1,6 @@
 """Resolve the active document layout from the database, with a safe catalog fallback."""
 
+from apps.core.config_cache import get_config
 from apps.documents.catalog import (
     DEFAULT_SECTION_SETTINGS,
     DEFAULT_TEMPLATE_NAME,
@@ -52,25 +53,37 @@ def _catalog_layout(engine='auto'):
 
 
 def resolve_layout(template=None):
-    """Return a ResolvedLayout from a PdfDocumentTemplate, or catalog defaults."""
+    """
+    Return a ResolvedLayout from a PdfDocumentTemplate, or catalog defaults.
+    Without ``template`` the default layout is memoized per process.
+    """
     if template is None:
         try:
-            from apps.documents.models import PdfDocumentTemplate
-            template = (
-                PdfDocumentTemplate.objects.filter(is_active=True, is_default=True)
-                .prefetch_related('sections')
-                .first()
-            )
-            if template is None:
-                template = (
-                    PdfDocumentTemplate.objects.filter(is_active=True)
-                    .prefetch_related('sections')
-                    .order_by('-version', 'id')
-                    .first()
-                )
+            return get_config('documents:default_layout', _load_default_layout)
         except Exception:
             return _catalog_layout()
+    return _layout_from_template(template)
+
+
+def _load_default_layout():
+    from apps.documents.models import PdfDocumentTemplate
+
+    template = (
+        PdfDocumentTemplate.objects.filter(is_active=True, is_default=True)
+        .prefetch_related('sections')
+        .first()
+    )
+    if template is None:
+        template = (
+            PdfDocumentTemplate.objects.filter(is_active=True)
+            .prefetch_related('sections')
+            .order_by('-version', 'id')
+            .first()
+        )
+    return _layout_from_template(template)
+
 
+def _layout_from_template(template):
     if template is None:
         return _catalog_layout()
 
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.benchmark import DEFAULT_PERSON_COUNTS, benchmark_layout_render
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare per-section and compiled HTML layout rendering on synthetic orders. '
+        'Nothing is written to the database or media storage.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--persons',
+            type=int,
+            nargs='+',
+            default=list(DEFAULT_PERSON_COUNTS),
+            help='Person (order item) counts to benchmark, 1-20.',
+        )
+        parser.add_argument('--lang', default='ar', choices=['en', 'ar', 'ur'])
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def handle(self, *args, **options):
+        persons = sorted(set(options['persons']))
+        if any(count < 1 or count > 20 for count in persons):
+            raise CommandError('--persons values must be between 1 and 20')
+
+        rows = benchmark_layout_render(persons, options['lang'], iterations=max(1, options['iterations']))
+
+        self.stdout.write(f'{"persons":>8}{"per-section ms":>16}{"compiled ms":>13}{"speedup":>10}')
+        for row in rows:
+            self.stdout.write(
+                f'{row["persons"]:>8}{row["per_section_ms"]:>16.3f}{row["compiled_ms"]:>13.3f}'
+                f'{row["speedup"]:>9.2f}x'
+            )
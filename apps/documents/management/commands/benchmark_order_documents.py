@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.benchmark import DEFAULT_PERSON_COUNTS, ENGINES, compare_results, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the ReportLab and HTML order document engines on synthetic orders. '
+        'Nothing is written to the database or media storage.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--persons',
+            type=int,
+            nargs='+',
+            default=list(DEFAULT_PERSON_COUNTS),
+            help='Person (order item) counts to benchmark, 1-20.',
+        )
+        parser.add_argument('--engine', action='append', choices=ENGINES, help='Repeatable. Defaults to both.')
+        parser.add_argument('--lang', default='ar', choices=['en', 'ar', 'ur'])
+        parser.add_argument('--iterations', type=int, default=3)
+        parser.add_argument('--warmup', type=int, default=1)
+        parser.add_argument('--output', default='', help='Write the JSON result to this path.')
+        parser.add_argument('--baseline', default='', help='Compare against a previous JSON result.')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.25,
+            help='Fail when a total median exceeds baseline by this ratio (default 1.25).',
+        )
+
+    def handle(self, *args, **options):
+        persons = sorted(set(options['persons']))
+        if any(count < 1 or count > 20 for count in persons):
+            raise CommandError('--persons values must be between 1 and 20')
+
+        result = run_benchmark(
+            persons,
+            options['engine'] or ENGINES,
+            options['lang'],
+            iterations=max(1, options['iterations']),
+            warmup=max(0, options['warmup']),
+        )
+
+        self.stdout.write(f'{"engine":<11}{"persons":>8}{"total ms":>11}{"render ms":>11}{"peak KiB":>11}{"pages":>7}')
+        for row in result['results']:
+            phases = row['phases']
+            self.stdout.write(
+                f'{row["engine"]:<11}{row["persons"]:>8}'
+                f'{phases["total"]["median_ms"]:>11.1f}{phases["render"]["median_ms"]:>11.1f}'
+                f'{row["peak_python_kib"]:>11.0f}{row["pages"]:>7}'
+            )
+
+        payload = json.dumps(result, indent=2, sort_keys=True)
+        if options['output']:
+            output = Path(options['output']).expanduser()
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(payload + '\n', encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'Wrote {output}'))
+
+        if options['baseline']:
+            try:
+                baseline = json.loads(Path(options['baseline']).expanduser().read_text(encoding='utf-8'))
+            except (OSError, ValueError) as exc:
+                raise CommandError(f'Unable to read baseline: {exc}') from exc
+            regressions = compare_results(result, baseline, threshold=options['threshold'])
+            for row in regressions:
+                self.stderr.write(
+                    f'Regression: {row["engine"]} {row["persons"]} persons ({row["lang"]}) '
+                    f'{row["baseline_ms"]} ms -> {row["current_ms"]} ms (x{row["ratio"]})'
+                )
+            if regressions:
+                raise CommandError(f'{len(regressions)} benchmark regression(s) above x{options["threshold"]}')
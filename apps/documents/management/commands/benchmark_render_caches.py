@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.jobs import order_document_queryset
+from apps.documents.service import generate_order_document
+from apps.documents.warmup import clear_render_resources, warm_render_resources
+from apps.orders.models import Order
+from apps.tailors.services.order_pdf import _canvas_prepare_text, _shape_arabic, _styles
+
+SAMPLE_TEXT = (
+    'مقاسك',
+    'تفاصيل الطلب',
+    'القياسات',
+    'ملاحظات العميل',
+    'آرڈر کی تفصیلات',
+    'Order 00321 — ثوب قطن',
+)
+
+
+def _elapsed_ms(fn, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+class Command(BaseCommand):
+    help = 'Compare cold and warm render-resource caches (stylesheets, shaping, full render).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lang', default='ar', choices=['en', 'ar', 'ur'])
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--order-id', type=int, help='Also time full renders of this order.')
+        parser.add_argument('--engine', default='reportlab', choices=['auto', 'html', 'reportlab'])
+
+    def handle(self, *args, **options):
+        lang = options['lang']
+        iterations = max(1, options['iterations'])
+
+        def styles():
+            _styles(lang)
+
+        def shaping():
+            for text in SAMPLE_TEXT:
+                _shape_arabic(text)
+                _canvas_prepare_text(text, lang)
+
+        rows = [
+            ('stylesheet', styles, iterations),
+            ('shape text', shaping, iterations),
+        ]
+
+        if options['order_id']:
+            try:
+                order = order_document_queryset().get(id=options['order_id'])
+            except Order.DoesNotExist as exc:
+                raise CommandError(f'Order {options["order_id"]} not found') from exc
+
+            def render():
+                generate_order_document(order, lang=lang, engine=options['engine'])
+
+            rows.append((f'render ({options["engine"]})', render, max(1, iterations // 10)))
+
+        self.stdout.write(f'{"phase":<20}{"cold ms":>12}{"warm ms":>12}{"speedup":>10}')
+        for name, fn, runs in rows:
+            cold = 0.0
+            for _ in range(runs):
+                clear_render_resources()
+                cold += _elapsed_ms(fn, 1)
+            cold /= runs
+            warm_render_resources()
+            fn()
+            warm = _elapsed_ms(fn, runs)
+            speedup = cold / warm if warm else float('inf')
+            self.stdout.write(f'{name:<20}{cold:>12.3f}{warm:>12.3f}{speedup:>9.1f}x')
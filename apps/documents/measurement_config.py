@@ -5,6 +5,7 @@ field names (``hem``, ``hips``, ``tall_front``, …). PDF generation and the
 layout studio must use that same template — not a parallel thobe template.
 """
 
+from apps.core.config_cache import get_config
 from apps.documents.measurement_aliases import LEGACY_TO_CANONICAL
 
 # Prefer the app template; fall back to thobe for dev/test databases.
@@ -36,6 +37,11 @@ DEFAULT_APP_PDF_GRID = {
 
 
 def get_pdf_measurement_template():
+    """The active PDF measurement template, memoized per process."""
+    return get_config('documents:pdf_measurement_template', _load_pdf_measurement_template)
+
+
+def _load_pdf_measurement_template():
     from apps.customization.models import MeasurementTemplate
 
     for name in PDF_MEASUREMENT_TEMPLATE_NAMES:
@@ -50,7 +56,15 @@ def get_pdf_measurement_template():
 
 
 def build_pdf_field_map():
-    """Field metadata keyed by name for the active PDF measurement template."""
+    """
+    Field metadata keyed by name for the active PDF measurement template.
+    The map is memoized per process; callers get their own copy to edit.
+    """
+    field_map = get_config('documents:pdf_field_map', _load_pdf_field_map)
+    return {name: dict(meta) for name, meta in field_map.items()}
+
+
+def _load_pdf_field_map():
     from apps.customization.models import MeasurementField
 
     template = get_pdf_measurement_template()
@@ -63,10 +77,9 @@ def build_pdf_field_map():
         is_active=True,
     ).order_by('display_order', 'name')
 
+    # Every field belongs to ``template``; reading field.template would cost a query per row.
+    unit = getattr(template, 'default_unit', None) or 'cm'
     for idx, field in enumerate(fields):
-        unit = 'cm'
-        if field.template_id and getattr(field.template, 'default_unit', None):
-            unit = field.template.default_unit or 'cm'
         field_map[field.name] = {
             'label_en': field.display_name or field.name.replace('_', ' ').title(),
             'label_ar': field.display_name_ar or field.display_name or field.name,
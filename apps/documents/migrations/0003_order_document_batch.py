@@ -0,0 +1,42 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:34
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0002_order_document_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderDocumentBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('order_ids', models.JSONField(default=list, help_text='Order ids in print order')),
+                ('lang', models.CharField(default='en', max_length=5)),
+                ('output_format', models.CharField(choices=[('pdf', 'Merged PDF'), ('zip', 'ZIP of PDFs')], default='pdf', max_length=3)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], db_index=True, default='queued', max_length=12)),
+                ('file_path', models.CharField(blank=True, default='', max_length=255)),
+                ('error_message', models.TextField(blank=True, default='')),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL)),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='requested_order_document_batches', to=settings.AUTH_USER_MODEL)),
+                ('tailor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_document_batches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Order document batch',
+                'verbose_name_plural': 'Order document batches',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -1,3 +1,6 @@
+import uuid
+
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
 
@@ -89,3 +92,98 @@ class PdfDocumentSection(BaseModel):
             raise ValidationError({'key': 'Unknown document section.'})
         if self.settings is not None and not isinstance(self.settings, dict):
             raise ValidationError({'settings': 'Settings must be a JSON object.'})
+
+
+class OrderDocumentJob(BaseModel):
+    """Background render of an order PDF, polled by the tailor app until ready."""
+
+    STATUS_CHOICES = (
+        ('queued', 'Queued'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    )
+
+    job_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    order = models.ForeignKey(
+        'orders.Order',
+        on_delete=models.CASCADE,
+        related_name='document_jobs',
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='order_document_jobs',
+    )
+    lang = models.CharField(max_length=5, default='en')
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default='queued', db_index=True)
+    file_path = models.CharField(max_length=255, blank=True, default='')
+    etag = models.CharField(max_length=64, blank=True, default='')
+    error_message = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Order document job'
+        verbose_name_plural = 'Order document jobs'
+        indexes = [
+            models.Index(fields=['order', 'lang', 'status'], name='documents_job_order_lang_idx'),
+        ]
+
+    def __str__(self):
+        return f'Document job {self.job_id} for order {self.order_id} ({self.status})'
+
+    @property
+    def is_finished(self):
+        return self.status in ('completed', 'failed')
+
+
+class OrderDocumentBatch(BaseModel):
+    """Background export of several orders as one merged PDF or a ZIP of PDFs."""
+
+    STATUS_CHOICES = OrderDocumentJob.STATUS_CHOICES
+    FORMAT_CHOICES = (
+        ('pdf', 'Merged PDF'),
+        ('zip', 'ZIP of PDFs'),
+    )
+
+    job_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    tailor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='order_document_batches',
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='requested_order_document_batches',
+    )
+    order_ids = models.JSONField(default=list, help_text='Order ids in print order')
+    lang = models.CharField(max_length=5, default='en')
+    output_format = models.CharField(max_length=3, choices=FORMAT_CHOICES, default='pdf')
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default='queued', db_index=True)
+    file_path = models.CharField(max_length=255, blank=True, default='')
+    error_message = models.TextField(blank=True, default='')
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Order document batch'
+        verbose_name_plural = 'Order document batches'
+
+    def __str__(self):
+        return f'Document batch {self.job_id} ({len(self.order_ids)} orders, {self.status})'
+
+    @property
+    def is_finished(self):
+        return self.status in ('completed', 'failed')
+
+    @property
+    def order_count(self):
+        return len(self.order_ids or [])
@@ -0,0 +1,261 @@
+"""Storage-backed cache for rendered order PDFs.
+
+Entries live in default storage under ``ORDER_PDF_CACHE_DIR/<order_id>/`` and
+are keyed by language, resolved layout, engine and a fingerprint of the order
+data the document reads. Computing the fingerprint costs a few narrow queries,
+so re-downloads (and ``If-None-Match`` revalidation) skip rendering entirely.
+Writes that change the document drop the order's stored files via signals.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
+
+from apps.documents.layout import resolve_layout
+
+logger = logging.getLogger(__name__)
+
+ORDER_PDF_CACHE_DIR = 'order_pdfs'
+
+# Bump when renderer output changes for identical input (templates, ReportLab code).
+ORDER_PDF_CACHE_VERSION = 2
+
+_ORDER_FINGERPRINT_FIELDS = (
+    'order_number',
+    'status',
+    'tailor_status',
+    'rider_status',
+    'order_type',
+    'service_mode',
+    'special_instructions',
+    'notes',
+    'rider_measurements',
+    'measurement_taken_at',
+    'appointment_date',
+    'appointment_time',
+    'estimated_delivery_date',
+    'actual_delivery_date',
+    'stitching_completion_date',
+    'created_at',
+    'updated_at',
+    'customer_id',
+    'customer__first_name',
+    'customer__last_name',
+    'customer__username',
+    'customer__phone',
+    'tailor_id',
+    'tailor__phone',
+    'tailor__tailor_profile__shop_name',
+    'tailor__tailor_profile__contact_number',
+    'rider_id',
+    'measurement_rider_id',
+    'delivery_rider_id',
+    # Rider contact lines fall back from the rider profile to the user account.
+    *(
+        f'{rider}__{field}'
+        for rider in ('measurement_rider', 'delivery_rider')
+        for field in (
+            'first_name',
+            'last_name',
+            'username',
+            'phone',
+            'rider_profile__full_name',
+            'rider_profile__phone_number',
+            'rider_profile__vehicle_type',
+        )
+    ),
+    'delivery_address_id',
+    'delivery_formatted_address',
+    'delivery_street',
+    'delivery_city',
+    'delivery_extra_info',
+)
+
+_ITEM_FINGERPRINT_FIELDS = (
+    'id',
+    'fabric_id',
+    'fabric__name',
+    'fabric__sku',
+    'quantity',
+    'is_ready',
+    'measurements',
+    'custom_styles',
+    'custom_instructions',
+    'family_member_id',
+    'family_member__name',
+    'family_member__relationship',
+    'recipient_display_name',
+    'customer_fabric_quantity',
+    'updated_at',
+)
+
+
+@dataclass(frozen=True)
+class OrderPdfCacheEntry:
+    """Where a rendered PDF lives and the validator clients revalidate with."""
+
+    path: str
+    etag: str
+    layout: object
+    engine: str
+
+
+def order_pdf_cache_enabled():
+    return bool(getattr(settings, 'ORDER_PDF_CACHE_ENABLED', True))
+
+
+def order_pdf_cache_dir(order_id):
+    return f'{ORDER_PDF_CACHE_DIR}/{order_id}'
+
+
+def _digest(payload):
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _layout_fingerprint(layout):
+    return [
+        layout.slug,
+        layout.version,
+        [[section.key, section.display_order, section.settings] for section in layout.sections],
+    ]
+
+
+def _measurement_config_fingerprint():
+    from apps.customization.models import MeasurementField, MeasurementTemplate
+
+    fields = MeasurementField.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    templates = MeasurementTemplate.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    return [fields['count'], fields['latest'], templates['count'], templates['latest']]
+
+
+def order_content_fingerprint(order):
+    """Hash of the order, item, history and photo data the document renders."""
+    from apps.orders.models import CustomerFabricImage, Order, OrderItem, OrderStatusHistory
+
+    order_row = Order.objects.filter(pk=order.pk).values(*_ORDER_FINGERPRINT_FIELDS).first()
+    items = list(
+        OrderItem.objects.filter(order_id=order.pk)
+        .order_by('created_at', 'id')
+        .values_list(*_ITEM_FINGERPRINT_FIELDS)
+    )
+    history = OrderStatusHistory.objects.filter(order_id=order.pk).aggregate(
+        count=Count('id'),
+        latest=Max('id'),
+        updated=Max('updated_at'),
+    )
+    photos = list(
+        CustomerFabricImage.objects.filter(order_item__order_id=order.pk)
+        .order_by('order_item_id', 'display_order', 'id')
+        .values_list('order_item_id', 'image', 'display_order')
+    )
+    return _digest({
+        'order': order_row,
+        'items': items,
+        'history': history,
+        'photos': photos,
+        'measurement_config': _measurement_config_fingerprint(),
+    })
+
+
+def order_pdf_cache_entry(order, lang='en', *, engine=None, layout=None):
+    """Resolve the cache path and ETag for ``order`` without rendering anything."""
+    from apps.documents.service import _requested_engine
+
+    layout = layout or resolve_layout()
+    engine = _requested_engine(layout, engine)
+    key = _digest([
+        ORDER_PDF_CACHE_VERSION,
+        order.pk,
+        lang,
+        engine,
+        _layout_fingerprint(layout),
+        order_content_fingerprint(order),
+    ])[:40]
+    return OrderPdfCacheEntry(
+        path=f'{order_pdf_cache_dir(order.pk)}/{lang}-{key}.pdf',
+        etag=f'"{key}"',
+        layout=layout,
+        engine=engine,
+    )
+
+
+def _read_cached_pdf(path):
+    try:
+        if not default_storage.exists(path):
+            return None
+        with default_storage.open(path, 'rb') as handle:
+            pdf_bytes = handle.read()
+    except Exception:
+        logger.warning('Unable to read cached order PDF %s', path, exc_info=True)
+        return None
+    return pdf_bytes if pdf_bytes.startswith(b'%PDF') else None
+
+
+def _store_pdf(path, pdf_bytes):
+    try:
+        if default_storage.exists(path):
+            default_storage.delete(path)
+        default_storage.save(path, ContentFile(pdf_bytes))
+    except Exception:
+        logger.warning('Unable to store cached order PDF %s', path, exc_info=True)
+
+
+def get_order_pdf(order, lang='en', *, engine=None, entry=None, layout=None, measurement_field_map=None):
+    """
+    Return ``(pdf_bytes, entry)`` for the order, rendering only on a cache miss.
+
+    ``entry`` may be passed when the caller already resolved it (e.g. to answer
+    ``If-None-Match`` first). ``entry`` is None when caching is disabled.
+    ``layout`` and ``measurement_field_map`` let batch callers resolve them once.
+    """
+    from apps.documents.service import generate_order_document
+
+    if not order_pdf_cache_enabled():
+        pdf_bytes = generate_order_document(
+            order, lang, engine=engine, layout=layout, measurement_field_map=measurement_field_map,
+        )
+        return pdf_bytes, None
+
+    entry = entry or order_pdf_cache_entry(order, lang, engine=engine, layout=layout)
+    pdf_bytes = _read_cached_pdf(entry.path)
+    if pdf_bytes is not None:
+        return pdf_bytes, entry
+
+    pdf_bytes = generate_order_document(
+        order,
+        lang,
+        engine=entry.engine,
+        layout=entry.layout,
+        measurement_field_map=measurement_field_map,
+    )
+    _store_pdf(entry.path, pdf_bytes)
+    return pdf_bytes, entry
+
+
+def invalidate_order_pdfs(order_id):
+    """Delete every cached PDF for an order. Missing directories are fine."""
+    if not order_id:
+        return 0
+    directory = order_pdf_cache_dir(order_id)
+    try:
+        _dirs, files = default_storage.listdir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    except Exception:
+        logger.warning('Unable to list cached PDFs for order %s', order_id, exc_info=True)
+        return 0
+
+    removed = 0
+    for name in files:
+        try:
+            default_storage.delete(f'{directory}/{name}')
+            removed += 1
+        except Exception:
+            logger.warning('Unable to delete cached PDF %s/%s', directory, name, exc_info=True)
+    return removed
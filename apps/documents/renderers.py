@@ -6,7 +6,8 @@ fallback so downloads never fail if WeasyPrint/system libs are missing.
 import logging
 from functools import lru_cache
 
-from django.template.loader import render_to_string
+from django.template import Context, engines
+from django.template.loader import get_template
 
 from apps.documents.catalog import (
     COMMENTS_FOOTER,
@@ -33,36 +34,58 @@ SECTION_PARTIALS = {
 }
 
 
-def render_order_html(context, layout):
-    section_html = []
-    for section in layout.sections:
-        template_name = SECTION_PARTIALS.get(section.key)
+# Template conditions for ``hide_if_empty``: the section renders only when true.
+SECTION_PRESENCE = {
+    RIDERS: 'riders.measurement or riders.delivery',
+    NOTES: 'order.special_instructions or order.notes',
+    STATUS_HISTORY: 'status_history',
+    PERSON_ITEMS: 'items or rider_measurements',
+}
+
+DOCUMENT_TEMPLATE = 'documents/order/document.html'
+
+
+def _layout_signature(layout):
+    """What the compiled template depends on: section order and hide_if_empty flags."""
+    return tuple(
+        (section.key, bool(section.settings.get('hide_if_empty')))
+        for section in layout.sections
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_layout(slug, version, signature):
+    parts = [f'{{% extends "{DOCUMENT_TEMPLATE}" %}}{{% block sections %}}']
+    for index, (key, hide_if_empty) in enumerate(signature):
+        template_name = SECTION_PARTIALS.get(key)
         if not template_name:
             continue
-        if section.settings.get('hide_if_empty') and _section_is_empty(section.key, context):
-            continue
-        section_html.append(render_to_string(template_name, {
-            **context,
-            'section': section,
-        }))
-    return render_to_string('documents/order/document.html', {
-        **context,
-        'section_html': section_html,
-    })
-
-
-def _section_is_empty(key, context):
-    if key == RIDERS:
-        riders = context.get('riders') or {}
-        return not riders.get('measurement') and not riders.get('delivery')
-    if key == NOTES:
-        order = context.get('order') or {}
-        return not order.get('special_instructions') and not order.get('notes')
-    if key == STATUS_HISTORY:
-        return not context.get('status_history')
-    if key == PERSON_ITEMS:
-        return not context.get('items') and not context.get('rider_measurements')
-    return False
+        body = get_template(template_name).template.source
+        if hide_if_empty and key in SECTION_PRESENCE:
+            body = f'{{% if {SECTION_PRESENCE[key]} %}}{body}{{% endif %}}'
+        parts.append(f'{{% with section=layout_sections.{index} %}}{body}{{% endwith %}}')
+    parts.append('{% endblock %}')
+    return engines['django'].engine.from_string(''.join(parts))
+
+
+def compile_layout(layout):
+    """
+    The document template for ``layout``: the section partials inlined in
+    order into the shell, compiled once per layout slug, version and section
+    list. Template files are read at compile time, so edits need a restart.
+    """
+    return _compile_layout(layout.slug, layout.version, _layout_signature(layout))
+
+
+def clear_compiled_layouts():
+    _compile_layout.cache_clear()
+
+
+def render_order_html(context, layout):
+    """Render the document in one pass; ``context`` is wrapped, not copied."""
+    template_context = Context(context)
+    template_context.update({'layout_sections': layout.sections})
+    return compile_layout(layout).render(template_context)
 
 
 @lru_cache(maxsize=1)
@@ -80,7 +103,20 @@ def render_html_pdf(html):
     return HTML(string=html, base_url='.').write_pdf()
 
 
-def render_reportlab_pdf(order, lang):
-    from apps.tailors.services.order_pdf import generate_order_pdf_reportlab
+def render_html_pdfs_merged(html_documents):
+    """Lay out each HTML document separately and write all pages as one PDF."""
+    from weasyprint import HTML
+
+    rendered = [HTML(string=html, base_url='.').render() for html in html_documents]
+    pages = [page for document in rendered for page in document.pages]
+    return rendered[0].copy(pages).write_pdf()
+
+
+def render_reportlab_pdf(order, lang, measurement_fields=None):
+    return render_reportlab_batch_pdf([order], lang, measurement_fields=measurement_fields)
+
+
+def render_reportlab_batch_pdf(orders, lang, measurement_fields=None):
+    from apps.tailors.services.order_pdf import generate_orders_pdf_reportlab
 
-    return generate_order_pdf_reportlab(order, lang=lang)
+    return generate_orders_pdf_reportlab(orders, lang=lang, measurement_fields=measurement_fields)
@@ -3,12 +3,15 @@ import logging
 
 from django.conf import settings
 
-from apps.documents.context import build_order_document_context
+from apps.documents.context import build_order_document_context, shared_image_cache
 from apps.documents.layout import resolve_layout
+from apps.documents.measurement_config import build_pdf_field_map
 from apps.documents.renderers import (
     html_engine_available,
     render_html_pdf,
+    render_html_pdfs_merged,
     render_order_html,
+    render_reportlab_batch_pdf,
     render_reportlab_pdf,
 )
 
@@ -31,23 +34,34 @@ def generate_order_html(order, lang='en', template=None, layout=None, measuremen
     return render_order_html(context, layout), context, layout
 
 
-def generate_order_document(order, lang='en', *, engine=None, template=None):
+def generate_order_document(
+    order,
+    lang='en',
+    *,
+    engine=None,
+    template=None,
+    layout=None,
+    measurement_field_map=None,
+):
     """
     Render the complete order PDF.
 
     engine: auto | html | reportlab
     HTML is preferred. ReportLab is used when HTML is unavailable or fails.
+    Pass ``layout`` when it was already resolved (e.g. by the PDF cache).
     """
-    layout = resolve_layout(template)
+    layout = layout or resolve_layout(template)
     requested = _requested_engine(layout, engine)
 
     if requested == 'reportlab':
-        return render_reportlab_pdf(order, lang)
+        return render_reportlab_pdf(order, lang, measurement_fields=measurement_field_map)
 
     if requested in ('auto', 'html'):
         if html_engine_available():
             try:
-                html, _context, _layout = generate_order_html(order, lang=lang, layout=layout)
+                html, _context, _layout = generate_order_html(
+                    order, lang=lang, layout=layout, measurement_field_map=measurement_field_map,
+                )
                 pdf_bytes = render_html_pdf(html)
                 if pdf_bytes and pdf_bytes.startswith(b'%PDF'):
                     return pdf_bytes
@@ -61,4 +75,44 @@ def generate_order_document(order, lang='en', *, engine=None, template=None):
         elif requested == 'html':
             raise RuntimeError('WeasyPrint is not installed; cannot render HTML PDFs.')
 
-    return render_reportlab_pdf(order, lang)
+    return render_reportlab_pdf(order, lang, measurement_fields=measurement_field_map)
+
+
+def generate_orders_document(orders, lang='en', *, engine=None, template=None, layout=None):
+    """
+    Render several orders into one merged PDF, each starting on a new page.
+
+    The layout, measurement field map, stylesheet and encoded images are
+    resolved once for the whole batch instead of once per order.
+    """
+    orders = list(orders)
+    if not orders:
+        raise ValueError('At least one order is required.')
+    layout = layout or resolve_layout(template)
+    requested = _requested_engine(layout, engine)
+    field_map = build_pdf_field_map()
+
+    if requested in ('auto', 'html'):
+        if html_engine_available():
+            try:
+                with shared_image_cache():
+                    html_documents = [
+                        generate_order_html(
+                            order, lang=lang, layout=layout, measurement_field_map=field_map,
+                        )[0]
+                        for order in orders
+                    ]
+                pdf_bytes = render_html_pdfs_merged(html_documents)
+                if pdf_bytes and pdf_bytes.startswith(b'%PDF'):
+                    return pdf_bytes
+            except Exception:
+                logger.exception(
+                    'HTML PDF engine failed for batch of %s orders; falling back to ReportLab',
+                    len(orders),
+                )
+                if requested == 'html':
+                    raise
+        elif requested == 'html':
+            raise RuntimeError('WeasyPrint is not installed; cannot render HTML PDFs.')
+
+    return render_reportlab_batch_pdf(orders, lang, measurement_fields=field_map)
@@ -0,0 +1,43 @@
+"""Drop cached order PDFs and memoized layout/measurement config when their data changes."""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.config_cache import bump_config_version
+from apps.documents.pdf_cache import invalidate_order_pdfs
+
+
+def _invalidate_on_commit(order_id):
+    if order_id:
+        transaction.on_commit(lambda: invalidate_order_pdfs(order_id))
+
+
+@receiver([post_save, post_delete], sender='orders.Order')
+def invalidate_pdfs_for_order(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    _invalidate_on_commit(instance.pk)
+
+
+@receiver([post_save, post_delete], sender='orders.OrderItem')
+@receiver([post_save, post_delete], sender='orders.OrderStatusHistory')
+def invalidate_pdfs_for_order_child(sender, instance, **kwargs):
+    _invalidate_on_commit(instance.order_id)
+
+
+@receiver([post_save, post_delete], sender='orders.CustomerFabricImage')
+def invalidate_pdfs_for_fabric_photo(sender, instance, **kwargs):
+    if not instance.order_item_id:
+        return
+    from apps.orders.models import OrderItem
+
+    order_id = OrderItem.objects.filter(pk=instance.order_item_id).values_list('order_id', flat=True).first()
+    _invalidate_on_commit(order_id)
+
+
+@receiver([post_save, post_delete], sender='customization.MeasurementTemplate')
+@receiver([post_save, post_delete], sender='customization.MeasurementField')
+@receiver([post_save, post_delete], sender='documents.PdfDocumentTemplate')
+@receiver([post_save, post_delete], sender='documents.PdfDocumentSection')
+def bump_config_for_document_settings(sender, instance, **kwargs):
+    bump_config_version()
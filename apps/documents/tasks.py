@@ -0,0 +1,41 @@
+import logging
+
+from celery import shared_task
+from celery.signals import worker_process_init
+
+from .jobs import run_order_document_batch, run_order_document_job
+
+logger = logging.getLogger(__name__)
+
+
+@worker_process_init.connect
+def warm_document_render_resources(**kwargs):
+    """Build render caches in each worker process before it takes a task."""
+    from .warmup import warm_render_resources
+
+    try:
+        warm_render_resources()
+    except Exception as exc:
+        logger.warning('Unable to warm document render resources: %s', exc)
+
+
+@shared_task(name='apps.documents.tasks.render_order_document_job_task', acks_late=True)
+def render_order_document_job_task(job_id):
+    """Background task to render the PDF for an OrderDocumentJob."""
+    try:
+        job = run_order_document_job(job_id)
+        return bool(job and job.status == 'completed')
+    except Exception as exc:
+        logger.exception('Error rendering order document job %s: %s', job_id, exc)
+        return False
+
+
+@shared_task(name='apps.documents.tasks.render_order_document_batch_task', acks_late=True)
+def render_order_document_batch_task(job_id):
+    """Background task to render a multi-order PDF or ZIP export."""
+    try:
+        batch = run_order_document_batch(job_id)
+        return bool(batch and batch.status == 'completed')
+    except Exception as exc:
+        logger.exception('Error rendering order document batch %s: %s', job_id, exc)
+        return False
@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 
+from apps.core.config_cache import bump_config_version
 from apps.customization.models import MeasurementField, MeasurementTemplate
 from apps.customers.models import CustomerProfile, FamilyMember
 from apps.documents.catalog import CUSTOMER, HEADER, PERSON_ITEMS, default_sections
@@ -98,6 +99,7 @@ class OrderDocumentEngineTest(TestCase):
     def test_hidden_section_is_omitted_from_html(self):
         template = PdfDocumentTemplate.objects.get(slug='order_receipt', version=1)
         PdfDocumentSection.objects.filter(template=template, key=CUSTOMER).update(is_visible=False)
+        bump_config_version()
         html, _context, layout = generate_order_html(self.order, lang='en')
         self.assertNotIn(CUSTOMER, [section.key for section in layout.sections])
         self.assertNotIn('CUSTOMER INFORMATION', html)
@@ -112,6 +114,7 @@ class OrderDocumentEngineTest(TestCase):
         MeasurementField.objects.filter(template=thobe, name='waist').update(
             pdf_grid_row=4, pdf_grid_col=1, display_order=3,
         )
+        bump_config_version()
         layout = resolve_layout()
         context = build_order_document_context(self.order, 'en', layout)
         cells = {cell['key']: cell for cell in context['items'][0]['measurement_cells']}
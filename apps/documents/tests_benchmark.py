@@ -0,0 +1,53 @@
+from django.test import TestCase
+
+from apps.documents.benchmark import (
+    benchmark_layout_render,
+    compare_results,
+    render_order_html_per_section,
+    run_benchmark,
+    synthetic_orders,
+)
+from apps.documents.context import build_order_document_context
+from apps.documents.layout import resolve_layout
+from apps.documents.renderers import render_order_html
+from apps.orders.models import Order
+
+
+class OrderDocumentBenchmarkTest(TestCase):
+    def test_reportlab_benchmark_reports_phases_and_leaves_no_rows(self):
+        orders_before = Order.objects.count()
+        result = run_benchmark((1, 3), ('reportlab',), 'ar', iterations=1, warmup=0)
+
+        self.assertEqual(Order.objects.count(), orders_before)
+        self.assertEqual([row['persons'] for row in result['results']], [1, 3])
+        row = result['results'][1]
+        self.assertEqual(set(row['phases']), {'story', 'render', 'total'})
+        self.assertGreater(row['pdf_bytes'], 0)
+        self.assertGreaterEqual(row['pages'], result['results'][0]['pages'])
+        self.assertGreater(row['peak_python_kib'], 0)
+
+    def test_compare_flags_slower_totals_only(self):
+        def result(total):
+            return {'results': [{
+                'engine': 'reportlab', 'persons': 5, 'lang': 'en',
+                'phases': {'total': {'median_ms': total, 'min_ms': total}},
+            }]}
+
+        self.assertEqual(compare_results(result(110), result(100)), [])
+        regressions = compare_results(result(150), result(100))
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]['ratio'], 1.5)
+
+    def test_compiled_layout_matches_per_section_render(self):
+        layout = resolve_layout()
+        with synthetic_orders((3,)) as orders:
+            context = build_order_document_context(orders[3], 'ar', layout)
+            expected = render_order_html_per_section(context, layout)
+            html = render_order_html(context, layout)
+        self.assertEqual(html.split(), expected.split())
+
+    def test_layout_benchmark_reports_both_renderers(self):
+        rows = benchmark_layout_render((2,), 'en', iterations=1)
+        self.assertEqual([row['persons'] for row in rows], [2])
+        self.assertGreater(rows[0]['per_section_ms'], 0)
+        self.assertGreater(rows[0]['compiled_ms'], 0)
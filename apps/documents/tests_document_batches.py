@@ -0,0 +1,181 @@
+import io
+import re
+import shutil
+import tempfile
+import zipfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.documents import service as document_service
+from apps.documents.jobs import (
+    STALE_PROCESSING_AFTER,
+    enqueue_order_document_batch,
+    run_order_document_batch,
+)
+from apps.documents.models import OrderDocumentBatch
+from apps.documents.service import generate_orders_document
+from apps.orders.models import Order, OrderItem
+from apps.tailors.models import TailorProfile
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix='zthob-document-batches-test-')
+
+
+def _page_count(pdf_bytes):
+    return len(re.findall(rb'/Type\s*/Page[^s]', pdf_bytes))
+
+
+@override_settings(
+    MEDIA_ROOT=_MEDIA_ROOT,
+    ORDER_PDF_ENGINE='reportlab',
+    ORDER_PDF_CACHE_ENABLED=True,
+    SECURE_SSL_REDIRECT=False,
+)
+class OrderDocumentBatchTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='batch_customer', password='testpass123', role='USER',
+        )
+        self.tailor_user = User.objects.create_user(
+            username='batch_tailor', password='testpass123', role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(
+            user=self.tailor_user,
+            defaults={'shop_name': 'Batch Tailors', 'shop_status': True},
+        )
+        self.orders = [self._create_order(waist) for waist in (30, 32, 34)]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.tailor_user)
+
+    def tearDown(self):
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def _create_order(self, waist, tailor=None):
+        order = Order.objects.create(
+            customer=self.customer,
+            tailor=tailor or self.tailor_user,
+            order_type='fabric_with_stitching',
+            payment_method='cod',
+            service_mode='walk_in',
+            subtotal=Decimal('100.00'),
+            total_amount=Decimal('100.00'),
+        )
+        OrderItem.objects.create(
+            order=order,
+            quantity=1,
+            unit_price=Decimal('100.00'),
+            total_price=Decimal('100.00'),
+            measurements={'waist': waist},
+        )
+        return order
+
+    def test_merged_pdf_has_pages_for_every_order_and_resolves_field_map_once(self):
+        single = generate_orders_document(self.orders[:1], 'en')
+        with mock.patch(
+            'apps.documents.service.build_pdf_field_map',
+            wraps=document_service.build_pdf_field_map,
+        ) as field_map:
+            merged = generate_orders_document(self.orders, 'en')
+        self.assertTrue(merged.startswith(b'%PDF'))
+        self.assertEqual(field_map.call_count, 1)
+        self.assertGreaterEqual(_page_count(merged), 3 * _page_count(single))
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_batch_task.delay')
+    def test_zip_batch_contains_one_pdf_per_order(self, delay, send_notification):
+        with self.captureOnCommitCallbacks(execute=True):
+            batch = enqueue_order_document_batch(
+                self.tailor_user,
+                [order.id for order in self.orders],
+                output_format='zip',
+                requested_by=self.tailor_user,
+            )
+        delay.assert_called_once_with(str(batch.job_id))
+
+        finished = run_order_document_batch(batch.job_id)
+        self.assertEqual(finished.status, 'completed')
+        self.assertEqual(send_notification.call_args.kwargs['category'], 'order_document_batch_ready')
+
+        with open(f'{_MEDIA_ROOT}/{finished.file_path}', 'rb') as handle:
+            archive = zipfile.ZipFile(io.BytesIO(handle.read()))
+        names = archive.namelist()
+        self.assertEqual(names, [f'order_{order.order_number}.pdf' for order in self.orders])
+        self.assertTrue(archive.read(names[0]).startswith(b'%PDF'))
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_batch_task.delay')
+    def test_redelivered_task_reclaims_batch_abandoned_by_a_crashed_worker(self, _delay, _notify):
+        batch = enqueue_order_document_batch(self.tailor_user, [self.orders[0].id], output_format='zip')
+        with mock.patch('apps.documents.jobs.get_order_pdf', side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                run_order_document_batch(batch.job_id)
+        self.assertEqual(run_order_document_batch(batch.job_id).status, 'processing')
+
+        OrderDocumentBatch.objects.filter(pk=batch.pk).update(
+            started_at=timezone.now() - STALE_PROCESSING_AFTER - timedelta(minutes=1),
+        )
+        finished = run_order_document_batch(batch.job_id)
+        self.assertEqual(finished.status, 'completed')
+
+    @mock.patch('apps.documents.jobs.get_order_pdf', side_effect=RuntimeError('boom'))
+    @mock.patch('apps.documents.tasks.render_order_document_batch_task.delay')
+    def test_render_failure_marks_batch_failed(self, _delay, _render):
+        batch = enqueue_order_document_batch(self.tailor_user, [self.orders[0].id], output_format='zip')
+        finished = run_order_document_batch(batch.job_id)
+        self.assertEqual(finished.status, 'failed')
+        self.assertIn('boom', finished.error_message)
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_batch_task.delay')
+    def test_api_create_poll_and_download_merged_pdf(self, _delay, _notify):
+        response = self.client.post(
+            '/api/tailors/orders/pdf-batches/',
+            {'order_ids': [order.id for order in self.orders], 'format': 'pdf', 'lang': 'en'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['data']['job_id']
+        self.assertEqual(response.data['data']['order_count'], 3)
+
+        pending = self.client.get(f'/api/tailors/pdf-batches/{job_id}/download/')
+        self.assertEqual(pending.status_code, 409)
+
+        run_order_document_batch(job_id)
+        poll = self.client.get(f'/api/tailors/pdf-batches/{job_id}/')
+        self.assertEqual(poll.data['data']['status'], 'completed')
+
+        download = self.client.get(f'/api/tailors/pdf-batches/{job_id}/download/')
+        self.assertEqual(download.status_code, 200)
+        self.assertEqual(download['Content-Type'], 'application/pdf')
+        self.assertTrue(b''.join(download.streaming_content).startswith(b'%PDF'))
+
+    def test_api_rejects_orders_from_another_shop(self):
+        other = User.objects.create_user(username='batch_other', password='testpass123', role='TAILOR')
+        foreign = self._create_order(36, tailor=other)
+        response = self.client.post(
+            '/api/tailors/orders/pdf-batches/',
+            {'order_ids': [self.orders[0].id, foreign.id]},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data['data']['missing_order_ids'], [foreign.id])
+        self.assertFalse(OrderDocumentBatch.objects.exists())
+
+    def test_api_validates_payload(self):
+        url = '/api/tailors/orders/pdf-batches/'
+        self.assertEqual(self.client.post(url, {'order_ids': []}, format='json').status_code, 400)
+        self.assertEqual(
+            self.client.post(url, {'order_ids': [self.orders[0].id], 'format': 'tar'}, format='json').status_code,
+            400,
+        )
+        self.assertEqual(
+            self.client.post(url, {'order_ids': list(range(1, 52))}, format='json').status_code,
+            400,
+        )
@@ -0,0 +1,170 @@
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.documents.jobs import STALE_PROCESSING_AFTER, enqueue_order_document_job, run_order_document_job
+from apps.documents.models import OrderDocumentJob
+from apps.documents.pdf_cache import get_order_pdf
+from apps.orders.models import Order, OrderItem
+from apps.tailors.models import TailorProfile
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix='zthob-document-jobs-test-')
+
+
+@override_settings(
+    MEDIA_ROOT=_MEDIA_ROOT,
+    ORDER_PDF_ENGINE='reportlab',
+    ORDER_PDF_CACHE_ENABLED=True,
+    SECURE_SSL_REDIRECT=False,
+)
+class OrderDocumentJobTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='job_customer', password='testpass123', role='USER',
+        )
+        self.tailor_user = User.objects.create_user(
+            username='job_tailor', password='testpass123', role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(
+            user=self.tailor_user,
+            defaults={'shop_name': 'Job Tailors', 'shop_status': True},
+        )
+        self.order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor_user,
+            order_type='fabric_with_stitching',
+            payment_method='cod',
+            service_mode='walk_in',
+            subtotal=Decimal('100.00'),
+            total_amount=Decimal('100.00'),
+        )
+        OrderItem.objects.create(
+            order=self.order,
+            quantity=1,
+            unit_price=Decimal('100.00'),
+            total_price=Decimal('100.00'),
+            measurements={'waist': 30},
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.tailor_user)
+
+    def tearDown(self):
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_enqueue_dispatches_task_after_commit_and_reuses_inflight_job(self, delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue_order_document_job(self.order, 'en', requested_by=self.tailor_user)
+        self.assertEqual(job.status, 'queued')
+        delay.assert_called_once_with(str(job.job_id))
+
+        again = enqueue_order_document_job(self.order, 'en', requested_by=self.tailor_user)
+        self.assertEqual(again.pk, job.pk)
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_run_renders_once_and_notifies(self, _delay, send_notification):
+        job = enqueue_order_document_job(self.order, 'en', requested_by=self.tailor_user)
+
+        finished = run_order_document_job(job.job_id)
+        self.assertEqual(finished.status, 'completed')
+        self.assertTrue(finished.file_path)
+        send_notification.assert_called_once()
+        self.assertEqual(send_notification.call_args.kwargs['category'], 'order_document_ready')
+
+        with mock.patch('apps.documents.jobs.get_order_pdf') as render:
+            run_order_document_job(job.job_id)
+        render.assert_not_called()
+
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_cached_pdf_completes_job_without_task(self, delay):
+        get_order_pdf(self.order, 'en')
+        job = enqueue_order_document_job(self.order, 'en', requested_by=self.tailor_user)
+        self.assertEqual(job.status, 'completed')
+        delay.assert_not_called()
+
+    @mock.patch('apps.documents.jobs.get_order_pdf', side_effect=RuntimeError('boom'))
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_render_failure_marks_job_failed(self, _delay, _render):
+        job = enqueue_order_document_job(self.order, 'en')
+        finished = run_order_document_job(job.job_id)
+        self.assertEqual(finished.status, 'failed')
+        self.assertIn('boom', finished.error_message)
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_redelivered_task_reclaims_job_abandoned_by_a_crashed_worker(self, _delay, _notify):
+        job = enqueue_order_document_job(self.order, 'en')
+        # The worker dies mid-render; nothing records the failure.
+        with mock.patch('apps.documents.jobs.get_order_pdf', side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                run_order_document_job(job.job_id)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'processing')
+        self.assertIsNotNone(job.started_at)
+
+        # A redelivery while the render may still be running does nothing.
+        self.assertEqual(run_order_document_job(job.job_id).status, 'processing')
+
+        OrderDocumentJob.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - STALE_PROCESSING_AFTER - timedelta(minutes=1),
+        )
+        finished = run_order_document_job(job.job_id)
+        self.assertEqual(finished.status, 'completed')
+
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_enqueue_does_not_reuse_stale_processing_job(self, delay):
+        stale = OrderDocumentJob.objects.create(
+            order=self.order,
+            lang='en',
+            status='processing',
+            started_at=timezone.now() - STALE_PROCESSING_AFTER - timedelta(minutes=1),
+        )
+        recent = OrderDocumentJob.objects.create(
+            order=self.order, lang='ar', status='processing', started_at=timezone.now(),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue_order_document_job(self.order, 'en')
+        self.assertNotEqual(job.pk, stale.pk)
+        delay.assert_called_once_with(str(job.job_id))
+        self.assertEqual(enqueue_order_document_job(self.order, 'ar').pk, recent.pk)
+
+    @mock.patch('apps.notifications.services.NotificationService.send_notification')
+    @mock.patch('apps.documents.tasks.render_order_document_job_task.delay')
+    def test_api_create_poll_and_download(self, _delay, _notify):
+        response = self.client.post(f'/api/tailors/orders/{self.order.id}/pdf-jobs/', {'lang': 'en'})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['data']['job_id']
+        self.assertEqual(response.data['data']['status'], 'queued')
+
+        pending = self.client.get(f'/api/tailors/pdf-jobs/{job_id}/download/')
+        self.assertEqual(pending.status_code, 409)
+
+        run_order_document_job(job_id)
+        poll = self.client.get(f'/api/tailors/pdf-jobs/{job_id}/')
+        self.assertEqual(poll.status_code, 200)
+        self.assertEqual(poll.data['data']['status'], 'completed')
+        self.assertTrue(poll.data['data']['download_url'])
+
+        download = self.client.get(f'/api/tailors/pdf-jobs/{job_id}/download/')
+        self.assertEqual(download.status_code, 200)
+        self.assertTrue(b''.join(download.streaming_content).startswith(b'%PDF'))
+
+    def test_other_shop_cannot_poll_job(self):
+        other = User.objects.create_user(username='job_other', password='testpass123', role='TAILOR')
+        TailorProfile.objects.get_or_create(user=other, defaults={'shop_name': 'Other'})
+        job = OrderDocumentJob.objects.create(order=self.order, lang='en')
+        client = APIClient()
+        client.force_authenticate(user=other)
+        response = client.get(f'/api/tailors/pdf-jobs/{job.job_id}/')
+        self.assertEqual(response.status_code, 404)
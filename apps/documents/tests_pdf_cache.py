@@ -0,0 +1,140 @@
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.documents import service as document_service
+from apps.documents.pdf_cache import (
+    get_order_pdf,
+    order_pdf_cache_dir,
+    order_pdf_cache_entry,
+)
+from apps.orders.models import Order, OrderItem
+from apps.tailors.models import TailorProfile
+
+User = get_user_model()
+
+_MEDIA_ROOT = tempfile.mkdtemp(prefix='zthob-pdf-cache-test-')
+
+
+@override_settings(
+    MEDIA_ROOT=_MEDIA_ROOT,
+    ORDER_PDF_ENGINE='reportlab',
+    ORDER_PDF_CACHE_ENABLED=True,
+    SECURE_SSL_REDIRECT=False,
+)
+class OrderPdfCacheTest(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='cache_customer', password='testpass123', role='USER',
+        )
+        self.tailor_user = User.objects.create_user(
+            username='cache_tailor', password='testpass123', role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(
+            user=self.tailor_user,
+            defaults={'shop_name': 'Cache Tailors', 'shop_status': True},
+        )
+        self.order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor_user,
+            order_type='fabric_with_stitching',
+            payment_method='cod',
+            service_mode='walk_in',
+            subtotal=Decimal('100.00'),
+            total_amount=Decimal('100.00'),
+        )
+        self.item = OrderItem.objects.create(
+            order=self.order,
+            quantity=1,
+            unit_price=Decimal('100.00'),
+            total_price=Decimal('100.00'),
+            measurements={'waist': 30},
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.tailor_user)
+
+    def tearDown(self):
+        shutil.rmtree(_MEDIA_ROOT, ignore_errors=True)
+
+    def test_second_request_is_served_from_storage(self):
+        with mock.patch(
+            'apps.documents.service.generate_order_document',
+            wraps=document_service.generate_order_document,
+        ) as render:
+            first, entry = get_order_pdf(self.order, 'en')
+            second, _entry = get_order_pdf(self.order, 'en')
+        self.assertTrue(first.startswith(b'%PDF'))
+        self.assertEqual(first, second)
+        self.assertEqual(render.call_count, 1)
+        self.assertTrue(default_storage.exists(entry.path))
+
+    def test_key_changes_with_measurements_and_language(self):
+        entry_en = order_pdf_cache_entry(self.order, 'en')
+        entry_ar = order_pdf_cache_entry(self.order, 'ar')
+        self.assertNotEqual(entry_en.etag, entry_ar.etag)
+
+        self.item.measurements = {'waist': 31}
+        self.item.save()
+        self.assertNotEqual(order_pdf_cache_entry(self.order, 'en').etag, entry_en.etag)
+
+    def test_key_changes_with_rider_profile_and_tailor_phone(self):
+        from apps.riders.models import RiderProfile
+
+        rider = User.objects.create_user(username='cache_rider', password='testpass123', role='RIDER')
+        profile, _ = RiderProfile.objects.get_or_create(user=rider)
+        profile.full_name = 'First Rider'
+        profile.save()
+        Order.objects.filter(pk=self.order.pk).update(delivery_rider=rider)
+        entry = order_pdf_cache_entry(self.order, 'en')
+
+        for field, value in (('full_name', 'Renamed Rider'), ('phone_number', '0551112222'), ('vehicle_type', 'car')):
+            setattr(profile, field, value)
+            profile.save()
+            changed = order_pdf_cache_entry(self.order, 'en')
+            self.assertNotEqual(changed.etag, entry.etag, field)
+            entry = changed
+
+        self.tailor_user.phone = '0553334444'
+        self.tailor_user.save()
+        self.assertNotEqual(order_pdf_cache_entry(self.order, 'en').etag, entry.etag)
+
+    def test_item_write_drops_cached_files(self):
+        get_order_pdf(self.order, 'en')
+        _dirs, files = default_storage.listdir(order_pdf_cache_dir(self.order.pk))
+        self.assertEqual(len(files), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.custom_instructions = 'Longer sleeves'
+            self.item.save()
+
+        _dirs, files = default_storage.listdir(order_pdf_cache_dir(self.order.pk))
+        self.assertEqual(files, [])
+
+    def test_download_returns_etag_and_304_on_revalidation(self):
+        url = f'/api/tailors/orders/{self.order.id}/download-pdf/?lang=en'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(etag)
+
+        with mock.patch('apps.tailors.views.order_download.get_order_pdf') as get_pdf:
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(revalidated.status_code, 304)
+        get_pdf.assert_not_called()
+
+    def test_cache_disabled_renders_without_etag(self):
+        with self.settings(ORDER_PDF_CACHE_ENABLED=False):
+            response = self.client.get(f'/api/tailors/orders/{self.order.id}/download-pdf/?lang=en')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
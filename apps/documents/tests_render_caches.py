@@ -0,0 +1,66 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.documents.catalog import NOTES
+from apps.documents.layout import resolve_layout, resolve_layout_from_draft
+from apps.documents.measurement_config import build_pdf_field_map
+from apps.documents.renderers import compile_layout, render_order_html
+from apps.documents.tasks import warm_document_render_resources
+from apps.documents.warmup import clear_render_resources
+from apps.tailors.services import order_pdf
+
+
+class RenderResourceCacheTest(TestCase):
+    def setUp(self):
+        # Earlier tests in the run render PDFs through the same caches.
+        clear_render_resources()
+
+    def tearDown(self):
+        clear_render_resources()
+
+    def test_stylesheet_is_built_once_per_language(self):
+        self.assertIs(order_pdf._styles('ar'), order_pdf._styles('ar'))
+        self.assertIsNot(order_pdf._styles('ar'), order_pdf._styles('en'))
+        self.assertEqual(order_pdf._styles('ar')['title'].name, 'Title_ar')
+
+    def test_cached_shaping_matches_uncached_output(self):
+        text = 'ملاحظات  العميل'
+        expected = order_pdf._shape_arabic_cached.__wrapped__(text)
+        self.assertEqual(order_pdf._shape_arabic(text), expected)
+        self.assertEqual(order_pdf._shape_arabic(text), expected)
+        self.assertEqual(order_pdf._shape_arabic_cached.cache_info().hits, 1)
+        self.assertEqual(order_pdf._shape_arabic(''), '')
+        self.assertIsNone(order_pdf._shape_arabic(None))
+
+    def test_worker_boot_warms_stylesheets(self):
+        clear_render_resources()
+        warm_document_render_resources()
+        self.assertEqual(order_pdf._build_styles.cache_info().currsize, 3)
+
+    def test_field_map_query_count_does_not_grow_with_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            field_map = build_pdf_field_map()
+        self.assertTrue(field_map)
+        self.assertLessEqual(len(queries), 3)
+
+    def test_layout_is_compiled_once_per_section_list(self):
+        layout = resolve_layout()
+        self.assertIs(compile_layout(layout), compile_layout(resolve_layout()))
+
+        draft = resolve_layout_from_draft(
+            {'slug': layout.slug, 'version': layout.version},
+            [{'key': NOTES, 'display_order': 1, 'settings': {'hide_if_empty': True}}],
+        )
+        self.assertIsNot(compile_layout(draft), compile_layout(layout))
+
+    def test_hide_if_empty_is_evaluated_in_the_compiled_template(self):
+        layout = resolve_layout_from_draft({}, [
+            {'key': NOTES, 'display_order': 1, 'settings': {'hide_if_empty': True}},
+        ])
+        context = {'labels': {'notes': 'NOTES-TITLE'}, 'order': {}}
+        self.assertNotIn('NOTES-TITLE', render_order_html(context, layout))
+        context['order'] = {'notes': 'Shorter sleeves'}
+        html = render_order_html(context, layout)
+        self.assertIn('NOTES-TITLE', html)
+        self.assertEqual(context, {'labels': {'notes': 'NOTES-TITLE'}, 'order': {'notes': 'Shorter sleeves'}})
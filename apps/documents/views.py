@@ -1,7 +1,18 @@
-from django.http import HttpResponse
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
 from drf_spectacular.utils import extend_schema
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
+from apps.documents.jobs import (
+    JOB_POLL_INTERVAL_SECONDS,
+    MAX_BATCH_ORDERS,
+    enqueue_order_document_batch,
+    enqueue_order_document_job,
+    job_file_available,
+)
+from apps.documents.models import OrderDocumentBatch, OrderDocumentJob
 from apps.documents.service import generate_order_html
 from apps.orders.models import Order
 from apps.tailors.permissions import IsShopStaff
@@ -10,6 +21,14 @@ from zthob.translations import get_language_from_request
 from zthob.utils import api_response
 
 
+def _document_lang(request):
+    lang = request.GET.get('lang')
+    if not lang and request.method == 'POST':
+        lang = request.data.get('lang')
+    lang = lang or get_language_from_request(request) or 'en'
+    return lang if lang in ('en', 'ar', 'ur') else 'en'
+
+
 class OrderDocumentPreviewView(BaseTailorAPIView):
     """HTML preview of the complete order document (same layout as the PDF)."""
 
@@ -47,3 +66,285 @@ class OrderDocumentPreviewView(BaseTailorAPIView):
             lang = 'en'
         html, _context, _layout = generate_order_html(order, lang=lang)
         return HttpResponse(html, content_type='text/html; charset=utf-8')
+
+
+def _job_payload(job, request):
+    download_url = None
+    if job.status == 'completed':
+        download_url = request.build_absolute_uri(
+            reverse('tailor-order-document-job-download', kwargs={'job_id': job.job_id})
+        )
+    return {
+        'job_id': str(job.job_id),
+        'order_id': job.order_id,
+        'order_number': job.order.order_number,
+        'lang': job.lang,
+        'status': job.status,
+        'error': job.error_message or None,
+        'download_url': download_url,
+        'poll_after_seconds': None if job.is_finished else JOB_POLL_INTERVAL_SECONDS,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'completed_at': job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
+class BaseOrderDocumentJobView(BaseTailorAPIView):
+    permission_classes = [IsAuthenticated, IsShopStaff]
+    required_employee_permission = 'can_manage_orders'
+
+    def get_job(self, request, job_id):
+        """Return (job, error_response) for a job owned by the caller's shop."""
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return None, api_response(
+                success=False, message='Tailor profile not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+        job = OrderDocumentJob.objects.select_related('order').filter(job_id=job_id).first()
+        if job is None or job.order.tailor_id != profile.user_id:
+            return None, api_response(
+                success=False, message='Document job not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+        return job, None
+
+
+class OrderDocumentJobCreateView(BaseOrderDocumentJobView):
+    """Queue a background PDF render for an order and return a job to poll."""
+
+    @extend_schema(
+        summary='Queue order PDF render',
+        description=(
+            'Starts rendering the order PDF in the background and returns a job id. '
+            'Poll the job status URL until status is completed, then download the file. '
+            'A push notification (category order_document_ready) is sent when it finishes.'
+        ),
+        tags=['Tailor Orders'],
+    )
+    def post(self, request, order_id):
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return api_response(
+                success=False, message='Tailor profile not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+        order = Order.objects.filter(id=order_id).first()
+        if order is None:
+            return api_response(success=False, message='Order not found', status_code=status.HTTP_404_NOT_FOUND)
+        if order.tailor_id != profile.user_id:
+            return api_response(
+                success=False,
+                message="You don't have access to this order",
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+
+        job = enqueue_order_document_job(order, _document_lang(request), requested_by=request.user)
+        return api_response(
+            success=True,
+            message='Document job queued',
+            data=_job_payload(job, request),
+            status_code=status.HTTP_200_OK if job.is_finished else status.HTTP_202_ACCEPTED,
+        )
+
+
+class OrderDocumentJobDetailView(BaseOrderDocumentJobView):
+    """Poll the status of a background PDF render."""
+
+    @extend_schema(summary='Order PDF job status', tags=['Tailor Orders'])
+    def get(self, request, job_id):
+        job, error = self.get_job(request, job_id)
+        if error:
+            return error
+        return api_response(success=True, message='Document job retrieved', data=_job_payload(job, request))
+
+
+class OrderDocumentJobDownloadView(BaseOrderDocumentJobView):
+    """Stream the finished PDF for a completed job."""
+
+    @extend_schema(summary='Download order PDF job result', responses={200: bytes}, tags=['Tailor Orders'])
+    def get(self, request, job_id):
+        job, error = self.get_job(request, job_id)
+        if error:
+            return error
+        if job.status != 'completed':
+            return api_response(
+                success=False, message='Document is not ready yet', status_code=status.HTTP_409_CONFLICT,
+            )
+        if not job_file_available(job):
+            return api_response(
+                success=False,
+                message='Document has changed since this job finished. Please request it again.',
+                status_code=status.HTTP_410_GONE,
+            )
+
+        response = FileResponse(
+            default_storage.open(job.file_path, 'rb'),
+            content_type='application/pdf',
+            as_attachment=True,
+            filename=f'order_{job.order.order_number}.pdf',
+        )
+        if job.etag:
+            response['ETag'] = job.etag
+        return response
+
+
+def _batch_payload(batch, request):
+    download_url = None
+    if batch.status == 'completed':
+        download_url = request.build_absolute_uri(
+            reverse('tailor-order-document-batch-download', kwargs={'job_id': batch.job_id})
+        )
+    return {
+        'job_id': str(batch.job_id),
+        'order_ids': batch.order_ids,
+        'order_count': batch.order_count,
+        'format': batch.output_format,
+        'lang': batch.lang,
+        'status': batch.status,
+        'error': batch.error_message or None,
+        'download_url': download_url,
+        'poll_after_seconds': None if batch.is_finished else JOB_POLL_INTERVAL_SECONDS,
+        'created_at': batch.created_at.isoformat() if batch.created_at else None,
+        'completed_at': batch.completed_at.isoformat() if batch.completed_at else None,
+    }
+
+
+def _requested_order_ids(raw):
+    """Unique positive order ids in the order given, or None when the payload is invalid."""
+    if not isinstance(raw, (list, tuple)) or not raw:
+        return None
+    order_ids = []
+    for value in raw:
+        try:
+            order_id = int(value)
+        except (TypeError, ValueError):
+            return None
+        if order_id <= 0:
+            return None
+        if order_id not in order_ids:
+            order_ids.append(order_id)
+    return order_ids
+
+
+class BaseOrderDocumentBatchView(BaseTailorAPIView):
+    permission_classes = [IsAuthenticated, IsShopStaff]
+    required_employee_permission = 'can_manage_orders'
+
+    def get_batch(self, request, job_id):
+        """Return (batch, error_response) for a batch owned by the caller's shop."""
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return None, api_response(
+                success=False, message='Tailor profile not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+        batch = OrderDocumentBatch.objects.filter(job_id=job_id, tailor_id=profile.user_id).first()
+        if batch is None:
+            return None, api_response(
+                success=False, message='Document job not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+        return batch, None
+
+
+class OrderDocumentBatchCreateView(BaseOrderDocumentBatchView):
+    """Queue a background export of several orders as one PDF or a ZIP of PDFs."""
+
+    @extend_schema(
+        summary='Queue multi-order PDF export',
+        description=(
+            'Body: {"order_ids": [..], "format": "pdf" | "zip", "lang": "en"}. '
+            f'Up to {MAX_BATCH_ORDERS} orders; "pdf" merges them in the given order, '
+            'each starting on a new page. Poll the job status URL, then download the file. '
+            'A push notification (category order_document_batch_ready) is sent when it finishes.'
+        ),
+        tags=['Tailor Orders'],
+    )
+    def post(self, request):
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return api_response(
+                success=False, message='Tailor profile not found', status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        order_ids = _requested_order_ids(request.data.get('order_ids'))
+        if order_ids is None:
+            return api_response(
+                success=False,
+                message='order_ids must be a non-empty list of order ids',
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(order_ids) > MAX_BATCH_ORDERS:
+            return api_response(
+                success=False,
+                message='A document batch can include at most {max_orders} orders',
+                message_kwargs={'max_orders': MAX_BATCH_ORDERS},
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        output_format = str(request.data.get('format') or 'pdf').lower()
+        if output_format not in dict(OrderDocumentBatch.FORMAT_CHOICES):
+            return api_response(
+                success=False,
+                message='format must be pdf or zip',
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        owned = set(
+            Order.objects.filter(id__in=order_ids, tailor_id=profile.user_id).values_list('id', flat=True)
+        )
+        missing = [order_id for order_id in order_ids if order_id not in owned]
+        if missing:
+            return api_response(
+                success=False,
+                message='Order not found',
+                data={'missing_order_ids': missing},
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        batch = enqueue_order_document_batch(
+            profile.user,
+            order_ids,
+            lang=_document_lang(request),
+            output_format=output_format,
+            requested_by=request.user,
+        )
+        return api_response(
+            success=True,
+            message='Document job queued',
+            data=_batch_payload(batch, request),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
+
+class OrderDocumentBatchDetailView(BaseOrderDocumentBatchView):
+    """Poll the status of a multi-order export."""
+
+    @extend_schema(summary='Multi-order PDF export status', tags=['Tailor Orders'])
+    def get(self, request, job_id):
+        batch, error = self.get_batch(request, job_id)
+        if error:
+            return error
+        return api_response(success=True, message='Document job retrieved', data=_batch_payload(batch, request))
+
+
+class OrderDocumentBatchDownloadView(BaseOrderDocumentBatchView):
+    """Stream the finished merged PDF or ZIP."""
+
+    @extend_schema(summary='Download multi-order PDF export', responses={200: bytes}, tags=['Tailor Orders'])
+    def get(self, request, job_id):
+        batch, error = self.get_batch(request, job_id)
+        if error:
+            return error
+        if batch.status != 'completed':
+            return api_response(
+                success=False, message='Document is not ready yet', status_code=status.HTTP_409_CONFLICT,
+            )
+        if not job_file_available(batch):
+            return api_response(
+                success=False,
+                message='Document has changed since this job finished. Please request it again.',
+                status_code=status.HTTP_410_GONE,
+            )
+
+        is_zip = batch.output_format == 'zip'
+        return FileResponse(
+            default_storage.open(batch.file_path, 'rb'),
+            content_type='application/zip' if is_zip else 'application/pdf',
+            as_attachment=True,
+            filename=f'orders_{batch.created_at:%Y%m%d_%H%M}_{batch.order_count}.{batch.output_format}',
+        )
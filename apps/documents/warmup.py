@@ -0,0 +1,28 @@
+"""Per-process render resources.
+
+Stylesheets, shaped Arabic/Urdu text, font URIs and style artwork are memoized
+for the life of the process. Workers warm them at boot so the first document a
+process renders does not pay for building them.
+"""
+import logging
+
+from apps.documents.context import clear_document_caches, warm_document_caches
+from apps.documents.renderers import clear_compiled_layouts, html_engine_available
+from apps.tailors.services.order_pdf import clear_render_caches, warm_render_caches
+
+logger = logging.getLogger(__name__)
+
+RENDER_LANGUAGES = ('en', 'ar', 'ur')
+
+
+def warm_render_resources(langs=RENDER_LANGUAGES):
+    warm_render_caches(langs)
+    warm_document_caches()
+    # Imports WeasyPrint (and its native libraries) once, up front.
+    html_engine_available()
+
+
+def clear_render_resources():
+    clear_render_caches()
+    clear_document_caches()
+    clear_compiled_layouts()
@@ -1,4 +1,5 @@
 from django.contrib import admin, messages
+from django.db import transaction
 from django.utils import timezone
 from .models import (
     TailorWallet, WalletTransaction, PayoutRequest,
@@ -6,11 +7,21 @@ from .models import (
 )
 from .services import WalletService
 
+
+def _apply_pending_entries(wallets):
+    applied = 0
+    for wallet in wallets:
+        with transaction.atomic():
+            applied += WalletService.apply_pending_entries(wallet)
+    return applied
+
 @admin.register(TailorWallet)
 class TailorWalletAdmin(admin.ModelAdmin):
-    list_display = ('tailor_shop_name', 'available_balance', 'pending_balance', 'total_earned', 'total_withdrawn')
+    list_display = ('tailor_shop_name', 'available_balance', 'pending_balance', 'total_earned', 'total_withdrawn', 'deferred_ledger')
+    list_filter = ('deferred_ledger',)
     search_fields = ('tailor__username', 'tailor__tailor_profile__shop_name')
-    readonly_fields = ('available_balance', 'pending_balance', 'total_earned', 'total_withdrawn')
+    readonly_fields = ('available_balance', 'pending_balance', 'total_earned', 'total_withdrawn', 'ledger_applied_at')
+    actions = ['apply_pending_entries']
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('tailor', 'tailor__tailor_profile')
@@ -21,10 +32,15 @@ class TailorWalletAdmin(admin.ModelAdmin):
             return f"{obj.tailor.username} | {obj.tailor.tailor_profile.shop_name}"
         return obj.tailor.username
 
+    @admin.action(description="Apply pending ledger entries to selected wallets")
+    def apply_pending_entries(self, request, queryset):
+        applied = _apply_pending_entries(queryset)
+        self.message_user(request, f"Applied {applied} pending ledger entries.", messages.SUCCESS)
+
 @admin.register(WalletTransaction)
 class WalletTransactionAdmin(admin.ModelAdmin):
-    list_display = ('id', 'tailor_shop_name', 'transaction_type', 'source', 'amount', 'order', 'created_at')
-    list_filter = ('transaction_type', 'source', 'created_at')
+    list_display = ('id', 'tailor_shop_name', 'transaction_type', 'source', 'amount', 'order', 'applied', 'created_at')
+    list_filter = ('transaction_type', 'source', 'applied', 'created_at')
     search_fields = ('wallet__tailor__username', 'wallet__tailor__tailor_profile__shop_name', 'order__order_number', 'description')
     readonly_fields = ('running_balance',)
 
@@ -40,9 +56,11 @@ class WalletTransactionAdmin(admin.ModelAdmin):
 
 @admin.register(RiderWallet)
 class RiderWalletAdmin(admin.ModelAdmin):
-    list_display = ('rider_name', 'available_balance', 'pending_balance', 'total_earned', 'total_withdrawn')
+    list_display = ('rider_name', 'available_balance', 'pending_balance', 'total_earned', 'total_withdrawn', 'deferred_ledger')
+    list_filter = ('deferred_ledger',)
     search_fields = ('rider__username', 'rider__rider_profile__full_name')
-    readonly_fields = ('available_balance', 'pending_balance', 'total_earned', 'total_withdrawn')
+    readonly_fields = ('available_balance', 'pending_balance', 'total_earned', 'total_withdrawn', 'ledger_applied_at')
+    actions = ['apply_pending_entries']
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related('rider', 'rider__rider_profile')
@@ -53,10 +71,15 @@ class RiderWalletAdmin(admin.ModelAdmin):
             return f"{obj.rider.username} | {obj.rider.rider_profile.full_name}"
         return obj.rider.username
 
+    @admin.action(description="Apply pending ledger entries to selected wallets")
+    def apply_pending_entries(self, request, queryset):
+        applied = _apply_pending_entries(queryset)
+        self.message_user(request, f"Applied {applied} pending ledger entries.", messages.SUCCESS)
+
 @admin.register(RiderWalletTransaction)
 class RiderWalletTransactionAdmin(admin.ModelAdmin):
-    list_display = ('id', 'rider_name', 'transaction_type', 'source', 'amount', 'order', 'created_at')
-    list_filter = ('transaction_type', 'source', 'created_at')
+    list_display = ('id', 'rider_name', 'transaction_type', 'source', 'amount', 'order', 'applied', 'created_at')
+    list_filter = ('transaction_type', 'source', 'applied', 'created_at')
     search_fields = ('wallet__rider__username', 'wallet__rider__rider_profile__full_name', 'order__order_number', 'description')
     readonly_fields = ('running_balance',)
 
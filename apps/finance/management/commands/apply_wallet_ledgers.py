@@ -0,0 +1,26 @@
+"""
+Management command to fold pending (deferred) ledger entries into wallet balances.
+
+Usage:
+    python manage.py apply_wallet_ledgers
+
+Wallets in deferred ledger mode append earnings without touching the wallet
+row. This command should be run every few minutes via cron job or task
+scheduler; each wallet is locked only while its own entries are applied.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.finance.models import RiderWallet, TailorWallet
+from apps.finance.services import WalletService
+
+
+class Command(BaseCommand):
+    help = 'Apply pending ledger entries to tailor and rider wallet balances'
+
+    def handle(self, *args, **options):
+        for label, wallet_model in (('tailor', TailorWallet), ('rider', RiderWallet)):
+            wallets, entries = WalletService.apply_all_pending(wallet_model)
+            self.stdout.write(
+                self.style.SUCCESS(f'Applied {entries} {label} ledger entries across {wallets} wallets')
+            )
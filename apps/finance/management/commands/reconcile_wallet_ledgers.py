@@ -0,0 +1,55 @@
+"""
+Management command to verify wallet balances against their ledgers.
+
+Usage:
+    python manage.py reconcile_wallet_ledgers
+    python manage.py reconcile_wallet_ledgers --apply-pending
+
+For every wallet, available_balance, total_earned and total_withdrawn must
+equal the sums of its applied ledger entries. Mismatches are reported, never
+corrected automatically. Exits non-zero when any wallet is out of balance.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.finance.models import RiderWallet, TailorWallet
+from apps.finance.services import WalletService
+
+
+class Command(BaseCommand):
+    help = 'Verify that wallet balances match the sums of their ledger entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--apply-pending',
+            action='store_true',
+            help='Apply pending (deferred) entries before checking'
+        )
+
+    def handle(self, *args, **options):
+        mismatched = 0
+        checked = 0
+        for label, wallet_model, owner in (
+            ('Tailor', TailorWallet, 'tailor'),
+            ('Rider', RiderWallet, 'rider'),
+        ):
+            if options['apply_pending']:
+                WalletService.apply_all_pending(wallet_model)
+
+            for wallet in wallet_model.objects.select_related(owner).iterator(chunk_size=500):
+                checked += 1
+                differences = WalletService.reconcile(wallet)
+                if not differences:
+                    continue
+                mismatched += 1
+                details = ', '.join(
+                    f'{field}: stored {stored}, ledger {ledger}'
+                    for field, (stored, ledger) in differences.items()
+                )
+                self.stdout.write(
+                    self.style.WARNING(f'{label} wallet {wallet.pk} ({getattr(wallet, owner).username}): {details}')
+                )
+
+        if mismatched:
+            raise CommandError(f'{mismatched} of {checked} wallets do not match their ledgers')
+        self.stdout.write(self.style.SUCCESS(f'All {checked} wallets match their ledgers'))
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0004_riderwallettransaction_earning_type'),
+        ('orders', '0045_order_needs_measurements'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='riderwallet',
+            name='deferred_ledger',
+            field=models.BooleanField(default=False, help_text='Append earnings to the ledger without locking the wallet; balances are applied in batches'),
+        ),
+        migrations.AddField(
+            model_name='riderwallet',
+            name='ledger_applied_at',
+            field=models.DateTimeField(blank=True, help_text='When pending ledger entries were last applied to the balances above', null=True),
+        ),
+        migrations.AddField(
+            model_name='riderwallettransaction',
+            name='applied',
+            field=models.BooleanField(default=True, help_text='Whether this entry is included in the wallet balances (deferred entries start unapplied)'),
+        ),
+        migrations.AddField(
+            model_name='tailorwallet',
+            name='deferred_ledger',
+            field=models.BooleanField(default=False, help_text='Append earnings to the ledger without locking the wallet; balances are applied in batches'),
+        ),
+        migrations.AddField(
+            model_name='tailorwallet',
+            name='ledger_applied_at',
+            field=models.DateTimeField(blank=True, help_text='When pending ledger entries were last applied to the balances above', null=True),
+        ),
+        migrations.AddField(
+            model_name='wallettransaction',
+            name='applied',
+            field=models.BooleanField(default=True, help_text='Whether this entry is included in the wallet balances (deferred entries start unapplied)'),
+        ),
+        migrations.AddIndex(
+            model_name='riderwallettransaction',
+            index=models.Index(condition=models.Q(('applied', False)), fields=['wallet', 'created_at'], name='rider_wallet_txn_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='wallettransaction',
+            index=models.Index(condition=models.Q(('applied', False)), fields=['wallet', 'created_at'], name='wallet_txn_pending_idx'),
+        ),
+    ]
@@ -41,6 +41,15 @@ class TailorWallet(BaseModel):
         default=Decimal('0.00'),
         help_text=_("Total amount successfully paid out to the tailor")
     )
+    deferred_ledger = models.BooleanField(
+        default=False,
+        help_text=_("Append earnings to the ledger without locking the wallet; balances are applied in batches")
+    )
+    ledger_applied_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("When pending ledger entries were last applied to the balances above")
+    )
 
     class Meta:
         verbose_name = _("Tailor Wallet")
@@ -86,6 +95,15 @@ class RiderWallet(BaseModel):
         default=Decimal('0.00'),
         help_text=_("Total amount successfully paid out to the rider")
     )
+    deferred_ledger = models.BooleanField(
+        default=False,
+        help_text=_("Append earnings to the ledger without locking the wallet; balances are applied in batches")
+    )
+    ledger_applied_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("When pending ledger entries were last applied to the balances above")
+    )
 
     class Meta:
         verbose_name = _("Rider Wallet")
@@ -156,11 +174,22 @@ class WalletTransaction(BaseModel):
         null=True,
         help_text=_("Wallet balance after this transaction (snapshot)")
     )
+    applied = models.BooleanField(
+        default=True,
+        help_text=_("Whether this entry is included in the wallet balances (deferred entries start unapplied)")
+    )
 
     class Meta:
         verbose_name = _("Wallet Transaction")
         verbose_name_plural = _("Wallet Transactions")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['wallet', 'created_at'],
+                condition=Q(applied=False),
+                name='wallet_txn_pending_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.transaction_type.upper()} | {self.amount} | {self.wallet.tailor.username}"
@@ -229,11 +258,22 @@ class RiderWalletTransaction(BaseModel):
         null=True,
         help_text=_("Wallet balance after this transaction (snapshot)")
     )
+    applied = models.BooleanField(
+        default=True,
+        help_text=_("Whether this entry is included in the wallet balances (deferred entries start unapplied)")
+    )
 
     class Meta:
         verbose_name = _("Rider Wallet Transaction")
         verbose_name_plural = _("Rider Wallet Transactions")
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['wallet', 'created_at'],
+                condition=Q(applied=False),
+                name='rider_wallet_txn_pending_idx',
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['wallet', 'order', 'transaction_type', 'earning_type'],
@@ -6,6 +6,7 @@ from .models import (
     RiderWallet, RiderWalletTransaction, RiderPayoutRequest,
 )
 from apps.orders.models import Order
+from .services import WalletService
 
 
 PAYOUT_RESERVED_STATUSES = ['pending', 'approved']
@@ -57,7 +58,8 @@ def _walk_in_order_credit_total(wallet):
 
 def _spendable_balance(wallet, user):
     reserved_amount = _reserved_payout_amount(user)
-    spendable = wallet.available_balance - reserved_amount - _walk_in_order_credit_total(wallet)
+    available = WalletService.get_balances(wallet).available_balance
+    spendable = available - reserved_amount - _walk_in_order_credit_total(wallet)
     return max(spendable, Decimal('0.00'))
 
 class OrderSummarySerializer(serializers.ModelSerializer):
@@ -99,6 +101,7 @@ class TailorWalletSerializer(serializers.ModelSerializer):
     pending_payout_amount = serializers.SerializerMethodField()
     ledger_balance = serializers.SerializerMethodField()
     total_earned = serializers.SerializerMethodField()
+    total_withdrawn = serializers.SerializerMethodField()
 
     class Meta:
         model = TailorWallet
@@ -115,15 +118,22 @@ class TailorWalletSerializer(serializers.ModelSerializer):
         return _money(_reserved_payout_amount(obj.tailor))
 
     def get_ledger_balance(self, obj):
-        return _money(max(obj.available_balance - _walk_in_order_credit_total(obj), Decimal('0.00')))
+        available = WalletService.get_balances(obj).available_balance
+        return _money(max(available - _walk_in_order_credit_total(obj), Decimal('0.00')))
 
     def get_total_earned(self, obj):
-        return _money(max(obj.total_earned - _walk_in_order_credit_total(obj), Decimal('0.00')))
+        total_earned = WalletService.get_balances(obj).total_earned
+        return _money(max(total_earned - _walk_in_order_credit_total(obj), Decimal('0.00')))
+
+    def get_total_withdrawn(self, obj):
+        return _money(WalletService.get_balances(obj).total_withdrawn)
 
 class RiderWalletSerializer(serializers.ModelSerializer):
     available_balance = serializers.SerializerMethodField()
     pending_payout_amount = serializers.SerializerMethodField()
     ledger_balance = serializers.SerializerMethodField()
+    total_earned = serializers.SerializerMethodField()
+    total_withdrawn = serializers.SerializerMethodField()
 
     class Meta:
         model = RiderWallet
@@ -140,7 +150,13 @@ class RiderWalletSerializer(serializers.ModelSerializer):
         return _money(_reserved_payout_amount(obj.rider))
 
     def get_ledger_balance(self, obj):
-        return _money(obj.available_balance)
+        return _money(WalletService.get_balances(obj).available_balance)
+
+    def get_total_earned(self, obj):
+        return _money(WalletService.get_balances(obj).total_earned)
+
+    def get_total_withdrawn(self, obj):
+        return _money(WalletService.get_balances(obj).total_withdrawn)
 
 class PayoutRequestSerializer(serializers.ModelSerializer):
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -1,16 +1,64 @@
+from collections import namedtuple
 from decimal import Decimal
-from django.db import transaction
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Sum
 from django.utils import timezone
 from .models import (
     TailorWallet, WalletTransaction, PayoutRequest,
     RiderWallet, RiderWalletTransaction, RiderPayoutRequest,
 )
 
+ZERO = Decimal('0.00')
+
+# Effect of one ledger entry on (available_balance, total_earned, total_withdrawn).
+# A refund reverses an earning.
+LEDGER_EFFECTS = {
+    'credit': (1, 1, 0),
+    'debit': (-1, 0, 1),
+    'refund': (-1, -1, 0),
+}
+
+WalletBalances = namedtuple('WalletBalances', ['available_balance', 'total_earned', 'total_withdrawn'])
+
+
+def ledger_model_for(wallet_model):
+    return WalletTransaction if wallet_model is TailorWallet else RiderWalletTransaction
+
+
+def _totals_by_type(entries):
+    """``{transaction_type: sum(amount)}`` for a ledger queryset, in one query."""
+    return {
+        row['transaction_type']: row['total'] or ZERO
+        for row in entries.order_by().values('transaction_type').annotate(total=Sum('amount'))
+    }
+
+
+def _balance_deltas(totals):
+    available = earned = withdrawn = ZERO
+    for transaction_type, amount in totals.items():
+        sign_available, sign_earned, sign_withdrawn = LEDGER_EFFECTS.get(transaction_type, (0, 0, 0))
+        available += sign_available * amount
+        earned += sign_earned * amount
+        withdrawn += sign_withdrawn * amount
+    return available, earned, withdrawn
+
+
 class WalletService:
     """
     Industry-level service to handle all wallet operations.
     Ensures atomicity and data consistency.
+
+    Wallets have two ledger modes:
+
+    * Immediate (default): each entry locks the wallet row, is applied to the
+      balances and gets its running_balance straight away.
+    * Deferred (``wallet.deferred_ledger``): earnings are appended as unapplied
+      entries without touching the wallet row, so a busy shop can complete many
+      orders in parallel. ``apply_pending_entries`` folds them into the stored
+      balances later (apply_wallet_ledgers command, or before any payout).
+
+    Readers use ``get_balances``: the stored snapshot plus unapplied entries,
+    which is correct in both modes.
     """
 
     @staticmethod
@@ -25,6 +73,105 @@ class WalletService:
         wallet, created = RiderWallet.objects.get_or_create(rider=rider)
         return wallet
 
+    @staticmethod
+    def get_balances(wallet):
+        """Snapshot balances plus unapplied ledger entries. Cached on the instance."""
+        cached = getattr(wallet, '_ledger_balances', None)
+        if cached is not None:
+            return cached
+        pending = ledger_model_for(type(wallet)).objects.filter(wallet_id=wallet.pk, applied=False)
+        available, earned, withdrawn = _balance_deltas(_totals_by_type(pending))
+        wallet._ledger_balances = WalletBalances(
+            wallet.available_balance + available,
+            wallet.total_earned + earned,
+            wallet.total_withdrawn + withdrawn,
+        )
+        return wallet._ledger_balances
+
+    @staticmethod
+    def apply_pending_entries(wallet):
+        """
+        Fold unapplied entries into the wallet balances. Returns the number applied.
+
+        Locks the wallet row for the duration; entries appended meanwhile are
+        simply left for the next run. Must be called inside a transaction.
+        """
+        wallet_model = type(wallet)
+        ledger_model = ledger_model_for(wallet_model)
+        locked = wallet_model.objects.select_for_update().get(pk=wallet.pk)
+        pending = list(
+            ledger_model.objects.filter(wallet_id=locked.pk, applied=False)
+            .order_by('created_at', 'pk')
+            .only('pk', 'transaction_type', 'amount')
+        )
+        for entry in pending:
+            sign_available, sign_earned, sign_withdrawn = LEDGER_EFFECTS.get(entry.transaction_type, (0, 0, 0))
+            locked.available_balance += sign_available * entry.amount
+            locked.total_earned += sign_earned * entry.amount
+            locked.total_withdrawn += sign_withdrawn * entry.amount
+            entry.running_balance = locked.available_balance
+            entry.applied = True
+        if pending:
+            ledger_model.objects.bulk_update(pending, ['running_balance', 'applied'])
+        locked.ledger_applied_at = timezone.now()
+        locked.save(update_fields=[
+            'available_balance', 'total_earned', 'total_withdrawn', 'ledger_applied_at', 'updated_at',
+        ])
+
+        for field in ('available_balance', 'total_earned', 'total_withdrawn', 'ledger_applied_at'):
+            setattr(wallet, field, getattr(locked, field))
+        wallet.__dict__.pop('_ledger_balances', None)
+        return len(pending)
+
+    @classmethod
+    def apply_all_pending(cls, wallet_model):
+        """Apply pending entries wallet by wallet. Returns ``(wallets, entries)`` applied."""
+        ledger_model = ledger_model_for(wallet_model)
+        wallet_ids = (
+            ledger_model.objects.filter(applied=False)
+            .order_by().values_list('wallet_id', flat=True).distinct()
+        )
+        wallets = entries = 0
+        for wallet in wallet_model.objects.filter(pk__in=list(wallet_ids)):
+            with transaction.atomic():
+                entries += cls.apply_pending_entries(wallet)
+            wallets += 1
+        return wallets, entries
+
+    @staticmethod
+    def reconcile(wallet):
+        """
+        Compare the stored balances with the sums of applied entries.
+
+        Returns ``{field: (stored, from_ledger)}`` for each mismatching field.
+        """
+        applied = ledger_model_for(type(wallet)).objects.filter(wallet_id=wallet.pk, applied=True)
+        expected = _balance_deltas(_totals_by_type(applied))
+        stored = (wallet.available_balance, wallet.total_earned, wallet.total_withdrawn)
+        return {
+            field: (actual, ledger)
+            for field, actual, ledger in zip(WalletBalances._fields, stored, expected)
+            if actual != ledger
+        }
+
+    @classmethod
+    def _record_entry(cls, wallet, *, apply_now=False, **fields):
+        """
+        Append one ledger entry. It is applied straight away unless the wallet
+        is in deferred mode (payouts pass ``apply_now``). Returns None when a
+        unique constraint says the entry already exists.
+        """
+        ledger_model = ledger_model_for(type(wallet))
+        try:
+            with transaction.atomic():
+                entry = ledger_model.objects.create(wallet=wallet, applied=False, **fields)
+                if apply_now or not wallet.deferred_ledger:
+                    cls.apply_pending_entries(wallet)
+                    entry.refresh_from_db(fields=['running_balance', 'applied'])
+        except IntegrityError:
+            return None
+        return entry
+
     @classmethod
     @transaction.atomic
     def process_order_earning(cls, order):
@@ -54,24 +201,16 @@ class WalletService:
 
         wallet = cls.get_or_create_wallet(order.tailor)
 
-        # Create Transaction Entry (The Ledger)
-        transaction_entry = WalletTransaction.objects.create(
-            wallet=wallet,
+        # Create Transaction Entry (The Ledger); balances follow its mode.
+        return cls._record_entry(
+            wallet,
             transaction_type='credit',
             source='order',
             amount=net_earning,
             order=order,
             description=f"Earnings for Order {order.order_number} (Fabric: {fabric_price}, Stitching: {stitching_price}, Express: {express_fee}, Fee: -{system_fee})",
-            running_balance=wallet.available_balance + net_earning
         )
 
-        # Update Wallet Balances
-        wallet.available_balance += net_earning
-        wallet.total_earned += net_earning
-        wallet.save()
-
-        return transaction_entry
-
     @classmethod
     @transaction.atomic
     def process_rider_order_earning(cls, order):
@@ -97,23 +236,16 @@ class WalletService:
             return None
 
         wallet = cls.get_or_create_rider_wallet(rider)
-        transaction_entry = RiderWalletTransaction.objects.create(
-            wallet=wallet,
+        return cls._record_entry(
+            wallet,
             transaction_type='credit',
             source='order',
             earning_type='delivery',
             amount=delivery_fee,
             order=order,
             description=f"Delivery earning for Order {order.order_number} (Delivery fee: {delivery_fee})",
-            running_balance=wallet.available_balance + delivery_fee
         )
 
-        wallet.available_balance += delivery_fee
-        wallet.total_earned += delivery_fee
-        wallet.save()
-
-        return transaction_entry
-
     @classmethod
     @transaction.atomic
     def process_measurement_rider_order_earning(cls, order):
@@ -147,23 +279,16 @@ class WalletService:
             return None
 
         wallet = cls.get_or_create_rider_wallet(rider)
-        transaction_entry = RiderWalletTransaction.objects.create(
-            wallet=wallet,
+        return cls._record_entry(
+            wallet,
             transaction_type='credit',
             source='order',
             earning_type='measurement',
             amount=measurement_fee,
             order=order,
             description=f"Measurement earning for Order {order.order_number} (Measurement fee: {measurement_fee})",
-            running_balance=wallet.available_balance + measurement_fee
         )
 
-        wallet.available_balance += measurement_fee
-        wallet.total_earned += measurement_fee
-        wallet.save()
-
-        return transaction_entry
-
     @classmethod
     @transaction.atomic
     def process_payout(cls, payout_request, admin_user, reference_number, notes=""):
@@ -175,22 +300,17 @@ class WalletService:
 
         wallet = cls.get_or_create_wallet(payout_request.tailor)
 
-        # Create Debit Transaction
-        transaction_entry = WalletTransaction.objects.create(
-            wallet=wallet,
+        # Create Debit Transaction; payouts always settle the ledger first.
+        transaction_entry = cls._record_entry(
+            wallet,
+            apply_now=True,
             transaction_type='debit',
             source='payout',
             amount=payout_request.amount,
             payout_request=payout_request,
             description=f"Payout processed. Ref: {reference_number}",
-            running_balance=wallet.available_balance - payout_request.amount
         )
 
-        # Update Wallet
-        wallet.available_balance -= payout_request.amount
-        wallet.total_withdrawn += payout_request.amount
-        wallet.save()
-
         # Update Payout Request
         payout_request.status = 'paid'
         payout_request.payment_reference = reference_number
@@ -212,20 +332,16 @@ class WalletService:
 
         wallet = cls.get_or_create_rider_wallet(payout_request.rider)
 
-        transaction_entry = RiderWalletTransaction.objects.create(
-            wallet=wallet,
+        transaction_entry = cls._record_entry(
+            wallet,
+            apply_now=True,
             transaction_type='debit',
             source='payout',
             amount=payout_request.amount,
             payout_request=payout_request,
             description=f"Payout processed. Ref: {reference_number}",
-            running_balance=wallet.available_balance - payout_request.amount
         )
 
-        wallet.available_balance -= payout_request.amount
-        wallet.total_withdrawn += payout_request.amount
-        wallet.save()
-
         payout_request.status = 'paid'
         payout_request.payment_reference = reference_number
         payout_request.admin_notes = notes
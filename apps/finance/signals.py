@@ -1,17 +1,22 @@
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
-from apps.orders.models import Order
+from apps.core.outbox import outbox_handler
+from apps.orders.models import ORDER_SAVED_TOPIC, order_for_event
 from .services import WalletService
 from .models import PayoutRequest, RiderPayoutRequest
 from apps.notifications.services import NotificationService
 
-@receiver(post_save, sender=Order)
-def handle_order_financials(sender, instance, created, **kwargs):
+@outbox_handler(ORDER_SAVED_TOPIC)
+def handle_order_financials(event):
     """
-    Signal receiver to process earnings when an order is completed.
+    Outbox consumer to process earnings when an order is completed.
     Tailor wallet credits home-delivery orders only (walk-in is skipped in WalletService).
     """
+    instance = order_for_event(event)
+    if instance is None:
+        return
+
     # Measurement rider can be credited once paid measurement work is complete.
     if instance.payment_status == 'paid':
         WalletService.process_measurement_rider_order_earning(instance)
@@ -11,6 +11,7 @@ from apps.finance.models import (
     RiderWalletTransaction,
     TailorWallet,
 )
+from apps.core.outbox import drain
 from apps.finance.services import WalletService
 from apps.orders.models import Order
 
@@ -68,7 +69,10 @@ class RiderFinanceAPITest(TestCase):
             'total_amount': Decimal('148.00'),
         }
         defaults.update(overrides)
-        return Order.objects.create(**defaults)
+        order = Order.objects.create(**defaults)
+        # Earnings are credited by the order_saved outbox consumer.
+        drain()
+        return order
 
     def test_completed_delivery_credits_rider_wallet_once(self):
         order = self._completed_delivery_order()
@@ -97,6 +101,7 @@ class RiderFinanceAPITest(TestCase):
         WalletService.process_measurement_rider_order_earning(order)
         order.status = 'delivered'
         order.save(update_fields=['status', 'updated_at'])
+        drain()
 
         delivery_wallet = RiderWallet.objects.get(rider=self.rider)
         measurement_wallet = RiderWallet.objects.get(rider=self.measurement_rider)
@@ -129,6 +134,7 @@ class RiderFinanceAPITest(TestCase):
         WalletService.process_measurement_rider_order_earning(order)
         order.status = 'delivered'
         order.save(update_fields=['status', 'updated_at'])
+        drain()
 
         wallet = RiderWallet.objects.get(rider=self.rider)
         self.assertEqual(wallet.available_balance, Decimal('35.00'))
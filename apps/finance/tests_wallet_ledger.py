@@ -0,0 +1,114 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.finance.models import PayoutRequest, TailorWallet, WalletTransaction
+from apps.finance.services import WalletService
+from apps.orders.models import Order
+
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+)
+class DeferredWalletLedgerTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='ledger_customer',
+            password='testpass123',
+            role='USER',
+        )
+        self.tailor = User.objects.create_user(
+            username='ledger_tailor',
+            password='testpass123',
+            role='TAILOR',
+        )
+        self.wallet = TailorWallet.objects.create(tailor=self.tailor, deferred_ledger=True)
+
+    def _order(self, subtotal):
+        # Left pending so the post_save signal does not credit it on its own.
+        return Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            service_mode='home_delivery',
+            payment_method='credit_card',
+            subtotal=Decimal(subtotal),
+            system_fee=Decimal('5.00'),
+            total_amount=Decimal(subtotal),
+        )
+
+    def test_deferred_earnings_do_not_touch_wallet_row(self):
+        first = WalletService.process_order_earning(self._order('100.00'))
+        WalletService.process_order_earning(self._order('50.00'))
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.available_balance, Decimal('0.00'))
+        self.assertFalse(first.applied)
+        self.assertIsNone(first.running_balance)
+        self.assertEqual(
+            WalletService.get_balances(self.wallet),
+            (Decimal('140.00'), Decimal('140.00'), Decimal('0.00')),
+        )
+
+    def test_apply_folds_pending_entries_in_order(self):
+        first = WalletService.process_order_earning(self._order('100.00'))
+        second = WalletService.process_order_earning(self._order('50.00'))
+
+        out = StringIO()
+        call_command('apply_wallet_ledgers', stdout=out)
+
+        self.wallet.refresh_from_db()
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(self.wallet.available_balance, Decimal('140.00'))
+        self.assertEqual(self.wallet.total_earned, Decimal('140.00'))
+        self.assertIsNotNone(self.wallet.ledger_applied_at)
+        self.assertEqual(first.running_balance, Decimal('95.00'))
+        self.assertEqual(second.running_balance, Decimal('140.00'))
+        self.assertFalse(WalletTransaction.objects.filter(applied=False).exists())
+        self.assertIn('Applied 2 tailor ledger entries across 1 wallets', out.getvalue())
+
+    def test_payout_settles_pending_entries_first(self):
+        WalletService.process_order_earning(self._order('100.00'))
+        payout = PayoutRequest.objects.create(tailor=self.tailor, amount=Decimal('40.00'))
+
+        entry = WalletService.process_payout(payout, admin_user=None, reference_number='REF-1')
+
+        self.wallet.refresh_from_db()
+        self.assertTrue(entry.applied)
+        self.assertEqual(entry.running_balance, Decimal('55.00'))
+        self.assertEqual(self.wallet.available_balance, Decimal('55.00'))
+        self.assertEqual(self.wallet.total_withdrawn, Decimal('40.00'))
+
+    def test_wallet_endpoint_includes_pending_entries(self):
+        WalletService.process_order_earning(self._order('100.00'))
+        client = APIClient()
+        client.force_authenticate(user=self.tailor)
+
+        response = client.get('/api/finance/wallet/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['available_balance'], '95.00')
+        self.assertEqual(response.data['total_earned'], '95.00')
+
+    def test_reconcile_reports_mismatches(self):
+        WalletService.process_order_earning(self._order('100.00'))
+        call_command('reconcile_wallet_ledgers', apply_pending=True, stdout=StringIO())
+
+        TailorWallet.objects.filter(pk=self.wallet.pk).update(available_balance=Decimal('90.00'))
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, '1 of 1 wallets do not match'):
+            call_command('reconcile_wallet_ledgers', stdout=out)
+        self.assertIn('available_balance: stored 90.00, ledger 95.00', out.getvalue())
@@ -4,7 +4,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from apps.core.phone_format import format_phone_e164
-from apps.core.taqnyat_service import TaqnyatSMSService
+from apps.core.taqnyat_service import SMSMessage, TaqnyatSMSService
 from apps.notifications.services import NotificationService
 
 from .models import AdminMessageDelivery, AdminOutboundMessage
@@ -44,22 +44,27 @@ def resolve_recipients(message: AdminOutboundMessage):
   return []
 
 
-def _send_sms_to_user(message: AdminOutboundMessage, user, delivery: AdminMessageDelivery) -> bool:
+def _prepare_sms(message: AdminOutboundMessage, user, delivery: AdminMessageDelivery):
+  """Return the SMS to send ``user``, or None after marking the delivery skipped or failed."""
   phone = (user.phone or '').strip()
   if not phone:
     delivery.sms_status = 'skipped'
     delivery.error_message = (delivery.error_message + ' No phone number on file.').strip()
-    return False
+    return None
 
   try:
     formatted_phone = format_phone_e164(phone)
   except Exception as exc:
     delivery.sms_status = 'failed'
     delivery.error_message = (delivery.error_message + f' Invalid phone: {exc}').strip()
-    return False
+    return None
 
   delivery.phone_used = formatted_phone
-  success, detail, message_id = TaqnyatSMSService.send_sms(formatted_phone, message.body)
+  return SMSMessage(formatted_phone, message.body)
+
+
+def _record_sms_result(delivery: AdminMessageDelivery, result) -> bool:
+  success, detail, message_id = result
   if success:
     delivery.sms_status = 'sent'
     if message_id:
@@ -71,6 +76,25 @@ def _send_sms_to_user(message: AdminOutboundMessage, user, delivery: AdminMessag
   return False
 
 
+def _sms_batch_results(message: AdminOutboundMessage, deliveries):
+  """
+  Yield each ``(user, delivery)`` once its SMS leg is settled. Sends run as one
+  concurrent batch; each delivery comes back as soon as its result is in.
+  """
+  pending = []
+  for user, delivery in deliveries:
+    sms = _prepare_sms(message, user, delivery)
+    if sms is None:
+      yield user, delivery
+    else:
+      pending.append((user, delivery, sms))
+
+  results = TaqnyatSMSService.iter_many(sms for _user, _delivery, sms in pending)
+  for (user, delivery, _sms), result in zip(pending, results):
+    _record_sms_result(delivery, result)
+    yield user, delivery
+
+
 def _send_push_to_user(message: AdminOutboundMessage, user, delivery: AdminMessageDelivery) -> bool:
   title = (message.title or '').strip() or 'Mgask'
   success = NotificationService.send_notification(
@@ -140,23 +164,28 @@ def process_admin_message(message_id: int):
   failed_count = 0
   errors = []
 
+  channel = message.channel
+  deliveries = []
   for user in recipients:
     delivery, _created = AdminMessageDelivery.objects.get_or_create(
       message=message,
       user=user,
       defaults={'created_by': message.sent_by},
     )
+    deliveries.append((user, delivery))
 
-    channel = message.channel
-    sms_result = push_result = True
-
-    if channel in ('sms', 'both'):
-      sms_result = _send_sms_to_user(message, user, delivery)
-    else:
+  if channel in ('sms', 'both'):
+    settled = _sms_batch_results(message, deliveries)
+  else:
+    for _user, delivery in deliveries:
       delivery.sms_status = 'skipped'
+    settled = deliveries
 
+  # Save each delivery as soon as its SMS result is in, so a crash part way
+  # through keeps the status of every message already sent.
+  for user, delivery in settled:
     if channel in ('push', 'both'):
-      push_result = _send_push_to_user(message, user, delivery)
+      _send_push_to_user(message, user, delivery)
     else:
       delivery.push_status = 'skipped'
 
@@ -93,6 +93,21 @@ class MessagingServiceTestCase(TestCase):
         self.assertEqual(delivery.provider_message_id, 'msg-123')
         mock_send_sms.assert_called_once()
 
+    @patch('apps.messaging.services._finalize_delivery_status')
+    @patch('apps.messaging.services.TaqnyatSMSService.send_sms')
+    def test_deliveries_are_saved_as_sms_results_arrive(self, mock_send_sms, mock_finalize):
+        mock_send_sms.return_value = (True, 'ok', 'msg-789')
+        mock_finalize.side_effect = [None, RuntimeError('worker crashed')]
+        message = self._create_message(audience_type='selected', target_user=None)
+        message.recipients.set([self.tailor, self.customer])
+
+        with self.assertRaises(RuntimeError):
+            process_admin_message(message.pk)
+
+        saved = AdminMessageDelivery.objects.filter(message=message, sms_status='sent')
+        self.assertEqual(saved.count(), 1)
+        self.assertEqual(saved.get().provider_message_id, 'msg-789')
+
     @patch('apps.messaging.services.TaqnyatSMSService.send_sms')
     def test_process_admin_message_sms_missing_phone(self, mock_send_sms):
         self.tailor.phone = ''
@@ -130,12 +145,13 @@ class MessagingServiceTestCase(TestCase):
     TAQNYAT_SENDER_NAME='TestSender',
 )
 class TaqnyatSendSmsTestCase(TestCase):
-    @patch('apps.core.taqnyat_service.urllib.request.urlopen')
-    def test_send_sms_success(self, mock_urlopen):
+    @patch('apps.core.taqnyat_service.post_json')
+    def test_send_sms_success(self, mock_post_json):
         from apps.core.taqnyat_service import TaqnyatSMSService
 
-        mock_response = mock_urlopen.return_value.__enter__.return_value
-        mock_response.read.return_value = b'{"statusCode":201,"messageId":"abc-123"}'
+        mock_response = mock_post_json.return_value
+        mock_response.status_code = 201
+        mock_response.text = '{"statusCode":201,"messageId":"abc-123"}'
 
         success, message, message_id = TaqnyatSMSService.send_sms('0501234567', 'Hello tailor')
 
@@ -137,6 +137,7 @@ class NotificationLogAdmin(admin.ModelAdmin):
     
     list_filter = [
         'notification_type',
+        'app_role',
         'category',
         'status',
         'created_at',
@@ -5,3 +5,5 @@ class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.notifications'
 
+    def ready(self):
+        import apps.notifications.signals
@@ -0,0 +1,122 @@
+"""
+Notification inbox: unread counters, read marking and retention.
+
+Each user has one inbox per app (CUSTOMER, TAILOR, RIDER). Unread badges
+read NotificationUnreadCount instead of counting NotificationLog. Signals
+keep the counters current for single-row saves. The bulk paths here
+(mark all read, archive) adjust them by the number of rows they changed.
+"""
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import FCMDeviceToken, NotificationLog, NotificationLogArchive, NotificationUnreadCount
+
+APP_ROLES = tuple(role for role, _ in FCMDeviceToken.APP_ROLE_CHOICES)
+
+ARCHIVE_FIELDS = (
+    'user_id', 'app_role', 'notification_type', 'category', 'title', 'body', 'data',
+    'status', 'error_message', 'sent_at', 'is_read', 'read_at', 'created_at',
+)
+
+
+def default_app_role(user):
+    """The app a notification not tied to a device token is shown in."""
+    role = getattr(user, 'role', None)
+    return role if role in ('TAILOR', 'RIDER') else 'CUSTOMER'
+
+
+def adjust_unread_count(user_id, app_role, delta):
+    """Add ``delta`` to an inbox's unread counter, creating it on first use."""
+    if not delta:
+        return
+    updated = NotificationUnreadCount.objects.filter(user_id=user_id, app_role=app_role).update(
+        unread_count=Greatest(F('unread_count') + delta, 0),
+    )
+    if updated:
+        return
+    # First change for this inbox: count the log, which already includes it.
+    unread = NotificationLog.objects.filter(user_id=user_id, app_role=app_role, is_read=False).count()
+    try:
+        with transaction.atomic():
+            NotificationUnreadCount.objects.create(user_id=user_id, app_role=app_role, unread_count=unread)
+    except IntegrityError:
+        NotificationUnreadCount.objects.filter(user_id=user_id, app_role=app_role).update(
+            unread_count=Greatest(F('unread_count') + delta, 0),
+        )
+
+
+def unread_counts(user):
+    """``{app_role: unread}`` for every app, in one query."""
+    counts = dict.fromkeys(APP_ROLES, 0)
+    counts.update(
+        NotificationUnreadCount.objects.filter(user=user).values_list('app_role', 'unread_count')
+    )
+    return counts
+
+
+def _mark_read(notifications):
+    """Mark unread rows read and take them off their counters. Returns rows changed."""
+    inboxes = defaultdict(list)
+    for user_id, app_role, pk in notifications.filter(is_read=False).values_list('user_id', 'app_role', 'pk'):
+        inboxes[(user_id, app_role)].append(pk)
+    now = timezone.now()
+    total = 0
+    for (user_id, app_role), ids in inboxes.items():
+        # Only rows still unread count, so concurrent requests never decrement twice.
+        marked = NotificationLog.objects.filter(pk__in=ids, is_read=False).update(is_read=True, read_at=now)
+        adjust_unread_count(user_id, app_role, -marked)
+        total += marked
+    return total
+
+
+def mark_notification_read(user, pk):
+    """Mark one of ``user``'s notifications read. Returns False if it is not theirs."""
+    notifications = NotificationLog.objects.filter(pk=pk, user=user)
+    if not notifications.exists():
+        return False
+    _mark_read(notifications)
+    return True
+
+
+def mark_all_read(user, app_role=None):
+    """Mark ``user``'s unread notifications read, optionally for one app only."""
+    notifications = NotificationLog.objects.filter(user=user)
+    if app_role:
+        notifications = notifications.filter(app_role=app_role)
+    return _mark_read(notifications)
+
+
+def archive_notification_logs(cutoff, batch_size=1000):
+    """
+    Move logs created before ``cutoff`` to NotificationLogArchive in id
+    batches, one transaction per batch. Returns the number archived.
+    """
+    archived = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                NotificationLog.objects.select_for_update()
+                .filter(created_at__lt=cutoff, pk__gt=last_id)
+                .order_by('pk')
+                .values('pk', *ARCHIVE_FIELDS)[:batch_size]
+            )
+            if not rows:
+                return archived
+            NotificationLogArchive.objects.bulk_create(
+                [
+                    NotificationLogArchive(original_id=row['pk'], **{field: row[field] for field in ARCHIVE_FIELDS})
+                    for row in rows
+                ],
+                ignore_conflicts=True,
+            )
+            unread = Counter((row['user_id'], row['app_role']) for row in rows if not row['is_read'])
+            NotificationLog.objects.filter(pk__in=[row['pk'] for row in rows]).delete()
+            for (user_id, app_role), count in unread.items():
+                adjust_unread_count(user_id, app_role, -count)
+        archived += len(rows)
+        last_id = rows[-1]['pk']
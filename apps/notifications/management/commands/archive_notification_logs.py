@@ -0,0 +1,47 @@
+"""
+Move notification logs older than the retention window to the archive table.
+Should be run daily via cron job.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.notifications.inbox import archive_notification_logs
+from apps.notifications.models import NotificationLog
+
+
+class Command(BaseCommand):
+    help = 'Archive notification logs older than 90 days'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Number of days to keep notification logs live (default: 90)',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show how many logs would be archived without moving them',
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        cutoff = timezone.now() - timedelta(days=days)
+
+        if options['dry_run']:
+            count = NotificationLog.objects.filter(created_at__lt=cutoff).count()
+            self.stdout.write(
+                self.style.WARNING(
+                    f'DRY RUN: Would archive {count} notification logs older than {days} days (before {cutoff})'
+                )
+            )
+            return
+
+        archived = archive_notification_logs(cutoff, batch_size=max(1, options['batch_size']))
+        self.stdout.write(
+            self.style.SUCCESS(f'Archived {archived} notification logs older than {days} days.')
+        )
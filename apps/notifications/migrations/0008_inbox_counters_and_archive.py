@@ -0,0 +1,108 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+USER_ROLE_APPS = {'TAILOR': 'TAILOR', 'RIDER': 'RIDER'}
+
+
+def backfill_app_roles_and_unread_counts(apps, schema_editor):
+    NotificationLog = apps.get_model('notifications', 'NotificationLog')
+    NotificationUnreadCount = apps.get_model('notifications', 'NotificationUnreadCount')
+    alias = schema_editor.connection.alias
+    logs = NotificationLog.objects.using(alias)
+
+    # Logs sent to a device belong to that device's app; the rest to the user's main app.
+    for role in ('TAILOR', 'RIDER'):
+        logs.filter(fcm_token__app_role=role).update(app_role=role)
+    for user_role, app_role in USER_ROLE_APPS.items():
+        logs.filter(fcm_token__isnull=True, user__role=user_role).update(app_role=app_role)
+
+    rows = (
+        logs.filter(is_read=False)
+        .values('user_id', 'app_role')
+        .annotate(unread=Count('id'))
+        .order_by()
+    )
+    NotificationUnreadCount.objects.using(alias).bulk_create(
+        [
+            NotificationUnreadCount(user_id=row['user_id'], app_role=row['app_role'], unread_count=row['unread'])
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_alter_fcmdevicetoken_unique_together_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationLogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('app_role', models.CharField(choices=[('CUSTOMER', 'Customer'), ('TAILOR', 'Tailor'), ('RIDER', 'Rider')], max_length=20)),
+                ('notification_type', models.CharField(choices=[('ORDER_STATUS', 'Order Status'), ('PAYMENT', 'Payment'), ('RIDER_ASSIGNMENT', 'Rider Assignment'), ('PROFILE', 'Profile'), ('APPOINTMENT', 'Appointment'), ('SYSTEM', 'System'), ('PROMOTION', 'Promotion'), ('STYLE_CONSENT', 'Style Consent'), ('TEST', 'Test')], max_length=20)),
+                ('category', models.CharField(max_length=50)),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], max_length=10)),
+                ('error_message', models.TextField(blank=True, null=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('is_read', models.BooleanField(default=False)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Notification Log',
+                'verbose_name_plural': 'Archived Notification Logs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='NotificationUnreadCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('app_role', models.CharField(choices=[('CUSTOMER', 'Customer'), ('TAILOR', 'Tailor'), ('RIDER', 'Rider')], max_length=20)),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Notification Unread Count',
+                'verbose_name_plural': 'Notification Unread Counts',
+            },
+        ),
+        migrations.AddField(
+            model_name='notificationlog',
+            name='app_role',
+            field=models.CharField(choices=[('CUSTOMER', 'Customer'), ('TAILOR', 'Tailor'), ('RIDER', 'Rider')], default='CUSTOMER', help_text='The app whose inbox shows this notification', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='notificationlog',
+            index=models.Index(fields=['user', 'app_role', '-created_at', '-id'], name='notification_inbox_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationlogarchive',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notification_logs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='notificationunreadcount',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_unread_counts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='notificationunreadcount',
+            constraint=models.UniqueConstraint(fields=('user', 'app_role'), name='unique_notification_unread_count'),
+        ),
+        migrations.RunPython(backfill_app_roles_and_unread_counts, migrations.RunPython.noop),
+    ]
@@ -169,6 +169,13 @@ class NotificationLog(BaseModel):
         help_text="When the notification was read by the user"
     )
     
+    app_role = models.CharField(
+        max_length=20,
+        choices=FCMDeviceToken.APP_ROLE_CHOICES,
+        default='CUSTOMER',
+        help_text="The app whose inbox shows this notification"
+    )
+    
     class Meta:
         verbose_name = "Notification Log"
         verbose_name_plural = "Notification Logs"
@@ -178,8 +185,65 @@ class NotificationLog(BaseModel):
             models.Index(fields=['notification_type', 'status']),
             models.Index(fields=['created_at']),
             models.Index(fields=['user', 'is_read']),
+            models.Index(fields=['user', 'app_role', '-created_at', '-id'], name='notification_inbox_idx'),
         ]
     
     def __str__(self):
         return f"{self.user.username} - {self.notification_type} - {self.category} - {self.status}"
 
+
+
+class NotificationUnreadCount(models.Model):
+    """
+    Unread NotificationLog rows per user and app, kept current by signals and
+    the inbox services so badges never count the log.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_unread_counts',
+    )
+    app_role = models.CharField(max_length=20, choices=FCMDeviceToken.APP_ROLE_CHOICES)
+    unread_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Notification Unread Count"
+        verbose_name_plural = "Notification Unread Counts"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'app_role'], name='unique_notification_unread_count'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.app_role}: {self.unread_count}"
+
+
+class NotificationLogArchive(models.Model):
+    """NotificationLog rows moved out of the live table by the retention command."""
+    original_id = models.BigIntegerField(unique=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_notification_logs',
+    )
+    app_role = models.CharField(max_length=20, choices=FCMDeviceToken.APP_ROLE_CHOICES)
+    notification_type = models.CharField(max_length=20, choices=NotificationLog.NOTIFICATION_TYPE_CHOICES)
+    category = models.CharField(max_length=50)
+    title = models.CharField(max_length=255)
+    body = models.TextField()
+    data = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=NotificationLog.STATUS_CHOICES)
+    error_message = models.TextField(blank=True, null=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    is_read = models.BooleanField(default=False)
+    read_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(db_index=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Archived Notification Log"
+        verbose_name_plural = "Archived Notification Logs"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user_id} - {self.category} ({self.created_at:%Y-%m-%d})"
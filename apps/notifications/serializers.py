@@ -98,6 +98,7 @@ class NotificationLogSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'notification_type',
+            'app_role',
             'category',
             'title',
             'body',
@@ -109,5 +110,5 @@ class NotificationLogSerializer(serializers.ModelSerializer):
             'read_at',
             'created_at',
         ]
-        read_only_fields = ['id', 'created_at', 'read_at']
+        read_only_fields = ['id', 'app_role', 'created_at', 'read_at']
 
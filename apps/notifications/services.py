@@ -2,7 +2,9 @@ import logging
 from typing import List, Dict, Optional
 from django.conf import settings
 from django.utils import timezone
-from .models import FCMDeviceToken, NotificationLog
+from .inbox import default_app_role
+from .models import NotificationLog
+from .token_registry import deactivate_token, get_tokens_for_users, get_user_tokens
 from zthob.translations import translate_message, get_language_from_request
 
 # Import Firebase Admin SDK
@@ -84,6 +86,7 @@ class NotificationService:
         priority: str = 'high',
         app_role: Optional[str] = None,
         language_override: Optional[str] = None,
+        fcm_tokens: Optional[List] = None,
     ) -> bool:
         """
         Send push notification to a user
@@ -97,6 +100,8 @@ class NotificationService:
             data: Additional data payload
             priority: Notification priority (high, normal)
             language_override: Optional language code to force translation (e.g. 'ar')
+            fcm_tokens: The user's tokens for ``app_role`` if already looked up
+                (see ``get_tokens_for_users``); read from the registry otherwise
         
         Returns:
             bool: True if notification was sent successfully, False otherwise
@@ -121,6 +126,7 @@ class NotificationService:
                     data=data or {},
                     status='failed',
                     error_message="Firebase Admin SDK not installed.",
+                    app_role=app_role or default_app_role(user),
                 )
                 return False
             
@@ -134,22 +140,17 @@ class NotificationService:
                     title=translated_title,
                     body=translated_body,
                     data=data or {},
+                    app_role=app_role or default_app_role(user),
                     status='pending',
                     error_message="Firebase not configured. Set FIREBASE_CREDENTIALS_PATH in .env to point to your service account JSON file.",
                 )
                 return True  # Return True because notification was logged successfully
             
-            # Get active FCM tokens for the user, filtered by role if provided
-            fcm_token_filter = {
-                'user': user,
-                'is_active': True
-            }
-            if app_role:
-                fcm_token_filter['app_role'] = app_role
-                
-            fcm_tokens = FCMDeviceToken.objects.filter(**fcm_token_filter)
+            # Active FCM tokens for the user, filtered by role if provided
+            if fcm_tokens is None:
+                fcm_tokens = get_user_tokens(user.id, app_role)
             
-            if not fcm_tokens.exists():
+            if not fcm_tokens:
                 logger.warning(f"No active FCM tokens found for user {user.id}")
                 return False
             
@@ -206,7 +207,8 @@ class NotificationService:
                     # Log successful notification
                     NotificationLog.objects.create(
                         user=user,
-                        fcm_token=fcm_token,
+                        fcm_token_id=fcm_token.id,
+                        app_role=fcm_token.app_role,
                         notification_type=notification_type,
                         category=category,
                         title=translated_title,
@@ -221,8 +223,7 @@ class NotificationService:
                 except messaging.UnregisteredError:
                     # Token is invalid, mark as inactive
                     logger.warning(f"FCM token {fcm_token.id} is unregistered, marking as inactive")
-                    fcm_token.is_active = False
-                    fcm_token.save()
+                    deactivate_token(fcm_token, user.id)
                     failed_tokens.append(fcm_token)
                     
                 except Exception as e:
@@ -231,7 +232,8 @@ class NotificationService:
                     # Log failed notification
                     NotificationLog.objects.create(
                         user=user,
-                        fcm_token=fcm_token,
+                        fcm_token_id=fcm_token.id,
+                        app_role=fcm_token.app_role,
                         notification_type=notification_type,
                         category=category,
                         title=translated_title,
@@ -267,6 +269,7 @@ class NotificationService:
             Dict with success_count and failed_count
         """
         results = {'success_count': 0, 'failed_count': 0}
+        tokens_by_user = get_tokens_for_users(user.id for user in users)
         
         for user in users:
             if NotificationService.send_notification(
@@ -276,7 +279,8 @@ class NotificationService:
                 notification_type=notification_type,
                 category=category,
                 data=data,
-                priority=priority
+                priority=priority,
+                fcm_tokens=tokens_by_user[user.id],
             ):
                 results['success_count'] += 1
             else:
@@ -979,8 +983,9 @@ class NotificationService:
             rider_profile__review__review_status='approved',
             rider_profile__is_available=True
         ).distinct()
+        active_riders = list(active_riders)
         
-        if not active_riders.exists():
+        if not active_riders:
             logger.info("No active riders found for broadcast")
             return
             
@@ -990,6 +995,7 @@ class NotificationService:
         
         if FIREBASE_SDK_AVAILABLE:
             count = 0
+            rider_tokens = get_tokens_for_users((rider.id for rider in active_riders), 'RIDER')
             for rider in active_riders:
                 success = NotificationService.send_notification(
                     user=rider,
@@ -1003,7 +1009,8 @@ class NotificationService:
                         'broadcast': True
                     },
                     priority='high',
-                    app_role='RIDER'
+                    app_role='RIDER',
+                    fcm_tokens=rider_tokens[rider.id],
                 )
                 if success:
                     count += 1
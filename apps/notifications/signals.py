@@ -0,0 +1,76 @@
+"""
+Outbox relay for order status notifications.
+Transitions are recorded as outbox events with the order change; this relay
+runs after commit and hands each claimed batch to one Celery task.
+
+Single-row NotificationLog saves also keep the inbox unread counters current,
+and FCMDeviceToken writes invalidate the cached token registry.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.core.outbox import outbox_handler
+from apps.orders.models import ORDER_STATUS_NOTIFICATION_TOPIC
+
+from .inbox import adjust_unread_count
+from .models import FCMDeviceToken, NotificationLog
+from .token_registry import invalidate_user_tokens
+
+
+@outbox_handler(ORDER_STATUS_NOTIFICATION_TOPIC, batch=True)
+def relay_status_notifications(events):
+    from .tasks import send_status_notifications_batch_task
+
+    notifications = [
+        event.payload for event in events
+        # A chain that ended where it started (e.g. accept then revert) is not news.
+        if event.payload.get('old_status') != event.payload.get('new_status')
+    ]
+    if notifications:
+        send_status_notifications_batch_task.delay(notifications)
+
+
+@receiver(pre_save, sender=NotificationLog)
+def remember_inbox_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._previous_inbox = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not {'is_read', 'app_role'} & set(update_fields):
+        return
+    instance._previous_inbox = (
+        NotificationLog.objects.filter(pk=instance.pk).values_list('app_role', 'is_read').first()
+    )
+
+
+@receiver(post_save, sender=NotificationLog)
+def update_unread_count(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        if not instance.is_read:
+            adjust_unread_count(instance.user_id, instance.app_role, 1)
+        return
+    previous = getattr(instance, '_previous_inbox', None)
+    if previous is None or previous == (instance.app_role, instance.is_read):
+        return
+    previous_role, previous_read = previous
+    if not previous_read:
+        adjust_unread_count(instance.user_id, previous_role, -1)
+    if not instance.is_read:
+        adjust_unread_count(instance.user_id, instance.app_role, 1)
+
+
+@receiver(pre_save, sender=FCMDeviceToken)
+def remember_token_owner(sender, instance, raw=False, **kwargs):
+    instance._previous_user_id = None
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    instance._previous_user_id = (
+        FCMDeviceToken.objects.filter(pk=instance.pk).values_list('user_id', flat=True).first()
+    )
+
+
+@receiver([post_save, post_delete], sender=FCMDeviceToken)
+def invalidate_token_registry(sender, instance, **kwargs):
+    # A reassigned token must also leave its previous owner's cached list.
+    invalidate_user_tokens(instance.user_id, getattr(instance, '_previous_user_id', None))
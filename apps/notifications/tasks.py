@@ -52,6 +52,36 @@ def send_tailor_status_notification_task(order_id, old_status, new_status, user_
         logger.error(f"Error in send_tailor_status_notification_task: {str(e)}")
         return False
 
+@shared_task(name="apps.notifications.tasks.send_status_notifications_batch_task")
+def send_status_notifications_batch_task(notifications):
+    """
+    Send a batch of rider/tailor status notifications relayed from the outbox.
+    Each item has order_id, side ('rider' or 'tailor'), old_status, new_status, user_id.
+    """
+    from apps.orders.models import Order
+    from .services import NotificationService
+
+    senders = {
+        'rider': NotificationService.send_rider_status_notification,
+        'tailor': NotificationService.send_tailor_status_notification,
+    }
+    orders = Order.objects.select_related('customer', 'tailor', 'rider').in_bulk(
+        {item['order_id'] for item in notifications}
+    )
+    users = User.objects.in_bulk({item['user_id'] for item in notifications if item.get('user_id')})
+    sent = 0
+    for item in notifications:
+        order = orders.get(item['order_id'])
+        sender = senders.get(item.get('side'))
+        if order is None or sender is None:
+            continue
+        try:
+            sender(order, item['old_status'], item['new_status'], users.get(item.get('user_id')))
+            sent += 1
+        except Exception as e:
+            logger.error(f"Error in send_status_notifications_batch_task for order {item['order_id']}: {str(e)}")
+    return sent
+
 @shared_task(name="apps.notifications.tasks.send_rider_status_notification_task")
 def send_rider_status_notification_task(order_id, old_status, new_status, user_id=None):
     from apps.orders.models import Order
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.notifications.models import NotificationLog, NotificationLogArchive, NotificationUnreadCount
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class NotificationInboxTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='inbox_user', role='TAILOR')
+        self.client.force_authenticate(user=self.user)
+
+    def _log(self, app_role='TAILOR', **extra):
+        return NotificationLog.objects.create(
+            user=self.user,
+            app_role=app_role,
+            notification_type='ORDER_STATUS',
+            category='order_confirmed',
+            title='Order update',
+            body='Your order was confirmed',
+            **extra,
+        )
+
+    def _counts(self):
+        response = self.client.get('/api/notifications/unread-count/')
+        self.assertEqual(response.status_code, 200)
+        return response.data['data']
+
+    def test_counters_follow_create_read_and_mark_all(self):
+        first = self._log()
+        self._log()
+        self._log(app_role='CUSTOMER')
+        self.assertEqual(self._counts(), {'counts': {'CUSTOMER': 1, 'TAILOR': 2, 'RIDER': 0}, 'total': 3})
+
+        self.client.post(f'/api/notifications/{first.id}/read/')
+        self.client.post(f'/api/notifications/{first.id}/read/')
+        self.assertEqual(self._counts()['counts']['TAILOR'], 1)
+
+        response = self.client.post('/api/notifications/read-all/', {'app_role': 'TAILOR'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._counts()['counts'], {'CUSTOMER': 1, 'TAILOR': 0, 'RIDER': 0})
+
+        self.client.post('/api/notifications/read-all/')
+        self.assertEqual(self._counts()['total'], 0)
+        self.assertFalse(NotificationLog.objects.filter(is_read=False).exists())
+
+    def test_saving_a_log_moves_it_between_counters(self):
+        log = self._log()
+        log.is_read = True
+        log.save()
+        log.app_role = 'CUSTOMER'
+        log.is_read = False
+        log.save(update_fields=['app_role', 'is_read'])
+        self.assertEqual(self._counts()['counts'], {'CUSTOMER': 1, 'TAILOR': 0, 'RIDER': 0})
+
+    def test_inbox_pages_by_cursor_within_one_app(self):
+        logs = [self._log() for _ in range(5)]
+        self._log(app_role='CUSTOMER')
+
+        response = self.client.get('/api/notifications/tailor/', {'page_size': 2})
+        data = response.data['data']
+        self.assertEqual([item['id'] for item in data['results']], [logs[4].id, logs[3].id])
+        self.assertEqual(data['unread_count'], 5)
+        self.assertIsNone(data['previous'])
+
+        seen = [item['id'] for item in data['results']]
+        while data['next']:
+            data = self.client.get(data['next']).data['data']
+            seen.extend(item['id'] for item in data['results'])
+        self.assertEqual(seen, [log.id for log in reversed(logs)])
+
+    def test_inbox_without_paging_params_keeps_the_bare_list(self):
+        logs = [self._log() for _ in range(3)]
+        self._log(app_role='CUSTOMER')
+
+        response = self.client.get('/api/notifications/tailor/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual([item['id'] for item in response.data], [log.id for log in reversed(logs)])
+
+    def test_archive_moves_old_logs_and_uncounts_unread(self):
+        old_unread = self._log()
+        old_read = self._log(is_read=True)
+        recent = self._log()
+        NotificationLog.objects.filter(pk__in=[old_unread.pk, old_read.pk]).update(
+            created_at=timezone.now() - timedelta(days=120),
+        )
+
+        out = StringIO()
+        call_command('archive_notification_logs', days=90, batch_size=1, stdout=out)
+
+        self.assertIn('Archived 2 notification logs', out.getvalue())
+        self.assertEqual(list(NotificationLog.objects.values_list('pk', flat=True)), [recent.pk])
+        self.assertEqual(
+            set(NotificationLogArchive.objects.values_list('original_id', flat=True)),
+            {old_unread.pk, old_read.pk},
+        )
+        self.assertEqual(
+            NotificationUnreadCount.objects.get(user=self.user, app_role='TAILOR').unread_count, 1,
+        )
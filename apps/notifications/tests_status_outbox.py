@@ -0,0 +1,101 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from apps.core.models import OutboxEvent
+from apps.core.outbox import drain
+from apps.orders.models import ORDER_STATUS_NOTIFICATION_TOPIC, Order
+
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class StatusNotificationOutboxTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='status_outbox_customer', password='testpass123', role='USER',
+        )
+        self.tailor = User.objects.create_user(
+            username='status_outbox_tailor', password='testpass123', role='TAILOR',
+        )
+        self.order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            service_mode='walk_in',
+            payment_method='cod',
+            subtotal=Decimal('50.00'),
+            total_amount=Decimal('50.00'),
+        )
+        # Only status notifications are under test here.
+        OutboxEvent.objects.all().delete()
+
+    def _tailor_chain(self):
+        self.order.tailor_accept_order(user=self.tailor)
+        self.order.save()
+        self.order.tailor_start_work()
+        self.order.save()
+        self.order.tailor_start_stitching()
+        self.order.save()
+
+    def _status_events(self):
+        return OutboxEvent.objects.filter(topic=ORDER_STATUS_NOTIFICATION_TOPIC)
+
+    @patch('apps.notifications.tasks.send_tailor_status_notification_task.delay')
+    def test_transition_chain_coalesces_into_one_event(self, mock_single_delay):
+        self._tailor_chain()
+
+        event = self._status_events().get()
+        self.assertEqual(event.key, f'{self.order.id}:tailor')
+        self.assertEqual(event.payload['old_status'], 'none')
+        self.assertEqual(event.payload['new_status'], 'stitching_started')
+        self.assertEqual(event.payload['user_id'], self.tailor.id)
+        mock_single_delay.assert_not_called()
+
+    def test_rolled_back_transition_leaves_no_event(self):
+        try:
+            with transaction.atomic():
+                self.order.tailor_accept_order(user=self.tailor)
+                self.order.save()
+                raise RuntimeError('payment capture failed')
+        except RuntimeError:
+            pass
+
+        self.assertFalse(self._status_events().exists())
+
+    @patch('apps.notifications.tasks.send_status_notifications_batch_task.delay')
+    def test_relay_publishes_one_task_per_batch(self, mock_batch_delay):
+        self._tailor_chain()
+        self.order.rider_accept_order()
+        self.order.save()
+
+        drain()
+
+        mock_batch_delay.assert_called_once()
+        notifications = mock_batch_delay.call_args[0][0]
+        self.assertEqual(
+            sorted((item['side'], item['old_status'], item['new_status']) for item in notifications),
+            [('rider', 'none', 'accepted'), ('tailor', 'none', 'stitching_started')],
+        )
+        self.assertFalse(self._status_events().exclude(status=OutboxEvent.STATUS_DONE).exists())
+
+    @patch('apps.notifications.services.NotificationService.send_tailor_status_notification')
+    def test_batch_task_sends_each_notification(self, mock_send):
+        from apps.notifications.tasks import send_status_notifications_batch_task
+
+        sent = send_status_notifications_batch_task([{
+            'order_id': self.order.id,
+            'side': 'tailor',
+            'old_status': 'none',
+            'new_status': 'stitching_started',
+            'user_id': self.tailor.id,
+        }])
+
+        self.assertEqual(sent, 1)
+        mock_send.assert_called_once_with(self.order, 'none', 'stitching_started', self.tailor)
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from firebase_admin import messaging
+from rest_framework.test import APIClient
+
+from apps.notifications.models import FCMDeviceToken, NotificationLog
+from apps.notifications.services import NotificationService
+from apps.notifications.token_registry import get_tokens_for_users, get_user_tokens
+
+User = get_user_model()
+
+
+def _token_queries(queries):
+    return [q['sql'] for q in queries if 'notifications_fcmdevicetoken' in q['sql']]
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class FCMTokenRegistryTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.users = [
+            User.objects.create_user(username=f'token_user_{index}', role='RIDER') for index in range(3)
+        ]
+        for index, user in enumerate(self.users):
+            FCMDeviceToken.objects.create(user=user, token=f'rider-token-{index}', app_role='RIDER')
+        FCMDeviceToken.objects.create(user=self.users[0], token='customer-token-0', app_role='CUSTOMER')
+
+    def test_batch_lookup_queries_once_then_serves_from_cache(self):
+        with CaptureQueriesContext(connection) as queries:
+            tokens = get_tokens_for_users([user.id for user in self.users], 'RIDER')
+        self.assertEqual(len(_token_queries(queries)), 1)
+        self.assertEqual([t.token for t in tokens[self.users[0].id]], ['rider-token-0'])
+
+        with CaptureQueriesContext(connection) as queries:
+            tokens = get_tokens_for_users([user.id for user in self.users])
+        self.assertEqual(_token_queries(queries), [])
+        self.assertEqual(len(tokens[self.users[0].id]), 2)
+
+    def test_registering_a_used_token_moves_it_between_users(self):
+        self.assertEqual(len(get_user_tokens(self.users[0].id, 'RIDER')), 1)
+        self.client.force_authenticate(user=self.users[1])
+
+        response = self.client.post(
+            '/api/notifications/fcm-token/register/',
+            {'token': 'rider-token-0', 'device_type': 'android', 'app_role': 'RIDER'},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(get_user_tokens(self.users[0].id, 'RIDER'), [])
+        self.assertEqual(
+            sorted(t.token for t in get_user_tokens(self.users[1].id, 'RIDER')),
+            ['rider-token-0', 'rider-token-1'],
+        )
+
+    @patch('apps.notifications.services.get_firebase_app', return_value=object())
+    @patch('apps.notifications.services.messaging.send')
+    def test_fan_out_reads_tokens_once_and_drops_unregistered_ones(self, send, _app):
+        def fake_send(message, app=None):
+            if message.token == 'rider-token-1':
+                raise messaging.UnregisteredError('gone')
+            return 'message-id'
+        send.side_effect = fake_send
+
+        with CaptureQueriesContext(connection) as queries:
+            results = NotificationService.send_bulk_notifications(
+                self.users, 'Hello', 'World', 'SYSTEM', 'test_fan_out',
+            )
+
+        self.assertEqual(results, {'success_count': 2, 'failed_count': 1})
+        token_reads = [sql for sql in _token_queries(queries) if sql.startswith('SELECT')]
+        self.assertEqual(len(token_reads), 1)
+        self.assertFalse(FCMDeviceToken.objects.get(token='rider-token-1').is_active)
+        self.assertEqual(get_user_tokens(self.users[1].id), [])
+        self.assertEqual(NotificationLog.objects.filter(status='sent').count(), 3)
@@ -0,0 +1,76 @@
+"""
+Cached registry of active FCM device tokens per user.
+
+Each user's active tokens (all apps) are cached as one entry; callers filter
+by app role. ``get_tokens_for_users`` resolves many users with one cache
+round trip and at most one query for the misses, so notification fan-out
+does not touch FCMDeviceToken per recipient. Token saves and deletes
+invalidate through signals; ``deactivate_token`` covers the send path.
+"""
+from collections import namedtuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import FCMDeviceToken
+
+FCM_TOKEN_CACHE_TTL = 60 * 60 * 24
+
+RegisteredToken = namedtuple('RegisteredToken', ('id', 'token', 'app_role'))
+
+
+def fcm_tokens_cache_key(user_id):
+    return f'notifications:fcm_tokens:{user_id}'
+
+
+def _for_role(tokens, app_role):
+    if not app_role:
+        return list(tokens)
+    return [token for token in tokens if token.app_role == app_role]
+
+
+def get_tokens_for_users(user_ids, app_role=None):
+    """``{user_id: [RegisteredToken, ...]}`` for every id in ``user_ids``."""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    keys = {fcm_tokens_cache_key(user_id): user_id for user_id in user_ids}
+    cached = cache.get_many(list(keys))
+    registry = {keys[key]: tokens for key, tokens in cached.items()}
+
+    missing = user_ids - registry.keys()
+    if missing:
+        loaded = {user_id: [] for user_id in missing}
+        rows = (
+            FCMDeviceToken.objects.filter(user_id__in=missing, is_active=True)
+            .order_by('id')
+            .values_list('user_id', 'id', 'token', 'app_role')
+        )
+        for user_id, *token in rows:
+            loaded[user_id].append(RegisteredToken(*token))
+        cache.set_many(
+            {fcm_tokens_cache_key(user_id): tokens for user_id, tokens in loaded.items()},
+            FCM_TOKEN_CACHE_TTL,
+        )
+        registry.update(loaded)
+
+    return {user_id: _for_role(tokens, app_role) for user_id, tokens in registry.items()}
+
+
+def get_user_tokens(user_id, app_role=None):
+    return get_tokens_for_users([user_id], app_role)[user_id]
+
+
+def invalidate_user_tokens(*user_ids):
+    """Drop cached tokens now and again after commit, so a concurrent read cannot re-cache stale ones."""
+    keys = [fcm_tokens_cache_key(user_id) for user_id in user_ids if user_id]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def deactivate_token(token, user_id):
+    """Mark an unregistered token inactive."""
+    FCMDeviceToken.objects.filter(pk=token.id).update(is_active=False)
+    invalidate_user_tokens(user_id)
@@ -8,6 +8,7 @@ urlpatterns = [
     path('rider/', views.RiderNotificationListView.as_view(), name='rider-notifications'),
     
     # Read status actions
+    path('unread-count/', views.NotificationUnreadCountView.as_view(), name='notification-unread-count'),
     path('<int:pk>/read/', views.MarkNotificationReadView.as_view(), name='mark-notification-read'),
     path('read-all/', views.MarkAllReadView.as_view(), name='mark-all-read'),
     
@@ -1,88 +1,137 @@
 from rest_framework import generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
-from .models import NotificationLog
+from .inbox import APP_ROLES, mark_all_read, mark_notification_read, unread_counts
+from .models import NotificationLog, NotificationUnreadCount
 from .serializers import NotificationLogSerializer, FCMDeviceTokenSerializer
 from zthob.utils import api_response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 
+
+class NotificationInboxPagination(CursorPagination):
+    """Keyset pages over the (user, app_role, created_at) inbox index."""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+    def get_paginated_response(self, data, unread_count=0):
+        return api_response(
+            success=True,
+            message="Data fetched successfully",
+            data={
+                'next': self.get_next_link(),
+                'previous': self.get_previous_link(),
+                'unread_count': unread_count,
+                'results': data,
+            },
+            status_code=200
+        )
+
+
 # Base class to avoid code duplication
 class BaseNotificationListView(generics.ListAPIView):
+    """
+    One app's inbox for the current user, newest first.
+
+    With ``cursor`` or ``page_size`` it is served in keyset pages with the
+    unread count. Without them it keeps the bare list shipped clients expect.
+    """
     serializer_class = NotificationLogSerializer
     permission_classes = [IsAuthenticated]
-    
+    pagination_class = NotificationInboxPagination
+    app_role = None
+    paging_params = ('cursor', 'page_size')
+
     def get_queryset(self):
-        # This will be overridden by subclasses or we can use a role paremeter
-        return NotificationLog.objects.filter(user=self.request.user)
+        return NotificationLog.objects.filter(
+            user=self.request.user, app_role=self.app_role,
+        ).order_by('-created_at', '-id')
+
+    def paginate_queryset(self, queryset):
+        if not any(param in self.request.query_params for param in self.paging_params):
+            return None
+        return super().paginate_queryset(queryset)
+
+    def get_paginated_response(self, data):
+        unread = NotificationUnreadCount.objects.filter(
+            user=self.request.user, app_role=self.app_role,
+        ).values_list('unread_count', flat=True).first()
+        return self.paginator.get_paginated_response(data, unread_count=unread or 0)
 
 # 1. Customer Notifications
 @extend_schema(tags=["Notifications"])
 class CustomerNotificationListView(BaseNotificationListView):
-    def get_queryset(self):
-        # We might want to filter by category or just return all for this user
-        # For now, simplistic approach: all notifications for this user
-        return NotificationLog.objects.filter(
-            user=self.request.user
-        ).order_by('-created_at')
+    app_role = 'CUSTOMER'
 
 # 2. Tailor Notifications
 @extend_schema(tags=["Notifications"])
 class TailorNotificationListView(BaseNotificationListView):
-    def get_queryset(self):
-        # If tailors are just users, logic is same. 
-        # But if you want to filter ONLY tailor-relevant notifications:
-        return NotificationLog.objects.filter(
-            user=self.request.user,
-            # category__startswith='tailor_' # Optional: strict filtering
-        ).order_by('-created_at')
+    app_role = 'TAILOR'
 
 # 3. Rider Notifications
 @extend_schema(tags=["Notifications"])
 class RiderNotificationListView(BaseNotificationListView):
-    def get_queryset(self):
-        return NotificationLog.objects.filter(
-            user=self.request.user
-            # category__startswith='rider_' # Optional
-        ).order_by('-created_at')
+    app_role = 'RIDER'
+
+# 4. Unread badge counts
+@extend_schema(tags=["Notifications"])
+class NotificationUnreadCountView(APIView):
+    """Unread notifications per app, read from the maintained counters."""
+    permission_classes = [IsAuthenticated]
 
-# 4. Mark as Read Endpoint
+    def get(self, request):
+        counts = unread_counts(request.user)
+        return api_response(
+            success=True,
+            message="Unread counts fetched successfully",
+            data={'counts': counts, 'total': sum(counts.values())},
+            status_code=status.HTTP_200_OK,
+            request=request
+        )
+
+# 5. Mark as Read Endpoint
 @extend_schema(tags=["Notifications"])
 class MarkNotificationReadView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, pk):
-        try:
-            notification = NotificationLog.objects.get(pk=pk, user=request.user)
-            if not notification.is_read:
-                notification.is_read = True
-                notification.read_at = timezone.now()
-                notification.save()
+        if mark_notification_read(request.user, pk):
             return api_response(
                 success=True,
                 message="Notification marked as read",
                 status_code=status.HTTP_200_OK,
                 request=request
             )
-        except NotificationLog.DoesNotExist:
-            return api_response(
-                success=False,
-                message="Notification not found",
-                status_code=status.HTTP_404_NOT_FOUND,
-                request=request
-            )
+        return api_response(
+            success=False,
+            message="Notification not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+            request=request
+        )
 
-# 5. Mark ALL as Read (Optional but standard)
-@extend_schema(tags=["Notifications"])
+# 6. Mark ALL as Read (Optional but standard)
+@extend_schema(
+    tags=["Notifications"],
+    parameters=[OpenApiParameter('app_role', str, description='Only mark this app\'s inbox (CUSTOMER, TAILOR, RIDER)')],
+)
 class MarkAllReadView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        NotificationLog.objects.filter(
-            user=request.user, 
-            is_read=False
-        ).update(is_read=True, read_at=timezone.now())
+        app_role = request.data.get('app_role') or request.query_params.get('app_role')
+        if app_role and app_role not in APP_ROLES:
+            return api_response(
+                success=False,
+                message="Invalid app role",
+                errors={'app_role': [f"Must be one of: {', '.join(APP_ROLES)}"]},
+                status_code=status.HTTP_400_BAD_REQUEST,
+                request=request
+            )
+        mark_all_read(request.user, app_role)
         return api_response(
             success=True,
             message="All notifications marked as read",
@@ -90,7 +139,7 @@ class MarkAllReadView(APIView):
             request=request
         )
 
-# 6. Test Notification Endpoints
+# 7. Test Notification Endpoints
 class TestCustomerNotificationView(APIView):
     """Send a test notification to the logged-in customer"""
     permission_classes = [IsAuthenticated]
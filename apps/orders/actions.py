@@ -494,7 +494,10 @@ class RecordMeasurementsAction(BaseOrderAction):
         if not recipient_items.exists():
             raise ValidationError("No order items found for the selected recipient.")
 
+        from apps.orders.models import Order
+
         recipient_items.update(measurements=measurements)
+        Order.sync_needs_measurements([self.order.id])
 
         self.order.measurement_taken_at = timezone.now()
         self.order.status = 'in_progress'
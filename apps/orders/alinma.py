@@ -11,6 +11,8 @@ from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from django.conf import settings
 
+from .gateway_client import alinma_client
+
 
 logger = logging.getLogger(__name__)
 
@@ -137,10 +139,11 @@ def initiate_hosted_payment(
     )
 
     try:
-        response = requests.post(
+        response = alinma_client.post(
             config.request_url,
+            operation='initiate_payment',
+            read_timeout=config.request_timeout,
             json=payload,
-            timeout=config.request_timeout,
         )
     except requests.RequestException as exc:
         logger.exception(
@@ -247,10 +250,11 @@ def inquire_transaction(
         payload['additionalDetails'] = {'userData': json.dumps(user_data)}
 
     try:
-        response = requests.post(
+        response = alinma_client.post(
             config.request_url,
+            operation='inquiry',
+            read_timeout=config.request_timeout,
             json=payload,
-            timeout=config.request_timeout,
         )
     except requests.RequestException as exc:
         logger.exception(
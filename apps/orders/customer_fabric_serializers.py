@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.core.image_variants import image_variant_url
 from apps.core.media_utils import build_public_media_url
 from apps.orders.customer_fabric import MAX_CUSTOMER_FABRIC_IMAGE_BYTES
 from apps.orders.models import CustomerFabricImage
@@ -25,10 +26,11 @@ class CustomerFabricUploadSerializer(serializers.ModelSerializer):
 class CustomerFabricUploadResponseSerializer(serializers.ModelSerializer):
     path = serializers.SerializerMethodField()
     url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
 
     class Meta:
         model = CustomerFabricImage
-        fields = ['id', 'path', 'url']
+        fields = ['id', 'path', 'url', 'thumbnail_url']
 
     def get_path(self, obj):
         return obj.image.name if obj.image else None
@@ -38,3 +40,8 @@ class CustomerFabricUploadResponseSerializer(serializers.ModelSerializer):
         if obj.image:
             return build_public_media_url(request, obj.image.url)
         return None
+
+    def get_thumbnail_url(self, obj):
+        if obj.image:
+            return image_variant_url(self.context.get('request'), obj.image, 'list')
+        return None
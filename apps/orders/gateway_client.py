@@ -0,0 +1,205 @@
+"""
+Shared HTTP clients for the payment gateways.
+
+Each gateway has one keep-alive ``requests.Session`` per process, with a
+bounded connection pool, a short connect timeout
+(PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS) and the gateway's own read timeout.
+
+A per-process circuit breaker opens after PAYMENT_GATEWAY_FAILURE_THRESHOLD
+consecutive failures: connection errors, timeouts and 5xx responses. While it
+is open, calls fail at once with GatewayUnavailableError. After
+PAYMENT_GATEWAY_RESET_SECONDS one trial call is let through, and its outcome
+closes or reopens the circuit. A gateway that is down or slow therefore cannot
+hold every worker for the full read timeout. GatewayUnavailableError is a
+``requests.ConnectionError``, so the gateway modules' existing handlers turn
+it into their own gateway errors.
+
+Every call is logged with its latency. ``latency_summary()`` reports this
+process's recent calls.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 200
+
+
+class GatewayUnavailableError(requests.ConnectionError):
+    """Raised without calling the gateway while its circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold, reset_seconds):
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._trial_thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return 'half_open'
+            return 'open'
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_seconds or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            self._trial_thread = threading.get_ident()
+            return True
+
+    def release_trial(self):
+        """Free the trial slot if this thread holds it without having recorded an outcome."""
+        with self._lock:
+            if self._trial_in_flight and self._trial_thread == threading.get_ident():
+                self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class GatewayClient:
+    """Pooled, circuit-broken HTTP client for one payment gateway."""
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._session = None
+        self._breaker = None
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._calls = 0
+        self._failures = 0
+
+    def _get_session(self):
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.PAYMENT_GATEWAY_POOL_SIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._session = session
+            return self._session
+
+    @property
+    def breaker(self):
+        with self._lock:
+            if self._breaker is None:
+                self._breaker = CircuitBreaker(
+                    settings.PAYMENT_GATEWAY_FAILURE_THRESHOLD,
+                    settings.PAYMENT_GATEWAY_RESET_SECONDS,
+                )
+            return self._breaker
+
+    def post(self, url, *, operation, read_timeout, **kwargs):
+        """
+        POST through the pooled session. Returns the response whatever its
+        status; raises ``requests.RequestException`` when none arrived.
+        """
+        if not self.breaker.allow():
+            logger.warning('Payment gateway %s circuit open; skipped %s', self.name, operation)
+            raise GatewayUnavailableError(f'{self.name} is unavailable; circuit open.')
+
+        timeout = (settings.PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS, read_timeout)
+        started = time.perf_counter()
+        try:
+            try:
+                response = self._get_session().post(url, timeout=timeout, **kwargs)
+            except requests.RequestException as exc:
+                self._record(operation, started, type(exc).__name__, failed=True)
+                raise
+            self._record(operation, started, response.status_code, failed=response.status_code >= 500)
+            return response
+        finally:
+            # Anything else the call raised says nothing about the gateway; let the next call try.
+            self.breaker.release_trial()
+
+    def _record(self, operation, started, outcome, failed):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if failed:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        with self._lock:
+            self._calls += 1
+            self._failures += int(failed)
+            self._latencies.append(elapsed_ms)
+        logger.info(
+            'Payment gateway call gateway=%s operation=%s outcome=%s elapsed_ms=%.1f',
+            self.name,
+            operation,
+            outcome,
+            elapsed_ms,
+        )
+
+    def latency_summary(self):
+        """Calls, failures and latency percentiles (ms) over this process's recent calls."""
+        with self._lock:
+            ordered = sorted(self._latencies)
+            summary = {'gateway': self.name, 'calls': self._calls, 'failures': self._failures}
+        if ordered:
+            summary.update(
+                p50_ms=round(_percentile(ordered, 0.5), 1),
+                p95_ms=round(_percentile(ordered, 0.95), 1),
+                max_ms=round(ordered[-1], 1),
+            )
+        summary['circuit'] = self.breaker.state
+        return summary
+
+    def reset(self, close=True):
+        """Drop the session, breaker and latency history; rebuilt from settings on next use."""
+        with self._lock:
+            session = self._session
+            self._session = None
+            self._breaker = None
+            self._latencies.clear()
+            self._calls = 0
+            self._failures = 0
+        if close and session is not None:
+            session.close()
+
+
+myfatoorah_client = GatewayClient('myfatoorah')
+alinma_client = GatewayClient('alinma')
+GATEWAY_CLIENTS = (myfatoorah_client, alinma_client)
+
+
+def _forget_after_fork():
+    # A forked worker must not share the parent's sockets; it opens its own.
+    for client in GATEWAY_CLIENTS:
+        client._lock = threading.Lock()
+        client.reset(close=False)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_after_fork)
@@ -0,0 +1,268 @@
+"""EXPLAIN the hot order list queries and report sequential scans.
+
+The queries are not re-typed here: each scenario calls the real view (or
+service) for a representative user and records the SQL it runs, so the report
+follows the views as they change. Every captured SELECT touching an order table
+is then EXPLAINed:
+
+* PostgreSQL: ``EXPLAIN (FORMAT JSON)``; ``Seq Scan`` nodes are reported.
+* SQLite: ``EXPLAIN QUERY PLAN``; ``SCAN <table>`` rows (full table or full index
+  walks) are reported.
+
+``seeded_orders`` creates a synthetic dataset inside a rolled-back transaction
+so coverage can be checked on an empty or development database.
+"""
+import json
+import random
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+ORDER_TABLES = ('orders_order', 'orders_orderitem')
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+
+class _Rollback(Exception):
+    pass
+
+
+@dataclass
+class QueryPlan:
+    scenario: str
+    sql: str
+    plan: list
+    seq_scans: list = field(default_factory=list)
+    executions: int = 1
+
+    def as_dict(self):
+        return {
+            'scenario': self.scenario,
+            'sql': self.sql,
+            'plan': self.plan,
+            'seq_scans': self.seq_scans,
+            'executions': self.executions,
+        }
+
+
+def _pg_seq_scans(node, found):
+    if node.get('Node Type') == 'Seq Scan':
+        found.append(node.get('Relation Name'))
+    for child in node.get('Plans', []):
+        _pg_seq_scans(child, found)
+    return found
+
+
+def explain(sql):
+    """Return ``(plan_lines, seq_scanned_tables)`` for one SELECT."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+            raw = cursor.fetchone()[0]
+            plan = raw if isinstance(raw, list) else json.loads(raw)
+            root = plan[0]['Plan']
+            cursor.execute(f'EXPLAIN {sql}')
+            lines = [row[0] for row in cursor.fetchall()]
+            return lines, sorted(set(_pg_seq_scans(root, [])))
+
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            lines = [row[-1] for row in cursor.fetchall()]
+            scans = []
+            for line in lines:
+                words = line.split()
+                # SCAN walks the whole table (or a whole index, in index order).
+                if len(words) >= 2 and words[0] == 'SCAN':
+                    scans.append(words[1].strip('"'))
+            return lines, sorted(set(scans))
+
+    raise NotImplementedError(f'EXPLAIN parsing is not implemented for {connection.vendor}')
+
+
+def _view_scenario(view_class, path, user, params=None):
+    def run():
+        request = APIRequestFactory().get(path, params or {})
+        force_authenticate(request, user=user)
+        view_class.as_view()(request)
+
+    return run
+
+
+def default_actors():
+    """Users with the most orders for each role, or None where no such user exists."""
+    from apps.orders.models import Order
+
+    def busiest(field_name, extra=None):
+        rows = Order.objects.exclude(**{f'{field_name}__isnull': True})
+        if extra:
+            rows = rows.filter(**extra)
+        top = rows.values(field_name).annotate(total=Count('id')).order_by('-total').first()
+        return get_user_model().objects.filter(pk=top[field_name]).first() if top else None
+
+    rider = (
+        get_user_model().objects
+        .filter(role='RIDER', rider_profile__review__review_status='approved')
+        .first()
+    )
+    return {
+        'tailor': busiest('tailor'),
+        'customer': busiest('customer'),
+        'rider': rider,
+    }
+
+
+def build_scenarios(tailor=None, customer=None, rider=None):
+    """``{name: callable}`` for each hot list query that has a user to run as."""
+    from apps.orders.views import CustomerOrderListView, TailorAvailableOrdersView, TailorOrderListView
+    from apps.riders.views.base import RiderAvailableOrdersView
+    from apps.tailors.services.home_service import TailorHomeService
+
+    scenarios = {}
+    if tailor is not None:
+        path = '/api/orders/tailor/'
+        scenarios.update({
+            'tailor_orders_open': _view_scenario(TailorOrderListView, path, tailor),
+            'tailor_orders_by_status': _view_scenario(TailorOrderListView, path, tailor, {'status': 'pending'}),
+            'tailor_orders_overdue': _view_scenario(TailorOrderListView, path, tailor, {'is_overdue': 'true'}),
+            'tailor_orders_due_week': _view_scenario(TailorOrderListView, path, tailor, {'delivery_due': 'week'}),
+            'tailor_available_orders': _view_scenario(TailorAvailableOrdersView, path, tailor),
+            'tailor_dashboard': lambda: TailorHomeService.build_dashboard_snapshot(tailor),
+        })
+    if customer is not None:
+        scenarios['customer_orders'] = _view_scenario(CustomerOrderListView, '/api/orders/', customer)
+    if rider is not None:
+        scenarios['rider_available_orders'] = _view_scenario(
+            RiderAvailableOrdersView, '/api/riders/orders/available/', rider,
+        )
+    return scenarios
+
+
+def _touches_orders(sql):
+    head = sql.lstrip().upper()
+    return head.startswith('SELECT') and any(f'"{table}"' in sql for table in ORDER_TABLES)
+
+
+def query_shape(sql):
+    """``sql`` with literals replaced, so per-row (N+1) repeats collapse into one entry."""
+    return _NUMBER_RE.sub('?', _STRING_RE.sub('?', sql))
+
+
+def analyze_scenarios(scenarios):
+    """Run each scenario, EXPLAIN its order queries and return the QueryPlans."""
+    plans = []
+    for name, run in scenarios.items():
+        # The debug query log is a bounded deque; start each scenario empty so
+        # CaptureQueriesContext's slice stays valid on large datasets.
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as captured:
+            run()
+        shapes = {}
+        for query in captured.captured_queries:
+            sql = query['sql']
+            if not _touches_orders(sql):
+                continue
+            shape = query_shape(sql)
+            if shape in shapes:
+                shapes[shape].executions += 1
+                continue
+            lines, scans = explain(sql)
+            shapes[shape] = QueryPlan(name, sql, lines, scans)
+        plans.extend(shapes.values())
+    return plans
+
+
+def refresh_statistics():
+    """Let the planner see freshly inserted rows."""
+    with connection.cursor() as cursor:
+        for table in ORDER_TABLES:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+
+
+def _seed(orders_count, tailors_count):
+    from apps.customers.models import Address
+    from apps.orders.models import Order, OrderItem
+    from apps.riders.models import RiderProfile, RiderProfileReview
+    from apps.tailors.models import TailorProfile
+
+    User = get_user_model()
+    stamp = time.monotonic_ns()
+    rng = random.Random(orders_count)
+
+    tailors = []
+    for index in range(tailors_count):
+        user = User.objects.create_user(username=f'advisor_tailor_{stamp}_{index}', role='TAILOR')
+        TailorProfile.objects.get_or_create(user=user, defaults={'shop_name': f'Advisor Tailor {index}'})
+        tailors.append(user)
+    customers = [
+        User.objects.create_user(username=f'advisor_customer_{stamp}_{index}', role='USER')
+        for index in range(max(1, orders_count // 20))
+    ]
+    addresses = {
+        customer.pk: Address.objects.create(user=customer, street='Advisor St', city='Riyadh', country='Saudi Arabia')
+        for customer in customers[:50]
+    }
+    rider = User.objects.create_user(username=f'advisor_rider_{stamp}', role='RIDER')
+    profile = RiderProfile.objects.create(user=rider, full_name='Advisor Rider', phone_number='+966500000000')
+    RiderProfileReview.objects.create(profile=profile, review_status='approved')
+
+    statuses = [choice for choice, _ in Order.ORDER_STATUS_CHOICES]
+    today = timezone.now().date()
+    orders = []
+    for index in range(orders_count):
+        customer = rng.choice(customers)
+        orders.append(Order(
+            customer=customer,
+            # Skewed like production: a few busy shops, a long tail.
+            tailor=tailors[min(int(rng.expovariate(0.5)), tailors_count - 1)],
+            order_number=f'A{stamp % 10**8:08d}{index:06d}',
+            order_type=rng.choice(['fabric_only', 'fabric_with_stitching', 'stitching_only']),
+            service_mode=rng.choice(['home_delivery', 'walk_in']),
+            # Most orders in a mature shop are finished.
+            status=rng.choices(statuses, weights=[4, 4, 6, 2, 2, 40, 30, 12])[0],
+            payment_status=rng.choice(['pending', 'paid', 'partially_paid']),
+            payment_method=rng.choice(['cod', 'credit_card']),
+            delivery_address=addresses.get(customer.pk),
+            estimated_delivery_date=today + timedelta(days=rng.randint(-30, 30)),
+            subtotal=Decimal('100.00'),
+            total_amount=Decimal('100.00'),
+        ))
+    created = Order.objects.bulk_create(orders, batch_size=1000)
+    OrderItem.objects.bulk_create(
+        [
+            OrderItem(
+                order=order,
+                quantity=1,
+                unit_price=Decimal('100.00'),
+                total_price=Decimal('100.00'),
+                measurements={} if rng.random() < 0.2 else {'chest': 100},
+            )
+            for order in created
+        ],
+        batch_size=1000,
+    )
+    Order.sync_needs_measurements(order.pk for order in created)
+    return {'tailor': tailors[0], 'customer': customers[0], 'rider': rider}
+
+
+@contextmanager
+def seeded_orders(orders_count=20000, tailors_count=20):
+    """Yield actors for a synthetic dataset; every row is rolled back afterwards."""
+    try:
+        with transaction.atomic():
+            actors = _seed(orders_count, max(1, tailors_count))
+            refresh_statistics()
+            yield actors
+            raise _Rollback
+    except _Rollback:
+        pass
@@ -0,0 +1,129 @@
+"""
+Management command to measure order number allocation under concurrency.
+
+Usage:
+    python manage.py benchmark_order_numbers --threads 16 --allocations 200
+
+The counter strategy uses its own scratch counter (never the real order number
+counter), so running it against production does not consume order numbers.
+The scan strategy times the previous allocator: a SELECT FOR UPDATE over orders
+matching ^\\d{5}$, held for the length of a transaction.
+"""
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connections, transaction
+
+from apps.orders.models import Order
+from apps.orders.order_numbers import drop_counter, ensure_counter, next_counter_value
+
+BENCHMARK_COUNTER = 'benchmark_order_number'
+
+
+def _allocate_from_counter():
+    with transaction.atomic():
+        return next_counter_value(BENCHMARK_COUNTER)
+
+
+def _allocate_by_scan():
+    with transaction.atomic():
+        last = (
+            Order.objects.select_for_update()
+            .filter(order_number__regex=r'^\d{5}$')
+            .order_by('-order_number')
+            .values_list('order_number', flat=True)
+            .first()
+        )
+        return int(last) + 1 if last else Order.STARTING_ORDER_NUMBER
+
+
+STRATEGIES = {
+    'counter': _allocate_from_counter,
+    'scan': _allocate_by_scan,
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark concurrent order number allocation (counter/sequence vs legacy scan)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent workers (default: 8)')
+        parser.add_argument(
+            '--allocations',
+            type=int,
+            default=100,
+            help='Allocations per worker (default: 100)',
+        )
+        parser.add_argument(
+            '--strategy',
+            action='append',
+            choices=sorted(STRATEGIES),
+            help='Strategy to run (repeatable). Defaults to both.',
+        )
+
+    def handle(self, *args, **options):
+        threads = max(1, options['threads'])
+        allocations = max(1, options['allocations'])
+        self.stdout.write(
+            f'{"strategy":<10}{"alloc/s":>10}{"p50 ms":>9}{"p99 ms":>9}{"errors":>8}{"duplicates":>12}'
+        )
+        for name in options['strategy'] or ['counter', 'scan']:
+            if name == 'counter':
+                drop_counter(BENCHMARK_COUNTER)
+                ensure_counter(BENCHMARK_COUNTER, 0)
+            try:
+                stats = self._run(STRATEGIES[name], threads, allocations)
+            finally:
+                if name == 'counter':
+                    drop_counter(BENCHMARK_COUNTER)
+            # The scan strategy never inserts, so every worker sees the same number.
+            duplicates = stats['duplicates'] if name == 'counter' else '-'
+            self.stdout.write(
+                f'{name:<10}{stats["rate"]:>10.0f}{stats["p50"]:>9.2f}{stats["p99"]:>9.2f}'
+                f'{stats["errors"]:>8}{duplicates:>12}'
+            )
+
+    def _run(self, allocate, threads, allocations):
+        latencies = []
+        values = []
+        errors = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(threads)
+
+        def worker():
+            local_latencies, local_values, local_errors = [], [], 0
+            try:
+                barrier.wait()
+                for _ in range(allocations):
+                    started = time.perf_counter()
+                    try:
+                        local_values.append(allocate())
+                    except DatabaseError:
+                        local_errors += 1
+                        continue
+                    local_latencies.append((time.perf_counter() - started) * 1000)
+            finally:
+                connections.close_all()
+                with lock:
+                    latencies.extend(local_latencies)
+                    values.extend(local_values)
+                    errors.append(local_errors)
+
+        started = time.perf_counter()
+        pool = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            'rate': len(values) / elapsed if elapsed else 0.0,
+            'p50': statistics.median(latencies) if latencies else 0.0,
+            'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0,
+            'errors': sum(errors),
+            'duplicates': len(values) - len(set(values)),
+        }
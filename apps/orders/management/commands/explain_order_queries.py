@@ -0,0 +1,104 @@
+"""
+Management command to check index coverage of the hot order list queries.
+
+Usage:
+    python manage.py explain_order_queries
+    python manage.py explain_order_queries --seed 50000 --fail-on-seq-scan
+    python manage.py explain_order_queries --tailor 12 --customer 40 --verbose-plans
+
+Each tailor/customer/rider list endpoint and the tailor dashboard are run for a
+representative user, and every SELECT they issue against orders is EXPLAINed.
+With --seed the dataset is synthetic and rolled back afterwards.
+"""
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.orders.index_advisor import (
+    ORDER_TABLES,
+    analyze_scenarios,
+    build_scenarios,
+    default_actors,
+    seeded_orders,
+)
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot order list queries and report sequential scans'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Create this many synthetic orders in a rolled-back transaction first.',
+        )
+        parser.add_argument('--tailors', type=int, default=20, help='Tailor shops in the seeded dataset.')
+        parser.add_argument('--tailor', type=int, help='Tailor user id to run tailor queries as.')
+        parser.add_argument('--customer', type=int, help='Customer user id to run customer queries as.')
+        parser.add_argument('--rider', type=int, help='Approved rider user id to run rider queries as.')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan, not only scans.')
+        parser.add_argument('--output', default='', help='Write the JSON report to this path.')
+        parser.add_argument(
+            '--fail-on-seq-scan',
+            action='store_true',
+            help=f'Exit non-zero when {", ".join(ORDER_TABLES)} is sequentially scanned.',
+        )
+
+    def handle(self, *args, **options):
+        if options['seed'] < 0:
+            raise CommandError('--seed must be positive')
+
+        if options['seed']:
+            with seeded_orders(options['seed'], options['tailors']) as actors:
+                plans = self._analyze(self._actors(options, actors))
+        else:
+            plans = self._analyze(self._actors(options, default_actors()))
+
+        flagged = [plan for plan in plans if set(plan.seq_scans) & set(ORDER_TABLES)]
+        for plan in plans:
+            if plan in flagged or options['verbose_plans']:
+                style = self.style.WARNING if plan in flagged else self.style.SUCCESS
+                self.stdout.write(style(
+                    f'[{plan.scenario}] x{plan.executions} seq scans: {", ".join(plan.seq_scans) or "none"}'
+                ))
+                self.stdout.write(f'  {plan.sql}')
+                for line in plan.plan:
+                    self.stdout.write(f'    {line}')
+
+        self.stdout.write(f'{"scenario":<26}{"queries":>8}{"executions":>12}{"order seq scans":>17}')
+        for scenario in dict.fromkeys(plan.scenario for plan in plans):
+            rows = [plan for plan in plans if plan.scenario == scenario]
+            executions = sum(plan.executions for plan in rows)
+            scans = sum(1 for plan in rows if plan in flagged)
+            self.stdout.write(f'{scenario:<26}{len(rows):>8}{executions:>12}{scans:>17}')
+
+        if options['output']:
+            output = Path(options['output']).expanduser()
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps([plan.as_dict() for plan in plans], indent=2) + '\n', encoding='utf-8')
+            self.stdout.write(self.style.SUCCESS(f'Wrote {output}'))
+
+        if flagged and options['fail_on_seq_scan']:
+            raise CommandError(f'{len(flagged)} order quer(y/ies) use a sequential scan')
+
+    def _actors(self, options, defaults):
+        User = get_user_model()
+        actors = dict(defaults)
+        for role in ('tailor', 'customer', 'rider'):
+            if options[role] is not None:
+                actors[role] = User.objects.filter(pk=options[role]).first()
+                if actors[role] is None:
+                    raise CommandError(f'User {options[role]} not found')
+        for role, user in actors.items():
+            if user is None:
+                self.stdout.write(self.style.WARNING(f'No {role} found; skipping {role} queries'))
+        return actors
+
+    def _analyze(self, actors):
+        try:
+            return analyze_scenarios(build_scenarios(**actors))
+        except NotImplementedError as exc:
+            raise CommandError(str(exc)) from exc
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:56
+
+from django.db import migrations, models
+
+STARTING_ORDER_NUMBER = 300
+SEQUENCE_NAME = 'orders_order_number_seq'
+
+
+def seed_order_number_counter(apps, schema_editor):
+    """Start the counter after the highest existing 5-digit order number."""
+    Order = apps.get_model('orders', 'Order')
+    last = (
+        Order.objects.using(schema_editor.connection.alias)
+        .filter(order_number__regex=r'^\d{5}$')
+        .order_by('-order_number')
+        .values_list('order_number', flat=True)
+        .first()
+    )
+    last_value = max(int(last) if last else 0, STARTING_ORDER_NUMBER - 1)
+
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f'CREATE SEQUENCE IF NOT EXISTS {SEQUENCE_NAME} MINVALUE 0 START WITH {last_value + 1}'
+        )
+        return
+
+    OrderNumberCounter = apps.get_model('orders', 'OrderNumberCounter')
+    OrderNumberCounter.objects.using(schema_editor.connection.alias).update_or_create(
+        name='order_number', defaults={'value': last_value},
+    )
+
+
+def drop_order_number_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f'DROP SEQUENCE IF EXISTS {SEQUENCE_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0042_customer_fabric_images'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderNumberCounter',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Order Number Counter',
+                'verbose_name_plural': 'Order Number Counters',
+            },
+        ),
+        migrations.RunPython(seed_order_number_counter, drop_order_number_sequence),
+    ]
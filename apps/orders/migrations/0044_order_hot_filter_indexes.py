@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0011_fix_audit_log_index_names'),
+        ('orders', '0043_order_number_counter'),
+        ('tailors', '0016_tailorprofile_standard_stitching_days'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['tailor', 'status', '-created_at'], name='order_tailor_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status__in', ('delivered', 'collected', 'cancelled')), _negated=True), fields=['tailor', '-created_at'], name='order_tailor_open_created'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status__in', ('delivered', 'collected', 'cancelled')), _negated=True), fields=['tailor', 'estimated_delivery_date'], name='order_tailor_open_due'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['service_mode', 'rider_status', 'payment_status'], name='order_mode_rider_payment'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer', '-created_at'], name='order_customer_created'),
+        ),
+    ]
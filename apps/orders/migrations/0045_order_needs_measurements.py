@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 01:11
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q
+
+
+def backfill_needs_measurements(apps, schema_editor):
+    Order = apps.get_model('orders', 'Order')
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    unmeasured = OrderItem.objects.filter(order_id=OuterRef('pk')).filter(
+        Q(measurements={}) | Q(measurements__isnull=True)
+    )
+    Order.objects.using(schema_editor.connection.alias).update(needs_measurements=Exists(unmeasured))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0011_fix_audit_log_index_names'),
+        ('orders', '0044_order_hot_filter_indexes'),
+        ('tailors', '0016_tailorprofile_standard_stitching_days'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='needs_measurements',
+            field=models.BooleanField(default=False, editable=False, help_text='Whether any item of this order is still missing measurements'),
+        ),
+        migrations.RunPython(backfill_needs_measurements, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('needs_measurements', True)), fields=['tailor', 'tailor_status'], name='order_tailor_needs_measure'),
+        ),
+    ]
@@ -0,0 +1,12 @@
+from django.db import migrations
+
+from apps.core.search import trigram_index_operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0045_order_needs_measurements'),
+    ]
+
+    operations = trigram_index_operations('orders_order', ['order_number'])
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-19 03:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0046_order_number_trigram_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='orderstatushistory',
+            index=models.Index(fields=['order', 'status', 'created_at'], name='order_history_status_created'),
+        ),
+    ]
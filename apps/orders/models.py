@@ -3,13 +3,29 @@ from django.db.models import Q
 from django.conf import settings
 from django.utils import timezone
 from django.dispatch import receiver
+from django.db.models.signals import post_delete, post_save
 from django.core.validators import FileExtensionValidator, MinValueValidator
-from apps.core.models import BaseModel
+from apps.core.models import BaseModel, refresh_maintained_fields
 from decimal import Decimal
 from django_fsm import FSMField, transition
 from django_fsm.signals import post_transition
 
 # Create your models here.
+
+# Orders in these states no longer need work from the shop or riders.
+CLOSED_ORDER_STATUSES = ('delivered', 'collected', 'cancelled')
+
+# Order items whose measurements have not been recorded yet.
+UNMEASURED_ITEM_Q = Q(measurements={}) | Q(measurements__isnull=True)
+
+# Outbox topic published on every order save; finance and delivery tracking
+# consume it after commit instead of running inside Order.save().
+ORDER_SAVED_TOPIC = 'orders.order_saved'
+
+# Outbox topic for rider/tailor status pushes, keyed by order and side.
+ORDER_STATUS_NOTIFICATION_TOPIC = 'orders.status_notification'
+
+
 class Order(BaseModel):
     """
     Order Status Flow Documentation:
@@ -446,6 +462,15 @@ class Order(BaseModel):
         blank=True,
         help_text="When measurements were taken by the rider"
     )
+
+    # Denormalized: at least one item matches UNMEASURED_ITEM_Q.
+    # Written only by Order.sync_needs_measurements(); a full save re-reads it
+    # from the row first, and update_fields saves should leave it out.
+    needs_measurements = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Whether any item of this order is still missing measurements"
+    )
     
     # Appointment fields
     appointment_date = models.DateField(
@@ -488,6 +513,32 @@ class Order(BaseModel):
         ordering=['-created_at']
         verbose_name='Order'
         verbose_name_plural='Orders'
+        indexes = [
+            # Tailor order list filtered by status, newest first.
+            models.Index(fields=['tailor', 'status', '-created_at'], name='order_tailor_status_created'),
+            # Default tailor list / dashboard: open orders only.
+            models.Index(
+                fields=['tailor', '-created_at'],
+                condition=~Q(status__in=CLOSED_ORDER_STATUSES),
+                name='order_tailor_open_created',
+            ),
+            # Overdue / due today / due this week alerts.
+            models.Index(
+                fields=['tailor', 'estimated_delivery_date'],
+                condition=~Q(status__in=CLOSED_ORDER_STATUSES),
+                name='order_tailor_open_due',
+            ),
+            # Rider available orders.
+            models.Index(fields=['service_mode', 'rider_status', 'payment_status'], name='order_mode_rider_payment'),
+            # Customer order history.
+            models.Index(fields=['customer', '-created_at'], name='order_customer_created'),
+            # "To measure" buckets and rider measurement feeds.
+            models.Index(
+                fields=['tailor', 'tailor_status'],
+                condition=Q(needs_measurements=True),
+                name='order_tailor_needs_measure',
+            ),
+        ]
 
     def clean(self):
         """Validate that tailor has TAILOR role"""
@@ -501,40 +552,27 @@ class Order(BaseModel):
     MAX_ORDER_NUMBER = 99999
 
     @classmethod
-    def _next_order_number(cls):
-        """
-        Compute the next 5-digit sequential order number.
+    def sync_needs_measurements(cls, order_ids):
+        """Recompute ``needs_measurements`` for ``order_ids`` in one UPDATE."""
+        from django.db.models import Exists, OuterRef
 
-        Must be called inside transaction.atomic() so SELECT FOR UPDATE
-        is held until the new order row is inserted.
-        """
-        last = (
-            cls.objects
-            .select_for_update()
-            .filter(order_number__regex=r'^\d{5}$')
-            .order_by('-order_number')
-            .values_list('order_number', flat=True)
-            .first()
-        )
-        next_num = int(last) + 1 if last else cls.STARTING_ORDER_NUMBER
-        next_num = max(next_num, cls.STARTING_ORDER_NUMBER)
-        if next_num > cls.MAX_ORDER_NUMBER:
-            raise ValueError(
-                f"Order number limit reached ({cls.MAX_ORDER_NUMBER})"
-            )
-        return f"{next_num:05d}"
+        order_ids = {order_id for order_id in order_ids if order_id}
+        if not order_ids:
+            return
+        unmeasured = OrderItem.objects.filter(order_id=OuterRef('pk')).filter(UNMEASURED_ITEM_Q)
+        cls.objects.filter(pk__in=order_ids).update(needs_measurements=Exists(unmeasured))
 
     @classmethod
     def generate_order_number(cls):
-        """Public helper: allocate next number under a short lock."""
-        from django.db import transaction
+        """Public helper: allocate the next number from the order number counter."""
+        from apps.orders.order_numbers import allocate_order_number
 
-        with transaction.atomic():
-            return cls._next_order_number()
+        return allocate_order_number()
 
     def save(self, *args, **kwargs):
         from django.db import IntegrityError, transaction
         from apps.orders.measurement_utils import with_measurement_order
+        from apps.orders.order_numbers import resync_order_number_counter
 
         if isinstance(self.rider_measurements, dict) and self.rider_measurements:
             self.rider_measurements = with_measurement_order(self.rider_measurements)
@@ -552,17 +590,25 @@ class Order(BaseModel):
         # This preserves the existing auto-sync logic from OrderStatusTransitionService
         self._sync_main_status()
 
+        if kwargs.get('update_fields') is None:
+            # needs_measurements is maintained from the item side; a full save
+            # of an instance loaded earlier must not write back a stale value.
+            refresh_maintained_fields(self, ['needs_measurements'])
+
         if self.order_number:
-            super().save(*args, **kwargs)
+            # The order_saved outbox row must commit (or roll back) with the order.
+            with transaction.atomic():
+                super().save(*args, **kwargs)
             return
 
-        # Allocate + insert in the same atomic block so the row lock is held
-        # until commit. Retry only on order_number unique collisions.
+        # Numbers come from a counter (a sequence on PostgreSQL), so nothing is
+        # scanned or locked here. Retry only on order_number unique collisions,
+        # e.g. numbers assigned by hand above the counter.
         last_error = None
         for _ in range(5):
             try:
                 with transaction.atomic():
-                    self.order_number = self._next_order_number()
+                    self.order_number = self.generate_order_number()
                     super().save(*args, **kwargs)
                 return
             except IntegrityError as exc:
@@ -573,6 +619,7 @@ class Order(BaseModel):
                     and 'orders_order_order_number' not in error_text
                 ):
                     raise
+                resync_order_number_counter()
                 self.order_number = None
                 if self.pk and not type(self).objects.filter(pk=self.pk).exists():
                     self.pk = None
@@ -953,6 +1000,9 @@ class OrderItem(BaseModel):
         if isinstance(self.measurements, dict) and self.measurements:
             self.measurements = with_measurement_order(self.measurements)
         super().save(*args,**kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'measurements' in update_fields:
+            Order.sync_needs_measurements([self.order_id])
 
     def __str__(self):
         if self.fabric:
@@ -1336,6 +1386,10 @@ class OrderStatusHistory(BaseModel):
         ordering=['-created_at']
         verbose_name='Order Status History'
         verbose_name_plural='Order Status Histories'
+        indexes = [
+            # First ready-for-delivery/pickup entry per order (stitching time stats).
+            models.Index(fields=['order', 'status', 'created_at'], name='order_history_status_created'),
+        ]
 
     def __str__(self):
         actor = self.changed_by.username if self.changed_by else "unknown"
@@ -1427,7 +1481,12 @@ def send_notification_on_status_transition(sender, instance, name, source, targe
     """
     Automatically send notifications when order status transitions occur.
     This fixes the bug where old_status and new_status were the same.
-    
+
+    The notification is recorded in the outbox with the transition, so it is
+    only sent if the transaction commits. Transitions of the same order and
+    side (rider/tailor) that are still pending coalesce into one push from the
+    first source to the latest target.
+
     Args:
         sender: Order model class
         instance: The order instance
@@ -1436,7 +1495,7 @@ def send_notification_on_status_transition(sender, instance, name, source, targe
         target: New status value
         **kwargs: Additional arguments including method_kwargs
     """
-    from apps.notifications.services import NotificationService
+    from apps.core.outbox import publish
     import logging
     
     logger = logging.getLogger(__name__)
@@ -1444,34 +1503,80 @@ def send_notification_on_status_transition(sender, instance, name, source, targe
     # Get the user who made the change from method arguments
     method_kwargs = kwargs.get('method_kwargs', {})
     user = method_kwargs.get('user')
-    
+
+    # Determine which field changed based on transition method name
+    if name.startswith('rider_'):
+        side = 'rider'
+    elif name.startswith('tailor_'):
+        side = 'tailor'
+    else:
+        return
+
     try:
-        from apps.notifications.tasks import (
-            send_rider_status_notification_task,
-            send_tailor_status_notification_task
+        publish(
+            ORDER_STATUS_NOTIFICATION_TOPIC,
+            key=f'{instance.id}:{side}',
+            payload={
+                'order_id': instance.id,
+                'side': side,
+                'old_status': source,
+                'new_status': target,
+                'user_id': user.id if user and hasattr(user, 'id') else None,
+            },
+            merge=coalesce_status_notification,
         )
-        
-        user_id = user.id if user and hasattr(user, 'id') else None
-
-        # Determine which field changed based on transition method name
-        if name.startswith('rider_'):
-            send_rider_status_notification_task.delay(
-                order_id=instance.id,
-                old_status=source,
-                new_status=target,
-                user_id=user_id
-            )
-            logger.info(f"Queued rider status notification task: {source} → {target} for order {instance.order_number}")
-            
-        elif name.startswith('tailor_'):
-            send_tailor_status_notification_task.delay(
-                order_id=instance.id,
-                old_status=source,
-                new_status=target,
-                user_id=user_id
-            )
-            logger.info(f"Queued tailor status notification task: {source} → {target} for order {instance.order_number}")
-            
+        logger.info(f"Recorded {side} status notification: {source} → {target} for order {instance.order_number}")
     except Exception as e:
         # Log error but don't fail the transition
         logger.error(f"Failed to send notification for {name}: {str(e)}")
+
+
+def coalesce_status_notification(pending, latest):
+    """Fold a newer transition into a pending notification: keep its origin and last known actor."""
+    return {
+        **latest,
+        'old_status': pending.get('old_status', latest.get('old_status')),
+        'user_id': latest.get('user_id') or pending.get('user_id'),
+    }
+
+
+@receiver(post_save, sender=Order)
+def publish_order_saved_event(sender, instance, raw=False, **kwargs):
+    from apps.core.outbox import publish
+
+    if raw:
+        return
+    publish(ORDER_SAVED_TOPIC, key=instance.pk, payload={'order_id': instance.pk})
+
+
+def order_for_event(event):
+    """Current state of the order behind an order_saved event, shared by its consumers."""
+    if not hasattr(event, '_order'):
+        event._order = Order.objects.select_related(
+            'customer', 'tailor', 'rider', 'assigned_rider', 'measurement_rider', 'delivery_rider',
+        ).filter(pk=event.payload.get('order_id')).first()
+    return event._order
+
+
+@receiver(post_delete, sender=OrderItem)
+def sync_needs_measurements_on_item_delete(sender, instance, **kwargs):
+    Order.sync_needs_measurements([instance.order_id])
+
+
+class OrderNumberCounter(models.Model):
+    """
+    Last issued value of a named counter.
+
+    Used to allocate order numbers on databases without sequences (SQLite in
+    development and tests). PostgreSQL uses a real sequence instead.
+    """
+
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Order Number Counter'
+        verbose_name_plural = 'Order Number Counters'
+
+    def __str__(self):
+        return f"{self.name}={self.value}"
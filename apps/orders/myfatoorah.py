@@ -9,6 +9,8 @@ from urllib.parse import urlparse
 import requests
 from django.conf import settings
 
+from .gateway_client import myfatoorah_client
+
 
 logger = logging.getLogger(__name__)
 
@@ -219,15 +221,16 @@ def normalize_payment_details(payload):
 def get_payment_status(invoice_id):
     config = get_myfatoorah_config()
     try:
-        response = requests.post(
+        response = myfatoorah_client.post(
             f'{config.api_base_url}/v2/GetPaymentStatus',
+            operation='GetPaymentStatus',
             headers={
                 'Authorization': f'Bearer {config.api_key}',
                 'Accept': 'application/json',
                 'Content-Type': 'application/json',
             },
             json={'Key': str(invoice_id), 'KeyType': 'InvoiceId'},
-            timeout=config.timeout_seconds,
+            read_timeout=config.timeout_seconds,
         )
         response.raise_for_status()
     except requests.Timeout as exc:
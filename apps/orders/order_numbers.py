@@ -0,0 +1,132 @@
+"""Customer-facing order number allocation.
+
+Numbers come from a counter instead of scanning ``Order``:
+
+* PostgreSQL: a sequence per counter. ``nextval`` takes no row lock and is not
+  rolled back, so concurrent checkouts never wait on each other. A checkout that
+  fails after allocating leaves a gap, like any sequence.
+* Other databases: an ``OrderNumberCounter`` row incremented in place. SQLite
+  serializes writers anyway, so this only has to be correct, not concurrent.
+
+Counters are seeded once from the highest existing 5-digit order number.
+"""
+import re
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+ORDER_NUMBER_COUNTER = 'order_number'
+
+_COUNTER_NAME_RE = re.compile(r'^[a-z][a-z0-9_]{0,40}$')
+
+
+class CounterMissing(LookupError):
+    """The counter has not been created yet."""
+
+
+def sequence_name(counter):
+    if not _COUNTER_NAME_RE.match(counter):
+        raise ValueError(f'Invalid counter name: {counter!r}')
+    return f'orders_{counter}_seq'
+
+
+def _uses_sequences(using):
+    return connections[using].vendor == 'postgresql'
+
+
+def highest_order_number(using=DEFAULT_DB_ALIAS):
+    """Highest issued 5-digit order number, or 0. Scans orders; only used for seeding."""
+    from apps.orders.models import Order
+
+    last = (
+        Order.objects.using(using)
+        .filter(order_number__regex=r'^\d{5}$')
+        .order_by('-order_number')
+        .values_list('order_number', flat=True)
+        .first()
+    )
+    return int(last) if last else 0
+
+
+def ensure_counter(counter, last_value, using=DEFAULT_DB_ALIAS):
+    """Create ``counter`` so its next value is ``last_value + 1``. Existing counters are kept."""
+    if _uses_sequences(using):
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f'CREATE SEQUENCE IF NOT EXISTS {sequence_name(counter)} '
+                f'MINVALUE 0 START WITH {int(last_value) + 1}'
+            )
+        return
+
+    from apps.orders.models import OrderNumberCounter
+
+    OrderNumberCounter.objects.using(using).get_or_create(
+        name=counter, defaults={'value': int(last_value)},
+    )
+
+
+def drop_counter(counter, using=DEFAULT_DB_ALIAS):
+    if _uses_sequences(using):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f'DROP SEQUENCE IF EXISTS {sequence_name(counter)}')
+        return
+
+    from apps.orders.models import OrderNumberCounter
+
+    OrderNumberCounter.objects.using(using).filter(name=counter).delete()
+
+
+def next_counter_value(counter, using=DEFAULT_DB_ALIAS):
+    """Increment ``counter`` and return the new value. Raises CounterMissing."""
+    if _uses_sequences(using):
+        try:
+            # Savepoint: a missing sequence must not abort the caller's transaction.
+            with transaction.atomic(using=using), connections[using].cursor() as cursor:
+                cursor.execute('SELECT nextval(%s)', [sequence_name(counter)])
+                return cursor.fetchone()[0]
+        except DatabaseError as exc:
+            raise CounterMissing(counter) from exc
+
+    from apps.orders.models import OrderNumberCounter
+
+    counters = OrderNumberCounter.objects.using(using).filter(name=counter)
+    with transaction.atomic(using=using):
+        if not counters.update(value=F('value') + 1):
+            raise CounterMissing(counter)
+        return counters.values_list('value', flat=True).get()
+
+
+def resync_order_number_counter(using=DEFAULT_DB_ALIAS):
+    """Move the counter past numbers issued outside it (fixtures, manual edits)."""
+    highest = highest_order_number(using)
+    if _uses_sequences(using):
+        with transaction.atomic(using=using), connections[using].cursor() as cursor:
+            cursor.execute(
+                f'SELECT setval(%s, GREATEST(%s, (SELECT last_value FROM {sequence_name(ORDER_NUMBER_COUNTER)})))',
+                [sequence_name(ORDER_NUMBER_COUNTER), highest],
+            )
+        return
+
+    from apps.orders.models import OrderNumberCounter
+
+    OrderNumberCounter.objects.using(using).filter(name=ORDER_NUMBER_COUNTER).update(
+        value=Greatest(F('value'), highest),
+    )
+
+
+def allocate_order_number(using=DEFAULT_DB_ALIAS):
+    """Return the next 5-digit order number without scanning or locking orders."""
+    from apps.orders.models import Order
+
+    try:
+        value = next_counter_value(ORDER_NUMBER_COUNTER, using)
+    except CounterMissing:
+        seed = max(highest_order_number(using), Order.STARTING_ORDER_NUMBER - 1)
+        ensure_counter(ORDER_NUMBER_COUNTER, seed, using)
+        value = next_counter_value(ORDER_NUMBER_COUNTER, using)
+
+    value = max(value, Order.STARTING_ORDER_NUMBER)
+    if value > Order.MAX_ORDER_NUMBER:
+        raise ValueError(f"Order number limit reached ({Order.MAX_ORDER_NUMBER})")
+    return f"{value:05d}"
@@ -0,0 +1,50 @@
+"""Ranked order search for tailor screens.
+
+Order numbers are matched on the order row; customer names and phones are
+matched through the shop's customer directory (tailors.ShopCustomer), whose
+keys are normalized (see apps.core.search). Nothing here scans users or
+joins customer names per order.
+"""
+from django.db.models import Case, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from apps.core.search import (
+    RANK_CONTAINS,
+    RANK_EXACT,
+    RANK_PREFIX,
+    is_phone_term,
+    normalize_search_text,
+)
+
+
+def search_tailor_orders(orders, tailor_user, term):
+    """
+    Filter ``orders`` (already scoped to ``tailor_user``) by ``term`` and
+    annotate ``search_rank`` (lower is better).
+    """
+    from apps.tailors.services.pos_customer_directory import ranked_shop_customers
+
+    term = normalize_search_text(term)
+    if not term:
+        return orders
+
+    customers = ranked_shop_customers(tailor_user, term)
+    customer_rank = Subquery(
+        customers.filter(customer_id=OuterRef('customer_id')).values('search_rank')[:1],
+        output_field=IntegerField(),
+    )
+    condition = Q(customer_id__in=customers.values('customer_id'))
+    rank = Coalesce(customer_rank, Value(RANK_CONTAINS + 1))
+
+    if is_phone_term(term):
+        digits = ''.join(filter(str.isdigit, term))
+        condition |= Q(order_number__contains=digits)
+        rank = Case(
+            When(order_number=digits, then=Value(RANK_EXACT)),
+            When(order_number__startswith=digits, then=Value(RANK_PREFIX)),
+            When(order_number__contains=digits, then=Value(RANK_CONTAINS)),
+            default=rank,
+            output_field=IntegerField(),
+        )
+
+    return orders.filter(condition).annotate(search_rank=rank)
@@ -2258,6 +2258,35 @@ class TailorOrderHistorySerializer(OrderListSerializer):
         return obj.updated_at
 
 
+class TailorOrderSearchResultSerializer(serializers.ModelSerializer):
+    """Compact order row for tailor type-ahead search results."""
+
+    customer_name = serializers.SerializerMethodField()
+    customer_phone = serializers.CharField(source='customer.phone', default='', read_only=True)
+    search_rank = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            'id',
+            'order_number',
+            'status',
+            'tailor_status',
+            'service_mode',
+            'total_amount',
+            'created_at',
+            'customer_name',
+            'customer_phone',
+            'search_rank',
+        ]
+
+    def get_customer_name(self, obj):
+        customer = obj.customer
+        if not customer:
+            return None
+        return customer.get_full_name() or customer.username
+
+
 class OrderStatusUpdateResponseSerializer(OrderSerializer):
     """Lightweight serializer for order status update responses - only returns essential fields"""
     
@@ -311,7 +311,7 @@ class CheckoutFlowTest(TestCase):
         ALINMAPAY_REQUEST_URL='https://example.com/pay-request',
         ALINMAPAY_RECEIPT_BASE_URL='https://app.mgask.net',
     )
-    @patch('apps.orders.alinma.requests.post')
+    @patch('apps.orders.alinma.alinma_client.post')
     def test_initiate_alinma_payment_returns_hosted_payment_url(self, mock_post):
         booking_key = self._create_checkout()
         mock_response = Mock()
@@ -231,7 +231,7 @@ class CODOrderFlowTest(TestCase):
         ALINMAPAY_RECEIPT_BASE_URL='https://app.mgask.net',
         ALINMAPAY_CURRENCY='SAR',
     )
-    @patch('apps.orders.alinma.requests.post')
+    @patch('apps.orders.alinma.alinma_client.post')
     def test_customer_can_initiate_remaining_balance_alinma_payment(self, mock_post):
         order = self._create_order(
             payment_method='credit_card',
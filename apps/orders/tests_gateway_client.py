@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.core.testing import StubServer
+from apps.orders import alinma, myfatoorah
+from apps.orders.gateway_client import GatewayUnavailableError, alinma_client, myfatoorah_client
+
+
+PAID_INVOICE = {
+    'IsSuccess': True,
+    'Data': {
+        'InvoiceId': 1234,
+        'InvoiceStatus': 'Paid',
+        'InvoiceValue': '135.000',
+        'CustomerReference': 'attempt-1',
+        'InvoiceTransactions': [
+            {'TransactionStatus': 'Succss', 'PaymentId': 'pay-1', 'PaidCurrency': 'SAR'},
+        ],
+    },
+}
+
+
+@override_settings(
+    MYFATOORAH_API_KEY='test-api-key',
+    ALINMAPAY_TERMINAL_ID='TERM123',
+    ALINMAPAY_TERMINAL_PASSWORD='term-password',
+    ALINMAPAY_MERCHANT_KEY='00112233445566778899aabbccddeeff',
+    ALINMAPAY_TIMEOUT_SECONDS=1,
+    PAYMENT_GATEWAY_FAILURE_THRESHOLD=2,
+    PAYMENT_GATEWAY_RESET_SECONDS=60,
+)
+class GatewayClientTest(SimpleTestCase):
+    def setUp(self):
+        for client in (myfatoorah_client, alinma_client):
+            client.reset()
+            self.addCleanup(client.reset)
+        self.server = StubServer(default=(200, PAID_INVOICE))
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+
+        config = myfatoorah.MyFatoorahConfig(
+            api_key='test-api-key',
+            api_base_url=self.server.url(),
+            webhook_secret='',
+            timeout_seconds=1,
+        )
+        patcher = patch('apps.orders.myfatoorah.get_myfatoorah_config', return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _inquire(self):
+        with self.settings(ALINMAPAY_REQUEST_URL=self.server.url('/pay-request')):
+            return alinma.inquire_transaction(reference_id='ref-1', order_id='ORD-1', amount='10.00')
+
+    def test_payment_status_calls_share_one_connection(self):
+        for _ in range(3):
+            details = myfatoorah.get_payment_status('1234')
+            self.assertTrue(details.is_paid)
+
+        self.assertEqual(self.server.connection_count, 1)
+        request = self.server.requests[0]
+        self.assertEqual(request.path, '/v2/GetPaymentStatus')
+        self.assertEqual(request.body, {'Key': '1234', 'KeyType': 'InvoiceId'})
+        summary = myfatoorah_client.latency_summary()
+        self.assertEqual((summary['calls'], summary['failures'], summary['circuit']), (3, 0, 'closed'))
+        self.assertIn('p95_ms', summary)
+
+    def test_circuit_opens_after_repeated_failures_and_fails_fast(self):
+        self.server.default = (503, {'message': 'down'})
+        for _ in range(2):
+            with self.assertRaises(myfatoorah.MyFatoorahGatewayError):
+                myfatoorah.get_payment_status('1234')
+
+        with self.assertRaisesMessage(myfatoorah.MyFatoorahGatewayError, 'Could not verify payment'):
+            myfatoorah.get_payment_status('1234')
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(myfatoorah_client.latency_summary()['circuit'], 'open')
+        # Each gateway has its own circuit.
+        self.assertEqual(alinma_client.latency_summary()['circuit'], 'closed')
+
+    def test_half_open_trial_closes_the_circuit(self):
+        self.server.default = (503, {})
+        with self.settings(PAYMENT_GATEWAY_RESET_SECONDS=0):
+            alinma_client.reset()
+            for _ in range(2):
+                with self.assertRaises(alinma.AlinmaGatewayError):
+                    self._inquire()
+            self.server.default = (200, {'responseCode': '000'})
+
+            self.assertEqual(self._inquire(), {'responseCode': '000'})
+
+        self.assertEqual(alinma_client.latency_summary()['circuit'], 'closed')
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_trial_that_raises_something_else_does_not_keep_the_circuit_open(self):
+        with self.settings(PAYMENT_GATEWAY_RESET_SECONDS=0):
+            alinma_client.reset()
+            alinma_client.breaker.record_failure()
+            alinma_client.breaker.record_failure()
+            with patch.object(alinma_client._get_session(), 'post', side_effect=ValueError('bad payload')):
+                with self.assertRaises(ValueError):
+                    alinma_client.post(self.server.url(), operation='inquiry', read_timeout=1, json={})
+
+            response = alinma_client.post(self.server.url(), operation='inquiry', read_timeout=1, json={})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(alinma_client.latency_summary()['circuit'], 'closed')
+
+    def test_slow_gateway_hits_the_read_timeout(self):
+        self.server.respond(200, {'responseCode': '000'}, delay=1.5)
+
+        with self.assertRaisesMessage(alinma.AlinmaGatewayError, 'Could not connect'):
+            self._inquire()
+
+        self.assertEqual(alinma_client.latency_summary()['failures'], 1)
+
+    def test_client_errors_do_not_trip_the_circuit(self):
+        self.server.default = (400, {'responseCode': '903', 'responseDescription': 'Bad request'})
+        for _ in range(3):
+            with self.assertRaisesMessage(alinma.AlinmaGatewayError, 'Bad request'):
+                self._inquire()
+
+        self.assertEqual(alinma_client.latency_summary()['circuit'], 'closed')
+
+    def test_open_circuit_raises_a_connection_error(self):
+        alinma_client.breaker.record_failure()
+        alinma_client.breaker.record_failure()
+
+        with self.assertRaises(GatewayUnavailableError):
+            alinma_client.post(self.server.url(), operation='inquiry', read_timeout=1, json={})
+        self.assertEqual(self.server.requests, [])
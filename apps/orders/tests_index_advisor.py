@@ -0,0 +1,39 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.orders.index_advisor import analyze_scenarios, build_scenarios, query_shape, seeded_orders
+from apps.orders.models import Order
+
+
+class OrderIndexAdvisorTest(TestCase):
+    def test_query_shape_collapses_literals(self):
+        self.assertEqual(
+            query_shape("SELECT 1 FROM t WHERE a = 42 AND b = 'x''y' AND c = 1.5"),
+            query_shape("SELECT 2 FROM t WHERE a = 7 AND b = 'z' AND c = 3.25"),
+        )
+
+    def test_tailor_lists_use_composite_indexes(self):
+        with seeded_orders(orders_count=400, tailors_count=4) as actors:
+            plans = analyze_scenarios(build_scenarios(tailor=actors['tailor']))
+
+        def list_plan(scenario):
+            return next(
+                plan for plan in plans
+                if plan.scenario == scenario and 'FROM "orders_order"' in plan.sql
+            )
+
+        self.assertIn('order_tailor_open_created', '\n'.join(list_plan('tailor_orders_open').plan))
+        self.assertIn('order_tailor_status_created', '\n'.join(list_plan('tailor_orders_by_status').plan))
+        self.assertEqual(list_plan('tailor_orders_open').seq_scans, [])
+
+    def test_command_reports_every_scenario_and_rolls_back(self):
+        out = StringIO()
+
+        call_command('explain_order_queries', seed=200, tailors=2, stdout=out)
+
+        report = out.getvalue()
+        for scenario in ('tailor_orders_open', 'tailor_dashboard', 'customer_orders', 'rider_available_orders'):
+            self.assertIn(scenario, report)
+        self.assertFalse(Order.objects.exists())
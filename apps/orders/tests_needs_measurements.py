@@ -0,0 +1,105 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.orders.models import Order, OrderItem
+from apps.tailors.models import TailorProfile
+
+
+User = get_user_model()
+
+
+class OrderNeedsMeasurementsTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='needs_customer',
+            email='needs_customer@example.com',
+            password='testpass123',
+            role='USER',
+        )
+        self.tailor = User.objects.create_user(
+            username='needs_tailor',
+            email='needs_tailor@example.com',
+            password='testpass123',
+            role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(user=self.tailor, defaults={'shop_name': 'Needs Tailor'})
+        self.order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            order_type='stitching_only',
+            payment_method='cod',
+            subtotal=Decimal('50.00'),
+            total_amount=Decimal('50.00'),
+        )
+
+    def _add_item(self, measurements):
+        return OrderItem.objects.create(
+            order=self.order,
+            quantity=1,
+            unit_price=Decimal('50.00'),
+            measurements=measurements,
+        )
+
+    def _flag(self):
+        return Order.objects.values_list('needs_measurements', flat=True).get(pk=self.order.pk)
+
+    def test_order_without_items_does_not_need_measurements(self):
+        self.assertFalse(self._flag())
+
+    def test_flag_follows_item_saves_and_deletes(self):
+        measured = self._add_item({'chest': 100})
+        self.assertFalse(self._flag())
+
+        pending = self._add_item({})
+        self.assertTrue(self._flag())
+
+        pending.measurements = {'chest': 98}
+        pending.save()
+        self.assertFalse(self._flag())
+
+        pending.measurements = {}
+        pending.save(update_fields=['measurements'])
+        self.assertTrue(self._flag())
+
+        pending.delete()
+        self.assertFalse(self._flag())
+        measured.delete()
+        self.assertFalse(self._flag())
+
+    def test_queryset_update_is_synced_explicitly(self):
+        item = self._add_item({})
+        OrderItem.objects.filter(pk=item.pk).update(measurements={'chest': 100})
+        self.assertTrue(self._flag())
+
+        Order.sync_needs_measurements([self.order.pk])
+
+        self.assertFalse(self._flag())
+
+    def test_stale_order_save_keeps_flag(self):
+        stale = Order.objects.get(pk=self.order.pk)
+        self._add_item({})
+
+        stale.notes = 'Updated from an older instance'
+        stale.save()
+
+        self.assertTrue(self._flag())
+        self.assertTrue(stale.needs_measurements)
+        self.assertEqual(Order.objects.get(pk=self.order.pk).notes, 'Updated from an older instance')
+
+    def test_full_save_of_a_deleted_order_inserts_it_again(self):
+        Order.objects.filter(pk=self.order.pk).delete()
+
+        self.order.save()
+
+        self.assertTrue(Order.objects.filter(pk=self.order.pk).exists())
+
+    def test_filters_use_flag(self):
+        self._add_item({})
+        Order.objects.filter(pk=self.order.pk).update(tailor_status='accepted')
+
+        self.assertEqual(
+            list(Order.objects.filter(tailor=self.tailor, tailor_status='accepted', needs_measurements=True)),
+            [self.order],
+        )
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.orders.models import Order, OrderNumberCounter
+from apps.orders.order_numbers import (
+    ORDER_NUMBER_COUNTER,
+    allocate_order_number,
+    drop_counter,
+    resync_order_number_counter,
+)
+from apps.tailors.models import TailorProfile
+
+
+User = get_user_model()
+
+
+class OrderNumberAllocationTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(
+            username='numbers_customer',
+            email='numbers_customer@example.com',
+            password='testpass123',
+            role='USER',
+        )
+        self.tailor = User.objects.create_user(
+            username='numbers_tailor',
+            email='numbers_tailor@example.com',
+            password='testpass123',
+            role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(user=self.tailor, defaults={'shop_name': 'Numbers Tailor'})
+
+    def _create_order(self, **kwargs):
+        return Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            order_type='fabric_only',
+            payment_method='cod',
+            subtotal=Decimal('10.00'),
+            total_amount=Decimal('10.00'),
+            **kwargs,
+        )
+
+    def test_orders_get_sequential_numbers_from_starting_number(self):
+        first = self._create_order()
+        second = self._create_order()
+
+        self.assertEqual(first.order_number, '00300')
+        self.assertEqual(second.order_number, '00301')
+        self.assertEqual(OrderNumberCounter.objects.get(name=ORDER_NUMBER_COUNTER).value, 301)
+
+    def test_missing_counter_is_seeded_after_highest_existing_number(self):
+        self._create_order(order_number='00420')
+        drop_counter(ORDER_NUMBER_COUNTER)
+
+        self.assertEqual(allocate_order_number(), '00421')
+        self.assertEqual(allocate_order_number(), '00422')
+
+    def test_collision_with_manual_number_resyncs_counter(self):
+        self._create_order(order_number='00300')
+        self._create_order(order_number='00301')
+
+        order = self._create_order()
+
+        self.assertEqual(order.order_number, '00302')
+
+    def test_resync_never_moves_counter_backwards(self):
+        OrderNumberCounter.objects.filter(name=ORDER_NUMBER_COUNTER).update(value=500)
+        self._create_order(order_number='00310')
+
+        resync_order_number_counter()
+
+        self.assertEqual(allocate_order_number(), '00501')
+
+    def test_limit_raises(self):
+        OrderNumberCounter.objects.filter(name=ORDER_NUMBER_COUNTER).update(value=Order.MAX_ORDER_NUMBER)
+
+        with self.assertRaisesMessage(ValueError, 'Order number limit reached'):
+            allocate_order_number()
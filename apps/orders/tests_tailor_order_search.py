@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.orders.models import Order
+from apps.tailors.models import TailorProfile
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class TailorOrderSearchViewTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='search_owner', role='TAILOR')
+        TailorProfile.objects.get_or_create(user=self.owner)
+        self.other_owner = User.objects.create_user(username='search_other_owner', role='TAILOR')
+        self.customer = User.objects.create_user(
+            username='search_customer', role='USER', phone='0551230000', first_name='أحمد',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def _order(self, number, tailor=None, customer=None):
+        order = Order.objects.create(
+            customer=customer or self.customer,
+            tailor=tailor or self.owner,
+            service_mode='walk_in',
+            payment_method='cod',
+            subtotal=Decimal('50.00'),
+            total_amount=Decimal('50.00'),
+        )
+        Order.objects.filter(pk=order.pk).update(order_number=number)
+        return order
+
+    def _ids(self, term):
+        response = self.client.get('/api/orders/tailor/search/', {'q': term})
+        self.assertEqual(response.status_code, 200, response.data)
+        return [item['id'] for item in response.data['data']['results']]
+
+    def test_order_numbers_rank_exact_then_prefix_then_contains(self):
+        contains = self._order('91234')
+        prefix = self._order('12345')
+        exact = self._order('00123')
+        self._order('00123-x', tailor=self.other_owner)
+
+        self.assertEqual(self._ids('00123'), [exact.id])
+        self.assertEqual(self._ids('123'), [prefix.id, exact.id, contains.id])
+        self.assertEqual(self._ids('1'), [])
+
+    def test_customer_name_and_phone_match_through_directory(self):
+        order = self._order('00501')
+        stranger = User.objects.create_user(username='search_stranger', role='USER', first_name='Ahmad')
+        self._order('00502', tailor=self.other_owner, customer=stranger)
+
+        self.assertEqual(self._ids('احمد'), [order.id])
+        self.assertEqual(self._ids('+966 55 123'), [order.id])
+        self.assertEqual(self._ids('ahmad'), [])
@@ -8,6 +8,7 @@ from .views import (
     CustomerOrderListView,
     TailorOrderListView,
     TailorOrderHistoryView,
+    TailorOrderSearchView,
     TailorAvailableOrdersView,
     TailorPaidOrdersView,
     TailorOrderDetailView,
@@ -73,6 +74,7 @@ urlpatterns = [
     path('tailor/available-orders/', TailorAvailableOrdersView.as_view(), name='tailor-available-orders'),
     path('tailor/my-orders/', TailorOrderListView.as_view(), name='tailor-orders'),
     path('tailor/history/', TailorOrderHistoryView.as_view(), name='tailor-order-history'),
+    path('tailor/search/', TailorOrderSearchView.as_view(), name='tailor-order-search'),
     path('tailor/paid-orders/', TailorPaidOrdersView.as_view(), name='tailor-paid-orders'),
     path('tailor/<int:order_id>/', TailorOrderDetailView.as_view(), name='tailor-order-detail'),
     
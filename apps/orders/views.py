@@ -16,7 +16,7 @@ from rest_framework.authentication import SessionAuthentication, BasicAuthentica
 from rest_framework.parsers import MultiPartParser, FormParser
 from .actions import OrderActionManager
 from django.db.models import Q
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from .models import CheckoutSession, Order, OrderItem, OrderPayment, OrderStatusHistory, RemainingPaymentSession
 from .serializers import(
 OrderItemSerializer,
@@ -30,6 +30,7 @@ OrderListSerializer,
     PayRemainingBalanceSerializer,
 	OrderStatusUpdateResponseSerializer,
     TailorOrderHistorySerializer,
+    TailorOrderSearchResultSerializer,
     CheckoutCreateOrderSerializer,
     CheckoutSessionSerializer,
     CheckoutInitiatePaymentSerializer,
@@ -52,7 +53,7 @@ from apps.tailors.shop_access import (
     user_can_see_stitch_order,
 )
 from apps.customers.models import CustomerProfile, Address
-from zthob.utils import api_response
+from zthob.utils import StandardResultsSetPagination, api_response
 from zthob.translations import get_language_from_request 
 import uuid
 from decimal import Decimal
@@ -61,6 +62,8 @@ from apps.orders.history_utils import (
     DEFAULT_PERIOD,
     get_tailor_completed_orders,
 )
+from apps.orders.search import search_tailor_orders
+from apps.core.search import MIN_TYPEAHEAD_LENGTH
 from apps.orders.alinma import (
     AlinmaConfigurationError,
     AlinmaGatewayError,
@@ -1570,11 +1573,7 @@ class TailorOrderListView(APIView):
         # Filter for orders that need measurements (usually for Shop Orders)
         needs_measurements = request.query_params.get('needs_measurements')
         if needs_measurements == 'true':
-            orders = orders.filter(
-                tailor_status='accepted'
-            ).filter(
-                Q(order_items__measurements={}) | Q(order_items__measurements__isnull=True)
-            ).distinct()
+            orders = orders.filter(tailor_status='accepted', needs_measurements=True)
 
         # New in_stitching filter for dashboard buckets
         in_stitching = request.query_params.get('in_stitching')
@@ -1588,10 +1587,7 @@ class TailorOrderListView(APIView):
                 orders = orders.filter(
                     Q(tailor_status__in=['in_progress', 'stitching_started', 'stitched']) |
                     Q(tailor_status='accepted', order_type__in=['fabric_with_stitching', 'stitching_only'])
-                ).exclude(
-                    Q(tailor_status='accepted', order_items__measurements={}) |
-                    Q(tailor_status='accepted', order_items__measurements__isnull=True)
-                ).distinct()
+                ).exclude(tailor_status='accepted', needs_measurements=True)
             else:
                 # Delivery orders separate 'accepted' into 'To Prepare' (Make Progress)
                 stitching_statuses = ['in_progress', 'stitching_started', 'stitched']
@@ -1662,12 +1658,7 @@ class TailorOrderHistoryView(APIView):
 
         search = (request.query_params.get('search') or '').strip()
         if search:
-            orders = orders.filter(
-                Q(order_number__icontains=search)
-                | Q(customer__first_name__icontains=search)
-                | Q(customer__last_name__icontains=search)
-                | Q(customer__username__icontains=search)
-            )
+            orders = search_tailor_orders(orders, tailor_user, search)
 
         serializer = TailorOrderHistorySerializer(
             orders,
@@ -1689,6 +1680,48 @@ class TailorOrderHistoryView(APIView):
         )
 
 
+class TailorOrderSearchView(APIView):
+    """Ranked type-ahead search over all of the tailor shop's orders."""
+    permission_classes = [IsAuthenticated, IsShopStaff]
+    required_employee_permission = 'can_manage_orders'
+    pagination_class = StandardResultsSetPagination
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(name='q', type=str, description='Order number, customer name or phone'),
+            OpenApiParameter(name='page', type=int),
+            OpenApiParameter(name='page_size', type=int),
+        ],
+        responses=TailorOrderSearchResultSerializer(many=True),
+        summary="Search tailor orders",
+        description=(
+            "Type-ahead over the tailor's orders. Exact order numbers first, then prefix, "
+            "then customer name/phone matches; newest first within each rank."
+        ),
+        tags=["Tailor Orders"],
+    )
+    def get(self, request):
+        tailor_user = _get_tailor_owner_user(request)
+        if not tailor_user:
+            return api_response(
+                success=False,
+                message="User is not a tailor",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        term = (request.query_params.get('q') or '').strip()
+        orders = Order.objects.filter(tailor=tailor_user).select_related('customer')
+        if len(term) < MIN_TYPEAHEAD_LENGTH:
+            orders = orders.none()
+        else:
+            orders = search_tailor_orders(orders, tailor_user, term).order_by('search_rank', '-created_at', '-id')
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(orders, request, view=self)
+        serializer = TailorOrderSearchResultSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data, message="Orders retrieved successfully")
+
+
 class TailorPaidOrdersView(APIView):
     """Get paid orders and pending COD orders for tailor"""
     permission_classes=[IsAuthenticated, IsShopStaff]
@@ -2253,14 +2286,21 @@ class WorkOrderPDFView(APIView):
     
     def get(self, request, order_id):
         from django.http import HttpResponse
+        from django.utils.cache import get_conditional_response
         
         try:
-            order = Order.objects.select_related('customer', 'tailor').prefetch_related(
+            order = Order.objects.select_related(
+                'customer',
+                'tailor',
+                'tailor__tailor_profile',
+                'measurement_rider__rider_profile',
+                'delivery_rider__rider_profile',
+                'delivery_address',
+            ).prefetch_related(
                 'order_items__fabric',
-                'order_items__customization',
-                'order_items__customization__collar_style',
-                'order_items__customization__cuff_style',
-                'order_items__customization__pocket_style',
+                'order_items__family_member',
+                'order_items__customer_fabric_images',
+                'status_history__changed_by',
             ).get(id=order_id)
         except Order.DoesNotExist:
             return api_response(success=False, message='Order not found',
@@ -2276,13 +2316,26 @@ class WorkOrderPDFView(APIView):
             language = 'ar'
         
         try:
-            from apps.documents.service import generate_order_document
-            pdf_bytes = generate_order_document(order, language)
-
+            from apps.documents.pdf_cache import (
+                get_order_pdf,
+                order_pdf_cache_enabled,
+                order_pdf_cache_entry,
+            )
+
+            entry = None
+            if order_pdf_cache_enabled():
+                entry = order_pdf_cache_entry(order, language)
+                not_modified = get_conditional_response(request, etag=entry.etag)
+                if not_modified is not None:
+                    return not_modified
+            pdf_bytes, entry = get_order_pdf(order, language, entry=entry)
             
             response = HttpResponse(pdf_bytes, content_type='application/pdf')
             filename = f'work_order_{order.order_number}_{language}.pdf'
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            if entry is not None:
+                response['ETag'] = entry.etag
+                response['Cache-Control'] = 'private, no-cache'
             return response
             
         except Exception as e:
@@ -603,7 +603,7 @@ class RiderAvailableOrdersView(APIView):
             Q(rider_status='none')
             & 
             Q(order_type__in=['fabric_with_stitching', 'stitching_only'], tailor_status__in=['accepted', 'in_progress'])
-            & (Q(order_items__measurements__isnull=True) | Q(order_items__measurements={}))
+            & Q(needs_measurements=True)
             & (unassigned_work | measurement_assignment)
         )
         delivery_work = (
@@ -631,7 +631,7 @@ class RiderAvailableOrdersView(APIView):
             Q(payment_status__in=['paid', 'partially_paid']) | Q(payment_method='cod', payment_status='pending')
         ).filter(
             delivery_work | fabric_only_work | measurement_work | measurement_service_work
-        ).distinct().select_related(
+        ).select_related(
             'customer',
             'tailor',
             'delivery_address',
@@ -697,7 +697,7 @@ class RiderMyOrdersView(APIView):
                 Q(order_type='measurement_service', service_mode='home_delivery')
                 | (
                     Q(order_type__in=['fabric_with_stitching', 'stitching_only'], tailor_status__in=['accepted', 'in_progress'])
-                    & (Q(order_items__measurements__isnull=True) | Q(order_items__measurements={}))
+                    & Q(needs_measurements=True)
                 )
             )
             & measurement_assignment
@@ -1137,6 +1137,7 @@ class RiderAddMeasurementsView(APIView):
                 
                 # Update all items for this family member in this order
                 order.order_items.filter(family_member=family_member).update(measurements=measurements_data)
+                Order.sync_needs_measurements([order.id])
             else:
                 # Update customer profile measurements
                 from apps.customers.models import CustomerProfile
@@ -1146,6 +1147,7 @@ class RiderAddMeasurementsView(APIView):
                 
                 # Update all items for the customer in this order
                 order.order_items.filter(family_member__isnull=True).update(measurements=measurements_data)
+                Order.sync_needs_measurements([order.id])
                 recipient_name = order.customer.get_full_name() or order.customer.username if order.customer else 'Customer'
             
             # Save order first to persist measurements
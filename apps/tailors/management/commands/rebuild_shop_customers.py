@@ -0,0 +1,31 @@
+"""
+Management command to rebuild the POS customer directory from orders.
+
+Usage:
+    python manage.py rebuild_shop_customers
+    python manage.py rebuild_shop_customers --tailor 42
+
+The directory is kept current on order creation and POS customer creation.
+Run this after bulk imports, order deletions or reassignments that bypass
+model saves; it recounts orders, refreshes search keys and drops rows for
+customers the shop no longer has.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.tailors.models import ShopCustomer
+
+
+class Command(BaseCommand):
+    help = 'Rebuild ShopCustomer rows from orders and POS-created customer profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tailor',
+            type=int,
+            action='append',
+            help='Shop owner user id to rebuild (repeatable). Defaults to all shops.',
+        )
+
+    def handle(self, *args, **options):
+        written = ShopCustomer.rebuild(tailor_ids=options['tailor'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} shop customer rows'))
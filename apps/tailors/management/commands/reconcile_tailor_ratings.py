@@ -0,0 +1,39 @@
+"""
+Management command to recompute tailor rating aggregates from scratch.
+
+Usage:
+    python manage.py reconcile_tailor_ratings
+    python manage.py reconcile_tailor_ratings --tailor 42 --batch-size 200
+
+Rating saves and deletes update TailorProfile sums, counts and averages
+incrementally. Run this after bulk imports or deletes that bypass model
+signals (queryset.update/delete, raw SQL) to bring them back in line.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.tailors.services.rating_aggregates import reconcile_rating_aggregates
+
+
+class Command(BaseCommand):
+    help = 'Recompute TailorProfile rating sums, counts and averages from TailorRating'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tailor',
+            type=int,
+            action='append',
+            help='TailorProfile id to reconcile (repeatable). Defaults to all tailors.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Tailor profiles recomputed per transaction (default 500).',
+        )
+
+    def handle(self, *args, **options):
+        corrected = reconcile_rating_aggregates(
+            tailor_ids=options['tailor'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Corrected {corrected} tailor rating aggregates'))
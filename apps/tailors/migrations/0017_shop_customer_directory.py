@@ -0,0 +1,77 @@
+# Generated by Django 5.2.5 on 2026-10-19 02:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_shop_customers(apps, schema_editor):
+    from apps.tailors.models.pos_customers import customer_search_keys
+
+    alias = schema_editor.connection.alias
+    Order = apps.get_model('orders', 'Order')
+    CustomerProfile = apps.get_model('customers', 'CustomerProfile')
+    ShopCustomer = apps.get_model('tailors', 'ShopCustomer')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    stats = {
+        (row['tailor_id'], row['customer_id']): (row['total'], row['last'])
+        for row in Order.objects.using(alias).filter(tailor__isnull=False)
+        .values('tailor_id', 'customer_id')
+        .annotate(total=Count('id'), last=Max('created_at'))
+    }
+    profiles = CustomerProfile.objects.using(alias).filter(pos_created_by__isnull=False)
+    for tailor_id, customer_id in profiles.values_list('pos_created_by_id', 'user_id'):
+        stats.setdefault((tailor_id, customer_id), (0, None))
+
+    users = User.objects.using(alias).in_bulk({customer_id for _, customer_id in stats})
+    rows = []
+    for (tailor_id, customer_id), (total, last) in stats.items():
+        user = users.get(customer_id)
+        if user is None:
+            continue
+        search_name, search_phone = customer_search_keys(user)
+        rows.append(ShopCustomer(
+            tailor_id=tailor_id,
+            customer_id=customer_id,
+            total_orders=total,
+            last_order_date=last,
+            search_name=search_name,
+            search_phone=search_phone,
+        ))
+    ShopCustomer.objects.using(alias).bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0011_fix_audit_log_index_names'),
+        ('orders', '0045_order_needs_measurements'),
+        ('tailors', '0016_tailorprofile_standard_stitching_days'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopCustomer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_orders', models.PositiveIntegerField(default=0)),
+                ('last_order_date', models.DateTimeField(blank=True, null=True)),
+                ('search_name', models.CharField(blank=True, default='', max_length=300)),
+                ('search_phone', models.CharField(blank=True, default='', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='shop_memberships', to=settings.AUTH_USER_MODEL)),
+                ('tailor', models.ForeignKey(help_text='Shop owner (same user as Order.tailor)', on_delete=django.db.models.deletion.CASCADE, related_name='shop_customers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Shop Customer',
+                'verbose_name_plural': 'Shop Customers',
+                'indexes': [models.Index(fields=['tailor', '-last_order_date', '-id'], name='shop_customer_recent_idx'), models.Index(fields=['tailor', 'search_phone'], name='shop_customer_phone_idx')],
+                'constraints': [models.UniqueConstraint(fields=('tailor', 'customer'), name='unique_shop_customer')],
+            },
+        ),
+        migrations.RunPython(backfill_shop_customers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import migrations
+
+from apps.core.search import trigram_index_operations
+
+
+def renormalize_search_keys(apps, schema_editor):
+    from apps.tailors.models.pos_customers import customer_search_keys
+
+    alias = schema_editor.connection.alias
+    ShopCustomer = apps.get_model('tailors', 'ShopCustomer')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    rows = list(ShopCustomer.objects.using(alias).only('id', 'customer_id'))
+    users = User.objects.using(alias).in_bulk({row.customer_id for row in rows})
+    for row in rows:
+        user = users.get(row.customer_id)
+        if user is not None:
+            row.search_name, row.search_phone = customer_search_keys(user)
+    ShopCustomer.objects.using(alias).bulk_update(rows, ['search_name', 'search_phone'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tailors', '0017_shop_customer_directory'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(renormalize_search_keys, migrations.RunPython.noop),
+        *trigram_index_operations('tailors_shopcustomer', ['search_name', 'search_phone']),
+    ]
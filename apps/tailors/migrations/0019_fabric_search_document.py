@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-19 02:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.core.search import trigram_index_operations
+
+
+def build_search_documents(apps, schema_editor):
+    from apps.tailors.models.catalog import fabric_search_document
+
+    alias = schema_editor.connection.alias
+    Fabric = apps.get_model('tailors', 'Fabric')
+    rows = list(
+        Fabric.objects.using(alias)
+        .select_related('category', 'fabric_type', 'country')
+        .prefetch_related('tags')
+    )
+    for fabric in rows:
+        fabric.search_document = fabric_search_document(fabric, [tag.name for tag in fabric.tags.all()])
+    Fabric.objects.using(alias).bulk_update(rows, ['search_document'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tailors', '0018_shop_customer_search_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fabric',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Normalized catalog search text (see fabric_search_document)'),
+        ),
+        migrations.AddIndex(
+            model_name='fabric',
+            index=models.Index(fields=['price'], name='tailors_fab_price_b9905d_idx'),
+        ),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+        *trigram_index_operations('tailors_fabric', ['search_document']),
+    ]
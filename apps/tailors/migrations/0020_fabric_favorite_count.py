@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-19 02:53
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_favorite_counts(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    Fabric = apps.get_model('tailors', 'Fabric')
+    FabricFavorite = apps.get_model('customers', 'FabricFavorite')
+    counts = (
+        FabricFavorite.objects.using(alias)
+        .filter(fabric_id=OuterRef('pk'))
+        .order_by()
+        .values('fabric_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Fabric.objects.using(alias).update(favorite_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tailors', '0019_fabric_search_document'),
+        ('customers', '0011_fix_audit_log_index_names'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fabric',
+            name='favorite_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of customers who favorited this fabric (kept by FabricFavorite signals)'),
+        ),
+        migrations.RunPython(backfill_favorite_counts, migrations.RunPython.noop),
+    ]
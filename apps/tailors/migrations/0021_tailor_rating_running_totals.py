@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-19 02:58
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_totals(apps, schema_editor):
+    alias = schema_editor.connection.alias
+    TailorProfile = apps.get_model('tailors', 'TailorProfile')
+    TailorRating = apps.get_model('tailors', 'TailorRating')
+    rows = (
+        TailorRating.objects.using(alias)
+        .order_by()
+        .values('tailor_id')
+        .annotate(
+            count=Count('id'),
+            stitching=Sum('stitching_quality'),
+            delivery=Sum('on_time_delivery'),
+            overall=Sum('overall_satisfaction'),
+        )
+    )
+    for row in rows:
+        TailorProfile.objects.using(alias).filter(pk=row['tailor_id']).update(
+            rating_count=row['count'],
+            stitching_quality_total=row['stitching'],
+            on_time_delivery_total=row['delivery'],
+            overall_satisfaction_total=row['overall'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tailors', '0020_fabric_favorite_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tailorprofile',
+            name='on_time_delivery_total',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of on-time delivery ratings'),
+        ),
+        migrations.AddField(
+            model_name='tailorprofile',
+            name='overall_satisfaction_total',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of overall satisfaction ratings'),
+        ),
+        migrations.AddField(
+            model_name='tailorprofile',
+            name='stitching_quality_total',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of stitching quality ratings'),
+        ),
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,7 @@ from .review import TailorProfileReview
 from .service_areas import ServiceArea
 from .rating import TailorRating
 from .employee import TailorEmployee
+from .pos_customers import ShopCustomer
 
 __all__ = [
     'TailorProfile',
@@ -25,4 +26,5 @@ __all__ = [
     'ServiceArea',
     'TailorRating',
     'TailorEmployee',
+    'ShopCustomer',
 ]
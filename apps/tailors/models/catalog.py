@@ -2,9 +2,34 @@
 from django.db import models 
 from django.utils.text import slugify
 import uuid
-from apps.core.models import BaseModel
+from apps.core.models import BaseModel, refresh_maintained_fields
 from .base import SluggedModel, IMAGE_VALIDATOR, SEASON_CHOICES
 
+# Fabric columns that feed Fabric.search_document.
+FABRIC_SEARCH_SOURCE_FIELDS = {'name', 'description', 'sku', 'category', 'fabric_type', 'country'}
+# Maintained with F() updates by signals (apps/customers/signals.py).
+FABRIC_COUNTER_FIELDS = {'favorite_count'}
+
+
+def fabric_search_document(fabric, tag_names=()):
+    """
+    Normalized Arabic/English text a fabric is found by: its name first (so
+    a prefix match on the document is a name prefix match), then category,
+    type, country, tags, SKU and description.
+    """
+    from apps.core.search import normalize_search_text
+
+    parts = [fabric.name]
+    for related in ('category', 'fabric_type'):
+        obj = getattr(fabric, related)
+        if obj is not None:
+            parts.append(obj.name)
+    if fabric.country is not None:
+        parts.extend([fabric.country.name, fabric.country.name_ar, fabric.country.code])
+    parts.extend(tag_names)
+    parts.extend([fabric.sku, fabric.description])
+    return normalize_search_text(' '.join(part for part in parts if part))
+
 class FabricType(SluggedModel):
     """Model representing different types of fabrics."""
     
@@ -261,6 +286,11 @@ class Fabric(BaseModel):
         default=0,
         help_text="Total number of times this fabric has been ordered"
     )
+    favorite_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of customers who favorited this fabric (kept by FabricFavorite signals)"
+    )
     
     # Legacy field (deprecated)
     fabric_image = models.ImageField(
@@ -270,6 +300,13 @@ class Fabric(BaseModel):
         blank=True,
         help_text="Legacy single image field - use gallery instead"
     )
+
+    search_document = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Normalized catalog search text (see fabric_search_document)"
+    )
     
     class Meta:
         verbose_name = "Fabric"
@@ -282,13 +319,40 @@ class Fabric(BaseModel):
             models.Index(fields=['is_featured']),
             models.Index(fields=['approval_status']),
             models.Index(fields=['is_on_sale', 'sale_start', 'sale_end']),
+            models.Index(fields=['price']),
         ]
     
     def save(self, *args, **kwargs):
-        """Generate SKU if not provided."""
+        """
+        Generate SKU if not provided and keep the search document current.
+        Full saves write back the stored counters, not the in-memory ones.
+        """
         if not self.sku:
             self.sku = f"FAB-{uuid.uuid4().hex[:8].upper()}"
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or FABRIC_SEARCH_SOURCE_FIELDS & set(update_fields):
+            self.search_document = fabric_search_document(self, self._search_tag_names())
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'search_document'}
+        if update_fields is None:
+            refresh_maintained_fields(self, FABRIC_COUNTER_FIELDS)
         super().save(*args, **kwargs)
+
+    def _search_tag_names(self):
+        if self.pk is None:
+            return []
+        return [tag.name for tag in self.tags.all()]
+
+    @classmethod
+    def refresh_search_documents(cls, fabrics):
+        """Rebuild search documents for a queryset of fabrics (tags and lookups renamed)."""
+        rows = list(
+            fabrics.select_related('category', 'fabric_type', 'country').prefetch_related('tags')
+        )
+        for fabric in rows:
+            fabric.search_document = fabric_search_document(fabric, [tag.name for tag in fabric.tags.all()])
+        cls.objects.bulk_update(rows, ['search_document'], batch_size=500)
+        return len(rows)
     
     @property
     def primary_image(self):
@@ -0,0 +1,166 @@
+# apps/tailors/models/pos_customers.py
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Max
+from django.db.models.functions import Coalesce, Greatest
+
+
+def customer_search_keys(user):
+    """Normalized name and local phone digits used to search the POS directory."""
+    from apps.core.search import normalize_search_text, phone_search_digits
+
+    name = normalize_search_text(' '.join(
+        part for part in (user.first_name, user.last_name, user.username) if part
+    ))
+    return name[:300], phone_search_digits(user.phone)[:20]
+
+
+class ShopCustomer(models.Model):
+    """
+    One row per customer a tailor shop may serve from its POS: customers who
+    ordered from the shop or were created by its POS (see
+    tailor_has_pos_access_to_customer). Order stats and search keys are kept
+    here so the POS customer list is an indexed, paginated read.
+    """
+
+    tailor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='shop_customers',
+        help_text="Shop owner (same user as Order.tailor)"
+    )
+    customer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='shop_memberships',
+    )
+    total_orders = models.PositiveIntegerField(default=0)
+    last_order_date = models.DateTimeField(null=True, blank=True)
+    search_name = models.CharField(max_length=300, blank=True, default='')
+    search_phone = models.CharField(max_length=20, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Shop Customer"
+        verbose_name_plural = "Shop Customers"
+        constraints = [
+            models.UniqueConstraint(fields=['tailor', 'customer'], name='unique_shop_customer'),
+        ]
+        indexes = [
+            models.Index(fields=['tailor', '-last_order_date', '-id'], name='shop_customer_recent_idx'),
+            models.Index(fields=['tailor', 'search_phone'], name='shop_customer_phone_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.customer_id} @ shop {self.tailor_id}"
+
+    @classmethod
+    def _create_or_update(cls, tailor_id, customer, **updates):
+        """Apply ``updates`` to the (tailor, customer) row, creating it first if needed."""
+        rows = cls.objects.filter(tailor_id=tailor_id, customer_id=customer.pk)
+        if updates and rows.update(**updates):
+            return
+        if not updates and rows.exists():
+            return
+        search_name, search_phone = customer_search_keys(customer)
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    tailor_id=tailor_id,
+                    customer=customer,
+                    search_name=search_name,
+                    search_phone=search_phone,
+                )
+        except IntegrityError:
+            # Created concurrently; fall through to the update.
+            pass
+        if updates:
+            rows.update(**updates)
+
+    @classmethod
+    def record_order(cls, order):
+        """Count a newly created order towards its shop's directory row."""
+        if not order.tailor_id or not order.customer_id:
+            return
+        cls._create_or_update(
+            order.tailor_id,
+            order.customer,
+            total_orders=F('total_orders') + 1,
+            last_order_date=Greatest(
+                Coalesce(F('last_order_date'), models.Value(order.created_at)),
+                models.Value(order.created_at),
+            ),
+        )
+
+    @classmethod
+    def record_pos_customer(cls, tailor_id, customer):
+        """Make sure a customer created (or tagged) by a shop's POS is listed there."""
+        cls._create_or_update(tailor_id, customer)
+
+    @classmethod
+    def refresh_search_keys(cls, user):
+        search_name, search_phone = customer_search_keys(user)
+        cls.objects.filter(customer=user).exclude(
+            search_name=search_name, search_phone=search_phone,
+        ).update(search_name=search_name, search_phone=search_phone)
+
+    @classmethod
+    def rebuild(cls, tailor_ids=None):
+        """
+        Recompute directory rows from orders and POS-created profiles.
+        Returns the number of rows written.
+        """
+        from django.contrib.auth import get_user_model
+        from apps.customers.models import CustomerProfile
+        from apps.orders.models import Order
+
+        orders = Order.objects.filter(tailor__isnull=False)
+        profiles = CustomerProfile.objects.filter(pos_created_by__isnull=False)
+        existing = cls.objects.all()
+        if tailor_ids is not None:
+            orders = orders.filter(tailor_id__in=tailor_ids)
+            profiles = profiles.filter(pos_created_by_id__in=tailor_ids)
+            existing = existing.filter(tailor_id__in=tailor_ids)
+
+        stats = {
+            (row['tailor_id'], row['customer_id']): (row['total'], row['last'])
+            for row in orders.values('tailor_id', 'customer_id').annotate(
+                total=Count('id'), last=Max('created_at'),
+            )
+        }
+        for tailor_id, customer_id in profiles.values_list('pos_created_by_id', 'user_id'):
+            stats.setdefault((tailor_id, customer_id), (0, None))
+
+        users = get_user_model().objects.in_bulk({customer_id for _, customer_id in stats})
+        rows = []
+        for (tailor_id, customer_id), (total, last) in stats.items():
+            user = users.get(customer_id)
+            if user is None:
+                continue
+            search_name, search_phone = customer_search_keys(user)
+            rows.append(cls(
+                tailor_id=tailor_id,
+                customer_id=customer_id,
+                total_orders=total,
+                last_order_date=last,
+                search_name=search_name,
+                search_phone=search_phone,
+            ))
+
+        with transaction.atomic():
+            stale = [
+                pk for pk, tailor_id, customer_id
+                in existing.values_list('pk', 'tailor_id', 'customer_id')
+                if (tailor_id, customer_id) not in stats
+            ]
+            if stale:
+                cls.objects.filter(pk__in=stale).delete()
+            cls.objects.bulk_create(
+                rows,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['tailor', 'customer'],
+                update_fields=['total_orders', 'last_order_date', 'search_name', 'search_phone'],
+            )
+        return len(rows)
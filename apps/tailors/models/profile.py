@@ -4,6 +4,19 @@ from django.conf import settings
 from django.core.validators import FileExtensionValidator
 from decimal import Decimal
 
+from apps.core.models import refresh_maintained_fields
+
+# Maintained with single-row UPDATEs by services/rating_aggregates.py.
+RATING_AGGREGATE_FIELDS = {
+    'rating_count',
+    'stitching_quality_total',
+    'on_time_delivery_total',
+    'overall_satisfaction_total',
+    'avg_stitching_quality',
+    'avg_on_time_delivery',
+    'avg_overall_satisfaction',
+}
+
 class TailorProfile(models.Model):
     """Model representing a tailor's profile information."""
     
@@ -82,6 +95,19 @@ class TailorProfile(models.Model):
         default=0,
         help_text="Total number of ratings received"
     )
+    # Running sums behind the averages (see services/rating_aggregates.py)
+    stitching_quality_total = models.PositiveIntegerField(
+        default=0,
+        help_text="Sum of stitching quality ratings"
+    )
+    on_time_delivery_total = models.PositiveIntegerField(
+        default=0,
+        help_text="Sum of on-time delivery ratings"
+    )
+    overall_satisfaction_total = models.PositiveIntegerField(
+        default=0,
+        help_text="Sum of overall satisfaction ratings"
+    )
     shop_image = models.ImageField(
         upload_to='tailor_profiles/shop_images/',
         null=True,
@@ -142,3 +168,9 @@ class TailorProfile(models.Model):
     
     def __str__(self):
         return f"{self.shop_name or self.user.get_full_name() or self.user.username}"
+
+    def save(self, *args, **kwargs):
+        """Full saves write back the stored rating aggregates, not the in-memory ones."""
+        if kwargs.get('update_fields') is None:
+            refresh_maintained_fields(self, RATING_AGGREGATE_FIELDS)
+        super().save(*args, **kwargs)
@@ -6,6 +6,7 @@ from ..models import (
 )
 from ..models.base import SEASON_CHOICES
 from .base import ImageWithMetadataSerializer
+from apps.core.image_variants import image_variant_url
 from apps.core.media_utils import build_public_media_url
 
 # Fabric Type Serializers
@@ -66,10 +67,12 @@ class FabricTagBasicSerializer(serializers.ModelSerializer):
 # Fabric Image Serializers
 class FabricImageSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    detail_url = serializers.SerializerMethodField()
 
     class Meta:
         model = FabricImage
-        fields = ["id", "image", "order", "is_primary"]
+        fields = ["id", "image", "thumbnail_url", "detail_url", "order", "is_primary"]
 
     def get_image(self, obj) -> str | None:
         request = self.context.get("request", None)
@@ -77,6 +80,16 @@ class FabricImageSerializer(serializers.ModelSerializer):
             return build_public_media_url(request, obj.image.url)
         return None
 
+    def get_thumbnail_url(self, obj) -> str | None:
+        if obj.image:
+            return image_variant_url(self.context.get("request", None), obj.image, "list")
+        return None
+
+    def get_detail_url(self, obj) -> str | None:
+        if obj.image:
+            return image_variant_url(self.context.get("request", None), obj.image, "detail")
+        return None
+
 # Fabric Serializers
 class FabricSerializer(serializers.ModelSerializer):
     gallery = FabricImageSerializer(many=True, read_only=True)
@@ -23,6 +23,12 @@ class TailorOrderSummarySerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         
+    def to_representation(self, instance):
+        # Rows from a cached dashboard snapshot are already summarized.
+        if isinstance(instance, dict):
+            return instance
+        return super().to_representation(instance)
+
     def get_customer_name(self, obj):
         if not obj.customer:
             return 'Unknown'
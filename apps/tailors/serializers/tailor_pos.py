@@ -22,7 +22,7 @@ class POSCustomerOrderStyleGroupSerializer(serializers.Serializer):
 class TailorCustomerSerializer(serializers.Serializer):
     """
     Serializes customer info for the tailor's POS customer list.
-    Built from Order queryset aggregation, not a ModelSerializer.
+    Built from ShopCustomer directory rows, not a ModelSerializer.
     """
     id = serializers.IntegerField()
     name = serializers.CharField()
@@ -31,7 +31,7 @@ class TailorCustomerSerializer(serializers.Serializer):
     total_orders = serializers.IntegerField()
     last_order_date = serializers.DateTimeField(allow_null=True)
     measurements = serializers.JSONField(allow_null=True)
-    order_styles = POSCustomerOrderStyleGroupSerializer(many=True)
+    order_styles = POSCustomerOrderStyleGroupSerializer(many=True, required=False)
     style_presets = serializers.ListField(child=serializers.DictField(), required=False)
 
 
@@ -1,21 +1,70 @@
+import uuid
 from decimal import Decimal
-from django.db.models import Count, Sum, Q, Exists, OuterRef
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Sum, Q
 from django.utils import timezone
-from apps.orders.models import Order, OrderItem
+from apps.orders.models import Order
+
+# Dashboard snapshots are cached per shop for a short time and dropped on any
+# write to that shop's orders by moving the shop's version token (see
+# bump_dashboard_version). The TTL bounds staleness from writes that bypass
+# model signals (queryset.update) and from time passing (overdue/due today).
+DASHBOARD_CACHE_TTL = 30
+DASHBOARD_VERSION_TTL = 60 * 60 * 24
+
+
+def _dashboard_version_key(tailor_id):
+    return f'tailors:dashboard_version:{tailor_id}'
+
+
+def bump_dashboard_version(tailor_id):
+    """Invalidate a shop's cached dashboard, now and again after commit."""
+    if not tailor_id:
+        return
+    key = _dashboard_version_key(tailor_id)
+
+    def bump():
+        cache.set(key, uuid.uuid4().hex, DASHBOARD_VERSION_TTL)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def _dashboard_version(tailor_id):
+    key = _dashboard_version_key(tailor_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, DASHBOARD_VERSION_TTL)
+        version = cache.get(key)
+    return version
+
 
 class TailorHomeService:
     """
     Service to provide action-oriented aggregated data for the Tailor Dashboard Home.
     Separates Delivery Orders and Shop Orders into distinct action-based sections.
     """
-    
+
     @staticmethod
-    def get_dashboard_data(tailor_user, language='ar'):
+    def get_dashboard_snapshot(tailor_user):
         """
-        Get action-oriented dashboard data for a tailor.
+        Language-independent dashboard numbers and order rows for a shop,
+        served from the per-shop cache when current.
         """
-        from zthob.translations import translate_message
-        
+        today = timezone.now().date()
+        key = f'tailors:dashboard:{tailor_user.pk}:{_dashboard_version(tailor_user.pk)}:{today.isoformat()}'
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = TailorHomeService.build_dashboard_snapshot(tailor_user)
+            cache.set(key, snapshot, DASHBOARD_CACHE_TTL)
+        return snapshot
+
+    @staticmethod
+    def build_dashboard_snapshot(tailor_user):
+        """Run the dashboard aggregate and list queries (uncached)."""
+        from apps.tailors.serializers.home import TailorOrderSummarySerializer
+
         now = timezone.now()
         today = now.date()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -29,18 +78,9 @@ class TailorHomeService:
         not_final_filter = ~Q(status__in=['delivered', 'collected', 'cancelled'])
         not_ready_filter = ~Q(status__in=['ready_for_delivery', 'ready_for_pickup', 'delivered', 'collected', 'cancelled'])
         
-        # Mark orders that need measurements
-        # (Where at least one item has empty or null measurements)
-        missing_measurements_subquery = OrderItem.objects.filter(
-            order=OuterRef('pk')
-        ).filter(
-            Q(measurements={}) | Q(measurements__isnull=True)
-        )
-        
         # Aggregate all stats in a single query
-        stats = Order.objects.filter(active_filter).annotate(
-            has_missing_measurements=Exists(missing_measurements_subquery)
-        ).aggregate(
+        # (needs_measurements: at least one item has empty or null measurements)
+        stats = Order.objects.filter(active_filter).aggregate(
             # Financials
             rev_today=Sum('total_amount', filter=Q(status__in=['delivered', 'collected'], updated_at__gte=today_start)),
             rev_week=Sum('total_amount', filter=Q(status__in=['delivered', 'collected'], updated_at__gte=week_start)),
@@ -58,11 +98,11 @@ class TailorHomeService:
             
             # --- SHOP ORDERS ACTION BUCKETS ---
             shop_new=Count('id', filter=Q(service_mode='walk_in', tailor_status='none') & not_ready_filter),
-            shop_measure=Count('id', filter=Q(service_mode='walk_in', tailor_status='accepted') & (Q(order_type='measurement_service') | Q(has_missing_measurements=True)) & not_ready_filter, distinct=True),
+            shop_measure=Count('id', filter=Q(service_mode='walk_in', tailor_status='accepted') & (Q(order_type='measurement_service') | Q(needs_measurements=True)) & not_ready_filter),
             shop_stitch=Count('id', filter=(
                 Q(service_mode='walk_in', tailor_status__in=['in_progress', 'stitching_started', 'stitched']) |
-                Q(service_mode='walk_in', tailor_status='accepted', order_type__in=['fabric_with_stitching', 'stitching_only'], has_missing_measurements=False)
-            ) & not_ready_filter, distinct=True),
+                Q(service_mode='walk_in', tailor_status='accepted', order_type__in=['fabric_with_stitching', 'stitching_only'], needs_measurements=False)
+            ) & not_ready_filter),
             shop_ready=Count('id', filter=Q(service_mode='walk_in', status='ready_for_pickup')),
             
             # Express count
@@ -72,12 +112,31 @@ class TailorHomeService:
         # Recent & Express lists
         express_list = Order.objects.filter(active_filter & Q(is_express=True) & not_final_filter).select_related('customer').order_by('-created_at')[:5]
         recent_orders = Order.objects.filter(active_filter).select_related('customer').order_by('-updated_at')[:10]
-        
+
+        stats['rev_today'] = str(stats['rev_today'] or Decimal('0.00'))
+        stats['rev_week'] = str(stats['rev_week'] or Decimal('0.00'))
+        return {
+            'stats': stats,
+            'express_items': [dict(row) for row in TailorOrderSummarySerializer(express_list, many=True).data],
+            'recent_orders': [dict(row) for row in TailorOrderSummarySerializer(recent_orders, many=True).data],
+        }
+
+    @staticmethod
+    def get_dashboard_data(tailor_user, language='ar'):
+        """
+        Get action-oriented dashboard data for a tailor.
+        Numbers come from the cached snapshot; labels are translated per request.
+        """
+        from zthob.translations import translate_message
+
+        snapshot = TailorHomeService.get_dashboard_snapshot(tailor_user)
+        stats = snapshot['stats']
+
         return {
             'financials': {
-                'today_revenue': str(stats['rev_today'] or Decimal('0.00')),
+                'today_revenue': stats['rev_today'],
                 'today_label': translate_message("Today's Revenue", language),
-                'weekly_revenue': str(stats['rev_week'] or Decimal('0.00')),
+                'weekly_revenue': stats['rev_week'],
                 'weekly_label': translate_message("Weekly Revenue", language),
             },
             'urgent_alerts': [
@@ -166,7 +225,7 @@ class TailorHomeService:
             'express_orders': {
                 'total_count': stats['exp_total'],
                 'filter_params': {'status': 'express'},
-                'items': express_list
+                'items': snapshot['express_items']
             },
-            'recent_orders': recent_orders
+            'recent_orders': snapshot['recent_orders']
         }
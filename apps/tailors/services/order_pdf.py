@@ -9,6 +9,7 @@ import os
 import re
 import unicodedata
 from decimal import Decimal
+from functools import lru_cache
 from urllib.parse import urlparse
 from xml.sax.saxutils import escape
 from reportlab.lib.pagesizes import A4
@@ -20,6 +21,7 @@ from reportlab.platypus import (
     KeepTogether,
 )
 from reportlab.platypus.doctemplate import BaseDocTemplate, PageTemplate, Frame, NextPageTemplate
+from reportlab.platypus.flowables import PageBreak
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
@@ -28,6 +30,7 @@ from django.utils import timezone
 from django.conf import settings
 import logging
 
+from apps.core.image_variants import image_variant_path
 from zthob.languages import is_rtl_language
 from .pdf_labels_ur import PDF_LABELS_UR
 
@@ -64,6 +67,9 @@ _COORD_ONLY_RE = re.compile(
     r'^\s*-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?\s*$'
 )
 
+# Shaped strings are reused across renders (labels, statuses, recurring names).
+SHAPED_TEXT_CACHE_SIZE = 4096
+
 _reshaper_config = None
 
 
@@ -160,6 +166,11 @@ def _shape_arabic(text):
     """
     if not text:
         return text
+    return _shape_arabic_cached(str(text))
+
+
+@lru_cache(maxsize=SHAPED_TEXT_CACHE_SIZE)
+def _shape_arabic_cached(text):
     logical = _normalize_rtl_text(text)
     if not logical:
         return logical
@@ -459,7 +470,16 @@ def _pdf_page_width():
 
 
 def _styles(lang='en'):
-    """Return a dict of named ParagraphStyles, RTL-aware for Arabic/Urdu."""
+    """
+    Return a dict of named ParagraphStyles, RTL-aware for Arabic/Urdu.
+
+    Built once per language per process; callers must not mutate the styles.
+    """
+    return _build_styles(lang)
+
+
+@lru_cache(maxsize=8)
+def _build_styles(lang):
     base = getSampleStyleSheet()
     is_rtl = _is_rtl(lang) and _ARABIC_FONT_AVAILABLE
 
@@ -833,7 +853,7 @@ def _custom_style_reference_images_row(ref_paths, inner_width, s, lang='en'):
     col_width = thumb_size + 3 * mm
     for ref_path in ref_paths:
         try:
-            images.append(Image(ref_path, width=thumb_size, height=thumb_size, kind='proportional'))
+            images.append(Image(image_variant_path(ref_path), width=thumb_size, height=thumb_size, kind='proportional'))
         except Exception as exc:
             logger.debug("Unable to add style reference image to PDF card: %s", exc)
 
@@ -864,7 +884,7 @@ def _custom_style_card(style, cell_width, s, lang='en'):
 
     if image_path:
         try:
-            img = Image(image_path, width=PDF_STYLE_THUMB_SIZE, height=PDF_STYLE_THUMB_SIZE, kind='proportional')
+            img = Image(image_variant_path(image_path), width=PDF_STYLE_THUMB_SIZE, height=PDF_STYLE_THUMB_SIZE, kind='proportional')
             rows.append([img])
         except Exception as exc:
             logger.debug("Unable to add custom style image to PDF card: %s", exc)
@@ -1686,7 +1706,7 @@ def _customer_fabric_images_table(item, page_w, s, lang):
     col_width = thumb_size + 4 * mm
     for path in paths:
         try:
-            images.append(Image(path, width=thumb_size, height=thumb_size, kind='proportional'))
+            images.append(Image(image_variant_path(path), width=thumb_size, height=thumb_size, kind='proportional'))
         except Exception as exc:
             logger.debug("Unable to add customer fabric image to PDF: %s", exc)
 
@@ -2307,6 +2327,11 @@ def _canvas_prepare_text(text, lang):
     """Shape mixed RTL/LTR strings for raw canvas drawing."""
     if text is None:
         return ''
+    return _canvas_prepare_text_cached(str(text), lang)
+
+
+@lru_cache(maxsize=SHAPED_TEXT_CACHE_SIZE)
+def _canvas_prepare_text_cached(text, lang):
     logical = _normalize_rtl_text(text)
     if not logical:
         return ''
@@ -2342,6 +2367,21 @@ def _canvas_prepare_text(text, lang):
         return ''.join(parts)
 
 
+def warm_render_caches(langs=('en', 'ar', 'ur')):
+    """Build stylesheets and load the shaping libraries before the first render."""
+    _get_reshaper_config()
+    for lang in langs:
+        _styles(lang)
+        _brand_title(lang)
+
+
+def clear_render_caches():
+    """Drop memoized stylesheets and shaped text (benchmarks and tests)."""
+    _build_styles.cache_clear()
+    _shape_arabic_cached.cache_clear()
+    _canvas_prepare_text_cached.cache_clear()
+
+
 def _canvas_fonts(lang):
     regular = _AR_FONT_REGULAR if (_is_rtl(lang) and _ARABIC_FONT_AVAILABLE) else 'Helvetica'
     bold = _AR_FONT_BOLD if (_is_rtl(lang) and _ARABIC_FONT_AVAILABLE) else 'Helvetica-Bold'
@@ -2362,6 +2402,11 @@ class _OrderPDFPageContext:
     def __init__(self, order, lang):
         self.order = order
         self.lang = lang
+        # Absolute page the order starts on; page labels restart per order in batch PDFs.
+        self.start_page = 1
+
+    def page_number(self, canvas):
+        return canvas.getPageNumber() - self.start_page + 1
 
 
 def _canvas_page_label(lang, page_num):
@@ -2423,14 +2468,15 @@ def _canvas_draw_top_band(canvas, order, lang, *, include_riders):
 
 def _make_pdf_page_callbacks(ctx):
     def _draw_first_page(canvas, doc):
+        ctx.start_page = canvas.getPageNumber()
         canvas.saveState()
-        _canvas_draw_page_number(canvas, canvas.getPageNumber(), ctx.lang)
+        _canvas_draw_page_number(canvas, ctx.page_number(canvas), ctx.lang)
         _canvas_draw_top_band(canvas, ctx.order, ctx.lang, include_riders=False)
         canvas.restoreState()
 
     def _draw_later_page(canvas, doc):
         canvas.saveState()
-        _canvas_draw_page_number(canvas, canvas.getPageNumber(), ctx.lang)
+        _canvas_draw_page_number(canvas, ctx.page_number(canvas), ctx.lang)
         _canvas_draw_top_band(canvas, ctx.order, ctx.lang, include_riders=True)
         canvas.restoreState()
 
@@ -2477,28 +2523,19 @@ def _build_order_pdf_doc(buffer):
     return doc, first_frame, later_frame
 
 
-def generate_order_pdf_reportlab(order, lang='en') -> bytes:
-    """Legacy ReportLab renderer for the complete order PDF."""
-    buffer = io.BytesIO()
-    page_ctx = _OrderPDFPageContext(order, lang)
-    draw_first_page, draw_later_page = _make_pdf_page_callbacks(page_ctx)
-    doc, first_frame, later_frame = _build_order_pdf_doc(buffer)
-    doc.addPageTemplates([
-        PageTemplate(id='First', frames=[first_frame], onPage=draw_first_page),
-        PageTemplate(id='Later', frames=[later_frame], onPage=draw_later_page),
-    ])
-    doc.title = f'Order {order.order_number}'
-
-    s = _styles(lang)
-    page_w = _pdf_page_width()
-    measurement_fields = _measurement_field_map()
-    items = list(
+def _order_items_for_pdf(order):
+    return list(
         order.order_items.select_related('fabric', 'family_member')
         .prefetch_related('customer_fabric_images')
         .all()
     )
 
-    story = [NextPageTemplate('Later')]
+
+def _build_order_story(order, page_w, s, lang, measurement_fields):
+    """Flowables for one complete order, after its page templates are selected."""
+    items = _order_items_for_pdf(order)
+
+    story = []
     story.extend(_build_header_section(order, page_w, s, lang))
     story.extend(_build_customer_section(order, page_w, s, lang))
     story.append(Spacer(1, PDF_SECTION_SPACER))
@@ -2518,6 +2555,50 @@ def generate_order_pdf_reportlab(order, lang='en') -> bytes:
         story.extend(history)
     story.append(Spacer(1, PDF_SECTION_SPACER))
     story.extend(_build_comments_and_footer(order, page_w, s, lang))
+    return story
+
+
+def generate_order_pdf_reportlab(order, lang='en') -> bytes:
+    """Legacy ReportLab renderer for the complete order PDF."""
+    return generate_orders_pdf_reportlab([order], lang=lang)
+
+
+def generate_orders_pdf_reportlab(orders, lang='en', *, measurement_fields=None) -> bytes:
+    """
+    Render one or more orders into a single PDF.
+
+    Styles, page geometry and the measurement field map are resolved once and
+    shared by every order. Each order starts on a new page with its own header
+    band and page numbering.
+    """
+    orders = list(orders)
+    buffer = io.BytesIO()
+    doc, first_frame, later_frame = _build_order_pdf_doc(buffer)
+
+    s = _styles(lang)
+    page_w = _pdf_page_width()
+    if measurement_fields is None:
+        measurement_fields = _measurement_field_map()
+
+    templates = []
+    story = []
+    for index, order in enumerate(orders):
+        draw_first_page, draw_later_page = _make_pdf_page_callbacks(_OrderPDFPageContext(order, lang))
+        first_id, later_id = ('First', 'Later') if index == 0 else (f'First_{index}', f'Later_{index}')
+        templates.extend([
+            PageTemplate(id=first_id, frames=[first_frame], onPage=draw_first_page),
+            PageTemplate(id=later_id, frames=[later_frame], onPage=draw_later_page),
+        ])
+        if index:
+            story.extend([NextPageTemplate(first_id), PageBreak()])
+        story.append(NextPageTemplate(later_id))
+        story.extend(_build_order_story(order, page_w, s, lang, measurement_fields))
+
+    doc.addPageTemplates(templates)
+    if len(orders) == 1:
+        doc.title = f'Order {orders[0].order_number}'
+    else:
+        doc.title = f'Orders ({len(orders)})'
 
     doc.build(story)
     pdf_bytes = buffer.getvalue()
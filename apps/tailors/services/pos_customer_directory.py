@@ -0,0 +1,99 @@
+"""Reads over the per-shop POS customer directory (ShopCustomer)."""
+
+from django.db import connection
+from django.db.models import F
+
+from apps.core.search import (
+    is_phone_term,
+    normalize_search_text,
+    phone_search_digits,
+    ranked_match,
+    similarity_rank,
+)
+from apps.customers.models import CustomerProfile
+from apps.tailors.models import ShopCustomer
+from apps.tailors.services.pos_customer_styles import get_customer_order_styles, get_customer_style_presets
+
+
+def shop_customer_queryset(owner_user):
+    """Directory rows of a shop: most recent order first, zero-order customers last."""
+    return (
+        ShopCustomer.objects.filter(tailor=owner_user)
+        .select_related('customer', 'customer__customer_profile')
+        .order_by(F('last_order_date').desc(nulls_last=True), '-id')
+    )
+
+
+def _search_key(term):
+    """Directory column and normalized key a typed term is matched against."""
+    if is_phone_term(term):
+        return 'search_phone', phone_search_digits(term)
+    return 'search_name', term
+
+
+def _ranked(queryset, term):
+    field, key = _search_key(term)
+    if not key:
+        return queryset.none(), field, key
+    condition, rank = ranked_match(field, key)
+    return queryset.filter(condition).annotate(search_rank=rank), field, key
+
+
+def ranked_shop_customers(owner_user, term):
+    """
+    Directory rows of a shop matching ``term`` (name fragment or phone digits),
+    annotated with ``search_rank``; unordered so it can be used as a subquery.
+    """
+    rows, _, _ = _ranked(ShopCustomer.objects.filter(tailor=owner_user), normalize_search_text(term))
+    return rows
+
+
+def search_shop_customers(queryset, term):
+    """Narrow directory rows to ``term``, best matches first, then most recent."""
+    term = normalize_search_text(term)
+    if not term:
+        return queryset
+
+    rows, field, key = _ranked(queryset, term)
+    return rows.annotate(
+        search_similarity=similarity_rank(connection, field, key),
+    ).order_by(
+        'search_rank',
+        F('search_similarity').desc(),
+        F('last_order_date').desc(nulls_last=True),
+        '-id',
+    )
+
+
+def build_customer_entries(entries, owner_user, request=None, with_styles=True):
+    """
+    Turn directory rows into TailorCustomerSerializer payloads.
+    Style history and presets are loaded for these customers only, and only
+    when asked for; the POS can fetch them per customer later.
+    """
+    customer_ids = [entry.customer_id for entry in entries]
+    if with_styles:
+        styles_map = get_customer_order_styles(owner_user, customer_ids, request)
+        presets_map = get_customer_style_presets(customer_ids, request)
+
+    results = []
+    for entry in entries:
+        user = entry.customer
+        try:
+            measurements = user.customer_profile.measurements
+        except CustomerProfile.DoesNotExist:
+            measurements = None
+        data = {
+            'id': user.id,
+            'name': user.get_full_name() or user.username,
+            'phone': user.phone or '',
+            'email': user.email,
+            'total_orders': entry.total_orders,
+            'last_order_date': entry.last_order_date,
+            'measurements': measurements,
+        }
+        if with_styles:
+            data['order_styles'] = styles_map.get(user.id, [])
+            data['style_presets'] = presets_map.get(user.id, [])
+        results.append(data)
+    return results
@@ -0,0 +1,125 @@
+"""
+Tailor rating aggregates kept as running sums on TailorProfile.
+
+Each rating create, edit or delete is a single UPDATE that adds the score
+delta to the sums and count and recomputes the averages from them, so the
+cost does not grow with the number of ratings and concurrent writers cannot
+lose each other's updates. ``reconcile_rating_aggregates`` recomputes
+everything from TailorRating (manage.py reconcile_tailor_ratings).
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, F, FloatField, Sum, Value, When
+from django.db.models.functions import Cast, Greatest
+
+from apps.tailors.models import TailorProfile, TailorRating
+
+# (TailorRating score field, TailorProfile sum field, TailorProfile average field)
+RATING_SCORES = (
+    ('stitching_quality', 'stitching_quality_total', 'avg_stitching_quality'),
+    ('on_time_delivery', 'on_time_delivery_total', 'avg_on_time_delivery'),
+    ('overall_satisfaction', 'overall_satisfaction_total', 'avg_overall_satisfaction'),
+)
+
+_AVERAGE = DecimalField(max_digits=3, decimal_places=2)
+
+
+def rating_scores(rating):
+    return {score: getattr(rating, score) for score, _, _ in RATING_SCORES}
+
+
+def apply_rating_delta(tailor_id, scores, count):
+    """
+    Add ``scores`` (score field -> delta) and ``count`` to a tailor's sums in
+    one UPDATE. SET expressions see the row's old values, so each average is
+    computed from the old sum plus the delta. Sums and count never go below
+    zero, even when they have drifted from TailorRating.
+    """
+    new_count = Greatest(F('rating_count') + count, 0)
+    updates = {'rating_count': new_count}
+    for score, total_field, avg_field in RATING_SCORES:
+        new_total = Greatest(F(total_field) + scores[score], 0)
+        updates[total_field] = new_total
+        updates[avg_field] = Case(
+            When(rating_count__lte=-count, then=Value(Decimal('0.00'))),
+            default=Cast(Cast(new_total, FloatField()) / new_count, _AVERAGE),
+            output_field=_AVERAGE,
+        )
+    TailorProfile.objects.filter(pk=tailor_id).update(**updates)
+
+
+def record_rating(rating, sign=1):
+    """Count a new rating (sign=1) or uncount a deleted one (sign=-1)."""
+    scores = {score: sign * value for score, value in rating_scores(rating).items()}
+    apply_rating_delta(rating.tailor_id, scores, sign)
+
+
+def record_rating_change(previous_tailor_id, previous_scores, rating):
+    """Apply an edited rating: move it between tailors or add the score differences."""
+    if previous_tailor_id != rating.tailor_id:
+        apply_rating_delta(previous_tailor_id, {k: -v for k, v in previous_scores.items()}, -1)
+        record_rating(rating)
+        return
+    scores = {score: value - previous_scores[score] for score, value in rating_scores(rating).items()}
+    if any(scores.values()):
+        apply_rating_delta(rating.tailor_id, scores, 0)
+
+
+def _averages(totals, count):
+    return {
+        avg_field: (
+            (Decimal(totals[total_field]) / count).quantize(Decimal('0.01'), ROUND_HALF_UP) if count else Decimal('0.00')
+        )
+        for _, total_field, avg_field in RATING_SCORES
+    }
+
+
+def reconcile_rating_aggregates(tailor_ids=None, batch_size=500):
+    """
+    Recompute sums, counts and averages from TailorRating, ``batch_size``
+    tailors at a time. Returns the number of profiles that were corrected.
+    """
+    fields = ['rating_count']
+    for _, total_field, avg_field in RATING_SCORES:
+        fields += [total_field, avg_field]
+
+    profiles = TailorProfile.objects.order_by('pk')
+    if tailor_ids is not None:
+        profiles = profiles.filter(pk__in=tailor_ids)
+
+    corrected = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            # Lock the batch so incremental updates wait for the recount.
+            batch = list(
+                profiles.filter(pk__gt=last_pk).select_for_update().only('pk', *fields)[:batch_size]
+            )
+            if not batch:
+                return corrected
+            last_pk = batch[-1].pk
+
+            stats = {
+                row['tailor_id']: row
+                for row in TailorRating.objects.filter(tailor_id__in=[p.pk for p in batch])
+                .order_by()
+                .values('tailor_id')
+                .annotate(
+                    count=Count('id'),
+                    **{total_field: Sum(score) for score, total_field, _ in RATING_SCORES},
+                )
+            }
+            changed = []
+            for profile in batch:
+                row = stats.get(profile.pk, {})
+                count = row.get('count', 0)
+                totals = {total_field: row.get(total_field) or 0 for _, total_field, _ in RATING_SCORES}
+                expected = {'rating_count': count, **totals, **_averages(totals, count)}
+                if any(getattr(profile, field) != value for field, value in expected.items()):
+                    for field, value in expected.items():
+                        setattr(profile, field, value)
+                    changed.append(profile)
+            if changed:
+                TailorProfile.objects.bulk_update(changed, fields)
+            corrected += len(changed)
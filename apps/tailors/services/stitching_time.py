@@ -1,4 +1,5 @@
-from django.db.models import Prefetch
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 from apps.orders.models import Order, OrderStatusHistory
 
@@ -23,43 +24,33 @@ def get_average_stitching_time_stats(tailor_user):
             'completed_stitching_orders_count': 0,
         }
 
-    ready_history = OrderStatusHistory.objects.filter(
-        status__in=READY_STATUSES
-    ).order_by('created_at')
-
-    orders = (
+    # One indexed lookup per order (order, status, created_at), averaged in SQL.
+    first_ready_at = (
+        OrderStatusHistory.objects.filter(order=OuterRef('pk'), status__in=READY_STATUSES)
+        .order_by('created_at')
+        .values('created_at')[:1]
+    )
+    stats = (
         Order.objects.filter(
             tailor=tailor_user,
             order_type__in=STITCHING_ORDER_TYPES,
             status__in=COMPLETED_STATUSES,
         )
-        .prefetch_related(
-            Prefetch(
-                'status_history',
-                queryset=ready_history,
-                to_attr='ready_status_history',
-            )
+        .annotate(finished_at=Coalesce(Subquery(first_ready_at), F('updated_at')))
+        .filter(finished_at__gte=F('created_at'))
+        .aggregate(
+            average_duration=Avg(
+                ExpressionWrapper(F('finished_at') - F('created_at'), output_field=DurationField())
+            ),
+            completed_count=Count('pk'),
         )
     )
 
-    total_seconds = 0
-    completed_count = 0
-
-    for order in orders:
-        ready_entry = order.ready_status_history[0] if order.ready_status_history else None
-        finished_at = ready_entry.created_at if ready_entry else order.updated_at
-        duration_seconds = (finished_at - order.created_at).total_seconds()
-
-        if duration_seconds < 0:
-            continue
-
-        total_seconds += duration_seconds
-        completed_count += 1
-
-    if completed_count == 0:
+    completed_count = stats['completed_count']
+    if completed_count == 0 or stats['average_duration'] is None:
         average_days = None
     else:
-        average_days = round(total_seconds / completed_count / SECONDS_PER_DAY, 1)
+        average_days = round(stats['average_duration'].total_seconds() / SECONDS_PER_DAY, 1)
 
     return {
         'average_stitching_time_days': average_days,
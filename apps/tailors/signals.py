@@ -1,8 +1,8 @@
+from django.db import transaction
 from django.dispatch import receiver
 from django.conf import settings
-from django.db.models.signals import post_save, post_delete
-from django.db.models import Avg, Count
-from apps.tailors.models import TailorProfile
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_save
+from apps.tailors.models import Fabric, TailorProfile
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -11,35 +11,152 @@ def create_tailor_profile(sender, instance, created, **kwargs):
         TailorProfile.objects.get_or_create(user=instance)
 
 
-def _update_tailor_rating_aggregates(tailor_profile):
-    """Recalculate and cache rating aggregates on TailorProfile."""
-    # Import here to avoid circular imports at module load time
+@receiver(pre_save, sender='tailors.TailorRating')
+def remember_previous_rating_scores(sender, instance, raw=False, **kwargs):
+    """Keep the stored scores of an edited rating so only the difference is applied."""
+    if raw or instance._state.adding or instance.pk is None:
+        return
     from apps.tailors.models.rating import TailorRating
-    agg = TailorRating.objects.filter(tailor=tailor_profile).aggregate(
-        avg_s=Avg('stitching_quality'),
-        avg_d=Avg('on_time_delivery'),
-        avg_o=Avg('overall_satisfaction'),
-        count=Count('id'),
+    from apps.tailors.services.rating_aggregates import RATING_SCORES
+    instance._previous_rating = (
+        TailorRating.objects.filter(pk=instance.pk)
+        .values('tailor_id', *(score for score, _, _ in RATING_SCORES))
+        .first()
     )
-    tailor_profile.avg_stitching_quality = agg['avg_s'] or 0
-    tailor_profile.avg_on_time_delivery = agg['avg_d'] or 0
-    tailor_profile.avg_overall_satisfaction = agg['avg_o'] or 0
-    tailor_profile.rating_count = agg['count'] or 0
-    tailor_profile.save(update_fields=[
-        'avg_stitching_quality',
-        'avg_on_time_delivery',
-        'avg_overall_satisfaction',
-        'rating_count',
-    ])
 
 
 @receiver(post_save, sender='tailors.TailorRating')
-def on_rating_saved(sender, instance, **kwargs):
-    """Update tailor aggregates when a rating is created or updated."""
-    _update_tailor_rating_aggregates(instance.tailor)
+def on_rating_saved(sender, instance, created, raw=False, **kwargs):
+    """Update tailor aggregates incrementally when a rating is created or edited."""
+    if raw:
+        return
+    from apps.tailors.services.rating_aggregates import record_rating, record_rating_change
+    previous = instance.__dict__.pop('_previous_rating', None)
+    if created:
+        record_rating(instance)
+    elif previous is not None:
+        previous_tailor_id = previous.pop('tailor_id')
+        record_rating_change(previous_tailor_id, previous, instance)
 
 
 @receiver(post_delete, sender='tailors.TailorRating')
 def on_rating_deleted(sender, instance, **kwargs):
-    """Update tailor aggregates when a rating is deleted."""
-    _update_tailor_rating_aggregates(instance.tailor)
\ No newline at end of file
+    """Uncount a deleted rating."""
+    from apps.tailors.services.rating_aggregates import record_rating
+    record_rating(instance, sign=-1)
+
+# ---------------------------------------------------------------------------
+# Tailor dashboard cache
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender='orders.Order')
+@receiver(post_delete, sender='orders.Order')
+def invalidate_tailor_dashboard(sender, instance, raw=False, **kwargs):
+    """Any write to a shop's orders moves that shop's dashboard cache version."""
+    if raw:
+        return
+    from apps.tailors.services.home_service import bump_dashboard_version
+    bump_dashboard_version(instance.tailor_id)
+
+
+@receiver(post_save, sender=TailorProfile)
+def start_tailor_dashboard_version(sender, instance, created, raw=False, **kwargs):
+    """A new shop never reads a dashboard cached under a reused user id."""
+    if created and not raw:
+        from apps.tailors.services.home_service import bump_dashboard_version
+        bump_dashboard_version(instance.user_id)
+
+# ---------------------------------------------------------------------------
+# POS customer directory (ShopCustomer)
+# ---------------------------------------------------------------------------
+
+SHOP_CUSTOMER_SEARCH_FIELDS = {'first_name', 'last_name', 'username', 'phone'}
+
+
+@receiver(post_save, sender='orders.Order')
+def add_order_to_shop_customer_directory(sender, instance, created, raw=False, **kwargs):
+    """Count new orders towards the shop's POS customer directory."""
+    if created and not raw:
+        from apps.tailors.models import ShopCustomer
+        ShopCustomer.record_order(instance)
+
+
+@receiver(post_save, sender='customers.CustomerProfile')
+def add_pos_customer_to_shop_customer_directory(sender, instance, raw=False, update_fields=None, **kwargs):
+    """List customers created (or tagged) by a shop's POS in that shop's directory."""
+    if raw or not instance.pos_created_by_id:
+        return
+    if update_fields is not None and 'pos_created_by' not in update_fields:
+        return
+    from apps.tailors.models import ShopCustomer
+    ShopCustomer.record_pos_customer(instance.pos_created_by_id, instance.user)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_shop_customer_search_keys(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Keep directory name/phone search keys in step with the customer's account."""
+    if created or raw:
+        return
+    if update_fields is not None and not SHOP_CUSTOMER_SEARCH_FIELDS.intersection(update_fields):
+        return
+    from apps.tailors.models import ShopCustomer
+    ShopCustomer.refresh_search_keys(instance)
+
+
+# ---------------------------------------------------------------------------
+# Fabric catalog search documents
+# ---------------------------------------------------------------------------
+
+@receiver(m2m_changed, sender=Fabric.tags.through)
+def refresh_fabric_search_document_on_tags(sender, instance, action, reverse, pk_set, raw=False, **kwargs):
+    """Tags are part of Fabric.search_document; rebuild it when they change."""
+    if reverse and action == 'pre_clear':
+        # tag.fabrics.clear() reports no pk_set; remember who is losing the tag.
+        instance._cleared_fabric_ids = list(instance.fabrics.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        if action == 'post_clear':
+            pk_set = instance.__dict__.pop('_cleared_fabric_ids', ())
+        fabrics = Fabric.objects.filter(pk__in=pk_set)
+    else:
+        fabrics = Fabric.objects.filter(pk=instance.pk)
+    Fabric.refresh_search_documents(fabrics)
+
+
+FABRIC_LOOKUP_SEARCH_FIELDS = {'name', 'name_ar', 'code'}
+
+
+def _lookup_search_fields(model, update_fields=None):
+    fields = {field.name for field in model._meta.concrete_fields} & FABRIC_LOOKUP_SEARCH_FIELDS
+    if update_fields is not None:
+        fields &= set(update_fields)
+    return sorted(fields)
+
+
+@receiver(pre_save, sender='tailors.FabricTag')
+@receiver(pre_save, sender='tailors.FabricCategory')
+@receiver(pre_save, sender='tailors.FabricType')
+@receiver(pre_save, sender='tailors.FabricCountry')
+def remember_fabric_lookup_search_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep the stored searchable values so an unchanged save rebuilds nothing."""
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = _lookup_search_fields(sender, update_fields)
+    if fields:
+        instance._previous_search_values = sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+
+
+@receiver(post_save, sender='tailors.FabricTag')
+@receiver(post_save, sender='tailors.FabricCategory')
+@receiver(post_save, sender='tailors.FabricType')
+@receiver(post_save, sender='tailors.FabricCountry')
+def refresh_fabric_search_documents_on_rename(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Renaming a tag, category, type or country changes the documents of its fabrics."""
+    previous = instance.__dict__.pop('_previous_search_values', None)
+    if created or raw or previous is None:
+        return
+    if all(getattr(instance, field) == value for field, value in previous.items()):
+        return
+    transaction.on_commit(lambda: Fabric.refresh_search_documents(instance.fabrics.all()))
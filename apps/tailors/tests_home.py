@@ -2,6 +2,8 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from apps.orders.models import Order
 from apps.tailors.models import TailorProfile
@@ -82,3 +84,33 @@ class TailorHomeAPITest(APITestCase):
         self.client.force_authenticate(user=self.customer_user)
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_dashboard_is_cached_per_shop_until_its_orders_change(self):
+        def del_new(response):
+            return next(b for b in response.data['data']['delivery_orders'] if b['key'] == 'del_new')
+
+        Order.objects.create(
+            customer=self.customer_user,
+            tailor=self.tailor_user,
+            service_mode='home_delivery',
+            tailor_status='none',
+            payment_status='paid'
+        )
+        self.assertEqual(del_new(self.client.get(self.url))['count'], 1)
+
+        # Warm cache: no order queries; labels still follow the request language.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='ar')
+        self.assertFalse([q['sql'] for q in queries if 'orders_order' in q['sql']])
+        self.assertEqual(del_new(response)['count'], 1)
+        self.assertEqual(del_new(response)['label'], 'طلبات جديدة')
+        self.assertEqual(len(response.data['data']['recent_orders']), 1)
+
+        Order.objects.create(
+            customer=self.customer_user,
+            tailor=self.tailor_user,
+            service_mode='home_delivery',
+            tailor_status='none',
+            payment_status='paid'
+        )
+        self.assertEqual(del_new(self.client.get(self.url))['count'], 2)
@@ -0,0 +1,164 @@
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.customers.models import CustomerProfile
+from apps.orders.models import Order
+from apps.tailors.models import ShopCustomer, TailorProfile
+
+User = get_user_model()
+
+
+@override_settings(
+    SECURE_SSL_REDIRECT=False,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class ShopCustomerDirectoryTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.tailor_user = User.objects.create_user(
+            username='directory_tailor',
+            phone='0500000201',
+            role='TAILOR',
+        )
+        TailorProfile.objects.get_or_create(user=self.tailor_user)
+        self.other_tailor_user = User.objects.create_user(
+            username='directory_other_tailor',
+            phone='0500000202',
+            role='TAILOR',
+        )
+        self.customer = User.objects.create_user(
+            username='directory_customer',
+            phone='0551234567',
+            role='USER',
+            first_name='Khalid',
+            last_name='Harbi',
+        )
+        self.client.force_authenticate(user=self.tailor_user)
+
+    def _order(self, tailor=None, customer=None):
+        return Order.objects.create(
+            customer=customer or self.customer,
+            tailor=tailor or self.tailor_user,
+            service_mode='walk_in',
+            payment_method='cod',
+            subtotal=Decimal('50.00'),
+            total_amount=Decimal('50.00'),
+        )
+
+    def _pos_customer(self, username, phone, first_name):
+        user = User.objects.create_user(
+            username=username, phone=phone, role='USER', first_name=first_name,
+        )
+        CustomerProfile.objects.create(user=user, pos_created_by=self.tailor_user)
+        return user
+
+    def test_orders_and_pos_profiles_maintain_rows(self):
+        self._order()
+        latest = self._order()
+        self._order(tailor=self.other_tailor_user)
+        pos_only = self._pos_customer('directory_pos_only', '0559999999', 'Saad')
+
+        entry = ShopCustomer.objects.get(tailor=self.tailor_user, customer=self.customer)
+        self.assertEqual(entry.total_orders, 2)
+        self.assertEqual(entry.last_order_date, latest.created_at)
+        self.assertEqual(entry.search_name, 'khalid harbi directory_customer')
+        self.assertEqual(entry.search_phone, '0551234567')
+        pos_entry = ShopCustomer.objects.get(tailor=self.tailor_user, customer=pos_only)
+        self.assertEqual((pos_entry.total_orders, pos_entry.last_order_date), (0, None))
+        self.assertEqual(ShopCustomer.objects.get(tailor=self.other_tailor_user).total_orders, 1)
+
+        self.customer.first_name = 'Khaled'
+        self.customer.save(update_fields=['first_name'])
+        entry.refresh_from_db()
+        self.assertEqual(entry.search_name, 'khaled harbi directory_customer')
+
+    def test_list_keeps_full_response_without_page_params(self):
+        self._pos_customer('directory_pos_only', '0559999999', 'Saad')
+        self._order()
+
+        response = self.client.get('/api/tailors/pos/customers/')
+
+        self.assertEqual(response.status_code, 200, response.data)
+        data = response.data['data']
+        self.assertEqual([item['id'] for item in data][0], self.customer.id)
+        self.assertEqual(data[0]['total_orders'], 1)
+        self.assertEqual(data[1]['total_orders'], 0)
+        self.assertIn('order_styles', data[0])
+
+    def test_paginated_search_skips_styles_until_expanded(self):
+        self._order()
+        for index in range(3):
+            self._pos_customer(f'directory_pos_{index}', f'056000000{index}', f'Saad{index}')
+
+        with patch('apps.tailors.services.pos_customer_directory.get_customer_order_styles') as mock_styles:
+            response = self.client.get('/api/tailors/pos/customers/', {'page': 1, 'page_size': 2})
+        mock_styles.assert_not_called()
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['data']['count'], 4)
+        self.assertEqual(len(response.data['data']['results']), 2)
+        self.assertNotIn('order_styles', response.data['data']['results'][0])
+
+        by_phone = self.client.get('/api/tailors/pos/customers/', {'page': 1, 'search': '+966 55 123'})
+        self.assertEqual([item['id'] for item in by_phone.data['data']['results']], [self.customer.id])
+
+        by_name = self.client.get(
+            '/api/tailors/pos/customers/', {'page': 1, 'search': 'HARBI', 'expand': 'styles'},
+        )
+        results = by_name.data['data']['results']
+        self.assertEqual([item['id'] for item in results], [self.customer.id])
+        self.assertEqual(results[0]['order_styles'], [])
+
+    def test_styles_endpoint_is_scoped_to_shop_customers(self):
+        self._order()
+        stranger = User.objects.create_user(username='directory_stranger', role='USER')
+
+        response = self.client.get(f'/api/tailors/pos/customers/{self.customer.id}/styles/')
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data['data']['order_styles'], [])
+        self.assertEqual(response.data['data']['style_presets'], [])
+
+        response = self.client.get(f'/api/tailors/pos/customers/{stranger.id}/styles/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_rebuild_command_recounts_rows(self):
+        order = self._order()
+        self._order()
+        Order.objects.filter(pk=order.pk).delete()
+        ShopCustomer.objects.create(tailor=self.tailor_user, customer=self.other_tailor_user)
+
+        out = StringIO()
+        call_command('rebuild_shop_customers', tailor=[self.tailor_user.id], stdout=out)
+
+        self.assertIn('Rebuilt 1 shop customer rows', out.getvalue())
+        self.assertEqual(
+            list(ShopCustomer.objects.filter(tailor=self.tailor_user).values_list('customer_id', 'total_orders')),
+            [(self.customer.id, 1)],
+        )
+
+    def test_typeahead_ranks_prefix_before_substring(self):
+        self._order()
+        arabic = self._pos_customer('directory_pos_ar', '0561111111', 'أحمد')
+        infix = self._pos_customer('directory_pos_infix', '0562222222', 'Mohamed')
+        prefix = self._pos_customer('directory_pos_prefix', '0563333333', 'Hamed')
+
+        response = self.client.get('/api/tailors/pos/customers/search/', {'q': 'hamed'})
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            [item['id'] for item in response.data['data']['results']],
+            [prefix.id, infix.id],
+        )
+
+        response = self.client.get('/api/tailors/pos/customers/search/', {'q': 'احمد'})
+        self.assertEqual([item['id'] for item in response.data['data']['results']], [arabic.id])
+
+        response = self.client.get('/api/tailors/pos/customers/search/', {'q': '٠٥٦٣'})
+        self.assertEqual([item['id'] for item in response.data['data']['results']], [prefix.id])
+
+        response = self.client.get('/api/tailors/pos/customers/search/', {'q': 'h'})
+        self.assertEqual(response.data['data']['count'], 0)
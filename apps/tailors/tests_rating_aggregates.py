@@ -0,0 +1,121 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.orders.models import Order
+from apps.tailors.models import TailorProfile, TailorRating
+
+User = get_user_model()
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TailorRatingAggregatesTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username='rating_customer', role='USER')
+        self.tailor_user = User.objects.create_user(username='rating_tailor', role='TAILOR')
+        self.profile, _ = TailorProfile.objects.get_or_create(user=self.tailor_user)
+
+    def _rate(self, stitching, delivery, overall):
+        order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor_user,
+            service_mode='walk_in',
+            payment_method='cod',
+            subtotal=Decimal('50.00'),
+            total_amount=Decimal('50.00'),
+        )
+        return TailorRating.objects.create(
+            order=order,
+            tailor=self.profile,
+            customer=self.customer,
+            stitching_quality=stitching,
+            on_time_delivery=delivery,
+            overall_satisfaction=overall,
+        )
+
+    def _aggregates(self):
+        self.profile.refresh_from_db()
+        return (
+            self.profile.rating_count,
+            self.profile.overall_satisfaction_total,
+            self.profile.avg_stitching_quality,
+            self.profile.avg_on_time_delivery,
+            self.profile.avg_overall_satisfaction,
+        )
+
+    def test_create_edit_and_delete_update_running_sums(self):
+        first = self._rate(5, 4, 5)
+        self._rate(4, 4, 3)
+        self._rate(4, 3, 5)
+        self.assertEqual(
+            self._aggregates(),
+            (3, 13, Decimal('4.33'), Decimal('3.67'), Decimal('4.33')),
+        )
+
+        first.overall_satisfaction = 2
+        first.save()
+        self.assertEqual(
+            self._aggregates(),
+            (3, 10, Decimal('4.33'), Decimal('3.67'), Decimal('3.33')),
+        )
+
+        first.delete()
+        self.assertEqual(
+            self._aggregates(),
+            (2, 8, Decimal('4.00'), Decimal('3.50'), Decimal('4.00')),
+        )
+
+        TailorRating.objects.all().delete()
+        self.assertEqual(
+            self._aggregates(),
+            (0, 0, Decimal('0.00'), Decimal('0.00'), Decimal('0.00')),
+        )
+
+    def test_delete_after_drift_does_not_go_below_zero(self):
+        rating = self._rate(5, 4, 3)
+        TailorProfile.objects.filter(pk=self.profile.pk).update(
+            rating_count=0,
+            stitching_quality_total=0,
+            on_time_delivery_total=0,
+            overall_satisfaction_total=0,
+        )
+
+        rating.delete()
+
+        self.assertEqual(
+            self._aggregates(),
+            (0, 0, Decimal('0.00'), Decimal('0.00'), Decimal('0.00')),
+        )
+
+    def test_unrelated_full_save_keeps_the_aggregates(self):
+        stale = TailorProfile.objects.get(pk=self.profile.pk)
+        self._rate(5, 4, 3)
+
+        # e.g. the tailor edits their shop from an instance loaded before the rating.
+        stale.shop_name = 'Renamed Shop'
+        stale.save()
+
+        self.assertEqual(
+            self._aggregates(),
+            (1, 3, Decimal('5.00'), Decimal('4.00'), Decimal('3.00')),
+        )
+        self.assertEqual(self.profile.shop_name, 'Renamed Shop')
+
+    def test_reconcile_command_repairs_drift(self):
+        self._rate(5, 5, 5)
+        self._rate(3, 4, 4)
+        TailorProfile.objects.filter(pk=self.profile.pk).update(
+            rating_count=7, overall_satisfaction_total=1, avg_overall_satisfaction=Decimal('1.00'),
+        )
+
+        out = StringIO()
+        call_command('reconcile_tailor_ratings', batch_size=1, stdout=out)
+
+        self.assertIn('Corrected 1 tailor rating aggregates', out.getvalue())
+        self.assertEqual(
+            self._aggregates(),
+            (2, 9, Decimal('4.00'), Decimal('4.50'), Decimal('4.50')),
+        )
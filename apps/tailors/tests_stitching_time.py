@@ -0,0 +1,57 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.orders.models import Order, OrderStatusHistory
+from apps.tailors.services.stitching_time import get_average_stitching_time_stats
+
+User = get_user_model()
+
+
+class AverageStitchingTimeStatsTest(TestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username='stitch_stats_customer', role='USER')
+        self.tailor = User.objects.create_user(username='stitch_stats_tailor', role='TAILOR')
+        self.start = timezone.now() - timedelta(days=30)
+
+    def _order(self, finished_after_days=None, ready_after_days=(), status='delivered'):
+        order = Order.objects.create(
+            customer=self.customer,
+            tailor=self.tailor,
+            order_type='stitching_only',
+            service_mode='walk_in',
+            status=status,
+            payment_status='paid',
+            total_amount=Decimal('80.00'),
+        )
+        updated_at = self.start + timedelta(days=finished_after_days or 20)
+        Order.objects.filter(pk=order.pk).update(created_at=self.start, updated_at=updated_at)
+        for days in ready_after_days:
+            entry = OrderStatusHistory.objects.create(
+                order=order, status='ready_for_pickup', previous_status='in_progress',
+            )
+            OrderStatusHistory.objects.filter(pk=entry.pk).update(created_at=self.start + timedelta(days=days))
+        return order
+
+    def test_average_uses_first_ready_entry_and_updated_at_fallback_in_one_query(self):
+        self._order(ready_after_days=(2, 9))
+        self._order(finished_after_days=5)
+        self._order(ready_after_days=(-1,))  # Inconsistent history is ignored.
+        self._order(ready_after_days=(1,), status='ready_for_pickup')  # Not completed yet.
+
+        with self.assertNumQueries(1):
+            stats = get_average_stitching_time_stats(self.tailor)
+
+        self.assertEqual(stats, {
+            'average_stitching_time_days': 3.5,
+            'completed_stitching_orders_count': 2,
+        })
+
+    def test_no_completed_orders(self):
+        self.assertEqual(get_average_stitching_time_stats(self.tailor), {
+            'average_stitching_time_days': None,
+            'completed_stitching_orders_count': 0,
+        })
@@ -1,7 +1,15 @@
 from django.urls import path
 
 from apps.core.views import SendOTPView, VerifyOTPView
-from apps.documents.views import OrderDocumentPreviewView
+from apps.documents.views import (
+    OrderDocumentBatchCreateView,
+    OrderDocumentBatchDetailView,
+    OrderDocumentBatchDownloadView,
+    OrderDocumentJobCreateView,
+    OrderDocumentJobDetailView,
+    OrderDocumentJobDownloadView,
+    OrderDocumentPreviewView,
+)
 from apps.tailors.views import (
     # Profile views
     TailorProfileView,
@@ -54,6 +62,8 @@ from apps.tailors.views import (
     TailorCreateCustomerView,
     TailorPOSCustomerOrdersView,
     TailorPOSCustomerOrderDetailView,
+    TailorPOSCustomerStylesView,
+    TailorPOSCustomerSearchView,
     TailorPOSFamilyMemberListCreateView,
     TailorPOSFamilyMemberDetailView,
 
@@ -130,12 +140,20 @@ urlpatterns = [
     path('orders/<int:order_id>/measurements/', TailorAddMeasurementsView.as_view(), name='tailor-add-measurements'),
     path('orders/<int:order_id>/download-pdf/', TailorOrderDownloadPDFView.as_view(), name='tailor-order-download-pdf'),
     path('orders/<int:order_id>/document-preview/', OrderDocumentPreviewView.as_view(), name='tailor-order-document-preview'),
+    path('orders/<int:order_id>/pdf-jobs/', OrderDocumentJobCreateView.as_view(), name='tailor-order-document-job-create'),
+    path('pdf-jobs/<uuid:job_id>/', OrderDocumentJobDetailView.as_view(), name='tailor-order-document-job'),
+    path('pdf-jobs/<uuid:job_id>/download/', OrderDocumentJobDownloadView.as_view(), name='tailor-order-document-job-download'),
+    path('orders/pdf-batches/', OrderDocumentBatchCreateView.as_view(), name='tailor-order-document-batch-create'),
+    path('pdf-batches/<uuid:job_id>/', OrderDocumentBatchDetailView.as_view(), name='tailor-order-document-batch'),
+    path('pdf-batches/<uuid:job_id>/download/', OrderDocumentBatchDownloadView.as_view(), name='tailor-order-document-batch-download'),
     path('config/', TailorConfigView.as_view(), name='tailor-config'),
 
     # POS URLs
     path('pos/customers/', TailorCustomerListView.as_view(), name='tailor-pos-customers'),
     path('pos/customers/create/', TailorCreateCustomerView.as_view(), name='tailor-pos-create-customer'),
+    path('pos/customers/search/', TailorPOSCustomerSearchView.as_view(), name='tailor-pos-customer-search'),
     path('pos/customers/<int:customer_id>/orders/', TailorPOSCustomerOrdersView.as_view(), name='tailor-pos-customer-orders'),
+    path('pos/customers/<int:customer_id>/styles/', TailorPOSCustomerStylesView.as_view(), name='tailor-pos-customer-styles'),
     path('pos/customers/<int:customer_id>/orders/<int:order_id>/', TailorPOSCustomerOrderDetailView.as_view(), name='tailor-pos-customer-order-detail'),
     path('pos/customers/<int:customer_id>/family/', TailorPOSFamilyMemberListCreateView.as_view(), name='tailor-pos-family-list'),
     path('pos/customers/<int:customer_id>/family/<int:family_member_id>/', TailorPOSFamilyMemberDetailView.as_view(), name='tailor-pos-family-detail'),
@@ -51,7 +51,9 @@ from .tailor_pos import (
     TailorCustomerListView,
     TailorCreateCustomerView,
     TailorPOSCustomerOrdersView,
-    TailorPOSCustomerOrderDetailView
+    TailorPOSCustomerOrderDetailView,
+    TailorPOSCustomerStylesView,
+    TailorPOSCustomerSearchView,
 )
 from .pos_family import (
     TailorPOSFamilyMemberListCreateView,
@@ -124,6 +126,8 @@ __all__ = [
     'TailorCreateCustomerView',
     'TailorPOSCustomerOrdersView',
     'TailorPOSCustomerOrderDetailView',
+    'TailorPOSCustomerStylesView',
+    'TailorPOSCustomerSearchView',
     'TailorPOSFamilyMemberListCreateView',
     'TailorPOSFamilyMemberDetailView',
 
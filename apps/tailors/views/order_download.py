@@ -7,6 +7,7 @@ Endpoint:
 
 Returns:
     - 200 application/pdf  with Content-Disposition: attachment; filename="order_<number>.pdf"
+    - 304 when If-None-Match matches the cached document's ETag
     - 403 if the user is not a TAILOR or does not own the order
     - 404 if the order does not exist
 """
@@ -14,13 +15,14 @@ import logging
 
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
 from apps.orders.models import Order
 from apps.tailors.permissions import IsShopStaff
-from apps.tailors.services.order_pdf import generate_order_pdf
+from apps.documents.pdf_cache import get_order_pdf, order_pdf_cache_enabled, order_pdf_cache_entry
 from apps.documents.service import generate_order_html
 from zthob.translations import get_language_from_request
 from zthob.utils import api_response
@@ -117,9 +119,15 @@ class TailorOrderDownloadPDFView(BaseTailorAPIView):
                 )
             return HttpResponse(html, content_type='text/html; charset=utf-8')
 
-        # Generate PDF
+        # Serve from the rendered-PDF cache; revalidation skips rendering entirely.
+        entry = None
         try:
-            pdf_bytes = generate_order_pdf(order, lang=lang)
+            if order_pdf_cache_enabled():
+                entry = order_pdf_cache_entry(order, lang)
+                not_modified = get_conditional_response(request, etag=entry.etag)
+                if not_modified is not None:
+                    return not_modified
+            pdf_bytes, entry = get_order_pdf(order, lang, entry=entry)
         except Exception as exc:
             logger.exception("PDF generation failed for order %s: %s", order_id, exc)
             return api_response(
@@ -132,4 +140,7 @@ class TailorOrderDownloadPDFView(BaseTailorAPIView):
         response = HttpResponse(pdf_bytes, content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
         response['Content-Length'] = len(pdf_bytes)
+        if entry is not None:
+            response['ETag'] = entry.etag
+            response['Cache-Control'] = 'private, no-cache'
         return response
@@ -413,6 +413,7 @@ class TailorAddMeasurementsView(APIView):
             actor_role = getattr(request.user, 'role', '')
 
             recipient_items.update(measurements=measurements_data)
+            Order.sync_needs_measurements([order.id])
             actual_family_member_ids = set(
                 recipient_items.values_list('family_member_id', flat=True)
             )
@@ -3,7 +3,6 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Max
 
 from apps.tailors.permissions import IsTailor
 from apps.tailors.serializers.tailor_pos import (
@@ -11,11 +10,18 @@ from apps.tailors.serializers.tailor_pos import (
     CreateCustomerSerializer,
 )
 from apps.core.phone_format import normalize_phone_to_local, phone_lookup_variations
+from apps.core.search import MIN_TYPEAHEAD_LENGTH
 from apps.customers.models import CustomerProfile
 from apps.orders.models import Order
 from apps.orders.serializers import OrderListSerializer, OrderSerializer
+from apps.tailors.models import ShopCustomer
+from apps.tailors.services.pos_customer_directory import (
+    build_customer_entries,
+    search_shop_customers,
+    shop_customer_queryset,
+)
 from apps.tailors.services.pos_customer_styles import get_customer_order_styles, get_customer_style_presets
-from zthob.utils import api_response
+from zthob.utils import StandardResultsSetPagination, api_response
 
 User = get_user_model()
 
@@ -29,10 +35,16 @@ class TailorCustomerListView(BaseTailorAPIView):
     Returns all unique customers who have:
       1. Previously ordered from this tailor shop, OR
       2. Were created via this tailor shop's POS.
+
+    Reads the shop's customer directory (ShopCustomer), newest order first.
+    Query params:
+      - search: name fragment or phone digits
+      - page / page_size: paginate; style data is then only included with
+        expand=styles (otherwise fetch it per customer from .../styles/)
     """
     permission_classes = [IsAuthenticated, IsShopStaff]
     required_employee_permission = 'can_manage_pos'
-
+    pagination_class = StandardResultsSetPagination
 
     def get(self, request):
         profile = self.get_tailor_profile(request.user)
@@ -40,93 +52,23 @@ class TailorCustomerListView(BaseTailorAPIView):
              return api_response(success=False, message="Shop profile not found", status_code=404)
         
         owner_user = profile.user
-        
-        # --- Source 1: Customers who placed orders with this shop ---
-        order_customer_data = (
-            Order.objects.filter(tailor=owner_user)
-
-            .values('customer')
-            .annotate(
-                total_orders=Count('id'),
-                last_order_date=Max('created_at'),
-            )
-        )
-        # Build a dict keyed by customer user ID
-        order_map = {
-            entry['customer']: {
-                'total_orders': entry['total_orders'],
-                'last_order_date': entry['last_order_date'],
-            }
-            for entry in order_customer_data
-        }
-
-        # --- Source 2: Customers created via this tailor's POS with no orders yet ---
-        # Note: We filter by owner_user for consistency
-        pos_profiles = CustomerProfile.objects.filter(
-            pos_created_by=owner_user
-        ).exclude(
-            user_id__in=order_map.keys()  # skip those already in order_map
-        ).select_related('user')
-
-
-        # Collect all user IDs to fetch
-        all_user_ids = set(order_map.keys()) | {p.user_id for p in pos_profiles}
-
-        # Fetch all users in a single query
-        users = User.objects.filter(id__in=all_user_ids).in_bulk()
-
-        # Fetch all customer profiles in a single query
-        profiles = {
-            cp.user_id: cp
-            for cp in CustomerProfile.objects.filter(user_id__in=all_user_ids)
-        }
-
-        styles_map = get_customer_order_styles(owner_user, all_user_ids, request)
-        presets_map = get_customer_style_presets(all_user_ids, request)
-
-        results = []
-
-        # Add order-based customers
-        for user_id, stats in order_map.items():
-            user = users.get(user_id)
-            if not user:
-                continue
-            profile = profiles.get(user_id)
-            results.append({
-                'id': user.id,
-                'name': user.get_full_name() or user.username,
-                'phone': user.phone or '',
-                'email': user.email,
-                'total_orders': stats['total_orders'],
-                'last_order_date': stats['last_order_date'],
-                'measurements': profile.measurements if profile else None,
-                'order_styles': styles_map.get(user_id, []),
-                'style_presets': presets_map.get(user_id, []),
-            })
-
-        # Add POS-created, zero-order customers
-        for profile in pos_profiles:
-            user = profile.user
-            if not user:
-                continue
-            results.append({
-                'id': user.id,
-                'name': user.get_full_name() or user.username,
-                'phone': user.phone or '',
-                'email': user.email,
-                'total_orders': 0,
-                'last_order_date': None,
-                'measurements': profile.measurements,
-                'order_styles': styles_map.get(user.id, []),
-                'style_presets': presets_map.get(user.id, []),
-            })
-
-        # Sort: customers with orders first (by last_order_date), then zero-order at the end
-        results.sort(
-            key=lambda x: (x['last_order_date'] is None, x['last_order_date'] or ''),
-            reverse=True
+        entries = search_shop_customers(
+            shop_customer_queryset(owner_user),
+            request.query_params.get('search'),
         )
 
+        if 'page' in request.query_params or 'page_size' in request.query_params:
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(entries, request, view=self)
+            with_styles = 'styles' in request.query_params.get('expand', '').split(',')
+            results = build_customer_entries(page, owner_user, request, with_styles=with_styles)
+            serializer = TailorCustomerSerializer(results, many=True)
+            return paginator.get_paginated_response(
+                serializer.data,
+                message="Customers retrieved successfully",
+            )
+
+        results = build_customer_entries(list(entries), owner_user, request)
         serializer = TailorCustomerSerializer(results, many=True)
         return api_response(
             success=True,
@@ -136,6 +78,68 @@ class TailorCustomerListView(BaseTailorAPIView):
         )
 
 
+class TailorPOSCustomerSearchView(BaseTailorAPIView):
+    """
+    GET /api/tailors/pos/customers/search/?q=<name or phone>
+    Type-ahead over this shop's customers: exact, then prefix, then word-prefix,
+    then substring matches, most recent customers first within each. Paginated.
+    """
+    permission_classes = [IsAuthenticated, IsShopStaff]
+    required_employee_permission = 'can_manage_pos'
+    pagination_class = StandardResultsSetPagination
+
+    def get(self, request):
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return api_response(success=False, message="Shop profile not found", status_code=404)
+
+        owner_user = profile.user
+        term = (request.query_params.get('q') or '').strip()
+        entries = shop_customer_queryset(owner_user)
+        if len(term) < MIN_TYPEAHEAD_LENGTH:
+            entries = entries.none()
+        else:
+            entries = search_shop_customers(entries, term)
+
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(entries, request, view=self)
+        results = build_customer_entries(page, owner_user, request, with_styles=False)
+        serializer = TailorCustomerSerializer(results, many=True)
+        return paginator.get_paginated_response(
+            serializer.data,
+            message="Customers retrieved successfully",
+        )
+
+
+class TailorPOSCustomerStylesView(BaseTailorAPIView):
+    """
+    GET /api/tailors/pos/customers/{customer_id}/styles/
+    Returns past order styles at this shop and saved style presets for one POS customer.
+    """
+    permission_classes = [IsAuthenticated, IsShopStaff]
+    required_employee_permission = 'can_manage_pos'
+
+    def get(self, request, customer_id):
+        profile = self.get_tailor_profile(request.user)
+        if not profile:
+            return api_response(success=False, message="Shop profile not found", status_code=404)
+
+        owner_user = profile.user
+        if not ShopCustomer.objects.filter(tailor=owner_user, customer_id=customer_id).exists():
+            return api_response(success=False, message="Customer not found", status_code=404)
+
+        return api_response(
+            success=True,
+            message="Customer styles retrieved successfully",
+            data={
+                'id': customer_id,
+                'order_styles': get_customer_order_styles(owner_user, [customer_id], request).get(customer_id, []),
+                'style_presets': get_customer_style_presets([customer_id], request).get(customer_id, []),
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+
 class TailorCreateCustomerView(BaseTailorAPIView):
     """
     POST /api/tailors/pos/customers/create/
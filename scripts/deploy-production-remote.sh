@@ -33,7 +33,7 @@ else
   : "${GHCR_TOKEN:?GHCR_TOKEN is required when IMAGE_PRELOADED is not true}"
   printf '%s' "$GHCR_TOKEN" | docker login ghcr.io -u "$GHCR_USERNAME" --password-stdin
   echo "--- pulling images ---"
-  "${COMPOSE[@]}" pull web celery_worker
+  "${COMPOSE[@]}" pull web celery_worker celery_documents_worker
   PULL_POLICY="always"
 fi
 
@@ -63,7 +63,7 @@ echo "--- running migrations ---"
 "${COMPOSE[@]}" run --rm web python manage.py migrate --noinput
 
 echo "--- removing old app containers ---"
-for service in web celery_worker; do
+for service in web celery_worker celery_documents_worker; do
   container_id="$("${COMPOSE[@]}" ps -q "$service" 2>/dev/null || true)"
   if [ -n "$container_id" ]; then
     echo "removing $service container $container_id"
@@ -72,7 +72,7 @@ for service in web celery_worker; do
 done
 
 echo "--- starting app containers ---"
-"${COMPOSE[@]}" up -d --no-deps --force-recreate --pull "$PULL_POLICY" web celery_worker
+"${COMPOSE[@]}" up -d --no-deps --force-recreate --pull "$PULL_POLICY" web celery_worker celery_documents_worker
 
 "${COMPOSE[@]}" ps
 
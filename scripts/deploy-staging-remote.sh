@@ -21,7 +21,7 @@ else
   : "${GHCR_TOKEN:?GHCR_TOKEN is required when IMAGE_PRELOADED is not true}"
   printf '%s' "$GHCR_TOKEN" | docker login ghcr.io -u "$GHCR_USERNAME" --password-stdin
   echo "--- pulling images ---"
-  "${COMPOSE[@]}" pull web celery_worker
+  "${COMPOSE[@]}" pull web celery_worker celery_documents_worker
   PULL_POLICY="always"
 fi
 
@@ -47,7 +47,7 @@ echo "--- running migrations ---"
 "${COMPOSE[@]}" run --rm web python manage.py migrate --noinput
 
 echo "--- removing old app containers ---"
-for service in web celery_worker; do
+for service in web celery_worker celery_documents_worker; do
   container_id="$("${COMPOSE[@]}" ps -q "$service" 2>/dev/null || true)"
   if [ -n "$container_id" ]; then
     echo "removing $service container $container_id"
@@ -56,7 +56,7 @@ for service in web celery_worker; do
 done
 
 echo "--- starting app containers ---"
-"${COMPOSE[@]}" up -d --no-deps --force-recreate --pull "$PULL_POLICY" web celery_worker
+"${COMPOSE[@]}" up -d --no-deps --force-recreate --pull "$PULL_POLICY" web celery_worker celery_documents_worker
 
 running_container_id="$("${COMPOSE[@]}" ps -q web | head -n1)"
 running_image_id="$(docker inspect --format='{{.Image}}' "$running_container_id")"
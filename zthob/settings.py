@@ -34,6 +34,8 @@ DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 
 # auto = HTML (WeasyPrint) with ReportLab fallback
 ORDER_PDF_ENGINE = os.getenv('ORDER_PDF_ENGINE', 'auto').strip().lower() or 'auto'
+# Rendered order PDFs are cached in media storage, keyed by order content
+ORDER_PDF_CACHE_ENABLED = os.getenv('ORDER_PDF_CACHE_ENABLED', 'True').lower() == 'true'
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.getenv('DJANGO_SECRET_KEY', 'django-insecure-vv#!hz_y7dae4soqei&61+5l-5@(cr@kaz#($@5-nyb5jsku1=')
@@ -311,6 +313,10 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# PDF rendering runs on its own queue/worker pool so spikes cannot starve other tasks
+CELERY_TASK_ROUTES = {
+    'apps.documents.tasks.*': {'queue': 'documents'},
+}
 
 # Email settings (for production and staging)
 if APP_ENV in ['production', 'staging']:
@@ -407,6 +413,13 @@ FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID', 'mgask-2025')
 TAQNYAT_BEARER_TOKEN = os.getenv('TAQNYAT_BEARER_TOKEN', None)
 TAQNYAT_SENDER_NAME = os.getenv('TAQNYAT_SENDER_NAME', None)
 OTP_EXPIRY_MINUTES = int(os.getenv('OTP_EXPIRY_MINUTES', '5'))
+# SMS dispatch: per-process send rate (messages/second), burst size and batch concurrency
+TAQNYAT_SMS_RATE_PER_SECOND = float(os.getenv('TAQNYAT_SMS_RATE_PER_SECOND', '10'))
+TAQNYAT_SMS_BURST = int(os.getenv('TAQNYAT_SMS_BURST', '10'))
+TAQNYAT_SMS_MAX_WORKERS = int(os.getenv('TAQNYAT_SMS_MAX_WORKERS', '4'))
+TAQNYAT_SMS_MAX_RETRIES = int(os.getenv('TAQNYAT_SMS_MAX_RETRIES', '2'))
+TAQNYAT_CONNECT_TIMEOUT_SECONDS = float(os.getenv('TAQNYAT_CONNECT_TIMEOUT_SECONDS', '5'))
+TAQNYAT_READ_TIMEOUT_SECONDS = float(os.getenv('TAQNYAT_READ_TIMEOUT_SECONDS', '15'))
 
 # Alinma Pay Configuration
 ALINMAPAY_TERMINAL_ID = os.getenv('ALINMAPAY_TERMINAL_ID', '')
@@ -415,7 +428,7 @@ ALINMAPAY_MERCHANT_KEY = os.getenv('ALINMAPAY_MERCHANT_KEY', '')
 ALINMAPAY_CURRENCY = os.getenv('ALINMAPAY_CURRENCY', 'SAR')
 ALINMAPAY_RECEIPT_BASE_URL = os.getenv('ALINMAPAY_RECEIPT_BASE_URL', 'https://app.mgask.net')
 ALINMAPAY_RETURN_URL = os.getenv('ALINMAPAY_RETURN_URL', 'https://app.mgask.net/payment-result')
-ALINMAPAY_TIMEOUT_SECONDS = int(os.getenv('ALINMAPAY_TIMEOUT_SECONDS', '60'))
+ALINMAPAY_TIMEOUT_SECONDS = int(os.getenv('ALINMAPAY_TIMEOUT_SECONDS', '20'))
 ALINMAPAY_REQUEST_URL = os.getenv(
     'ALINMAPAY_REQUEST_URL',
     (
@@ -432,10 +445,16 @@ MYFATOORAH_API_BASE_URL = os.getenv(
     'MYFATOORAH_API_BASE_URL',
     'https://api-sa.myfatoorah.com' if APP_ENV == 'production' else 'https://apitest.myfatoorah.com',
 )
-MYFATOORAH_TIMEOUT_SECONDS = int(os.getenv('MYFATOORAH_TIMEOUT_SECONDS', '30'))
+MYFATOORAH_TIMEOUT_SECONDS = int(os.getenv('MYFATOORAH_TIMEOUT_SECONDS', '10'))
 MYFATOORAH_COUNTRY = os.getenv('MYFATOORAH_COUNTRY', 'SAU').upper()
 MYFATOORAH_CURRENCY = os.getenv('MYFATOORAH_CURRENCY', 'SAR').upper()
 
+# Payment gateway HTTP clients (apps/orders/gateway_client.py); read timeouts are per gateway above
+PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS = float(os.getenv('PAYMENT_GATEWAY_CONNECT_TIMEOUT_SECONDS', '3'))
+PAYMENT_GATEWAY_POOL_SIZE = int(os.getenv('PAYMENT_GATEWAY_POOL_SIZE', '10'))
+PAYMENT_GATEWAY_FAILURE_THRESHOLD = int(os.getenv('PAYMENT_GATEWAY_FAILURE_THRESHOLD', '5'))
+PAYMENT_GATEWAY_RESET_SECONDS = float(os.getenv('PAYMENT_GATEWAY_RESET_SECONDS', '30'))
+
 # Jazzmin Admin UI Configuration - Simplified
 JAZZMIN_SETTINGS = {
     # Simple branding
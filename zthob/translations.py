@@ -542,6 +542,18 @@ TRANSLATIONS_AR = {
     "New orders waiting for your approval": "طلبات جديدة في انتظار موافقتك",
     "Orders currently being worked on": "طلبات قيد العمل حالياً",
     "Orders ready for customer pickup": "طلبات جاهزة لاستلام العملاء",
+    "Order document ready": "مستند الطلب جاهز",
+    "Order #{order_number} PDF is ready to download": "ملف PDF للطلب #{order_number} جاهز للتنزيل",
+    "Document job queued": "تمت جدولة إنشاء المستند",
+    "Document job retrieved": "تم استرجاع حالة المستند",
+    "Document job not found": "لم يتم العثور على مهمة المستند",
+    "Document is not ready yet": "المستند غير جاهز بعد",
+    "Document has changed since this job finished. Please request it again.": "تغير المستند بعد اكتمال المهمة. يرجى طلبه مرة أخرى.",
+    "Order documents ready": "مستندات الطلبات جاهزة",
+    "{order_count} order PDFs are ready to download": "ملفات PDF لعدد {order_count} طلبات جاهزة للتنزيل",
+    "order_ids must be a non-empty list of order ids": "يجب أن يكون order_ids قائمة غير فارغة بأرقام الطلبات",
+    "A document batch can include at most {max_orders} orders": "يمكن أن تتضمن دفعة المستندات {max_orders} طلبات كحد أقصى",
+    "format must be pdf or zip": "يجب أن تكون الصيغة pdf أو zip",
 }
 
 TRANSLATIONS = TRANSLATIONS_AR
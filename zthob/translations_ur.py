@@ -408,4 +408,16 @@ TRANSLATIONS_UR = {
     'New orders waiting for your approval': 'نئے آرڈرز آپ کی منظوری کا انتظار کر رہے ہیں',
     'Orders currently being worked on': 'آرڈرز پر فی الحال کام جاری ہے',
     'Orders ready for customer pickup': 'گاہک کی وصولی کے لیے تیار آرڈرز',
+    'Order document ready': 'آرڈر کی دستاویز تیار ہے',
+    'Order #{order_number} PDF is ready to download': 'آرڈر #{order_number} کی PDF ڈاؤن لوڈ کے لیے تیار ہے',
+    'Document job queued': 'دستاویز کی تیاری قطار میں شامل ہو گئی',
+    'Document job retrieved': 'دستاویز کی حالت حاصل کر لی گئی',
+    'Document job not found': 'دستاویز کا کام نہیں ملا',
+    'Document is not ready yet': 'دستاویز ابھی تیار نہیں ہے',
+    'Document has changed since this job finished. Please request it again.': 'کام مکمل ہونے کے بعد دستاویز بدل گئی ہے۔ براہ کرم دوبارہ درخواست کریں۔',
+    'Order documents ready': 'آرڈرز کی دستاویزات تیار ہیں',
+    '{order_count} order PDFs are ready to download': '{order_count} آرڈرز کی PDF فائلیں ڈاؤن لوڈ کے لیے تیار ہیں',
+    'order_ids must be a non-empty list of order ids': 'order_ids آرڈر نمبرز کی غیر خالی فہرست ہونی چاہیے',
+    'A document batch can include at most {max_orders} orders': 'ایک دستاویزی بیچ میں زیادہ سے زیادہ {max_orders} آرڈرز شامل ہو سکتے ہیں',
+    'format must be pdf or zip': 'فارمیٹ pdf یا zip ہونا چاہیے',
 }